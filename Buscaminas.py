@@ -2,28 +2,54 @@ import random
 
 #Creaccion del tablero
 
-def tablero_logico(filas, columnas, num_minas):
+def elegir_posiciones(total, cantidad, excluidas, rng):
+    #Elige 'cantidad' posiciones distintas de 0 a total-1 sin reintentos
+    #(Fisher-Yates parcial: solo se guardan las posiciones intercambiadas)
+    libres = total - len(excluidas)
+    if cantidad > libres:
+        raise ValueError("No caben tantas minas en el tablero")
+
+    #Las excluidas que quedan delante se cambian por las libres del final,
+    #asi solo hay que sortear entre las 'libres' primeras posiciones
+    delante = [p for p in excluidas if p < libres]
+    detras = [p for p in range(libres, total) if p not in excluidas]
+    cambios = dict(zip(delante, detras))
+
+    elegidas = []
+    for i in range(cantidad):
+        k = rng.randrange(i, libres)
+        elegidas.append(cambios.get(k, k))
+        cambios[k] = cambios.get(i, i)
+    return elegidas
+
+def tablero_logico(filas, columnas, num_minas, excluir=None, rng=None):
+    #rng permite pasar un random.Random con semilla para repetir tableros
+    if rng is None:
+        rng = random
+
     tablero = []
     #Crear tablero vacio
     for _ in range(filas):
         tablero.append([0] * columnas)
     
-    #Colocacion de minas
-    minas_plantadas = 0
-    while minas_plantadas < num_minas:
-        f = random.randint(0, filas -1)
-        c = random.randint(0, columnas -1)
-
-        #si no hay mina se planta (representado con el -1)
-        if tablero[f][c] != -1:
-            tablero[f][c] = -1
-            minas_plantadas += 1
-
-            #Recorremos el cuadrado de 3x3 alrededor de la mina
-            for i in range(max(0, f-1), min(filas, f+2)):
-                for j in range(max(0, c-1), min(columnas, c+2)):
-                    if tablero[i][j] != -1:
-                        tablero[i][j] += 1
+    #Casillas prohibidas (por ejemplo el primer clic y sus vecinas) como posiciones lineales
+    prohibidas = set()
+    for f, c in (excluir or []):
+        if 0 <= f < filas and 0 <= c < columnas:
+            prohibidas.add(f * columnas + c)
+
+    #Colocacion de minas sin repetir
+    for posicion in elegir_posiciones(filas * columnas, num_minas, prohibidas, rng):
+        f, c = divmod(posicion, columnas)
+
+        #se planta la mina (representado con el -1)
+        tablero[f][c] = -1
+
+        #Recorremos el cuadrado de 3x3 alrededor de la mina
+        for i in range(max(0, f-1), min(filas, f+2)):
+            for j in range(max(0, c-1), min(columnas, c+2)):
+                if tablero[i][j] != -1:
+                    tablero[i][j] += 1
     return tablero
 
 
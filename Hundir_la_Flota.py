@@ -1,6 +1,9 @@
 # Creación del tablero vacío
 import random
 
+# Generador propio de esta partida (no el compartido del módulo random)
+rng = random.Random()
+
 tablero = []
 for i in range(10):
     fila = ["~", "~", "~", "~", "~", "~", "~", "~", "~", "~"]
@@ -109,9 +112,9 @@ for longitud in barcos_a_colocar:
     
     while colocado == False:
         # La IA elige coordenadas y orientación al azar
-        fila_index = random.randint(0, 9)
-        columna = random.randint(0, 9)
-        orientacion = random.choice(["H", "V"])
+        fila_index = rng.randint(0, 9)
+        columna = rng.randint(0, 9)
+        orientacion = rng.choice(["H", "V"])
         
         error = False
         
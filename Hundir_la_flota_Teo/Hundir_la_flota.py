@@ -1,68 +1,138 @@
+import importlib.util
+import os
 import random
+import sys
 import time
 import json 
 
+# El núcleo de bitboards y el guardado son los de la otra versión del juego: su paquete 'compartido'
+RUTA_COMPARTIDO = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Propuesta_Carliyo", "compartido")
+
+def cargar_compartido():
+    """Carga el paquete 'compartido' de Propuesta_Carliyo por su ruta (si no está ya cargado), sin tocar sys.path."""
+    if "compartido" not in sys.modules:
+        spec = importlib.util.spec_from_file_location("compartido", os.path.join(RUTA_COMPARTIDO, "__init__.py"),
+                                                      submodule_search_locations=[RUTA_COMPARTIDO])
+        paquete = importlib.util.module_from_spec(spec)
+        sys.modules["compartido"] = paquete
+        spec.loader.exec_module(paquete)
+    return sys.modules["compartido"]
+
+cargar_compartido()
+from compartido import bitboard_flota
+from compartido import colocacion_barcos
+from compartido import almacen_partidas
+from compartido import coordenadas
+from compartido import diario_jugadas
+from compartido import indice_barcos
+from compartido import partida_binaria
+from compartido import pool_casillas
+
 # --- Constantes del Juego ---
 DIMENSION = 10
+DIMENSION_MINIMA = 5
+DIMENSION_MAXIMA = 100  # Filas de A a CV
 AGUA = "~"      
 BARCO = "#"     
 TOCADO = "X"    
 FALLADO = "O"   
 
-LETRAS_A_NUMEROS = {'A': 0, 'B': 1, 'C': 2, 'D': 3, 'E': 4, 'F': 5, 'G': 6, 'H': 7, 'I': 8, 'J': 9}
-NUMEROS_A_LETRAS = "ABCDEFGHIJ" 
+# Flota de un tablero 10x10; en tableros mayores va una copia más por cada 1000 casillas
+FLOTA_ESTANDAR = [4, 3, 3, 2, 2]
+CASILLAS_POR_FLOTA = 1000
+
+# Valores de casilla en el orden del formato binario de guardado (2 bits cada uno)
+SIMBOLOS = (AGUA, BARCO, TOCADO, FALLADO)
+
+# Partida guardada en formato binario (ver partida_binaria.py) y la del formato JSON antiguo
+ARCHIVO_PARTIDA = "partida_guardada.flota"
+ARCHIVO_PARTIDA_JSON = "partida_guardada.json"
+
+# Guardado automático jugada a jugada (ver diario_jugadas.py): foto y diario de la partida en curso
+BASE_DIARIO = "partida_en_curso"
+SINCRONIZAR_DIARIO = 'lote'
+
+# Acciones del diario: disparo del jugador y disparo de la IA
+JUGADA_JUGADOR = 'J'
+JUGADA_IA = 'I'
+
+# Si es True, cada comprobación de victoria con contadores se contrasta
+# con un recorrido completo del tablero (modo depuración).
+DEPURAR_CONTADORES = False
+
+# Si es False, no se hace ninguna pausa (partidas automáticas o sin terminal).
+PAUSAS = True
 
 
 # -----------------------------------------------------------------
 ## 1. Lógica Básica del Tablero y Barcos
 # -----------------------------------------------------------------
 
+def pausa(segundos):
+    """Espera para dar dramatismo al juego, salvo que las pausas estén desactivadas."""
+    if PAUSAS: time.sleep(segundos)
+
 def crear_tablero(dimension):
     """Crea una matriz de NxN llena de agua."""
     return [[AGUA for _ in range(dimension)] for _ in range(dimension)]
 
+def flota_para_dimension(dimension):
+    """Longitudes de la flota de un tablero NxN: la estándar, repetida una vez por cada 1000 casillas."""
+    return FLOTA_ESTANDAR * max(1, dimension * dimension // CASILLAS_POR_FLOTA)
+
 def imprimir_tablero(tablero):
-    """Muestra el tablero con coordenadas en la consola y alinea las columnas."""
+    """Muestra el tablero con coordenadas en la consola y alinea las columnas (en una sola escritura).
+    Las filas pasan a dos letras (AA, AB...) y las columnas a dos cifras en tableros de más de 26 o 10."""
+    dimension = len(tablero)
+    ancho_fila = len(coordenadas.letras_columna(dimension - 1))
+    ancho_columna = len(str(dimension - 1))
     
-    # 1. Cabecera (Números de columna): 3 espacios iniciales
-    numeros_columna = " ".join([f"{i}" for i in range(DIMENSION)])
-    print(f"\n   {numeros_columna}") 
+    # 1. Cabecera (Números de columna): alineada con la primera casilla
+    numeros_columna = " ".join([f"{i:>{ancho_columna}}" for i in range(dimension)])
+    margen = " " * (ancho_fila + 2)
+    lineas = [f"\n{margen}{numeros_columna}"]
     
-    # 2. Línea separadora: Usando '-' y longitud ajustada a 19 para la alineación perfecta
-    print("   +" + "-" * 19) 
+    # 2. Línea separadora: tan larga como la cabecera
+    lineas.append(margen + "+" + "-" * len(numeros_columna))
     
     for i, fila in enumerate(tablero):
         # 3. Filas: 1 espacio inicial para alinear la letra A con el '+', 
-        print(f" {NUMEROS_A_LETRAS[i]} | {' '.join(fila)}") 
+        casillas = " ".join([f"{c:>{ancho_columna}}" for c in fila])
+        lineas.append(f" {coordenadas.letras_columna(i):>{ancho_fila}} | {casillas}")
+    
+    print("\n".join(lineas))
         
 def validar_coordenadas(fila, col, longitud, orientacion, tablero):
-    """Comprueba si el barco cabe y no choca con otro."""
+    """Comprueba si el barco cabe y no choca con otro (solo mira sus casillas, no todo el tablero)."""
+    dimension = len(tablero)
+    if not (0 <= fila < dimension and 0 <= col < dimension): return False
     if orientacion == 'H':
-        if col + longitud > DIMENSION: return False
+        if col + longitud > dimension: return False
         for i in range(longitud):
             if tablero[fila][col + i] != AGUA: return False
     else:
-        if fila + longitud > DIMENSION: return False
+        if fila + longitud > dimension: return False
         for i in range(longitud):
             if tablero[fila + i][col] != AGUA: return False
     return True
 
-def colocar_barcos_aleatorios(tablero, flota):
-    """Coloca una lista de barcos (longitudes) aleatoriamente."""
-    for longitud in flota:
-        colocado = False
-        while not colocado:
-            fila = random.randint(0, DIMENSION - 1)
-            col = random.randint(0, DIMENSION - 1)
-            orientacion = random.choice(['H', 'V'])
-            if validar_coordenadas(fila, col, longitud, orientacion, tablero):
-                if orientacion == 'H':
-                    for i in range(longitud):
-                        tablero[fila][col + i] = BARCO
-                else:
-                    for i in range(longitud):
-                        tablero[fila + i][col] = BARCO
-                colocado = True
+def colocar_barcos_aleatorios(tablero, flota, indice=None, rng=None):
+    """Coloca una lista de barcos (longitudes) aleatoriamente, eligiendo entre las posiciones libres.
+    Si se da un índice (IndiceBarcos), registra en él cada barco: aquí los barcos pueden tocarse.
+    'rng' es el generador de la partida (random.Random); por defecto, el módulo random.
+    Usa el índice de colocaciones legales de colocacion_barcos (rápido también en 100x100), que
+    vuelve atrás si la flota queda encajonada; si no cabe, lanza ValueError sin tocar el tablero."""
+    dimension = len(tablero)
+    ocupadas = bitboard_flota.mascara_tablero(tablero, (BARCO, TOCADO, FALLADO))
+    colocaciones = colocacion_barcos.IndiceColocaciones(dimension, ocupadas, separacion=False)
+    elegidas = colocacion_barcos.buscar_colocaciones(colocaciones, flota, rng)
+    if elegidas is None:
+        raise ValueError(f"No queda sitio para los barcos {sorted(flota, reverse=True)}")
+    for longitud, fila, col, orientacion in elegidas:
+        casillas = [(fila, col + i) if orientacion == 'H' else (fila + i, col) for i in range(longitud)]
+        for f, c in casillas:
+            tablero[f][c] = BARCO
+        if indice is not None: indice.agregar_barco(casillas)
     return tablero
 
 
@@ -70,174 +140,310 @@ def colocar_barcos_aleatorios(tablero, flota):
 ## 2. Lógica de Coordenadas y Ataque del Jugador
 # -----------------------------------------------------------------
 
-def traducir_coordenada(coordenada):
-    """Traduce una coordenada tipo 'A5' a índices de matriz (0, 5)."""
-    if len(coordenada) < 2 or len(coordenada) > 3: return None, None
-    letra_fila = coordenada[0].upper()
-    try:
-        num_columna = int(coordenada[1:])
-    except ValueError: return None, None 
+def traducir_coordenada(coordenada, dimension=DIMENSION):
+    """Traduce una coordenada tipo 'A5' (o 'AB12' en tableros grandes) a índices de matriz (0, 5)."""
+    letras_fila, num_columna = coordenadas.separar_coordenada(coordenada)
+    if letras_fila is None: return None, None
 
-    if letra_fila in LETRAS_A_NUMEROS: fila = LETRAS_A_NUMEROS[letra_fila]
-    else: return None, None
-
-    columna = num_columna 
+    fila = coordenadas.indice_columna(letras_fila)
+    if fila is None: return None, None  # Letras fuera de A-Z, como 'Ñ' o 'é'
+    columna = int(num_columna)
     
-    if 0 <= fila < DIMENSION and 0 <= columna < DIMENSION:
+    if 0 <= fila < dimension and 0 <= columna < dimension:
         return fila, columna
     else: return None, None
 
 def pedir_disparo(tablero_enemigo_disparos):
     """Pide y valida la coordenada de disparo."""
+    dimension = len(tablero_enemigo_disparos)
+    ultima_fila = coordenadas.letras_columna(dimension - 1)
     while True:
-        coordenada_str = input("¿Dónde disparas? (Ej: A5, J0): ").strip()
-        fila, columna = traducir_coordenada(coordenada_str)
+        coordenada_str = input(f"¿Dónde disparas? (Ej: A5, {ultima_fila}0): ").strip()
+        fila, columna = traducir_coordenada(coordenada_str, dimension)
         
         if fila is None:
-            print("Formato de coordenada inválido. Usa una letra (A-J) y un número (0-9).")
+            print(f"Formato de coordenada inválido. Usa letras (A-{ultima_fila}) y un número (0-{dimension - 1}).")
             continue
         if tablero_enemigo_disparos[fila][columna] != AGUA:
             print("Ya has disparado a esa casilla. Elige otra.")
             continue
         return fila, columna
 
-def realizar_ataque(tablero_pc_barcos, tablero_pc_disparos):
-    """Gestiona la secuencia de ataque del jugador y devuelve si hubo impacto."""
+def aplicar_disparo(tablero_barcos, tablero_disparos, fila, col, contadores=None):
+    """Aplica un disparo sin mostrar nada y devuelve un diccionario con el resultado:
+    {'resultado': 'agua' | 'tocado' | 'hundido', 'fila': fila, 'columna': col, 'impacto': bool}.
+    El disparo se anota en tablero_disparos (y el impacto también en tablero_barcos)."""
+    if tablero_barcos[fila][col] == BARCO:
+        tablero_disparos[fila][col] = TOCADO
+        tablero_barcos[fila][col] = TOCADO
+        if contadores is not None:
+            contadores["barcos_restantes"] -= 1
+            resultado, _ = contadores["barcos"].resolver_disparo(fila, col)
+        else:
+            resultado = "tocado"
+    else:
+        tablero_disparos[fila][col] = FALLADO
+        resultado = "agua"
+    return {"resultado": resultado, "fila": fila, "columna": col, "impacto": resultado != "agua"}
+
+def realizar_ataque(tablero_pc_barcos, tablero_pc_disparos, contadores_pc=None, diario=None):
+    """Gestiona la secuencia de ataque del jugador y devuelve si hubo impacto.
+    Con 'diario' (DiarioJugadas), el disparo se anota en el guardado automático."""
     print("\n--- INICIANDO ATAQUE DEL JUGADOR ---")
     
     f_disp, c_disp = pedir_disparo(tablero_pc_disparos)
     
-    impacto = False
-    if tablero_pc_barcos[f_disp][c_disp] == BARCO:
-        print("\n¡TOCADO! Excelente puntería.")
-        tablero_pc_disparos[f_disp][c_disp] = TOCADO
-        tablero_pc_barcos[f_disp][c_disp] = TOCADO
-        impacto = True
-    else:
-        print("\n¡AGUA! Has fallado el tiro.")
-        tablero_pc_disparos[f_disp][c_disp] = FALLADO
+    disparo = aplicar_disparo(tablero_pc_barcos, tablero_pc_disparos, f_disp, c_disp, contadores_pc)
+    if diario is not None: diario.anotar(JUGADA_JUGADOR, f_disp, c_disp)
+    if disparo["resultado"] == "hundido": print("\n¡TOCADO Y HUNDIDO! Has hundido un barco enemigo.")
+    elif disparo["resultado"] == "tocado": print("\n¡TOCADO! Excelente puntería.")
+    else: print("\n¡AGUA! Has fallado el tiro.")
         
-    time.sleep(1.5)
-    return impacto 
+    pausa(1.5)
+    return disparo["impacto"] 
 
 
 # -----------------------------------------------------------------
 ## 3. Lógica de la IA
 # -----------------------------------------------------------------
 
-def generar_disparo_ia(tablero_jugador_barcos):
-    """Genera coordenadas aleatorias, asegurando que no se dispare dos veces."""
-    while True:
-        fila = random.randint(0, DIMENSION - 1)
-        col = random.randint(0, DIMENSION - 1)
-        
-        if tablero_jugador_barcos[fila][col] not in [TOCADO, FALLADO]:
-            return fila, col
+def crear_pool_ia(tablero_jugador_barcos):
+    """Crea el pool de casillas a las que la IA aún no ha disparado (ver pool_casillas.py)."""
+    return pool_casillas.PoolCasillas.desde_tablero(tablero_jugador_barcos, libres=(AGUA, BARCO))
+
+def generar_disparo_ia(tablero_jugador_barcos, pool_ia=None, rng=None):
+    """Genera coordenadas aleatorias, asegurando que no se dispare dos veces.
+    Con el pool de casillas libres es un solo sorteo, sin reintentos (con el generador 'rng', si se da)."""
+    if pool_ia is None: pool_ia = crear_pool_ia(tablero_jugador_barcos)
+    return pool_ia.aleatoria(rng)
 
-def realizar_ataque_ia(tablero_jugador_barcos, tablero_jugador_disparos):
+def realizar_ataque_ia(tablero_jugador_barcos, tablero_jugador_disparos, contadores_jugador=None, pool_ia=None, diario=None, rng=None):
     """Lógica de un solo disparo de la IA y devuelve si hubo impacto."""
     
-    f_disp, c_disp = generar_disparo_ia(tablero_jugador_barcos)
-    coordenada_str = f"{NUMEROS_A_LETRAS[f_disp]}{c_disp}"
+    f_disp, c_disp = generar_disparo_ia(tablero_jugador_barcos, pool_ia, rng)
+    if pool_ia is not None: pool_ia.quitar(f_disp, c_disp)
+    coordenada_str = f"{coordenadas.letras_columna(f_disp)}{c_disp}"
     
     print(f"\nLa IA dispara a la coordenada: {coordenada_str}...")
-    time.sleep(1)
-
-    impacto = False
-    if tablero_jugador_barcos[f_disp][c_disp] == BARCO:
-        print("¡HAN DADO EN TU FLOTA! Tocado.")
-        tablero_jugador_barcos[f_disp][c_disp] = TOCADO 
-        impacto = True
-    else:
-        print("La IA ha disparado al agua. Falló.")
-        tablero_jugador_barcos[f_disp][c_disp] = FALLADO 
+    pausa(1)
+
+    # La IA anota sus disparos en el propio tablero de barcos del jugador
+    disparo = aplicar_disparo(tablero_jugador_barcos, tablero_jugador_barcos, f_disp, c_disp, contadores_jugador)
+    if diario is not None: diario.anotar(JUGADA_IA, f_disp, c_disp)
+    if disparo["resultado"] == "hundido": print("¡HAN HUNDIDO UNO DE TUS BARCOS!")
+    elif disparo["resultado"] == "tocado": print("¡HAN DADO EN TU FLOTA! Tocado.")
+    else: print("La IA ha disparado al agua. Falló.")
     
-    time.sleep(1.5)
-    return impacto
-
-def turno_ia(tablero_jugador_barcos, tablero_jugador_disparos, dificultad):
-    """Controla el número de disparos de la IA según la dificultad."""
-    print("\n--- TURNO DE LA IA ---")
+    pausa(1.5)
+    return disparo["impacto"]
+
+def turno_ia(tablero_jugador_barcos, tablero_jugador_disparos, dificultad, contadores_jugador=None, pool_ia=None, diario=None, rng=None, impacto_previo=None):
+    """Controla el número de disparos de la IA según la dificultad.
+    Con 'impacto_previo' (partida recuperada a mitad del turno de la IA) el primer disparo ya está hecho
+    y solo falta, si toca, el segundo."""
+    if impacto_previo is None:
+        print("\n--- TURNO DE LA IA ---")
+        # Primer ataque (siempre se ejecuta)
+        impacto_anterior = realizar_ataque_ia(tablero_jugador_barcos, tablero_jugador_disparos, contadores_jugador, pool_ia, diario, rng)
+    else:
+        impacto_anterior = impacto_previo
     
-    # Primer ataque (siempre se ejecuta)
-    impacto_anterior = realizar_ataque_ia(tablero_jugador_barcos, tablero_jugador_disparos)
+    # Si ya ha hundido toda la flota no hay segundo disparo
+    if verificar_victoria(tablero_jugador_barcos, contadores_jugador):
+        return
     
     # Manejar ataques adicionales
     if dificultad == "Medio" and impacto_anterior:
         print("\n--- ¡IMPACTO! La IA ataca de nuevo (Nivel Medio) ---")
-        realizar_ataque_ia(tablero_jugador_barcos, tablero_jugador_disparos)
+        realizar_ataque_ia(tablero_jugador_barcos, tablero_jugador_disparos, contadores_jugador, pool_ia, diario, rng)
         
     elif dificultad == "Dificil":
         print("\n--- La IA ataca de nuevo (Nivel Difícil) ---")
-        realizar_ataque_ia(tablero_jugador_barcos, tablero_jugador_disparos)
+        realizar_ataque_ia(tablero_jugador_barcos, tablero_jugador_disparos, contadores_jugador, pool_ia, diario, rng)
 
 
 # -----------------------------------------------------------------
-## 4. Funcionalidad de Guardado y Carga
+## 3b. Contadores de Victoria
 # -----------------------------------------------------------------
 
-def guardar_partida(tablero_pc_barcos, tablero_pc_disparos, tablero_jugador_barcos, tablero_jugador_disparos, nombre_archivo="partida_guardada.json"):
-    """Guarda el estado completo de la partida (4 tableros)."""
+def contar_barcos_restantes(tablero_barcos):
+    """Cuenta las casillas de barco que todavía no han sido tocadas (recorrido completo)."""
+    return sum(fila.count(BARCO) for fila in tablero_barcos)
+
+def crear_contadores(tablero_barcos, indice=None):
+    """Crea los contadores en vivo de un tablero; los ataques los actualizan en cada impacto.
+    'barcos' es el índice de barcos (IndiceBarcos) que dice al instante si un impacto hunde.
+    Sin índice se reconstruye del tablero, que solo es exacto si los barcos no se tocan."""
+    if indice is None:
+        indice = indice_barcos.IndiceBarcos.desde_tablero(tablero_barcos, barco=(BARCO, TOCADO), tocado=(TOCADO,))
+    return {"barcos_restantes": contar_barcos_restantes(tablero_barcos), "barcos": indice}
+
+def verificar_victoria(tablero_barcos, contadores=None):
+    """Devuelve True si no queda ninguna casilla de barco sin tocar (O(1) con contadores)."""
+    if contadores is None:
+        return contar_barcos_restantes(tablero_barcos) == 0
     
-    estado_partida = {
-        "tablero_pc_barcos": tablero_pc_barcos,
-        "tablero_pc_disparos": tablero_pc_disparos,
-        "tablero_jugador_barcos": tablero_jugador_barcos,
-        "tablero_jugador_disparos": tablero_jugador_disparos,
-    }
+    if DEPURAR_CONTADORES:
+        restantes = contar_barcos_restantes(tablero_barcos)
+        if restantes != contadores["barcos_restantes"]:
+            raise RuntimeError(f"Contador desincronizado: {contadores['barcos_restantes']} != {restantes}")
+    
+    return contadores["barcos_restantes"] == 0
+
+
+# -----------------------------------------------------------------
+## 4. Funcionalidad de Guardado y Carga
+# -----------------------------------------------------------------
+
+def guardar_partida(tablero_pc_barcos, tablero_pc_disparos, tablero_jugador_barcos, tablero_jugador_disparos, nombre_archivo=ARCHIVO_PARTIDA, indice_pc=None, indice_jugador=None):
+    """Guarda el estado completo de la partida (4 tableros y, si los hay, los índices de barcos)
+    en formato binario compacto. Se escribe en un archivo temporal que luego sustituye al
+    anterior, así que un corte a mitad de escritura no estropea la partida guardada."""
     
+    tableros = [tablero_pc_barcos, tablero_pc_disparos, tablero_jugador_barcos, tablero_jugador_disparos]
     try:
-        with open(nombre_archivo, 'w') as f:
-            json.dump(estado_partida, f, indent=4)
+        datos = partida_binaria.codificar_partida(tableros, [indice_pc, indice_jugador], SIMBOLOS)
+        partida_binaria.escribir_atomico(nombre_archivo, datos)
         print(f"\nPartida guardada con éxito en '{nombre_archivo}'.")
     except Exception as e:
         print(f"\nError al guardar la partida: {e}")
 
-def cargar_partida(nombre_archivo="partida_guardada.json"):
-    """Carga el estado completo de la partida desde un archivo JSON (4 tableros)."""
+def cargar_partida(nombre_archivo=ARCHIVO_PARTIDA):
+    """Carga el estado completo de la partida (4 tableros y 2 índices de barcos).
+    Lee tanto el formato binario como el JSON antiguo; si no hay partida binaria se prueba
+    con la antigua 'partida_guardada.json'.
+    Las partidas guardadas sin índices devuelven None en su lugar (se reconstruyen al jugar)."""
+    if nombre_archivo == ARCHIVO_PARTIDA and not os.path.exists(nombre_archivo) and os.path.exists(ARCHIVO_PARTIDA_JSON):
+        nombre_archivo = ARCHIVO_PARTIDA_JSON
     try:
-        with open(nombre_archivo, 'r') as f:
-            estado_partida = json.load(f)
+        with open(nombre_archivo, 'rb') as f:
+            datos = f.read()
+        
+        if partida_binaria.es_binario(datos):
+            tableros, (indice_pc, indice_jugador) = partida_binaria.decodificar_partida(datos, SIMBOLOS)
+        else:
+            # Formato antiguo: JSON con los tableros como listas
+            estado_partida = json.loads(datos.decode('utf-8'))
+            tableros = [estado_partida["tablero_pc_barcos"], estado_partida["tablero_pc_disparos"],
+                        estado_partida["tablero_jugador_barcos"], estado_partida["tablero_jugador_disparos"]]
+            indice_pc = estado_partida.get("indice_pc")
+            indice_jugador = estado_partida.get("indice_jugador")
+            if indice_pc is not None: indice_pc = indice_barcos.IndiceBarcos.desde_dict(indice_pc)
+            if indice_jugador is not None: indice_jugador = indice_barcos.IndiceBarcos.desde_dict(indice_jugador)
         
         print(f"\nPartida cargada desde '{nombre_archivo}'.")
         
-        return (estado_partida["tablero_pc_barcos"], 
-                estado_partida["tablero_pc_disparos"],
-                estado_partida["tablero_jugador_barcos"],
-                estado_partida["tablero_jugador_disparos"])
+        return (tableros[0], tableros[1], tableros[2], tableros[3], indice_pc, indice_jugador)
         
     except FileNotFoundError:
-        return None, None, None, None
+        return None, None, None, None, None, None
     except Exception as e:
         print(f"\nError al cargar la partida. El archivo podría estar corrupto: {e}")
-        return None, None, None, None
+        return None, None, None, None, None, None
+
+
+def guardar_en_almacen(almacen, jugador, tableros, indices, id_partida=None):
+    """Guarda la partida en el almacén de partidas (ver almacen_partidas.py), en una partida
+    nueva o sobrescribiendo 'id_partida'. Devuelve el id de la partida guardada."""
+    datos = partida_binaria.codificar_partida(tableros, indices, SIMBOLOS)
+    id_partida = almacen.guardar(jugador, almacen_partidas.JUEGO_FLOTA_TEO, datos, id_partida)
+    print(f"\nPartida guardada con éxito (partida nº {id_partida} de {jugador}).")
+    return id_partida
+
+def cargar_de_almacen(almacen, jugador, id_partida):
+    """Carga una partida del jugador del almacén: devuelve (4 tableros, 2 índices), o None si no existe, es de otro o está dañada."""
+    fila = almacen.cargar(id_partida, jugador)
+    if fila is None or fila[1] != almacen_partidas.JUEGO_FLOTA_TEO: return None
+    try:
+        return partida_binaria.decodificar_partida(fila[4], SIMBOLOS)
+    except ValueError as e:
+        print(f"\nError al cargar la partida: {e}")
+        return None
+
+def estado_para_diario(tableros, indices, dificultad="Medio", jugador=None, id_partida=None):
+    """Foto de la partida para el guardado automático: una línea JSON con la dificultad y dónde se guarda
+    la partida (jugador e id del almacén, o None si va al archivo de partida) y, detrás, el mismo formato
+    binario que guardar_partida."""
+    datos = {"dificultad": dificultad, "jugador": jugador, "id_partida": id_partida}
+    return json.dumps(datos).encode("utf-8") + b"\n" + partida_binaria.codificar_partida(tableros, indices, SIMBOLOS)
+
+def recuperar_del_diario(diario):
+    """Reconstruye la partida en curso con la última foto y los disparos anotados después.
+    Devuelve (4 tableros, 2 índices, turno de la IA pendiente, datos de la partida), o None si no hay partida
+    o la foto está dañada. Los datos son el diccionario de estado_para_diario (dificultad, jugador, id_partida).
+    El turno pendiente es None si le toca al jugador; si el programa se cerró después del disparo del jugador
+    y antes de que la IA terminase su turno, es la lista de impactos de los disparos que la IA ya hizo
+    ([] si no llegó a disparar), para terminar su turno al continuar (ver turno_ia)."""
+    try:
+        recuperada = diario.recuperar()
+        if recuperada is None: return None
+        estado, jugadas = recuperada
+        datos = {"dificultad": "Medio", "jugador": None, "id_partida": None}
+        if not partida_binaria.es_binario(estado):
+            cabecera, estado = estado.split(b"\n", 1)
+            datos.update(json.loads(cabecera.decode("utf-8")))
+        tableros, indices = partida_binaria.decodificar_partida(estado, SIMBOLOS)
+    except ValueError as e:
+        print(f"\nNo se pudo recuperar la partida: {e}")
+        return None
+    
+    pc_b, pc_d, jug_b, _ = tableros
+    contadores_pc = crear_contadores(pc_b, indices[0])
+    contadores_jugador = crear_contadores(jug_b, indices[1])
+    # La foto siempre se hace en el turno del jugador: el turno cambia con cada disparo anotado
+    disparos_ia = None
+    for accion, fila, col in jugadas:
+        if accion == JUGADA_JUGADOR:
+            aplicar_disparo(pc_b, pc_d, fila, col, contadores_pc)
+            disparos_ia = []
+        else:
+            disparo = aplicar_disparo(jug_b, jug_b, fila, col, contadores_jugador)
+            if disparos_ia is not None: disparos_ia.append(disparo["impacto"])
+    
+    # La IA dispara como mucho dos veces por turno, y no hay turno si alguien ya ha ganado
+    if disparos_ia is not None and (len(disparos_ia) >= 2 or verificar_victoria(pc_b, contadores_pc)
+                                    or verificar_victoria(jug_b, contadores_jugador)):
+        disparos_ia = None
+    return tableros, [contadores_pc["barcos"], contadores_jugador["barcos"]], disparos_ia, datos
 
 
 # -----------------------------------------------------------------
 ## 5. Función Controladora del Juego
 # -----------------------------------------------------------------
 
-def iniciar_juego(tablero_pc_barcos=None, tablero_pc_disparos=None, tablero_jugador_barcos=None, tablero_jugador_disparos=None, dificultad="Medio"):
+def iniciar_juego(tablero_pc_barcos=None, tablero_pc_disparos=None, tablero_jugador_barcos=None, tablero_jugador_disparos=None, dificultad="Medio", indice_pc=None, indice_jugador=None, almacen=None, jugador=None, id_partida=None, diario=None, rng=None, dimension=DIMENSION, flota=None, turno_ia_pendiente=None):
     """
     Configura y gestiona el bucle de la partida. 
-    Recibe los 4 tableros si se está cargando la partida, o los inicializa si es nueva.
+    Recibe los 4 tableros (y los índices de barcos, si se guardaron) si se está cargando la partida, o los inicializa si es nueva.
+    Con 'almacen' y 'jugador', la partida se guarda en el almacén de partidas (en 'id_partida' si ya estaba guardada)
+    en lugar de en el archivo de partida.
+    Con 'diario' (DiarioJugadas), cada disparo se guarda automáticamente y la partida se puede recuperar
+    si el programa se cierra de golpe.
+    'rng' es el generador de la partida (colocación de barcos y disparos de la IA); por defecto uno nuevo,
+    propio de esta partida.
+    'dimension' y 'flota' (longitudes de los barcos) solo se usan en partidas nuevas: las cargadas
+    tienen el tamaño de sus tableros. Sin flota se usa la de flota_para_dimension().
+    'turno_ia_pendiente' (ver recuperar_del_diario) hace que la IA termine su turno antes de volver al jugador.
     """
-    flota_estandar = [4, 3, 3, 2, 2]
+    if flota is None: flota = flota_para_dimension(dimension)
+    if rng is None: rng = random.Random()
 
     if tablero_pc_barcos is None:
         # Lógica de "Nueva Partida" (Crea los 4 tableros)
         print("\n>> Generando el campo de batalla...")
-        time.sleep(1)
+        pausa(1)
         
         # Tableros del PC
-        tablero_pc_barcos = crear_tablero(DIMENSION)     
-        tablero_pc_disparos = crear_tablero(DIMENSION)   
-        colocar_barcos_aleatorios(tablero_pc_barcos, flota_estandar)
+        tablero_pc_barcos = crear_tablero(dimension)     
+        tablero_pc_disparos = crear_tablero(dimension)   
+        indice_pc = indice_barcos.IndiceBarcos(dimension)
+        colocar_barcos_aleatorios(tablero_pc_barcos, flota, indice_pc, rng)
         
         # Tableros del Jugador
-        tablero_jugador_barcos = crear_tablero(DIMENSION) 
-        tablero_jugador_disparos = crear_tablero(DIMENSION) 
-        colocar_barcos_aleatorios(tablero_jugador_barcos, flota_estandar)
+        tablero_jugador_barcos = crear_tablero(dimension) 
+        tablero_jugador_disparos = crear_tablero(dimension) 
+        indice_jugador = indice_barcos.IndiceBarcos(dimension)
+        colocar_barcos_aleatorios(tablero_jugador_barcos, flota, indice_jugador, rng)
         
         print("\n--- ¡FLOTAS LISTAS! COMIENZA LA BATALLA ---")
     
@@ -246,6 +452,26 @@ def iniciar_juego(tablero_pc_barcos=None, tablero_pc_disparos=None, tablero_juga
         print("\n--- Partida cargada con éxito. Continuamos la batalla. ---")
         
     print(f"Dificultad de la IA: {dificultad}")
+    
+    # Contadores en vivo (también para partidas cargadas)
+    contadores_pc = crear_contadores(tablero_pc_barcos, indice_pc)
+    contadores_jugador = crear_contadores(tablero_jugador_barcos, indice_jugador)
+    
+    # Casillas a las que la IA aún no ha disparado (también para partidas cargadas)
+    pool_ia = crear_pool_ia(tablero_jugador_barcos)
+    
+    tableros = [tablero_pc_barcos, tablero_pc_disparos, tablero_jugador_barcos, tablero_jugador_disparos]
+    indices = [contadores_pc["barcos"], contadores_jugador["barcos"]]
+    if turno_ia_pendiente is not None:
+        # Partida recuperada a mitad del turno de la IA: lo termina antes de la foto nueva
+        print("\nLa IA no había terminado su turno.")
+        impacto_previo = turno_ia_pendiente[0] if turno_ia_pendiente else None
+        turno_ia(tablero_jugador_barcos, tablero_jugador_disparos, dificultad, contadores_jugador, pool_ia, None, rng, impacto_previo)
+        if verificar_victoria(tablero_jugador_barcos, contadores_jugador):
+            print("\n¡DERROTA! La IA ha hundido toda tu flota.")
+            if diario is not None: diario.terminar()
+            return
+    if diario is not None: diario.empezar(estado_para_diario(tableros, indices, dificultad, jugador, id_partida))
         
     # --- Bucle Principal de Partida con Submenú ---
     while True:
@@ -261,10 +487,22 @@ def iniciar_juego(tablero_pc_barcos=None, tablero_pc_disparos=None, tablero_juga
         eleccion = input("\n> Selecciona una opción: ").strip()
 
         if eleccion == '1':
-            realizar_ataque(tablero_pc_barcos, tablero_pc_disparos)
+            realizar_ataque(tablero_pc_barcos, tablero_pc_disparos, contadores_pc, diario)
+            if verificar_victoria(tablero_pc_barcos, contadores_pc):
+                print("\n¡VICTORIA! Has hundido toda la flota enemiga.")
+                if diario is not None: diario.terminar()
+                break
             
             # --- TURNO DE LA IA ---
-            turno_ia(tablero_jugador_barcos, tablero_jugador_disparos, dificultad)
+            turno_ia(tablero_jugador_barcos, tablero_jugador_disparos, dificultad, contadores_jugador, pool_ia, diario, rng)
+            if verificar_victoria(tablero_jugador_barcos, contadores_jugador):
+                print("\n¡DERROTA! La IA ha hundido toda tu flota.")
+                if diario is not None: diario.terminar()
+                break
+            
+            # Foto nueva cada cierto número de disparos para que el diario no crezca sin límite
+            if diario is not None and diario.pendientes >= diario.compactar_cada:
+                diario.compactar(estado_para_diario(tableros, indices, dificultad, jugador, id_partida))
             
         elif eleccion == '2': 
             print("\n   --- MI FLOTA ---")
@@ -277,12 +515,19 @@ def iniciar_juego(tablero_pc_barcos=None, tablero_pc_disparos=None, tablero_juga
             input("\nPresiona ENTER para volver al menú de partida...")
             
         elif eleccion == '4': 
-            guardar_partida(tablero_pc_barcos, tablero_pc_disparos, tablero_jugador_barcos, tablero_jugador_disparos)
+            if almacen is not None:
+                guardar_en_almacen(almacen, jugador, [tablero_pc_barcos, tablero_pc_disparos, tablero_jugador_barcos, tablero_jugador_disparos],
+                                   [contadores_pc["barcos"], contadores_jugador["barcos"]], id_partida)
+            else:
+                guardar_partida(tablero_pc_barcos, tablero_pc_disparos, tablero_jugador_barcos, tablero_jugador_disparos,
+                                indice_pc=contadores_pc["barcos"], indice_jugador=contadores_jugador["barcos"])
+            # Ya está guardada a mano: no hace falta recuperarla al volver a abrir el juego
+            if diario is not None: diario.terminar()
             break 
         
         else:
             print("\nOpción no válida. Inténtalo de nuevo.")
-            time.sleep(1)
+            pausa(1)
 
 # -----------------------------------------------------------------
 ## 6. Lógica del Menú Principal (Función de Inicio)
@@ -292,28 +537,51 @@ def mostrar_menu_principal():
     """Muestra el menú principal y gestiona las opciones de inicio/carga."""
     
     dificultad_actual = "Medio" # Por defecto
+    dimension_actual = DIMENSION
+    diario = diario_jugadas.DiarioJugadas(BASE_DIARIO, SINCRONIZAR_DIARIO)
+    
+    # Si el programa se cerró a mitad de partida, se ofrece recuperarla
+    if diario.hay_partida():
+        respuesta = input("\nSe encontró una partida sin terminar. ¿Quieres recuperarla? (S/N): ").strip().upper()
+        recuperada = recuperar_del_diario(diario) if respuesta == 'S' else None
+        if recuperada is not None:
+            tableros, (ind_pc, ind_jug), pendiente, datos = recuperada
+            # Con la dificultad de la partida y, si era del almacén, en su misma ranura
+            dificultad_actual = datos["dificultad"]
+            if datos["jugador"] is not None:
+                with almacen_partidas.AlmacenPartidas() as almacen:
+                    iniciar_juego(*tableros, dificultad=dificultad_actual, indice_pc=ind_pc, indice_jugador=ind_jug,
+                                  almacen=almacen, jugador=datos["jugador"], id_partida=datos["id_partida"],
+                                  diario=diario, turno_ia_pendiente=pendiente)
+            else:
+                iniciar_juego(*tableros, dificultad=dificultad_actual, indice_pc=ind_pc, indice_jugador=ind_jug, diario=diario,
+                              turno_ia_pendiente=pendiente)
+        else:
+            diario.terminar()
     
     while True:
         print("\n" + "#" * 30)
         print("####### HUNDIR LA FLOTA #######")
         print("#" * 30)
         print("\nSelecciona una opción:")
-        print(" [1] Nueva Partida (Dificultad: " + dificultad_actual + ")")
+        print(" [1] Nueva Partida (Dificultad: " + dificultad_actual + f", Tablero: {dimension_actual}x{dimension_actual})")
         print(" [2] Cargar Partida")
         print(" [3] Cambiar Dificultad")
-        print(" [4] Salir")
+        print(" [4] Mis Partidas (varias por jugador)")
+        print(" [5] Cambiar Tamaño del Tablero")
+        print(" [6] Salir")
         
         eleccion = input("\n> Opción: ").strip()
 
         if eleccion == '1':
             # Inicia una nueva partida (todos los tableros son None)
-            iniciar_juego(dificultad=dificultad_actual)
+            iniciar_juego(dificultad=dificultad_actual, diario=diario, dimension=dimension_actual)
         
         elif eleccion == '2':
             # Intenta cargar la partida
-            pc_b, pc_d, jug_b, jug_d = cargar_partida()
+            pc_b, pc_d, jug_b, jug_d, ind_pc, ind_jug = cargar_partida()
             if pc_b is not None:
-                iniciar_juego(pc_b, pc_d, jug_b, jug_d, dificultad=dificultad_actual)
+                iniciar_juego(pc_b, pc_d, jug_b, jug_d, dificultad=dificultad_actual, indice_pc=ind_pc, indice_jugador=ind_jug, diario=diario)
             else:
                 print("\nNo se pudo cargar la partida o no existe el archivo.")
         
@@ -321,11 +589,46 @@ def mostrar_menu_principal():
             dificultad_actual = elegir_dificultad()
         
         elif eleccion == '4':
+            menu_mis_partidas(dificultad_actual, diario, dimension_actual)
+        
+        elif eleccion == '5':
+            dimension_actual = elegir_dimension(dimension_actual)
+        
+        elif eleccion == '6':
             print("\n¡Gracias por jugar! ¡Hasta la próxima!")
+            diario.cerrar()
             break
         
         else:
-            print("\nOpción no válida. Por favor, selecciona 1, 2, 3 o 4.")
+            print("\nOpción no válida. Por favor, selecciona 1, 2, 3, 4, 5 o 6.")
+
+def menu_mis_partidas(dificultad, diario=None, dimension=DIMENSION):
+    """Partidas guardadas de un jugador en el almacén de partidas: continuar una o empezar otra."""
+    jugador = input("\n> Tu nombre de jugador: ").strip()
+    if not jugador:
+        print("\nNecesitas un nombre para guardar tus partidas.")
+        return
+    
+    with almacen_partidas.AlmacenPartidas() as almacen:
+        partidas = almacen.listar(jugador, almacen_partidas.JUEGO_FLOTA_TEO)
+        print(f"\n--- PARTIDAS DE {jugador.upper()} ---")
+        if not partidas: print(" (no tienes partidas guardadas)")
+        for numero, (id_partida, _, _, actualizada) in enumerate(partidas, 1):
+            print(f" [{numero}] Partida nº {id_partida} - guardada el {time.strftime('%d/%m/%Y %H:%M', time.localtime(actualizada))}")
+        print(" [N] Nueva partida")
+        
+        eleccion = input("\n> Elige una partida (Enter para volver): ").strip().upper()
+        if eleccion == 'N':
+            iniciar_juego(dificultad=dificultad, almacen=almacen, jugador=jugador, diario=diario, dimension=dimension)
+        elif eleccion.isdigit() and 1 <= int(eleccion) <= len(partidas):
+            id_partida = partidas[int(eleccion) - 1][0]
+            cargada = cargar_de_almacen(almacen, jugador, id_partida)
+            if cargada is None:
+                print("\nNo se pudo cargar la partida.")
+                return
+            tableros, (ind_pc, ind_jug) = cargada
+            iniciar_juego(*tableros, dificultad=dificultad, indice_pc=ind_pc, indice_jugador=ind_jug,
+                          almacen=almacen, jugador=jugador, id_partida=id_partida, diario=diario)
 
 def elegir_dificultad():
     """Permite al usuario elegir la dificultad de la IA."""
@@ -342,6 +645,17 @@ def elegir_dificultad():
         elif d == '3': return "Dificil"
         else: print("\nOpción no válida.")
 
+def elegir_dimension(actual=DIMENSION):
+    """Permite al usuario elegir el lado del tablero; la flota crece con el tablero (ver flota_para_dimension)."""
+    while True:
+        d = input(f"\n> Lado del tablero ({DIMENSION_MINIMA}-{DIMENSION_MAXIMA}, Enter para dejar {actual}): ").strip()
+        if not d: return actual
+        if d.isdigit() and DIMENSION_MINIMA <= int(d) <= DIMENSION_MAXIMA:
+            dimension = int(d)
+            print(f"\nTablero de {dimension}x{dimension} con {len(flota_para_dimension(dimension))} barcos por bando.")
+            return dimension
+        print("\nTamaño no válido.")
+
 # -----------------------------------------------------------------
 ## 7. LLAMADA DE INICIO DEL PROGRAMA
 # -----------------------------------------------------------------
@@ -8,41 +8,75 @@ Este módulo implementa el juego del Buscaminas con tres niveles de dificultad:
 - Difícil: 30 filas × 16 columnas con 99 minas
 
 Funcionalidades principales:
-- Colocación aleatoria de minas
+- Colocación aleatoria de minas (el primer clic nunca es mina)
 - Cálculo automático de minas vecinas
 - Expansión automática cuando se encuentra un 0
 - Sistema de banderas para marcar minas sospechosas
 - Detección de victoria/derrota
+- Modo sin adivinar (ver generador_sin_adivinar.py)
+- Guardado automático jugada a jugada: si el programa se cierra a mitad
+  de partida, se puede continuar al volver a jugar (ver diario_jugadas.py)
+- Varias partidas guardadas por jugador, para continuarlas cuando se
+  quiera (ver almacen_partidas.py)
 
 Autor: Proyecto Grupal ASIR - Python
 Fecha: Diciembre 2025
 """
 
 import random
-import os
+import sqlite3
+import time
+
+import renderizado
+import tablero_compacto
+from compartido import almacen_partidas, coordenadas, diario_jugadas
+
+
+# Modo depuración: si es True, cada comprobación de victoria basada en
+# contadores se contrasta con un recorrido completo del tablero.
+DEPURAR_CONTADORES = False
+
+# Guardado automático de la partida en curso (ver diario_jugadas.py)
+BASE_DIARIO = "buscaminas_en_curso"
+SINCRONIZAR_DIARIO = 'lote'
+
+# Grabación de la última partida jugada (ver repeticion.py)
+ARCHIVO_REPETICION = "ultima_partida_buscaminas.json"
+
+# Niveles de dificultad: nombre -> (filas, columnas, minas)
+NIVELES = {
+    'facil': (8, 10, 10),
+    'intermedio': (16, 16, 40),
+    'dificil': (30, 16, 99),
+}
 
 
 def limpiar_pantalla():
     """
     Limpia la pantalla de la terminal para mejorar la visualización.
-    Funciona en Windows (cls) y Linux/Mac (clear).
+    En Linux/Mac usa una secuencia ANSI en lugar de lanzar 'clear' (ver renderizado.py).
     """
-    os.system('cls' if os.name == 'nt' else 'clear')
+    renderizado.limpiar_pantalla()
 
 
-def crear_tablero(filas, columnas):
+def crear_tablero(filas, columnas, compacto=False):
     """
     Crea dos tableros vacíos: uno para el estado real y otro para lo que ve el jugador.
     
     Args:
         filas (int): Número de filas del tablero
         columnas (int): Número de columnas del tablero
+        compacto (bool): Si True, usa TableroCompacto (1 byte por casilla) en lugar de listas
     
     Returns:
         tuple: (tablero_real, tablero_visible)
             - tablero_real: Contiene las minas ('*') y números
             - tablero_visible: Lo que el jugador ve ('#' = oculto, número/bandera visible)
     """
+    if compacto:
+        return (tablero_compacto.TableroCompacto(filas, columnas, 0),
+                tablero_compacto.TableroCompacto(filas, columnas, '#'))
+    
     # Tablero real: inicializado con 0 en todas las posiciones
     tablero_real = [[0 for _ in range(columnas)] for _ in range(filas)]
     
@@ -52,27 +86,106 @@ def crear_tablero(filas, columnas):
     return tablero_real, tablero_visible
 
 
-def colocar_minas(tablero_real, num_minas):
+def elegir_posiciones(total, cantidad, excluidas=(), rng=None):
+    """
+    Elige 'cantidad' posiciones distintas de 0 a total-1 sin reintentos.
+    
+    Es un Fisher-Yates parcial "virtual": en vez de crear la lista de todas
+    las posiciones, solo se guardan en un diccionario las que se han
+    intercambiado. Primero las posiciones excluidas se mueven al final y
+    después se sortean las 'cantidad' primeras. El coste es
+    O(cantidad + excluidas), sea cual sea la densidad de minas.
+    
+    Args:
+        total (int): Número total de posiciones
+        cantidad (int): Cuántas posiciones elegir
+        excluidas (iterable): Posiciones que no se pueden elegir
+        rng (random.Random): Generador aleatorio; por defecto el módulo random
+    
+    Returns:
+        list: Posiciones elegidas (enteros), en orden aleatorio
+    
+    Raises:
+        ValueError: Si no hay suficientes posiciones disponibles
+    """
+    if rng is None:
+        rng = random
+    
+    excluidas = set(excluidas)
+    disponibles = total - len(excluidas)
+    if cantidad < 0 or cantidad > disponibles:
+        raise ValueError(f"No se pueden elegir {cantidad} posiciones entre {disponibles} disponibles.")
+    
+    # Las excluidas que quedan delante se cambian por las libres del final
+    excluidas_delante = [p for p in excluidas if p < disponibles]
+    libres_detras = [p for p in range(disponibles, total) if p not in excluidas]
+    cambios = dict(zip(excluidas_delante, libres_detras))
+    
+    # Fisher-Yates parcial sobre las 'disponibles' primeras posiciones
+    elegidas = []
+    for i in range(cantidad):
+        j = rng.randrange(i, disponibles)
+        elegidas.append(cambios.get(j, j))
+        cambios[j] = cambios.get(i, i)
+    
+    return elegidas
+
+
+def colocar_minas(tablero_real, num_minas, excluir=None, rng=None):
     """
     Coloca las minas de forma aleatoria en el tablero sin repetir posiciones.
     
+    Las posiciones se sortean sin reemplazo (ver elegir_posiciones), así que
+    no hay reintentos aunque el tablero esté casi lleno de minas.
+    
     Args:
         tablero_real (list): El tablero donde se colocarán las minas
         num_minas (int): Cantidad de minas a colocar
+        excluir (iterable): Casillas (fila, columna) donde no puede haber mina, opcional
+        rng (random.Random): Generador aleatorio (para tableros reproducibles), opcional
+    
+    Raises:
+        ValueError: Si las minas no caben fuera de la zona excluida
     """
     filas = len(tablero_real)
     columnas = len(tablero_real[0])
-    minas_colocadas = 0
     
-    while minas_colocadas < num_minas:
-        # Generar posición aleatoria
-        fila = random.randint(0, filas - 1)
-        columna = random.randint(0, columnas - 1)
-        
-        # Si la posición no tiene mina, colocar una
-        if tablero_real[fila][columna] != '*':
-            tablero_real[fila][columna] = '*'
-            minas_colocadas += 1
+    # Trabajar con posiciones lineales: fila * columnas + columna
+    excluidas = [f * columnas + c for f, c in (excluir or ())
+                 if 0 <= f < filas and 0 <= c < columnas]
+    
+    for posicion in elegir_posiciones(filas * columnas, num_minas, excluidas, rng):
+        fila, columna = divmod(posicion, columnas)
+        tablero_real[fila][columna] = '*'
+
+
+def zona_primer_clic(tablero_real, fila, columna, num_minas):
+    """
+    Calcula la zona sin minas alrededor del primer clic.
+    
+    Normalmente es la casilla y sus 8 vecinas, para que el primer clic abra
+    un área. Si con tantas minas no cabe, se protege solo la casilla pulsada.
+    
+    Args:
+        tablero_real (list): Tablero (todavía sin minas)
+        fila (int): Fila del primer clic
+        columna (int): Columna del primer clic
+        num_minas (int): Cantidad de minas que se van a colocar
+    
+    Returns:
+        list: Casillas (fila, columna) que deben quedar sin mina
+    """
+    filas = len(tablero_real)
+    columnas = len(tablero_real[0])
+    
+    zona = [(f, c)
+            for f in range(max(0, fila - 1), min(filas, fila + 2))
+            for c in range(max(0, columna - 1), min(columnas, columna + 2))]
+    
+    if num_minas > filas * columnas - len(zona):
+        return [(fila, columna)]
+    
+    return zona
 
 
 def calcular_vecinos(tablero_real):
@@ -114,51 +227,128 @@ def calcular_vecinos(tablero_real):
                 tablero_real[fila][columna] = minas_vecinas
 
 
-def mostrar_tablero(tablero_visible, mostrar_coordenadas=True):
+def formatear_fila(valores):
     """
-    Muestra el tablero en la terminal de forma visual y clara.
+    Convierte los valores de una fila visible en texto ('.' para los ceros).
+    """
+    return " ".join('.' if casilla == 0 else str(casilla) for casilla in valores)
+
+
+def formatear_tablero(tablero_visible, mostrar_coordenadas=True, cache=None):
+    """
+    Construye las líneas de texto del tablero sin escribirlas en pantalla.
     
     Args:
         tablero_visible (list): El tablero que ve el jugador
         mostrar_coordenadas (bool): Si mostrar las letras de columnas y números de filas
+        cache (renderizado.CacheFilas): Si se indica, solo se vuelven a formatear
+                                        las filas que han cambiado
+    
+    Returns:
+        list: Líneas del tablero (sin saltos de línea)
     """
-    filas = len(tablero_visible)
-    columnas = len(tablero_visible[0])
+    lineas = []
     
-    # Mostrar letras de columnas (A, B, C, ...)
+    # Letras de columnas (A, B, C, ...)
     if mostrar_coordenadas:
-        print("\n    ", end="")
-        for i in range(columnas):
-            # Usar letras A-Z, luego AA, AB, etc. si hay más de 26 columnas
-            if i < 26:
-                print(chr(65 + i), end=" ")
-            else:
-                print(chr(65 + i // 26 - 1) + chr(65 + i % 26), end="")
-        print()
+        columnas = len(tablero_visible[0])
+        lineas.append("    " + " ".join(coordenadas.letras_columna(i) for i in range(columnas)))
     
-    # Mostrar cada fila con su número
+    # Cada fila con su número
     for i, fila in enumerate(tablero_visible):
+        if cache is not None:
+            texto = cache.obtener(i, fila, formatear_fila)
+        else:
+            texto = formatear_fila(fila)
         if mostrar_coordenadas:
-            print(f"{i + 1:3} ", end="")  # Número de fila alineado a la derecha
+            texto = f"{i + 1:3} {texto}"  # Número de fila alineado a la derecha
+        lineas.append(texto)
+    
+    return lineas
+
+
+def mostrar_tablero(tablero_visible, mostrar_coordenadas=True):
+    """
+    Muestra el tablero en la terminal de forma visual y clara.
+    Todo el tablero se escribe de una vez, no casilla a casilla.
+    
+    Args:
+        tablero_visible (list): El tablero que ve el jugador
+        mostrar_coordenadas (bool): Si mostrar las letras de columnas y números de filas
+    """
+    lineas = formatear_tablero(tablero_visible, mostrar_coordenadas)
+    print("\n" + "\n".join(lineas) + "\n")
+
+
+def revelar_area(tablero_real, tablero_visible, fila, columna):
+    """
+    Motor de revelado iterativo: revela una casilla y, si es 0, expande el área.
+    
+    En lugar de llamarse a sí misma una vez por vecino, usa una pila explícita.
+    Cada casilla se marca como revelada en el momento de apilarla, así que
+    nunca entra dos veces en la pila y el coste es lineal en el área abierta.
+    Al no usar recursión, no hay límite de profundidad: sirve para tableros
+    de millones de casillas.
+    
+    Args:
+        tablero_real (list): Tablero con las minas y números
+        tablero_visible (list): Tablero que ve el jugador
+        fila (int): Fila de la casilla a revelar
+        columna (int): Columna de la casilla a revelar
+    
+    Returns:
+        list: Casillas (fila, columna) reveladas en esta jugada, en orden.
+              Vacía si la casilla está fuera del tablero, ya revelada o con bandera.
+    """
+    filas = len(tablero_real)
+    columnas = len(tablero_real[0])
+    
+    # Verificar límites y que la casilla siga oculta
+    if fila < 0 or fila >= filas or columna < 0 or columna >= columnas:
+        return []
+    if tablero_visible[fila][columna] != '#':
+        return []
+    
+    # Revelar la casilla inicial
+    valor = tablero_real[fila][columna]
+    tablero_visible[fila][columna] = valor
+    reveladas = [(fila, columna)]
+    
+    # Si es mina o un número, no hay nada que expandir
+    if valor != 0:
+        return reveladas
+    
+    # Pila de ceros pendientes de expandir
+    pila = [(fila, columna)]
+    
+    while pila:
+        f, c = pila.pop()
         
-        for casilla in fila:
-            # Colorear o formatear según el contenido
-            if casilla == '#':
-                print('#', end=" ")  # Casilla oculta
-            elif casilla == 'F':
-                print('F', end=" ")  # Bandera
-            elif casilla == 0:
-                print('.', end=" ")  # Casilla vacía (sin minas vecinas)
-            else:
-                print(casilla, end=" ")  # Número de minas vecinas
-        print()
-    print()
+        # Recorrer las 8 vecinas (limitadas al tablero)
+        for nf in range(max(0, f - 1), min(filas, f + 2)):
+            fila_visible = tablero_visible[nf]
+            fila_real = tablero_real[nf]
+            for nc in range(max(0, c - 1), min(columnas, c + 2)):
+                # Solo casillas ocultas (las banderas se respetan)
+                if fila_visible[nc] != '#':
+                    continue
+                
+                # Revelar la vecina; alrededor de un 0 nunca hay minas
+                valor = fila_real[nc]
+                fila_visible[nc] = valor
+                reveladas.append((nf, nc))
+                
+                # Si la vecina también es 0, se expandirá más adelante
+                if valor == 0:
+                    pila.append((nf, nc))
+    
+    return reveladas
 
 
-def revelar_casilla(tablero_real, tablero_visible, fila, columna):
+def revelar_casilla(tablero_real, tablero_visible, fila, columna, contadores=None):
     """
     Revela una casilla. Si es 0, expande automáticamente a las casillas vecinas.
-    Esta función usa recursividad para la expansión automática.
+    La expansión la hace revelar_area() con una pila explícita (sin recursión).
     
     IMPORTANTE: Cuando se expande un área de ceros, también se revelan las casillas
     con números (1-8) que están en el borde de esa expansión. Esto es fundamental
@@ -169,47 +359,24 @@ def revelar_casilla(tablero_real, tablero_visible, fila, columna):
         tablero_visible (list): Tablero que ve el jugador
         fila (int): Fila de la casilla a revelar
         columna (int): Columna de la casilla a revelar
+        contadores (dict): Contadores de la partida (ver crear_contadores), opcional
     
     Returns:
         bool: True si pisó una mina, False si es seguro
     """
-    # Verificar límites del tablero
-    if fila < 0 or fila >= len(tablero_real) or columna < 0 or columna >= len(tablero_real[0]):
-        return False
-    
-    # Si ya está revelada o tiene bandera, no hacer nada
-    if tablero_visible[fila][columna] != '#':
-        return False
+    reveladas = revelar_area(tablero_real, tablero_visible, fila, columna)
     
-    # Revelar la casilla actual
-    tablero_visible[fila][columna] = tablero_real[fila][columna]
+    # Solo se puede pisar una mina en la casilla elegida (nunca al expandir)
+    piso_mina = bool(reveladas) and tablero_real[fila][columna] == '*'
     
-    # Si es mina, retornar True (perdió)
-    if tablero_real[fila][columna] == '*':
-        return True
+    # Todas las casillas reveladas sin pisar mina son seguras
+    if contadores is not None and not piso_mina:
+        contadores['seguras_ocultas'] -= len(reveladas)
     
-    # Si es 0, expandir automáticamente a TODAS las casillas vecinas
-    # Esto revelará tanto los ceros como los números (1-8) en el borde
-    if tablero_real[fila][columna] == 0:
-        direcciones = [
-            (-1, -1), (-1, 0), (-1, 1),  # Arriba-izq, arriba, arriba-der
-            (0, -1),           (0, 1),    # Izquierda, derecha
-            (1, -1),  (1, 0),  (1, 1)     # Abajo-izq, abajo, abajo-der
-        ]
-        
-        for df, dc in direcciones:
-            nueva_fila = fila + df
-            nueva_columna = columna + dc
-            
-            # Recursión: revelar todas las casillas vecinas
-            # Si la vecina es 0, continuará expandiendo
-            # Si la vecina es un número (1-8), se revelará pero no expandirá más
-            revelar_casilla(tablero_real, tablero_visible, nueva_fila, nueva_columna)
-    
-    return False
+    return piso_mina
 
 
-def marcar_bandera(tablero_visible, fila, columna):
+def marcar_bandera(tablero_visible, fila, columna, contadores=None):
     """
     Marca o desmarca una bandera en una casilla.
     Las banderas se usan para indicar dónde el jugador cree que hay una mina.
@@ -218,6 +385,7 @@ def marcar_bandera(tablero_visible, fila, columna):
         tablero_visible (list): Tablero visible del jugador
         fila (int): Fila de la casilla
         columna (int): Columna de la casilla
+        contadores (dict): Contadores de la partida (ver crear_contadores), opcional
     
     Returns:
         bool: True si se pudo marcar/desmarcar, False si no
@@ -225,58 +393,92 @@ def marcar_bandera(tablero_visible, fila, columna):
     # Solo se puede marcar/desmarcar casillas ocultas o con bandera
     if tablero_visible[fila][columna] == '#':
         tablero_visible[fila][columna] = 'F'
+        if contadores is not None:
+            contadores['banderas'] += 1
         return True
     elif tablero_visible[fila][columna] == 'F':
         tablero_visible[fila][columna] = '#'
+        if contadores is not None:
+            contadores['banderas'] -= 1
         return True
     
     return False
 
 
-def verificar_victoria(tablero_real, tablero_visible):
+def contar_seguras_ocultas(tablero_real, tablero_visible):
     """
-    Verifica si el jugador ha ganado.
-    Gana cuando todas las casillas sin minas están reveladas.
+    Cuenta las casillas sin mina que el jugador todavía no ha revelado.
+    Una casilla con bandera sigue sin revelar, aunque no tenga mina.
     
     Args:
         tablero_real (list): Tablero con minas y números
         tablero_visible (list): Tablero que ve el jugador
     
     Returns:
-        bool: True si ganó, False si no
+        int: Número de casillas seguras ocultas
     """
-    filas = len(tablero_real)
-    columnas = len(tablero_real[0])
+    ocultas = 0
     
-    for fila in range(filas):
-        for columna in range(columnas):
-            # Si hay una casilla sin mina que no está revelada, no ha ganado
-            if tablero_real[fila][columna] != '*' and tablero_visible[fila][columna] == '#':
-                return False
+    for fila_real, fila_visible in zip(tablero_real, tablero_visible):
+        for real, visible in zip(fila_real, fila_visible):
+            if real != '*' and visible in ('#', 'F'):
+                ocultas += 1
     
-    return True
+    return ocultas
 
 
-def convertir_coordenada_columna(letra):
+def crear_contadores(tablero_real, tablero_visible):
     """
-    Convierte una letra de columna (A, B, C...) a índice numérico (0, 1, 2...).
+    Crea los contadores en vivo de una partida, con un único recorrido del tablero.
+    
+    A partir de aquí revelar_casilla() y marcar_bandera() los actualizan en cada
+    jugada, de modo que verificar_victoria() no tiene que recorrer el tablero.
+    Se deben crear después de colocar las minas.
     
     Args:
-        letra (str): Letra o letras de la columna (ej: 'A', 'B', 'AA')
+        tablero_real (list): Tablero con minas y números
+        tablero_visible (list): Tablero que ve el jugador
     
     Returns:
-        int: Índice de columna o -1 si es inválido
+        dict: {'seguras_ocultas': int, 'banderas': int}
     """
-    letra = letra.upper()
+    banderas = sum(fila.count('F') for fila in tablero_visible)
     
-    # Si es una sola letra (A-Z)
-    if len(letra) == 1:
-        return ord(letra) - ord('A')
-    # Si son dos letras (AA, AB, etc.)
-    elif len(letra) == 2:
-        return (ord(letra[0]) - ord('A') + 1) * 26 + (ord(letra[1]) - ord('A'))
+    return {
+        'seguras_ocultas': contar_seguras_ocultas(tablero_real, tablero_visible),
+        'banderas': banderas,
+    }
+
+
+def verificar_victoria(tablero_real, tablero_visible, contadores=None):
+    """
+    Verifica si el jugador ha ganado.
+    Gana cuando todas las casillas sin minas están reveladas.
+    
+    Con contadores la comprobación es inmediata (O(1)); sin ellos se recorre
+    todo el tablero. Si DEPURAR_CONTADORES está activo, se hacen las dos cosas
+    y se comprueba que coinciden.
+    
+    Args:
+        tablero_real (list): Tablero con minas y números
+        tablero_visible (list): Tablero que ve el jugador
+        contadores (dict): Contadores de la partida (ver crear_contadores), opcional
     
-    return -1
+    Returns:
+        bool: True si ganó, False si no
+    """
+    if contadores is None:
+        return contar_seguras_ocultas(tablero_real, tablero_visible) == 0
+    
+    if DEPURAR_CONTADORES:
+        ocultas = contar_seguras_ocultas(tablero_real, tablero_visible)
+        if ocultas != contadores['seguras_ocultas']:
+            raise RuntimeError(
+                f"Contador desincronizado: seguras_ocultas={contadores['seguras_ocultas']}, "
+                f"recorrido completo={ocultas}"
+            )
+    
+    return contadores['seguras_ocultas'] == 0
 
 
 def revelar_todo(tablero_real, tablero_visible):
@@ -300,7 +502,8 @@ def menu_dificultad():
     Muestra el menú de selección de dificultad y retorna la configuración elegida.
     
     Returns:
-        tuple: (filas, columnas, minas) o None si cancela
+        tuple: (filas, columnas, minas), 'guardada' para continuar una
+               partida guardada o None si cancela
     """
     while True:
         limpiar_pantalla()
@@ -310,82 +513,295 @@ def menu_dificultad():
         print("\n1. Fácil      (8 × 10 con 10 minas)")
         print("2. Intermedio (16 × 16 con 40 minas)")
         print("3. Difícil    (30 × 16 con 99 minas)")
-        print("4. Volver al menú principal")
+        print("4. Continuar una partida guardada")
+        print("5. Volver al menú principal")
         print("=" * 50)
         
-        opcion = input("\nElige tu nivel de dificultad (1-4): ").strip()
+        opcion = input("\nElige tu nivel de dificultad (1-5): ").strip()
         
         if opcion == '1':
-            return (8, 10, 10)
+            return NIVELES['facil']
         elif opcion == '2':
-            return (16, 16, 40)
+            return NIVELES['intermedio']
         elif opcion == '3':
-            return (30, 16, 99)
+            return NIVELES['dificil']
         elif opcion == '4':
+            return 'guardada'
+        elif opcion == '5':
             return None
         else:
             print("\n❌ Opción inválida. Presiona Enter para intentar de nuevo...")
             input()
 
 
-def jugar_buscaminas():
+def nueva_partida(config=None):
     """
-    Función principal del juego Buscaminas.
-    Controla todo el flujo del juego desde la selección de dificultad hasta el final.
+    Pide la dificultad (y si el tablero es sin adivinar) y crea la partida.
+    
+    Args:
+        config (tuple): (filas, columnas, minas) ya elegidos; si no, se preguntan
+    
+    Returns:
+        PartidaBuscaminas: La partida nueva, o None si el jugador vuelve al menú
     """
-    # Seleccionar dificultad
-    config = menu_dificultad()
+    # Importación aquí porque motor_buscaminas, repeticion y tablero_numpy importan este módulo
+    import motor_buscaminas
+    import repeticion
+    import tablero_numpy
     
+    # Seleccionar dificultad
     if config is None:
-        return  # Volver al menú principal
+        config = menu_dificultad()
+    
+    if config is None or config == 'guardada':
+        return None
     
     filas, columnas, num_minas = config
     
-    # Crear el tablero
-    tablero_real, tablero_visible = crear_tablero(filas, columnas)
+    # Crear la partida (las minas se colocan tras el primer clic, con la
+    # semilla de la partida para poder reproducirla). Con NumPy instalado los
+    # tableros van en arrays; si no, en las listas de siempre
+    partida = motor_buscaminas.PartidaBuscaminas(filas, columnas, num_minas, semilla=repeticion.nueva_semilla(),
+                                                 usar_numpy=tablero_numpy.disponible())
+    
+    # Modo sin adivinar: el tablero se resuelve solo con lógica desde una casilla
+    # de inicio, que se revela al empezar
+    respuesta = input("\n¿Tablero sin adivinar (sin 50/50)? (S/N): ").strip().upper()
+    if respuesta == 'S':
+        # Importación aquí porque generador_sin_adivinar importa este módulo
+        import generador_sin_adivinar
+        print("Preparando tablero...")
+        generado = generador_sin_adivinar.obtener_tablero(filas, columnas, num_minas)
+        if generado is None:
+            print("\n❌ No se encontró ningún tablero. Se jugará uno normal.")
+            input("Presiona Enter para continuar...")
+        else:
+            tablero_real, tablero_visible, (fila_inicio, columna_inicio) = generado
+            partida = motor_buscaminas.PartidaBuscaminas.desde_tableros(tablero_real, tablero_visible,
+                                                                         num_minas)
+            partida.revelar(fila_inicio, columna_inicio)
+    return partida
+
+
+def recuperar_partida(diario):
+    """
+    Reconstruye la partida en curso con la última foto del diario y las
+    jugadas anotadas después.
     
-    # Colocar minas
-    colocar_minas(tablero_real, num_minas)
+    Args:
+        diario (DiarioJugadas): Diario de la partida
     
-    # Calcular números de vecinos
-    calcular_vecinos(tablero_real)
+    Returns:
+        PartidaBuscaminas: La partida, o None si no hay o está dañada
+    """
+    # Importación aquí porque motor_buscaminas y repeticion importan este módulo
+    import motor_buscaminas
+    import repeticion
     
-    # Variables del juego
-    juego_activo = True
+    try:
+        recuperada = diario.recuperar()
+        if recuperada is None:
+            return None
+        estado, jugadas = recuperada
+        # La foto no guarda la semilla; solo importa si las minas aún no están colocadas
+        partida = motor_buscaminas.PartidaBuscaminas.desde_bytes(estado, repeticion.nueva_semilla())
+    except ValueError as error:
+        print(f"\n❌ No se pudo recuperar la partida: {error}")
+        return None
+    
+    # Las jugadas del diario no colocan minas: la foto se hace justo
+    # después del primer clic, cuando ya están colocadas
+    for accion, fila, columna in jugadas:
+        partida.aplicar(accion, fila, columna)
+    return partida
+
+
+def cargar_partida_guardada(ruta_almacen=almacen_partidas.RUTA_ALMACEN):
+    """
+    Deja elegir una de las partidas de Buscaminas que el jugador guardó en
+    el almacén de partidas y la carga.
+    
+    Args:
+        ruta_almacen (str): Base de datos del almacén
+    
+    Returns:
+        tuple: (partida, (jugador, id_partida)), o None si no hay ninguna o vuelve
+    """
+    # Importación aquí porque motor_buscaminas y repeticion importan este módulo
+    import motor_buscaminas
+    import repeticion
+    
+    jugador = input("\nTu nombre de jugador: ").strip()
+    if not jugador:
+        return None
+    
+    with almacen_partidas.AlmacenPartidas(ruta_almacen) as almacen:
+        partidas = almacen.listar(jugador, almacen_partidas.JUEGO_BUSCAMINAS)
+        if not partidas:
+            print(f"\n{jugador} no tiene partidas de Buscaminas guardadas.")
+            input("Presiona Enter para continuar...")
+            return None
+        print()
+        for numero, (id_partida, _, _, actualizada) in enumerate(partidas, 1):
+            print(f"{numero}. Partida nº {id_partida} - guardada el "
+                  f"{time.strftime('%d/%m/%Y %H:%M', time.localtime(actualizada))}")
+        eleccion = input("\nElige una partida (Enter para volver): ").strip()
+        if not (eleccion.isdigit() and 1 <= int(eleccion) <= len(partidas)):
+            return None
+        id_partida = partidas[int(eleccion) - 1][0]
+        fila = almacen.cargar(id_partida, jugador)
+    
+    try:
+        if fila is None:
+            raise ValueError("ya no existe")
+        # No guarda la semilla; solo importa si las minas aún no están colocadas
+        partida = motor_buscaminas.PartidaBuscaminas.desde_bytes(fila[4], repeticion.nueva_semilla())
+        if partida.terminada:
+            raise ValueError("ya está terminada")
+    except ValueError as error:
+        print(f"\n❌ No se pudo cargar la partida: {error}")
+        input("Presiona Enter para continuar...")
+        return None
+    return partida, (jugador, id_partida)
+
+
+def guardar_partida(partida, guardada=None, ruta_almacen=almacen_partidas.RUTA_ALMACEN):
+    """
+    Guarda la partida en el almacén de partidas, sobrescribiendo la que se
+    guardó antes en esta misma partida (o la que se cargó).
+    
+    Args:
+        partida (PartidaBuscaminas): Partida en curso
+        guardada (tuple): (jugador, id_partida) de la última vez, o None
+        ruta_almacen (str): Base de datos del almacén
+    
+    Returns:
+        tuple: (jugador, id_partida) guardada; si no se pudo, la 'guardada' de antes
+    """
+    if guardada is not None:
+        jugador, id_partida = guardada
+    else:
+        jugador, id_partida = input("\nTu nombre de jugador: ").strip(), None
+        if not jugador:
+            print("\n❌ Necesitas un nombre para guardar tus partidas.")
+            return guardada
+    
+    try:
+        with almacen_partidas.AlmacenPartidas(ruta_almacen) as almacen:
+            datos = partida.a_bytes()
+            nuevo_id = almacen.guardar(jugador, almacen_partidas.JUEGO_BUSCAMINAS, datos, id_partida)
+            if nuevo_id is None:
+                # Se borró mientras tanto: se guarda como partida nueva
+                nuevo_id = almacen.guardar(jugador, almacen_partidas.JUEGO_BUSCAMINAS, datos)
+    except sqlite3.Error as error:
+        print(f"\n❌ No se pudo guardar la partida: {error}")
+        return guardada
+    print(f"\n✓ Partida guardada (partida nº {nuevo_id} de {jugador}).")
+    return jugador, nuevo_id
+
+
+def jugar_buscaminas(base_diario=BASE_DIARIO, ruta_almacen=almacen_partidas.RUTA_ALMACEN):
+    """
+    Función principal del juego Buscaminas.
+    Controla todo el flujo del juego desde la selección de dificultad hasta el final.
+    
+    Solo se encarga de menús, pantallas y entrada del jugador; el estado de
+    la partida y las reglas están en motor_buscaminas.PartidaBuscaminas.
+    
+    Args:
+        base_diario (str): Archivos del guardado automático (sin extensión);
+                           None para jugar sin guardado automático
+        ruta_almacen (str): Base de datos donde se guardan las partidas con G
+    """
+    # Importación aquí porque repeticion importa este módulo
+    import repeticion
+    
+    # ¿Quedó una partida a medias la última vez?
+    partida = None
+    diario = None
+    if base_diario is not None:
+        diario = diario_jugadas.DiarioJugadas(base_diario, SINCRONIZAR_DIARIO)
+        if diario.hay_partida():
+            respuesta = input("\nHay una partida de Buscaminas sin terminar. ¿Continuarla? (S/N): ").strip().upper()
+            if respuesta == 'S':
+                partida = recuperar_partida(diario)
+            if partida is None or partida.terminada:
+                partida = None
+                diario.terminar()
+    
+    # Partida del almacén que se está jugando: (jugador, id_partida)
+    guardada = None
+    
+    if partida is None:
+        config = menu_dificultad()
+        if config == 'guardada':
+            cargada = cargar_partida_guardada(ruta_almacen)
+            partida, guardada = cargada if cargada is not None else (None, None)
+        else:
+            partida = nueva_partida(config)
+        if partida is None:
+            return  # Volver al menú principal
+        if diario is not None:
+            diario.empezar(partida.a_bytes())
+    
+    filas, columnas, num_minas = partida.filas, partida.columnas, partida.num_minas
+    
+    # Semilla, tablero inicial y jugadas, para reproducir la partida con repeticion.py
+    grabacion = repeticion.Grabacion.de_buscaminas(partida)
+    
+    # Pantalla del juego: solo se reescriben las filas que cambian
+    renderizador = renderizado.Renderizador()
+    cache_filas = renderizado.CacheFilas()
     
     # Bucle principal del juego
-    while juego_activo:
-        limpiar_pantalla()
-        
-        print("=" * 50)
-        print("                   BUSCAMINAS")
-        print("=" * 50)
-        print(f"Tablero: {filas}×{columnas} | Minas: {num_minas}")
-        print("=" * 50)
-        print("\nLeyenda:")
-        print("  # = Casilla oculta")
-        print("  F = Bandera (mina sospechosa)")
-        print("  . = Casilla vacia (0 minas vecinas)")
-        print("  1-8 = Numero de minas vecinas")
-        print("=" * 50)
+    while not partida.terminada:
+        lineas = [
+            "=" * 50,
+            "                   BUSCAMINAS",
+            "=" * 50,
+            f"Tablero: {filas}×{columnas} | Minas: {num_minas} | Banderas: {partida.contadores['banderas']}",
+            "=" * 50,
+            "",
+            "Leyenda:",
+            "  # = Casilla oculta",
+            "  F = Bandera (mina sospechosa)",
+            "  . = Casilla vacia (0 minas vecinas)",
+            "  1-8 = Numero de minas vecinas",
+            "=" * 50,
+            "",
+        ]
         
-        # Mostrar tablero
-        mostrar_tablero(tablero_visible)
+        # Tablero
+        lineas.extend(formatear_tablero(partida.tablero_visible, cache=cache_filas))
         
-        print("\nOpciones:")
-        print("  R = Revelar casilla  |  F = Marcar/desmarcar bandera  |  S = Salir")
-        print("=" * 50)
+        lineas.extend([
+            "",
+            "",
+            "Opciones:",
+            "  R = Revelar casilla  |  F = Marcar/desmarcar bandera",
+            "  G = Guardar partida  |  S = Salir",
+            "=" * 50,
+        ])
+        renderizador.dibujar(lineas)
         
         # Pedir acción al jugador
-        accion = input("\n¿Qué quieres hacer? (R/F/S): ").strip().upper()
+        accion = input("\n¿Qué quieres hacer? (R/F/G/S): ").strip().upper()
+        
+        if accion == 'G':
+            guardada = guardar_partida(partida, guardada, ruta_almacen)
+            input("Presiona Enter para continuar...")
+            continue
         
         if accion == 'S':
             print("\nSaliendo del juego...")
+            if diario is not None:
+                diario.cerrar()
+                print("La partida queda guardada: podrás continuarla la próxima vez.")
             input("Presiona Enter para continuar...")
             break
         
         if accion not in ['R', 'F']:
-            print("\n❌ Acción inválida. Usa R (revelar), F (bandera) o S (salir).")
+            print("\n❌ Acción inválida. Usa R (revelar), F (bandera), G (guardar) o S (salir).")
             input("Presiona Enter para continuar...")
             continue
         
@@ -394,12 +810,12 @@ def jugar_buscaminas():
             columna_input = input("Columna (letra, ej: A): ").strip()
             fila_input = input("Fila (número, ej: 1): ").strip()
             
-            columna = convertir_coordenada_columna(columna_input)
+            columna = coordenadas.indice_columna(columna_input)
             fila = int(fila_input) - 1  # Convertir a índice (comenzando en 0)
             
             # Verificar que las coordenadas sean válidas
-            if columna < 0 or columna >= columnas or fila < 0 or fila >= filas:
-                print(f"\n❌ Coordenadas fuera del tablero. Debe ser entre A-{chr(65 + columnas - 1)} y 1-{filas}.")
+            if columna is None or not partida.dentro(fila, columna):
+                print(f"\n❌ Coordenadas fuera del tablero. Debe ser entre A-{coordenadas.letras_columna(columnas - 1)} y 1-{filas}.")
                 input("Presiona Enter para continuar...")
                 continue
             
@@ -408,44 +824,65 @@ def jugar_buscaminas():
             input("Presiona Enter para continuar...")
             continue
         
-        # Ejecutar la acción
-        if accion == 'R':
-            # Revelar casilla
-            piso_mina = revelar_casilla(tablero_real, tablero_visible, fila, columna)
-            
-            if piso_mina:
-                # Perdió - revelar todo el tablero
-                limpiar_pantalla()
-                print("=" * 50)
-                print("                *** BOOM ***")
-                print("=" * 50)
-                print("\nPisaste una mina! Has perdido.")
-                print("\nTablero completo:")
-                revelar_todo(tablero_real, tablero_visible)
-                mostrar_tablero(tablero_visible)
-                print("=" * 50)
-                input("\nPresiona Enter para volver al menú principal...")
-                juego_activo = False
-            else:
-                # Verificar victoria
-                if verificar_victoria(tablero_real, tablero_visible):
-                    limpiar_pantalla()
-                    print("=" * 50)
-                    print("              *** VICTORIA ***")
-                    print("=" * 50)
-                    print("\nFelicidades! Has descubierto todas las casillas seguras.")
-                    print("\nTablero completo:")
-                    revelar_todo(tablero_real, tablero_visible)
-                    mostrar_tablero(tablero_visible)
-                    print("=" * 50)
-                    input("\nPresiona Enter para volver al menú principal...")
-                    juego_activo = False
+        # Ejecutar la acción (en el primer clic el motor coloca las minas
+        # lejos de la casilla elegida)
+        minas_colocadas = partida.minas_colocadas
+        resultado = partida.aplicar(accion, fila, columna)['resultado']
+        if resultado != 'invalida':
+            grabacion.anotar(accion, fila, columna)
         
-        elif accion == 'F':
-            # Marcar/desmarcar bandera
-            if not marcar_bandera(tablero_visible, fila, columna):
-                print("\n[X] No puedes poner una bandera en una casilla ya revelada.")
-                input("Presiona Enter para continuar...")
+        # Guardado automático: partida terminada -> nada que recuperar;
+        # primer clic -> foto con las minas ya colocadas; si no, se anota la jugada
+        if diario is not None:
+            if partida.terminada:
+                diario.terminar()
+            elif not minas_colocadas and partida.minas_colocadas:
+                diario.compactar(partida.a_bytes())
+            elif diario.anotar(accion, fila, columna):
+                diario.compactar(partida.a_bytes())
+        
+        if resultado == 'mina':
+            # Perdió - revelar todo el tablero
+            limpiar_pantalla()
+            print("=" * 50)
+            print("                *** BOOM ***")
+            print("=" * 50)
+            print("\nPisaste una mina! Has perdido.")
+            print("\nTablero completo:")
+            revelar_todo(partida.tablero_real, partida.tablero_visible)
+            mostrar_tablero(partida.tablero_visible)
+            print("=" * 50)
+            input("\nPresiona Enter para volver al menú principal...")
+        
+        elif resultado == 'victoria':
+            limpiar_pantalla()
+            print("=" * 50)
+            print("              *** VICTORIA ***")
+            print("=" * 50)
+            print("\nFelicidades! Has descubierto todas las casillas seguras.")
+            print("\nTablero completo:")
+            revelar_todo(partida.tablero_real, partida.tablero_visible)
+            mostrar_tablero(partida.tablero_visible)
+            print("=" * 50)
+            input("\nPresiona Enter para volver al menú principal...")
+        
+        elif accion == 'F' and resultado == 'invalida':
+            print("\n[X] No puedes poner una bandera en una casilla ya revelada.")
+            input("Presiona Enter para continuar...")
+    
+    # Una partida guardada que ya ha terminado no se puede continuar
+    if partida.terminada and guardada is not None:
+        try:
+            with almacen_partidas.AlmacenPartidas(ruta_almacen) as almacen:
+                almacen.borrar(guardada[1], guardada[0])
+        except sqlite3.Error as error:
+            print(f"\n❌ No se pudo borrar la partida guardada: {error}")
+    
+    # Guardar la partida para poder verla después con repeticion.py
+    try:
+        grabacion.guardar(ARCHIVO_REPETICION)
+    except OSError as error:
+        print(f"\n❌ No se pudo guardar la repetición: {error}")
 
 
 # Punto de entrada para pruebas del módulo
@@ -0,0 +1,373 @@
+"""
+BUSCAMINAS INFINITO - Modo sin fin por chunks
+=============================================
+
+Un Buscaminas con las mismas reglas que buscaminas.py pero sobre un tablero
+sin bordes. El mundo se divide en chunks (bloques) de TAMANO_CHUNK ×
+TAMANO_CHUNK casillas:
+
+- Las minas de cada chunk se obtienen de forma determinista a partir de la
+  semilla del mundo y las coordenadas del chunk, así que no hace falta
+  guardarlas: se generan solo cuando una jugada o la vista las necesita.
+- Los chunks generados (minas y números) viven en una caché LRU de tamaño
+  fijo. Los que salen de la vista se descartan y se vuelven a generar
+  idénticos si hacen falta.
+- Del estado de las casillas (oculta/revelada/bandera) solo se guarda lo
+  que no está oculto: los chunks con pocas casillas abiertas o con bandera
+  usan un dict {posición: estado}, los que tienen muchas un bytearray de 1
+  byte por casilla, y los que vuelven a estar del todo ocultos se borran.
+  La memoria crece con lo que ha jugado el jugador, no con los chunks que
+  ha visitado.
+
+Los números de los bordes de un chunk se calculan con las minas de los
+chunks vecinos y la expansión de ceros cruza de un chunk a otro, así que
+no se nota dónde termina cada uno.
+
+Coordenadas: (fila, columna) enteras, positivas o negativas. La partida
+empieza en (0, 0), que siempre es un 0 (su zona 3×3 nunca tiene minas).
+
+Uso:
+    python buscaminas_infinito.py
+
+Autor: Proyecto Grupal ASIR - Python
+"""
+
+import random
+from collections import OrderedDict
+
+import buscaminas
+
+
+# Lado de un chunk en casillas
+TAMANO_CHUNK = 16
+
+# Proporción de minas de cada chunk
+DENSIDAD_MINAS = 0.16
+
+# Chunks generados que se mantienen en memoria (caché LRU)
+MAX_CHUNKS_EN_CACHE = 256
+
+# Máximo de casillas que puede abrir un solo clic; los ceros que quedan por
+# expandir se guardan y la expansión sigue en el siguiente clic
+LIMITE_EXPANSION = 100000
+
+# Casillas no ocultas a partir de las cuales un chunk guarda su estado en un
+# bytearray en lugar de un dict
+UMBRAL_DENSO = 32
+
+# Estados de una casilla en el bytearray de su chunk
+OCULTA = 0
+REVELADA = 1
+BANDERA = 2
+
+# Valor de una mina en los datos de un chunk (0-8 son los números)
+MINA = 9
+
+
+class MundoInfinito:
+    """
+    Mundo infinito de Buscaminas generado por chunks bajo demanda.
+
+    Atributos:
+        semilla: Semilla del mundo
+        estados (dict): (cf, cc) -> estado de las casillas no ocultas del chunk:
+                        dict {posición: estado} o bytearray con todas
+        pendientes (list): Ceros revelados cuyas vecinas aún no se han
+                           expandido (la expansión llegó a LIMITE_EXPANSION)
+        reveladas (int): Casillas seguras reveladas (la puntuación)
+        perdida (bool): True si se ha pisado una mina
+    """
+
+    def __init__(self, semilla=None, densidad=DENSIDAD_MINAS, tamano_chunk=TAMANO_CHUNK,
+                 max_chunks=MAX_CHUNKS_EN_CACHE):
+        self.semilla = semilla if semilla is not None else random.randrange(2 ** 32)
+        self.densidad = densidad
+        self.tamano = tamano_chunk
+        self.max_chunks = max_chunks
+        self.minas_por_chunk = round(densidad * tamano_chunk * tamano_chunk)
+
+        # Cachés LRU: minas de cada chunk y datos (minas + números) de cada chunk
+        self.cache_minas = OrderedDict()
+        self.cache_datos = OrderedDict()
+
+        self.estados = {}
+        self.pendientes = []
+        self.reveladas = 0
+        self.perdida = False
+
+    # --- Generación de chunks ---
+
+    def minas_chunk(self, cf, cc):
+        """
+        Devuelve el conjunto de posiciones locales (fila * tamaño + columna) con mina.
+        Siempre es el mismo para la misma semilla y chunk.
+        """
+        clave = (cf, cc)
+        minas = self.cache_minas.get(clave)
+        if minas is not None:
+            self.cache_minas.move_to_end(clave)
+            return minas
+
+        # Semilla propia del chunk, derivada de la del mundo y sus coordenadas
+        rng = random.Random(f"{self.semilla}:{cf}:{cc}")
+        area = self.tamano * self.tamano
+        excluidas = []
+        if (cf, cc) in ((0, 0), (0, -1), (-1, 0), (-1, -1)):
+            # Zona de inicio: la casilla (0, 0) y sus vecinas nunca tienen mina
+            excluidas = [p for p in range(area)
+                         if max(abs(cf * self.tamano + p // self.tamano),
+                                abs(cc * self.tamano + p % self.tamano)) <= 1]
+        minas = frozenset(buscaminas.elegir_posiciones(area, self.minas_por_chunk, excluidas, rng))
+
+        self.cache_minas[clave] = minas
+        if len(self.cache_minas) > self.max_chunks * 4:
+            self.cache_minas.popitem(last=False)
+        return minas
+
+    def datos_chunk(self, cf, cc):
+        """
+        Devuelve los valores de todas las casillas del chunk: 0-8 o MINA.
+        Los números del borde cuentan las minas de los 8 chunks vecinos.
+
+        Returns:
+            bytes: tamaño × tamaño valores, fila a fila
+        """
+        clave = (cf, cc)
+        datos = self.cache_datos.get(clave)
+        if datos is not None:
+            self.cache_datos.move_to_end(clave)
+            return datos
+
+        t = self.tamano
+        # Minas del bloque 3×3 de chunks en coordenadas relativas al chunk central
+        minas = set()
+        for df in (-1, 0, 1):
+            for dc in (-1, 0, 1):
+                for p in self.minas_chunk(cf + df, cc + dc):
+                    f, c = divmod(p, t)
+                    minas.add((f + df * t, c + dc * t))
+
+        valores = bytearray(t * t)
+        for f in range(t):
+            for c in range(t):
+                if (f, c) in minas:
+                    valores[f * t + c] = MINA
+                else:
+                    valores[f * t + c] = sum((f + df, c + dc) in minas
+                                             for df in (-1, 0, 1) for dc in (-1, 0, 1))
+        datos = bytes(valores)
+
+        self.cache_datos[clave] = datos
+        if len(self.cache_datos) > self.max_chunks:
+            self.cache_datos.popitem(last=False)
+        return datos
+
+    # --- Acceso a casillas ---
+
+    def valor(self, fila, columna):
+        """
+        Valor real de una casilla: '*' o el número de minas vecinas.
+        """
+        cf, f = divmod(fila, self.tamano)
+        cc, c = divmod(columna, self.tamano)
+        v = self.datos_chunk(cf, cc)[f * self.tamano + c]
+        return '*' if v == MINA else v
+
+    def estado(self, fila, columna):
+        cf, f = divmod(fila, self.tamano)
+        cc, c = divmod(columna, self.tamano)
+        estados = self.estados.get((cf, cc))
+        if estados is None:
+            return OCULTA
+        if isinstance(estados, dict):
+            return estados.get(f * self.tamano + c, OCULTA)
+        return estados[f * self.tamano + c]
+
+    def cambiar_estado(self, fila, columna, estado):
+        """
+        Cambia el estado de una casilla, pasando el chunk de dict a bytearray
+        (o al revés) según cuántas casillas no ocultas tenga.
+        """
+        cf, f = divmod(fila, self.tamano)
+        cc, c = divmod(columna, self.tamano)
+        clave = (cf, cc)
+        posicion = f * self.tamano + c
+        estados = self.estados.get(clave)
+
+        if estados is None:
+            if estado != OCULTA:
+                self.estados[clave] = {posicion: estado}
+            return
+
+        if isinstance(estados, dict):
+            if estado == OCULTA:
+                estados.pop(posicion, None)
+                if not estados:
+                    del self.estados[clave]
+                return
+            estados[posicion] = estado
+            if len(estados) >= UMBRAL_DENSO:
+                denso = bytearray(self.tamano * self.tamano)
+                for p, e in estados.items():
+                    denso[p] = e
+                self.estados[clave] = denso
+            return
+
+        estados[posicion] = estado
+        if estado == OCULTA:
+            # Solo se oculta al quitar una bandera: puede que el chunk vuelva a ser disperso
+            no_ocultas = len(estados) - estados.count(OCULTA)
+            if no_ocultas == 0:
+                del self.estados[clave]
+            elif no_ocultas < UMBRAL_DENSO // 2:
+                self.estados[clave] = {p: e for p, e in enumerate(estados) if e != OCULTA}
+
+    def visible(self, fila, columna):
+        """
+        Lo que ve el jugador en una casilla, con los mismos símbolos que buscaminas.py.
+        """
+        estado = self.estado(fila, columna)
+        if estado == OCULTA:
+            return '#'
+        if estado == BANDERA:
+            return 'F'
+        return self.valor(fila, columna)
+
+    # --- Acciones del jugador ---
+
+    def revelar(self, fila, columna):
+        """
+        Revela una casilla y expande los ceros con una pila, cruzando chunks.
+        Si un clic anterior llegó a LIMITE_EXPANSION, su expansión sigue
+        ahora (después de la de la casilla nueva).
+
+        Returns:
+            list: Casillas reveladas; si la primera es una mina, la partida está perdida
+        """
+        if self.perdida:
+            return []
+
+        reveladas = []
+        if self.estado(fila, columna) == OCULTA:
+            self.cambiar_estado(fila, columna, REVELADA)
+            reveladas.append((fila, columna))
+            valor = self.valor(fila, columna)
+            if valor == '*':
+                self.perdida = True
+                return reveladas
+            if valor == 0:
+                self.pendientes.append((fila, columna))
+
+        # La pila sigue guardada entre clics: si se corta por el límite, los
+        # ceros que quedan en ella se expanden en el siguiente
+        pila = self.pendientes
+        while pila and len(reveladas) < LIMITE_EXPANSION:
+            f, c = pila.pop()
+            for nf in (f - 1, f, f + 1):
+                for nc in (c - 1, c, c + 1):
+                    if self.estado(nf, nc) != OCULTA:
+                        continue
+                    self.cambiar_estado(nf, nc, REVELADA)
+                    reveladas.append((nf, nc))
+                    if self.valor(nf, nc) == 0:
+                        pila.append((nf, nc))
+
+        self.reveladas += len(reveladas)
+        return reveladas
+
+    def marcar(self, fila, columna):
+        """
+        Marca o desmarca una bandera.
+
+        Returns:
+            bool: True si se pudo marcar/desmarcar, False si la casilla está revelada
+        """
+        estado = self.estado(fila, columna)
+        if estado == REVELADA:
+            return False
+        self.cambiar_estado(fila, columna, OCULTA if estado == BANDERA else BANDERA)
+        return True
+
+    def vista(self, fila, columna, alto, ancho):
+        """
+        Devuelve la zona visible del mundo como matriz de valores visibles.
+
+        Args:
+            fila, columna (int): Esquina superior izquierda de la vista
+            alto, ancho (int): Tamaño de la vista en casillas
+
+        Returns:
+            list: Lista de filas con '#', 'F', '*' o números
+        """
+        return [[self.visible(f, c) for c in range(columna, columna + ancho)]
+                for f in range(fila, fila + alto)]
+
+
+def mostrar_vista(mundo, fila, columna, alto, ancho):
+    """
+    Muestra la vista con coordenadas absolutas: filas a la izquierda y el
+    último dígito de cada columna arriba.
+    """
+    cabecera = " ".join(str(abs(c) % 10) for c in range(columna, columna + ancho))
+    print(f"\n       {cabecera}")
+    for i, fila_vista in enumerate(mundo.vista(fila, columna, alto, ancho)):
+        casillas = " ".join('.' if v == 0 else str(v) for v in fila_vista)
+        print(f"{fila + i:6} {casillas}")
+    print()
+
+
+def jugar_infinito(semilla=None, alto=16, ancho=30):
+    """
+    Bucle de juego en la terminal del modo infinito.
+
+    Comandos:
+        R fila columna  -> revelar
+        F fila columna  -> bandera
+        W/A/S/D         -> mover la vista
+        Q               -> salir
+    """
+    mundo = MundoInfinito(semilla)
+    fila_vista, columna_vista = -alto // 2, -ancho // 2
+    paso = 8
+
+    while True:
+        buscaminas.limpiar_pantalla()
+        print("=" * 50)
+        print("             BUSCAMINAS INFINITO")
+        print("=" * 50)
+        print(f"Semilla: {mundo.semilla} | Casillas reveladas: {mundo.reveladas}")
+        if mundo.pendientes:
+            print("La última expansión no ha terminado: sigue con el próximo R.")
+        mostrar_vista(mundo, fila_vista, columna_vista, alto, ancho)
+
+        if mundo.perdida:
+            print("*** BOOM *** Pisaste una mina.")
+            print(f"Puntuación final: {mundo.reveladas} casillas reveladas.")
+            input("\nPresiona Enter para salir...")
+            return
+
+        print("Comandos: R fila columna | F fila columna | W/A/S/D mover | Q salir")
+        partes = input("> ").strip().upper().split()
+        if not partes:
+            continue
+
+        comando = partes[0]
+        if comando == 'Q':
+            return
+        if comando in ('W', 'A', 'S', 'D'):
+            fila_vista += {'W': -paso, 'S': paso}.get(comando, 0)
+            columna_vista += {'A': -paso, 'D': paso}.get(comando, 0)
+            continue
+        if comando in ('R', 'F') and len(partes) == 3:
+            try:
+                fila, columna = int(partes[1]), int(partes[2])
+            except ValueError:
+                continue
+            if comando == 'R':
+                mundo.revelar(fila, columna)
+            else:
+                mundo.marcar(fila, columna)
+
+
+if __name__ == "__main__":
+    jugar_infinito()
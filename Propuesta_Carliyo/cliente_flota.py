@@ -0,0 +1,139 @@
+"""
+CLIENTE DE HUNDIR LA FLOTA - Jugar en el servidor desde la terminal
+===================================================================
+
+Se conecta a servidor_flota.py, envía las órdenes que escribe el jugador
+y muestra los mensajes del servidor a medida que llegan (también los
+disparos del rival mientras se espera).
+
+Atajos: escribir solo una casilla (p. ej. "B7") equivale a "DISPARO B7".
+Cuando es tu turno se piden y se muestran tus tableros automáticamente.
+
+Uso:
+    python cliente_flota.py [host] [puerto]
+
+Autor: Proyecto Grupal ASIR - Python
+"""
+
+import asyncio
+import json
+import sys
+
+import hundir_flota
+import servidor_flota
+
+
+AYUDA = """Órdenes:
+  PVC [nivel]   Jugar contra la IA (facil, intermedio, dificil, probabilistico, experto)
+  PVP [id]      Jugar contra otra persona (sin id: la primera partida que espere rival)
+  BARCO A1 H    Colocar el siguiente barco  |  ALEATORIA  Colocar al azar los que falten
+  A5            Disparar a A5               |  TABLERO    Ver tus tableros
+  SALIR"""
+
+RESULTADOS = {'agua': "[~] AGUA", 'tocado': "[X] TOCADO", 'hundido': "[XXX] HUNDIDO"}
+
+
+def mostrar_mensaje(mensaje):
+    """
+    Escribe un mensaje del servidor en la terminal.
+
+    Returns:
+        bool: True si conviene pedir los tableros (es nuestro turno)
+    """
+    tipo = mensaje['tipo']
+    if tipo == 'bienvenida':
+        print("Conectado al servidor de Hundir la Flota.\n" + AYUDA)
+    elif tipo == 'partida':
+        print(f"\nPartida {mensaje['id']} ({mensaje['modo'].upper()}). Coloca tu flota: BARCO A1 H o ALEATORIA.")
+    elif tipo == 'esperando':
+        print("Esperando a un rival...")
+    elif tipo == 'rival_conectado':
+        print("¡Rival conectado!")
+    elif tipo == 'colocado':
+        if mensaje['pendientes']:
+            siguiente = hundir_flota.FLOTA[-mensaje['pendientes']]
+            print(f"✓ Barco colocado. Siguiente: {siguiente[0]} ({siguiente[1]} casillas)")
+        else:
+            print("✓ Flota lista.")
+    elif tipo == 'empieza':
+        print("\n*** EMPIEZA LA BATALLA ***")
+        return mensaje['tu_turno']
+    elif tipo in ('disparo', 'disparo_rival'):
+        quien = "Tu disparo" if tipo == 'disparo' else "Disparo del rival"
+        barco = f" ({mensaje['barco']})" if mensaje['barco'] else ""
+        print(f"{quien} en {mensaje['casilla']}: {RESULTADOS[mensaje['resultado']]}{barco}")
+        return mensaje['tu_turno']
+    elif tipo == 'fin':
+        print("\n*** HAS GANADO! ***" if mensaje['ganador'] else "\n*** HAS PERDIDO ***")
+        print("Escribe PVC o PVP para jugar otra partida, o SALIR.")
+    elif tipo == 'tablero':
+        hundir_flota.mostrar_tableros(mensaje['barcos'], mensaje['disparos'], "Tú")
+        print("Tu turno: escribe la casilla a la que disparas (p. ej. A5).")
+    elif tipo == 'rival_desconectado':
+        print("\nTu rival se ha desconectado. Escribe PVC o PVP para jugar otra partida.")
+    elif tipo == 'error':
+        print(f"❌ {mensaje['mensaje']}")
+    else:
+        print(mensaje)
+    return False
+
+
+def orden_de_entrada(linea):
+    """
+    Traduce lo que escribe el jugador a una orden del protocolo.
+    """
+    linea = linea.strip()
+    fila, _ = servidor_flota.leer_casilla(linea) if ' ' not in linea else (None, None)
+    if fila is not None:
+        return f"DISPARO {linea}"
+    return linea
+
+
+async def recibir(reader, writer):
+    """
+    Muestra los mensajes del servidor según llegan.
+    """
+    while True:
+        linea = await reader.readline()
+        if not linea:
+            print("\nEl servidor ha cerrado la conexión.")
+            return
+        if mostrar_mensaje(json.loads(linea)):
+            writer.write(b"TABLERO\n")
+
+
+async def jugar(host, puerto):
+    reader, writer = await asyncio.open_connection(host, puerto)
+    receptor = asyncio.ensure_future(recibir(reader, writer))
+    loop = asyncio.get_running_loop()
+    try:
+        while not receptor.done():
+            # input() bloquea, así que se lee en un hilo aparte
+            linea = await loop.run_in_executor(None, sys.stdin.readline)
+            if not linea:
+                break
+            orden = orden_de_entrada(linea)
+            if not orden:
+                continue
+            writer.write(orden.encode() + b"\n")
+            await writer.drain()
+            if orden.upper() == 'SALIR':
+                break
+    finally:
+        receptor.cancel()
+        writer.close()
+
+
+def main():
+    host = sys.argv[1] if len(sys.argv) > 1 else servidor_flota.HOST
+    puerto = int(sys.argv[2]) if len(sys.argv) > 2 else servidor_flota.PUERTO
+    try:
+        asyncio.run(jugar(host, puerto))
+    except ConnectionRefusedError:
+        print(f"No se pudo conectar a {host}:{puerto}. ¿Está arrancado servidor_flota.py?")
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+"""
+COMPARTIDO - Módulos comunes de las dos versiones de Hundir la Flota
+===================================================================
+
+Los usan los juegos de esta carpeta y también
+Hundir_la_flota_Teo/Hundir_la_flota.py, que carga este paquete por su
+ruta (no hay copias en la carpeta de Teo):
+
+- bitboard_flota: tableros como máscaras de bits
+- colocacion_barcos: colocación aleatoria de la flota entre las posiciones legales
+- indice_barcos: qué barco hay en cada casilla y cuándo se hunde
+- partida_binaria: formato binario de guardado
+- diario_jugadas: guardado automático jugada a jugada
+- almacen_partidas: varias partidas por jugador en SQLite
+- pool_casillas: casillas sin disparar con sorteo en O(1)
+- coordenadas: letras de fila o columna para tableros grandes
+
+Entre ellos se importan con importaciones relativas (from . import ...).
+
+Autor: Proyecto Grupal ASIR - Python
+"""
@@ -0,0 +1,169 @@
+"""
+ALMACÉN DE PARTIDAS - Varias partidas guardadas por jugador en SQLite
+=====================================================================
+
+Guarda partidas de cualquier juego en una base de datos SQLite (módulo
+sqlite3 de la biblioteca estándar), una fila por partida, en lugar de un
+único archivo fijo. Cada jugador puede tener tantas partidas como quiera
+y continuar cualquiera de ellas.
+
+- Las partidas se guardan en binario: Hundir la Flota de Teo con
+  partida_binaria.py y el Buscaminas con PartidaBuscaminas.a_bytes().
+- Índices por (jugador, actualizada) y (jugador, juego, actualizada):
+  listar las partidas de un jugador lee solo sus filas, aunque la base
+  tenga millones.
+- Modo WAL: quien lee no bloquea a quien escribe ni al revés, así que
+  varios procesos (p. ej. los puestos de un quiosco) pueden usar la misma
+  base a la vez.
+
+Uso:
+    with AlmacenPartidas("partidas.db") as almacen:
+        id_partida = almacen.guardar("ana", JUEGO_BUSCAMINAS, partida.a_bytes())
+        for id_partida, juego, nombre, actualizada in almacen.listar("ana"):
+            ...
+        jugador, juego, nombre, actualizada, datos = almacen.cargar(id_partida, "ana")
+
+Autor: Proyecto Grupal ASIR - Python
+"""
+
+import sqlite3
+import time
+
+
+RUTA_ALMACEN = "partidas.db"
+
+# Tipos de juego que se guardan en el almacén
+JUEGO_FLOTA_TEO = 'flota_teo'
+JUEGO_BUSCAMINAS = 'buscaminas'
+
+# Milisegundos que se espera a que otro proceso termine de escribir
+ESPERA_BLOQUEO_MS = 5000
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS partidas (
+    id          INTEGER PRIMARY KEY,
+    jugador     TEXT NOT NULL,
+    juego       TEXT NOT NULL,
+    nombre      TEXT,
+    actualizada REAL NOT NULL,
+    datos       BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS partidas_jugador ON partidas (jugador, actualizada);
+CREATE INDEX IF NOT EXISTS partidas_jugador_juego ON partidas (jugador, juego, actualizada);
+"""
+
+
+class AlmacenPartidas:
+    """
+    Conexión a una base de datos de partidas guardadas.
+
+    Atributos:
+        ruta (str): Archivo de la base de datos
+        conexion (sqlite3.Connection): Conexión abierta
+    """
+
+    def __init__(self, ruta=RUTA_ALMACEN):
+        self.ruta = ruta
+        self.conexion = sqlite3.connect(ruta, timeout=ESPERA_BLOQUEO_MS / 1000)
+        self.conexion.execute("PRAGMA journal_mode=WAL")
+        # Con WAL, NORMAL no pierde la coherencia de la base en un corte
+        # (como mucho, las últimas partidas guardadas)
+        self.conexion.execute("PRAGMA synchronous=NORMAL")
+        with self.conexion:
+            self.conexion.executescript(ESQUEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+    def cerrar(self):
+        self.conexion.close()
+
+    def guardar(self, jugador, juego, datos, id_partida=None, nombre=None):
+        """
+        Guarda una partida nueva o sobrescribe una del mismo jugador.
+
+        Args:
+            jugador (str): Nombre del jugador
+            juego (str): Tipo de juego (JUEGO_FLOTA_TEO, JUEGO_BUSCAMINAS...)
+            datos (bytes): Estado de la partida
+            id_partida (int): Partida a sobrescribir; None para una nueva
+            nombre (str): Nombre que le da el jugador, opcional
+
+        Returns:
+            int: Id de la partida, o None si id_partida no es de ese jugador
+        """
+        ahora = time.time()
+        with self.conexion:
+            if id_partida is None:
+                cursor = self.conexion.execute(
+                    "INSERT INTO partidas (jugador, juego, nombre, actualizada, datos) VALUES (?, ?, ?, ?, ?)",
+                    (jugador, juego, nombre, ahora, datos))
+                return cursor.lastrowid
+            cursor = self.conexion.execute(
+                "UPDATE partidas SET datos = ?, actualizada = ?, nombre = COALESCE(?, nombre) "
+                "WHERE id = ? AND jugador = ? AND juego = ?",
+                (datos, ahora, nombre, id_partida, jugador, juego))
+            return id_partida if cursor.rowcount else None
+
+    def guardar_muchas(self, filas):
+        """
+        Inserta muchas partidas en una sola transacción (p. ej. al migrar).
+
+        Args:
+            filas (iterable): Tuplas (jugador, juego, nombre, actualizada, datos)
+        """
+        with self.conexion:
+            self.conexion.executemany(
+                "INSERT INTO partidas (jugador, juego, nombre, actualizada, datos) VALUES (?, ?, ?, ?, ?)", filas)
+
+    def cargar(self, id_partida, jugador):
+        """
+        Carga una partida del jugador (como guardar() y borrar(), nunca la de otro).
+
+        Returns:
+            tuple: (jugador, juego, nombre, actualizada, datos), o None si no
+                   existe o no es de ese jugador
+        """
+        return self.conexion.execute(
+            "SELECT jugador, juego, nombre, actualizada, datos FROM partidas WHERE id = ? AND jugador = ?",
+            (id_partida, jugador)).fetchone()
+
+    def listar(self, jugador, juego=None, limite=20):
+        """
+        Partidas de un jugador, de la más reciente a la más antigua.
+
+        Args:
+            jugador (str): Nombre del jugador
+            juego (str): Solo las de este tipo de juego, opcional
+            limite (int): Máximo de partidas
+
+        Returns:
+            list: Tuplas (id, juego, nombre, actualizada)
+        """
+        if juego is None:
+            consulta = ("SELECT id, juego, nombre, actualizada FROM partidas WHERE jugador = ? "
+                        "ORDER BY actualizada DESC LIMIT ?")
+            parametros = (jugador, limite)
+        else:
+            consulta = ("SELECT id, juego, nombre, actualizada FROM partidas WHERE jugador = ? AND juego = ? "
+                        "ORDER BY actualizada DESC LIMIT ?")
+            parametros = (jugador, juego, limite)
+        return self.conexion.execute(consulta, parametros).fetchall()
+
+    def borrar(self, id_partida, jugador):
+        """
+        Borra una partida del jugador.
+
+        Returns:
+            bool: True si existía
+        """
+        with self.conexion:
+            cursor = self.conexion.execute("DELETE FROM partidas WHERE id = ? AND jugador = ?",
+                                           (id_partida, jugador))
+            return cursor.rowcount > 0
+
+    def contar(self):
+        return self.conexion.execute("SELECT COUNT(*) FROM partidas").fetchone()[0]
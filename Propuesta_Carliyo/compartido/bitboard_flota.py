@@ -0,0 +1,328 @@
+"""
+BITBOARD FLOTA - Tableros de Hundir la Flota como enteros
+=========================================================
+
+Un tablero N × N cabe en un entero de Python de N² bits: la casilla
+(fila, columna) es el bit fila * N + columna. Barcos, impactos, fallos y
+el halo (las casillas alrededor de un barco, que otro barco no puede
+tocar) son máscaras, y las reglas del juego se reducen a AND, OR y
+desplazamientos:
+
+- Colocación válida: la máscara del barco no toca la zona prohibida
+  (barcos ya colocados más su halo).
+- Disparo: el bit del disparo AND la máscara de barcos.
+- Hundido: la máscara del barco AND NOT impactos == 0.
+- Victoria: todos los barcos AND NOT impactos == 0.
+
+Las máscaras de las colocaciones (longitud, fila, columna, orientación) y
+sus halos se calculan una sola vez por tamaño de tablero y longitud (ver
+geometria()), así que comprobar una colocación es una sola operación.
+Es la base de la IA, que evalúa muchísimos tableros hipotéticos.
+
+Autor: Proyecto Grupal ASIR - Python
+"""
+
+from functools import lru_cache
+
+
+# Lado máximo de tablero en el que Geometria guarda las máscaras que calcula
+LADO_MAXIMO_GUARDAR = 32
+
+
+def bit(n, fila, columna):
+    """
+    Máscara de una sola casilla.
+    """
+    return 1 << (fila * n + columna)
+
+
+def casillas(mascara, n):
+    """
+    Lista de (fila, columna) de los bits activos de una máscara.
+    """
+    resultado = []
+    while mascara:
+        menor = mascara & -mascara
+        resultado.append(divmod(menor.bit_length() - 1, n))
+        mascara ^= menor
+    return resultado
+
+
+class Geometria:
+    """
+    Máscaras de un tablero N × N.
+
+    Las colocaciones de cada longitud se calculan la primera vez que se
+    piden (una partida solo usa las longitudes de su flota). En tableros de
+    hasta LADO_MAXIMO_GUARDAR casillas de lado también se guardan sus
+    máscaras; en los grandes cada máscara ocupa cientos de bytes y se
+    calcula al momento con un desplazamiento, que sigue siendo inmediato.
+
+    Atributos:
+        n (int): Lado del tablero
+        total (int): Máscara con todas las casillas
+        primera_columna, ultima_columna (int): Máscaras de esas columnas
+        colocaciones (dict): longitud -> lista de (fila, columna, orientacion)
+        guardadas (dict): (longitud, fila, columna, orientacion) -> (mascara, halo),
+                          o None si el tablero es demasiado grande para guardarlas
+    """
+
+    def __init__(self, n):
+        self.n = n
+        self.total = (1 << (n * n)) - 1
+        self.primera_columna = sum(1 << (f * n) for f in range(n))
+        self.ultima_columna = self.primera_columna << (n - 1)
+        self.colocaciones = {}
+        self.guardadas = {} if n <= LADO_MAXIMO_GUARDAR else None
+
+    def colocaciones_de(self, longitud):
+        """
+        Colocaciones (fila, columna, orientacion) de un barco en el tablero vacío.
+        """
+        lista = self.colocaciones.get(longitud)
+        if lista is None:
+            n = self.n
+            lista = [(fila, columna, orientacion)
+                     for fila in range(n) for columna in range(n) for orientacion in ('H', 'V')
+                     if (columna if orientacion == 'H' else fila) + longitud <= n]
+            self.colocaciones[longitud] = lista
+        return lista
+
+    def mascaras_de(self, longitud, fila, columna, orientacion):
+        """
+        Máscara de un barco y de su halo.
+
+        Returns:
+            tuple: (mascara, halo), o None si el barco se sale del tablero
+        """
+        clave = (longitud, fila, columna, orientacion)
+        guardadas = self.guardadas
+        if guardadas is not None:
+            mascaras = guardadas.get(clave)
+            if mascaras is not None:
+                return mascaras
+
+        n = self.n
+        if not (0 <= fila < n and 0 <= columna < n and longitud >= 1 and orientacion in ('H', 'V')):
+            return None
+        if (columna if orientacion == 'H' else fila) + longitud > n:
+            return None  # Se sale del tablero
+        paso = 1 if orientacion == 'H' else n
+        mascara = sum(1 << (i * paso) for i in range(longitud)) << (fila * n + columna)
+        mascaras = (mascara, self.dilatar(mascara))
+        if guardadas is not None:
+            guardadas[clave] = mascaras
+        return mascaras
+
+    def dilatar(self, mascara):
+        """
+        Añade a la máscara sus 8 casillas vecinas (sin dar la vuelta por los bordes).
+        """
+        n = self.n
+        # El & total evita que un bit salido por la última casilla vuelva a entrar
+        # al desplazar en vertical
+        horizontal = (mascara
+                      | ((mascara << 1) & ~self.primera_columna)
+                      | ((mascara >> 1) & ~self.ultima_columna)) & self.total
+        return (horizontal | (horizontal << n) | (horizontal >> n)) & self.total
+
+    def extender_recta(self, mascara, desde):
+        """
+        Tramo recto de casillas de 'mascara' que pasa por el bit 'desde'
+        (primero en horizontal; si no hay vecinos, en vertical).
+        """
+        n = self.n
+        tramo = desde
+        while True:
+            nuevo = (tramo
+                     | ((tramo << 1) & ~self.primera_columna)
+                     | ((tramo >> 1) & ~self.ultima_columna)) & mascara
+            if nuevo == tramo:
+                break
+            tramo = nuevo
+        if tramo != desde:
+            return tramo
+        while True:
+            nuevo = (tramo | (tramo << n) | (tramo >> n)) & mascara & self.total
+            if nuevo == tramo:
+                return tramo
+            tramo = nuevo
+
+
+@lru_cache(maxsize=16)
+def geometria(n):
+    """
+    Geometría de un tablero N × N, calculada una sola vez por tamaño.
+    """
+    return Geometria(n)
+
+
+@lru_cache(maxsize=32)
+def _tabla_bits(simbolos):
+    # Tabla para bytes.translate(): '1' para los símbolos, '0' para el resto
+    return bytes(0x31 if chr(i) in simbolos else 0x30 for i in range(256))
+
+
+def mascara_tablero(tablero, simbolos):
+    """
+    Máscara de las casillas de un tablero de listas cuyo valor está en 'simbolos'.
+
+    Args:
+        tablero (list): Tablero N × N de listas (o TableroCompacto)
+        simbolos (tuple): Valores que cuentan como bit activo
+    """
+    n = len(tablero)
+    try:
+        # Camino rápido: casillas de un carácter -> texto binario (la última casilla
+        # es el bit más alto, así que el texto va al revés)
+        texto = "".join("".join(fila) for fila in tablero)[::-1]
+        if len(texto) == n * n:
+            return int(texto.encode("latin-1").translate(_tabla_bits(tuple(simbolos))), 2)
+    except (TypeError, UnicodeEncodeError):
+        pass
+
+    mascara = 0
+    for fila in range(n - 1, -1, -1):
+        for casilla in reversed(tablero[fila]):
+            mascara = (mascara << 1) | (casilla in simbolos)
+    return mascara
+
+
+class TableroBits:
+    """
+    Tablero de un jugador: sus barcos y los disparos recibidos.
+
+    Atributos:
+        n (int): Lado del tablero
+        barcos (list): Máscara de cada barco
+        ocupadas (int): Todas las casillas con barco
+        prohibidas (int): Casillas donde ya no cabe otro barco (barcos + halo)
+        impactos (int): Disparos recibidos que dieron en un barco
+        fallos (int): Disparos recibidos al agua
+    """
+
+    __slots__ = ('n', 'geo', 'barcos', 'ocupadas', 'prohibidas', 'impactos', 'fallos')
+
+    def __init__(self, n=10):
+        self.n = n
+        self.geo = geometria(n)
+        self.barcos = []
+        self.ocupadas = 0
+        self.prohibidas = 0
+        self.impactos = 0
+        self.fallos = 0
+
+    # --- Colocación ---
+
+    def puede_colocar(self, longitud, fila, columna, orientacion, separacion=True):
+        """
+        Comprueba si un barco cabe en esa posición.
+
+        Args:
+            separacion (bool): Si True, los barcos no se pueden tocar (reglas de
+                               hundir_flota.py); si False, solo no pueden solaparse
+        """
+        mascaras = self.geo.mascaras_de(longitud, fila, columna, orientacion)
+        if mascaras is None:
+            return False  # Se sale del tablero
+        return not mascaras[0] & (self.prohibidas if separacion else self.ocupadas)
+
+    def colocar(self, longitud, fila, columna, orientacion, separacion=True):
+        """
+        Coloca un barco si la posición es válida.
+
+        Returns:
+            bool: True si se colocó
+        """
+        if not self.puede_colocar(longitud, fila, columna, orientacion, separacion):
+            return False
+        mascara, halo = self.geo.mascaras_de(longitud, fila, columna, orientacion)
+        self.agregar_barco(mascara, halo)
+        return True
+
+    def agregar_barco(self, mascara, halo=None):
+        """
+        Añade un barco dado por su máscara, sin comprobar nada.
+        """
+        self.barcos.append(mascara)
+        self.ocupadas |= mascara
+        self.prohibidas |= halo if halo is not None else self.geo.dilatar(mascara)
+
+    # --- Disparos ---
+
+    def disparar(self, fila, columna):
+        """
+        Resuelve un disparo recibido.
+
+        Returns:
+            str: 'repetido', 'agua', 'tocado' o 'hundido'
+        """
+        disparo = bit(self.n, fila, columna)
+        if (self.impactos | self.fallos) & disparo:
+            return 'repetido'
+        if not self.ocupadas & disparo:
+            self.fallos |= disparo
+            return 'agua'
+        self.impactos |= disparo
+        if self.barco_en(disparo) & ~self.impactos:
+            return 'tocado'
+        return 'hundido'
+
+    def barco_en(self, disparo):
+        """
+        Máscara del barco que ocupa la casilla del bit 'disparo' (0 si no hay ninguno).
+        """
+        for barco in self.barcos:
+            if barco & disparo:
+                return barco
+        return 0
+
+    def hundidos(self):
+        """
+        Máscara con las casillas de todos los barcos hundidos.
+        """
+        resultado = 0
+        for barco in self.barcos:
+            if not barco & ~self.impactos:
+                resultado |= barco
+        return resultado
+
+    def victoria(self):
+        """
+        True si todos los barcos están hundidos.
+        """
+        return not self.ocupadas & ~self.impactos
+
+    # --- Conversión con los tableros de listas ---
+
+    @classmethod
+    def desde_tablero(cls, tablero, barco=('B', 'X'), tocado=('X',), fallo=('O',)):
+        """
+        Crea el bitboard de un tablero de listas de hundir_flota.py.
+
+        Los barcos se reconocen como tramos rectos de casillas de barco, así
+        que solo es exacto si los barcos no se tocan (reglas de hundir_flota.py).
+        """
+        tablero_bits = cls(len(tablero))
+        geo = tablero_bits.geo
+        pendientes = mascara_tablero(tablero, barco)
+        while pendientes:
+            tramo = geo.extender_recta(pendientes, pendientes & -pendientes)
+            tablero_bits.agregar_barco(tramo)
+            pendientes &= ~tramo
+        tablero_bits.impactos = mascara_tablero(tablero, tocado)
+        tablero_bits.fallos = mascara_tablero(tablero, fallo)
+        return tablero_bits
+
+    def a_tablero(self, agua='~', barco='B', tocado='X', fallo='O'):
+        """
+        Devuelve el tablero como listas con los símbolos de hundir_flota.py.
+        """
+        tablero = [[agua] * self.n for _ in range(self.n)]
+        for f, c in casillas(self.ocupadas, self.n):
+            tablero[f][c] = barco
+        for f, c in casillas(self.impactos, self.n):
+            tablero[f][c] = tocado
+        for f, c in casillas(self.fallos, self.n):
+            tablero[f][c] = fallo
+        return tablero
@@ -0,0 +1,365 @@
+"""
+COLOCACIÓN DE BARCOS - Índice de posiciones válidas
+===================================================
+
+Motor de colocación aleatoria de la flota para Hundir la Flota (las dos
+versiones del juego).
+
+En lugar de probar posiciones al azar hasta acertar, se mantiene para cada
+longitud de barco el conjunto de colocaciones que siguen siendo legales,
+guardado como máscaras de bits (ver bitboard_flota.py):
+
+- Las casillas libres son una máscara. Las colocaciones horizontales
+  legales de un barco de longitud L son las casillas libres cuyas L - 1
+  siguientes también lo están: L desplazamientos y AND. Las verticales
+  igual, desplazando filas enteras. Al colocar un barco se quita su halo
+  (el barco y las casillas de alrededor) de las libres, así que el
+  índice se actualiza con un par de operaciones, sin precalcular nada del
+  tablero (sirve igual en 100×100 con 50 barcos).
+- Cada barco se elige uniformemente entre todas sus colocaciones legales
+  (se cuentan los bits y se toma el k-ésimo al azar).
+- Si un barco se queda sin sitio se vuelve atrás y se prueba otra
+  colocación del anterior. Entre barcos iguales no se prueban los mismos
+  repartos en otro orden, y una cota de superficie sobre las casillas que
+  aún se pueden usar corta pronto las ramas sin salida: las flotas que no
+  caben fallan enseguida y la búsqueda tiene un límite de nodos, así que
+  termina en tiempo acotado.
+
+Para que los desplazamientos no pasen de una fila a la siguiente, el
+tablero N × N se guarda con una columna y una fila de más (N + 1 bits por
+fila) que nunca están libres.
+
+Autor: Proyecto Grupal ASIR - Python
+"""
+
+import random
+
+
+# Máximo de colocaciones que se prueban en la búsqueda antes de rendirse
+LIMITE_NODOS = 20000
+
+# Colocaciones que se prueban en el primer intento antes de empezar de nuevo
+# con otras elecciones al azar (reintentar rápido funciona mejor que insistir
+# en un mismo reparto cuando la flota está muy apretada). Cada intento
+# nuevo tiene el doble, así que una flota imposible se descarta en cuanto
+# un intento recorre todas las opciones
+LIMITE_NODOS_INTENTO = 50
+
+
+def casillas_barco(fila, columna, longitud, orientacion):
+    """
+    Casillas que ocupa un barco.
+
+    Returns:
+        list: Lista de (fila, columna)
+    """
+    if orientacion == 'H':
+        return [(fila, columna + i) for i in range(longitud)]
+    return [(fila + i, columna) for i in range(longitud)]
+
+
+def cabe_por_superficie(filas, columnas, longitudes):
+    """
+    Comprobación rápida de que la flota puede caber.
+
+    Si a cada barco de longitud L se le suma la fila y columna siguientes,
+    ocupa un rectángulo de (L + 1) × 2 casillas, y como los barcos no se
+    tocan, estos rectángulos no se solapan dentro de un tablero de
+    (filas + 1) × (columnas + 1).
+
+    Returns:
+        bool: False si seguro que no cabe; True si puede caber
+    """
+    return sum(2 * (longitud + 1) for longitud in longitudes) <= (filas + 1) * (columnas + 1)
+
+
+def contar_bits(mascara):
+    """
+    Número de bits activos de una máscara.
+    """
+    return bin(mascara).count("1")
+
+
+def posicion_bit(mascara, k):
+    """
+    Posición del k-ésimo bit activo de una máscara (el 0 es el más bajo).
+
+    Se parte la máscara por la mitad mientras es larga, quedándose con la
+    mitad donde cae el bit, así que cuesta lo mismo que contar sus bits.
+    """
+    desplazamiento = 0
+    ancho = mascara.bit_length()
+    while ancho > 64:
+        mitad = ancho // 2
+        baja = mascara & ((1 << mitad) - 1)
+        cuantos = contar_bits(baja)
+        if k < cuantos:
+            mascara = baja
+            ancho = mitad
+        else:
+            k -= cuantos
+            mascara >>= mitad
+            desplazamiento += mitad
+            ancho -= mitad
+    for _ in range(k):
+        mascara &= mascara - 1
+    return desplazamiento + (mascara & -mascara).bit_length() - 1
+
+
+class IndiceColocaciones:
+    """
+    Colocaciones legales de cada longitud de barco en un tablero N × N.
+
+    Una colocación es la tupla (longitud, fila, columna, orientacion).
+
+    Atributos:
+        n (int): Lado del tablero
+        ancho (int): Bits por fila (N + 1: la última columna es una pared)
+        dentro (int): Máscara de las casillas del tablero
+        libres (int): Casillas donde todavía puede ir un barco
+        separacion (bool): Si True, los barcos no se pueden tocar (reglas de
+                           hundir_flota.py); si False, solo no pueden solaparse
+                           (reglas de la versión de Teo)
+    """
+
+    def __init__(self, n, prohibidas=0, separacion=True):
+        """
+        Args:
+            n (int): Lado del tablero
+            prohibidas (int): Máscara (de bitboard_flota, N bits por fila) de las
+                              casillas donde no puede ir ningún barco, p. ej. los
+                              barcos ya colocados y su halo
+            separacion (bool): Ver atributos
+        """
+        self.n = n
+        self.ancho = n + 1
+        fila_completa = (1 << n) - 1
+        self.dentro = sum(fila_completa << (f * self.ancho) for f in range(n))
+        self.separacion = separacion
+        self.libres = self.dentro & ~self.ensanchar(prohibidas)
+        self.verticales = {}
+        # Esquinas de los bloques de 2 × 2 de las cuatro formas de partir el tablero
+        self.rejillas = [sum(1 << (f * self.ancho + c)
+                             for f in range(fila0, n + 1, 2) for c in range(columna0, n + 1, 2))
+                         for fila0 in (0, 1) for columna0 in (0, 1)]
+
+    def ensanchar(self, mascara):
+        """
+        Pasa una máscara de N bits por fila (bitboard_flota) a N + 1 bits por fila.
+        """
+        n, ancho = self.n, self.ancho
+        fila_completa = (1 << n) - 1
+        resultado = 0
+        for f in range(n):
+            resultado |= ((mascara >> (f * n)) & fila_completa) << (f * ancho)
+        return resultado
+
+    def inicios(self, longitud, libres=None):
+        """
+        Casillas donde puede empezar un barco.
+
+        Returns:
+            tuple: (horizontales, verticales) como máscaras de casillas de inicio.
+                   Un barco de longitud 1 solo cuenta como horizontal
+        """
+        libres = self.libres if libres is None else libres
+        horizontales = verticales = libres
+        for i in range(1, longitud):
+            horizontales &= libres >> i
+            verticales &= libres >> (i * self.ancho)
+        if longitud == 1:
+            verticales = 0
+        return horizontales, verticales
+
+    def cubiertas(self, longitud, horizontales, verticales):
+        """
+        Casillas que cubre alguna de las colocaciones dadas por sus inicios.
+        """
+        resultado = horizontales | verticales
+        for i in range(1, longitud):
+            resultado |= (horizontales << i) | (verticales << (i * self.ancho))
+        return resultado
+
+    def mascara(self, longitud, inicio, orientacion):
+        """
+        Máscara de un barco que empieza en el bit 'inicio'.
+        """
+        if orientacion == 'H':
+            return ((1 << longitud) - 1) << inicio
+        vertical = self.verticales.get(longitud)
+        if vertical is None:
+            vertical = self.verticales[longitud] = sum(1 << (i * self.ancho) for i in range(longitud))
+        return vertical << inicio
+
+    def bloqueadas(self, mascara):
+        """
+        Casillas que deja de tener libres un barco: él mismo y, con
+        separación, sus 8 vecinas (la pared absorbe lo que sale por los bordes).
+        """
+        if not self.separacion:
+            return mascara
+        horizontal = mascara | (mascara << 1) | (mascara >> 1)
+        return horizontal | (horizontal << self.ancho) | (horizontal >> self.ancho)
+
+    def superficie(self, cubiertas):
+        """
+        Casillas que pueden aprovechar los barcos que caben en 'cubiertas'.
+
+        Con separación es el área de (L + 1) × 2 de cabe_por_superficie():
+        las casillas cubiertas más la de su derecha, la de debajo y la de la
+        diagonal. Sin separación, las propias casillas cubiertas.
+        """
+        if not self.separacion:
+            return contar_bits(cubiertas)
+        ampliadas = cubiertas | (cubiertas << 1)
+        return contar_bits(ampliadas | (ampliadas << self.ancho))
+
+    def bloques(self, cubiertas):
+        """
+        Bloques de 2 × 2 con alguna casilla cubierta, en la partición del
+        tablero que menos tiene.
+
+        Con separación, en un bloque solo puede haber casillas de un barco, y
+        un barco de longitud L ocupa al menos (L + 1) // 2 bloques.
+        """
+        # Cada bit pasa a la esquina inferior derecha de su bloque
+        pares = cubiertas | (cubiertas << 1)
+        pares |= pares << self.ancho
+        return min(contar_bits(pares & rejilla) for rejilla in self.rejillas)
+
+    def colocacion(self, longitud, inicio, orientacion):
+        """
+        Tupla (longitud, fila, columna, orientacion) de un barco que empieza en el bit 'inicio'.
+        """
+        fila, columna = divmod(inicio, self.ancho)
+        return (longitud, fila, columna, orientacion)
+
+
+def buscar_colocaciones(indice, longitudes, rng=None, limite=LIMITE_NODOS,
+                        limite_intento=LIMITE_NODOS_INTENTO):
+    """
+    Elige una colocación para cada barco, al azar entre las legales.
+
+    Los barcos se colocan de mayor a menor y cada uno se elige
+    uniformemente entre sus colocaciones legales. Si un barco se queda sin
+    sitio se vuelve atrás y se prueba otra colocación del anterior; la que
+    ha fallado ya no se prueba en los demás barcos de la misma longitud de
+    esa rama (sería el mismo reparto en otro orden). Antes de cada barco se
+    comprueba, para cada longitud pendiente, que hay colocaciones y que la
+    superficie (y, con separación, los bloques de 2 × 2) de las casillas
+    que aún pueden usar los barcos de esa longitud o más alcanza para
+    todos ellos. Si el intento gasta limite_intento colocaciones, se
+    empieza otro con el doble, y desde el segundo se prefieren las
+    colocaciones de arriba a la izquierda (como quedarse con la menor de
+    varias sorteadas, el triple de ellas en cada intento), que encajan
+    mejor las flotas apretadas.
+
+    Args:
+        indice (IndiceColocaciones): Índice del tablero; al terminar con éxito
+                                     quedan bloqueados los barcos elegidos
+        longitudes (list): Longitudes de los barcos a colocar
+        rng (random.Random): Generador aleatorio, opcional
+        limite (int): Máximo de colocaciones a probar entre todos los intentos
+        limite_intento (int): Máximo de colocaciones a probar en el primer intento
+
+    Returns:
+        list: Colocaciones elegidas, de mayor a menor, o None si no es posible
+              (o se llegó al límite)
+    """
+    rng = rng or random
+    longitudes = sorted(longitudes, reverse=True)
+    if any(longitud < 1 for longitud in longitudes):
+        return None
+
+    # Para cada barco, las longitudes pendientes (de mayor a menor) con la
+    # superficie y los bloques que necesitan los barcos pendientes de esa
+    # longitud o más
+    por_barco = []
+    for i in range(len(longitudes)):
+        cotas = []
+        necesaria = bloques = 0
+        for j in range(i, len(longitudes)):
+            necesaria += 2 * (longitudes[j] + 1) if indice.separacion else longitudes[j]
+            bloques += (longitudes[j] + 1) // 2
+            if j + 1 == len(longitudes) or longitudes[j + 1] != longitudes[j]:
+                cotas.append((longitudes[j], necesaria, bloques))
+        por_barco.append(cotas)
+
+    elegidas = []
+    nodos = 0
+    nodos_intento = 0
+    tope_intento = 0
+    sorteos = 1
+
+    def colocar_desde(i, libres, descartadas_h, descartadas_v):
+        nonlocal nodos, nodos_intento
+        if i == len(longitudes):
+            indice.libres = libres
+            return True
+
+        # Poda: alguna longitud sin sitio o sin superficie para sus barcos
+        cubiertas = 0
+        for longitud, necesaria, bloques in por_barco[i]:
+            horizontales, verticales = indice.inicios(longitud, libres)
+            if not horizontales | verticales:
+                return False
+            if longitud == longitudes[i]:
+                candidatas = (horizontales & ~descartadas_h, verticales & ~descartadas_v)
+            cubiertas |= indice.cubiertas(longitud, horizontales, verticales)
+            if indice.superficie(cubiertas) < necesaria:
+                return False
+            if indice.separacion and indice.bloques(cubiertas) < bloques:
+                return False
+
+        longitud = longitudes[i]
+        siguiente_igual = i + 1 < len(longitudes) and longitudes[i + 1] == longitud
+        horizontales, verticales = candidatas
+        cuantas_h, cuantas_v = contar_bits(horizontales), contar_bits(verticales)
+        while cuantas_h + cuantas_v:
+            if nodos_intento >= tope_intento:
+                return False
+            nodos += 1
+            nodos_intento += 1
+
+            if sorteos == 1:
+                k = rng.randrange(cuantas_h + cuantas_v)
+            else:
+                # El menor de 'sorteos' números al azar, sacado con un solo sorteo
+                k = int((cuantas_h + cuantas_v) * (1 - rng.random() ** (1.0 / sorteos)))
+            if k < cuantas_h:
+                inicio, orientacion = posicion_bit(horizontales, k), 'H'
+            else:
+                inicio, orientacion = posicion_bit(verticales, k - cuantas_h), 'V'
+            mascara = indice.mascara(longitud, inicio, orientacion)
+            elegidas.append(indice.colocacion(longitud, inicio, orientacion))
+            libres_barco = libres & ~indice.bloqueadas(mascara)
+            if siguiente_igual:
+                hecho = colocar_desde(i + 1, libres_barco, descartadas_h, descartadas_v)
+            else:
+                hecho = colocar_desde(i + 1, libres_barco, 0, 0)
+            if hecho:
+                return True
+            elegidas.pop()
+
+            # Esta colocación ya no se prueba en este barco ni en los iguales que vienen
+            if orientacion == 'H':
+                horizontales &= ~(1 << inicio)
+                descartadas_h |= 1 << inicio
+                cuantas_h -= 1
+            else:
+                verticales &= ~(1 << inicio)
+                descartadas_v |= 1 << inicio
+                cuantas_v -= 1
+        return False
+
+    while nodos < limite:
+        nodos_intento = 0
+        tope_intento = min(limite_intento, limite - nodos)
+        if colocar_desde(0, indice.libres, 0, 0):
+            return elegidas
+        if nodos_intento < tope_intento:
+            # Se recorrieron todas las opciones sin llegar al límite: no hay solución
+            return None
+        limite_intento *= 2
+        sorteos *= 3
+    return None
@@ -0,0 +1,69 @@
+"""
+COORDENADAS - Letras de columna para tableros de cualquier tamaño
+=================================================================
+
+Las columnas se nombran como en una hoja de cálculo: A-Z, después AA-AZ,
+BA-BZ... hasta ZZ, luego AAA, etc. Así un tablero de 100 columnas va de
+A a CV y cualquier coordenada se escribe como letras + número ('CV100').
+
+Uso:
+    letras_columna(27)            # 'AB'
+    indice_columna('ab')          # 27
+    separar_coordenada('AB12')    # ('AB', '12')
+
+Autor: Proyecto Grupal ASIR - Python
+"""
+
+
+def letras_columna(indice):
+    """
+    Letras de una columna (0 -> 'A', 25 -> 'Z', 26 -> 'AA').
+
+    Args:
+        indice (int): Índice de la columna (desde 0)
+
+    Returns:
+        str: Letras de la columna
+    """
+    letras = ""
+    indice += 1
+    while indice:
+        indice, resto = divmod(indice - 1, 26)
+        letras = chr(ord('A') + resto) + letras
+    return letras
+
+
+def indice_columna(letras):
+    """
+    Índice de una columna a partir de sus letras ('A' -> 0, 'AA' -> 26).
+
+    Args:
+        letras (str): Letras de la columna (mayúsculas o minúsculas)
+
+    Returns:
+        int: Índice de la columna, o None si no son letras A-Z
+    """
+    letras = letras.strip().upper()
+    if not letras:
+        return None
+    indice = 0
+    for letra in letras:
+        if not 'A' <= letra <= 'Z':
+            return None
+        indice = indice * 26 + ord(letra) - ord('A') + 1
+    return indice - 1
+
+
+def separar_coordenada(texto):
+    """
+    Separa una coordenada escrita de una vez en letras y número ('AB12' -> ('AB', '12')).
+
+    Returns:
+        tuple: (letras, numero) como texto, o (None, None) si no tiene esa forma
+    """
+    texto = texto.strip()
+    letras = texto.rstrip("0123456789")
+    numero = texto[len(letras):]
+    if not letras or not numero or not letras.isalpha():
+        return None, None
+    return letras, numero
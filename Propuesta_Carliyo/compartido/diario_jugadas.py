@@ -0,0 +1,240 @@
+"""
+DIARIO DE JUGADAS - Guardado automático jugada a jugada
+=======================================================
+
+Cada jugada se añade al final de un diario como un registro fijo de
+8 bytes, en lugar de reescribir todos los tableros. Cada cierto número
+de jugadas se guarda una foto (snapshot) del estado completo y el diario
+se vacía (compactación). Si el programa se cierra de golpe, la partida
+se reconstruye con la última foto más las jugadas del diario.
+
+Archivos de una partida con base 'partida_en_curso':
+    partida_en_curso.foto     Foto del estado (escritura atómica)
+    partida_en_curso.diario   Registros añadidos tras la foto
+
+Registro (8 bytes, big-endian):
+    número de jugada (4) | acción (1) | fila (1) | columna (1) | suma (1)
+
+La suma de comprobación detecta un registro a medio escribir al final
+del diario (se descarta). El número de jugada evita aplicar dos veces
+las jugadas que ya estaban en la foto si el programa se cortó entre
+guardar la foto y vaciar el diario.
+
+Durabilidad (parámetro 'sincronizar'):
+    'nunca'    Cada registro se pasa al sistema operativo con os.write():
+               sobrevive a que se cierre o se mate el programa, no a un
+               corte de luz. Cuesta ~1 µs por jugada.
+    'lote'     Además, os.fsync() cada 'cada' jugadas.
+    'siempre'  os.fsync() tras cada jugada (lo más seguro, lo más lento).
+
+Autor: Proyecto Grupal ASIR - Python
+"""
+
+import os
+import struct
+import zlib
+
+from . import partida_binaria
+
+
+REGISTRO = struct.Struct(">IBBBB")
+CABECERA_FOTO = struct.Struct(">3sBI")
+MAGIA_FOTO = b"FOT"
+VERSION = 1
+
+SINCRONIZAR = ['nunca', 'lote', 'siempre']
+
+# Jugadas entre dos os.fsync() en modo 'lote'
+LOTE_FSYNC = 32
+
+# Jugadas en el diario a partir de las que conviene hacer una foto nueva
+COMPACTAR_CADA = 200
+
+
+def _suma(numero, accion, fila, columna):
+    return (numero + (numero >> 8) + (numero >> 16) + (numero >> 24) + accion + fila + columna + 0x5A) & 0xFF
+
+
+class DiarioJugadas:
+    """
+    Foto y diario de jugadas de una partida.
+
+    Atributos:
+        base (str): Ruta de los archivos sin extensión
+        sincronizar (str): 'nunca', 'lote' o 'siempre'
+        numero (int): Número de la última jugada anotada
+        pendientes (int): Jugadas anotadas desde la última foto
+    """
+
+    def __init__(self, base, sincronizar='lote', cada=LOTE_FSYNC, compactar_cada=COMPACTAR_CADA):
+        if sincronizar not in SINCRONIZAR:
+            raise ValueError(f"sincronizar debe ser uno de {SINCRONIZAR}")
+        self.base = base
+        self.ruta_foto = base + ".foto"
+        self.ruta_diario = base + ".diario"
+        self.sincronizar = sincronizar
+        self.cada = cada
+        self.compactar_cada = compactar_cada
+        self.descriptor = None
+        self.numero = 0
+        self.pendientes = 0
+        self.sin_sincronizar = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+    # --- Recuperación ---
+
+    def hay_partida(self):
+        """
+        True si hay una partida a medias (existe su foto).
+        """
+        return os.path.exists(self.ruta_foto)
+
+    def leer_foto(self):
+        """
+        Returns:
+            tuple: (número de la última jugada incluida, datos del estado)
+
+        Raises:
+            ValueError: Si la foto está dañada
+        """
+        with open(self.ruta_foto, "rb") as archivo:
+            datos = archivo.read()
+        if len(datos) < CABECERA_FOTO.size + 4 or datos[:3] != MAGIA_FOTO:
+            raise ValueError("La foto de la partida no es válida")
+        if struct.unpack_from(">I", datos, len(datos) - 4)[0] != zlib.crc32(datos[:-4]):
+            raise ValueError("La foto de la partida está dañada (CRC incorrecto)")
+        _, version, numero = CABECERA_FOTO.unpack_from(datos)
+        if version != VERSION:
+            raise ValueError(f"Versión de foto no soportada: {version}")
+        return numero, datos[CABECERA_FOTO.size:-4]
+
+    def recuperar(self):
+        """
+        Lee la foto y las jugadas posteriores. Los registros incompletos o
+        dañados del final se descartan (y se quitan del archivo).
+
+        Returns:
+            tuple: (datos del estado, lista de jugadas (accion, fila, columna)),
+                   o None si no hay partida
+
+        Raises:
+            ValueError: Si la foto está dañada
+        """
+        if not self.hay_partida():
+            return None
+        numero_foto, estado = self.leer_foto()
+
+        jugadas = []
+        validos = 0
+        numero = numero_foto
+        try:
+            with open(self.ruta_diario, "rb") as archivo:
+                datos = archivo.read()
+        except FileNotFoundError:
+            datos = b""
+        for posicion in range(0, len(datos) - REGISTRO.size + 1, REGISTRO.size):
+            registro = REGISTRO.unpack_from(datos, posicion)
+            if registro[4] != _suma(*registro[:4]):
+                break
+            validos = posicion + REGISTRO.size
+            if registro[0] <= numero_foto:
+                continue  # Ya está en la foto
+            if registro[0] != numero + 1:
+                break
+            numero = registro[0]
+            jugadas.append((chr(registro[1]), registro[2], registro[3]))
+
+        if validos != len(datos):
+            with open(self.ruta_diario, "r+b") as archivo:
+                archivo.truncate(validos)
+        self.numero = numero
+        self.pendientes = len(jugadas)
+        return estado, jugadas
+
+    # --- Escritura ---
+
+    def _abrir_diario(self, vaciar):
+        if self.descriptor is not None:
+            os.close(self.descriptor)
+        banderas = os.O_WRONLY | os.O_CREAT | os.O_APPEND | (os.O_TRUNC if vaciar else 0)
+        self.descriptor = os.open(self.ruta_diario, banderas | getattr(os, "O_BINARY", 0), 0o644)
+
+    def _escribir_foto(self, estado):
+        cabecera = CABECERA_FOTO.pack(MAGIA_FOTO, VERSION, self.numero) + estado
+        partida_binaria.escribir_atomico(self.ruta_foto, cabecera + struct.pack(">I", zlib.crc32(cabecera)))
+
+    def empezar(self, estado):
+        """
+        Empieza el diario de una partida (nueva, cargada o recuperada) con
+        la foto de su estado actual.
+
+        Args:
+            estado (bytes): Estado completo de la partida
+        """
+        self._escribir_foto(estado)
+        self._abrir_diario(vaciar=True)
+        self.pendientes = 0
+
+    def anotar(self, accion, fila, columna):
+        """
+        Añade una jugada al diario.
+
+        Args:
+            accion (str): Letra de la acción (cada juego define las suyas)
+            fila, columna (int): Casilla de la jugada (0-255)
+
+        Returns:
+            bool: True si conviene compactar (ver compactar())
+        """
+        if self.descriptor is None:
+            self._abrir_diario(vaciar=False)
+        self.numero += 1
+        codigo = ord(accion)
+        os.write(self.descriptor, REGISTRO.pack(self.numero, codigo, fila, columna,
+                                                _suma(self.numero, codigo, fila, columna)))
+        self.pendientes += 1
+        self.sin_sincronizar += 1
+        if self.sincronizar == 'siempre' or (self.sincronizar == 'lote' and self.sin_sincronizar >= self.cada):
+            os.fsync(self.descriptor)
+            self.sin_sincronizar = 0
+        return self.pendientes >= self.compactar_cada
+
+    def compactar(self, estado):
+        """
+        Guarda una foto con el estado actual y vacía el diario.
+        """
+        if self.descriptor is not None and self.sin_sincronizar:
+            os.fsync(self.descriptor)
+            self.sin_sincronizar = 0
+        # Primero la foto: si se corta aquí, las jugadas del diario ya
+        # incluidas en ella se saltan al recuperar (por su número)
+        self._escribir_foto(estado)
+        self._abrir_diario(vaciar=True)
+        self.pendientes = 0
+
+    def terminar(self):
+        """
+        La partida ha terminado (o se ha guardado aparte): borra foto y diario.
+        """
+        self.cerrar()
+        for ruta in (self.ruta_foto, self.ruta_diario):
+            if os.path.exists(ruta):
+                os.remove(ruta)
+        self.numero = 0
+        self.pendientes = 0
+
+    def cerrar(self):
+        """
+        Vuelca lo pendiente a disco y cierra el diario (la partida sigue recuperable).
+        """
+        if self.descriptor is not None:
+            if self.sin_sincronizar and self.sincronizar != 'nunca':
+                os.fsync(self.descriptor)
+            os.close(self.descriptor)
+            self.descriptor = None
+            self.sin_sincronizar = 0
@@ -0,0 +1,162 @@
+"""
+ÍNDICE DE BARCOS - Qué barco hay en cada casilla
+================================================
+
+Guarda, para cada casilla, el número (id) del barco que la ocupa y, para
+cada barco, cuántas casillas le quedan sin tocar. Se rellena al colocar
+los barcos, así que resolver un disparo (agua / tocado / hundido y qué
+barco) es inmediato, sin recorrer el tablero.
+
+Como cada casilla sabe a qué barco pertenece, funciona aunque los barcos
+se toquen (variantes sin separación), cosa que no puede hacer deducir el
+barco a partir de casillas 'B' vecinas.
+
+Uso:
+    indice = IndiceBarcos(10)
+    id_barco = indice.agregar_barco([(0, 0), (0, 1)], "Lancha")
+    resultado, id_barco = indice.resolver_disparo(0, 0)   # ('tocado', 0)
+    datos = indice.a_dict()                                # para guardar en JSON
+    indice = IndiceBarcos.desde_dict(datos)
+
+Autor: Proyecto Grupal ASIR - Python
+"""
+
+from . import bitboard_flota
+
+
+# Valor de una casilla sin barco en IndiceBarcos.id_casilla
+SIN_BARCO = -1
+
+
+class IndiceBarcos:
+    """
+    Barco de cada casilla y vida de cada barco.
+
+    Atributos:
+        n (int): Lado del tablero
+        id_casilla (list): Para cada casilla (fila * n + columna), id de su barco o SIN_BARCO
+        casillas (list): Para cada barco, tupla de sus casillas (fila, columna)
+        vida (list): Para cada barco, casillas que le quedan sin tocar
+        nombres (list): Para cada barco, su nombre (o None)
+    """
+
+    def __init__(self, n=10):
+        self.n = n
+        self.id_casilla = [SIN_BARCO] * (n * n)
+        self.casillas = []
+        self.vida = []
+        self.nombres = []
+
+    def agregar_barco(self, casillas, nombre=None):
+        """
+        Registra un barco nuevo.
+
+        Args:
+            casillas (list): Casillas (fila, columna) del barco
+            nombre (str): Nombre del barco, opcional
+
+        Returns:
+            int: Id del barco
+        """
+        casillas = tuple((fila, columna) for fila, columna in casillas)
+        id_barco = len(self.casillas)
+        for fila, columna in casillas:
+            if self.id_casilla[fila * self.n + columna] != SIN_BARCO:
+                raise ValueError(f"La casilla ({fila}, {columna}) ya tiene un barco")
+        for fila, columna in casillas:
+            self.id_casilla[fila * self.n + columna] = id_barco
+        self.casillas.append(casillas)
+        self.vida.append(len(casillas))
+        self.nombres.append(nombre)
+        return id_barco
+
+    def barco_en(self, fila, columna):
+        """
+        Id del barco en esa casilla, o None si es agua.
+        """
+        id_barco = self.id_casilla[fila * self.n + columna]
+        return None if id_barco == SIN_BARCO else id_barco
+
+    def resolver_disparo(self, fila, columna):
+        """
+        Aplica un disparo nuevo (no repetido) a la casilla.
+
+        Returns:
+            tuple: (resultado, id_barco) con resultado 'agua', 'tocado' o
+                   'hundido', e id_barco None si es agua
+        """
+        id_barco = self.id_casilla[fila * self.n + columna]
+        if id_barco == SIN_BARCO:
+            return 'agua', None
+        self.vida[id_barco] -= 1
+        return ('hundido' if self.vida[id_barco] == 0 else 'tocado'), id_barco
+
+    def hundidos(self):
+        """
+        Ids de los barcos hundidos.
+        """
+        return [id_barco for id_barco, vida in enumerate(self.vida) if vida == 0]
+
+    def barcos_a_flote(self):
+        """
+        Número de barcos a los que aún les queda alguna casilla sin tocar.
+        """
+        return sum(1 for vida in self.vida if vida > 0)
+
+    def copiar(self):
+        """
+        Copia independiente del índice (la vida de los barcos no se comparte).
+        """
+        copia = IndiceBarcos.__new__(IndiceBarcos)
+        copia.n = self.n
+        copia.id_casilla = self.id_casilla[:]
+        copia.casillas = self.casillas[:]
+        copia.vida = self.vida[:]
+        copia.nombres = self.nombres[:]
+        return copia
+
+    # --- Guardar y cargar ---
+
+    def a_dict(self):
+        """
+        Datos del índice para guardarlos en JSON.
+        """
+        return {
+            'n': self.n,
+            'barcos': [
+                {'casillas': [list(casilla) for casilla in casillas], 'vida': vida, 'nombre': nombre}
+                for casillas, vida, nombre in zip(self.casillas, self.vida, self.nombres)
+            ],
+        }
+
+    @classmethod
+    def desde_dict(cls, datos):
+        """
+        Reconstruye un índice guardado con a_dict().
+        """
+        indice = cls(datos['n'])
+        for barco in datos['barcos']:
+            id_barco = indice.agregar_barco(barco['casillas'], barco.get('nombre'))
+            indice.vida[id_barco] = barco['vida']
+        return indice
+
+    @classmethod
+    def desde_tablero(cls, tablero, barco=('B', 'X'), tocado=('X',)):
+        """
+        Reconstruye el índice de un tablero de listas que no lo tenía (p. ej.
+        una partida guardada antes de existir el índice).
+
+        Los barcos se reconocen como tramos rectos de casillas de barco, así
+        que solo es exacto si los barcos no se tocan (reglas de hundir_flota.py).
+        """
+        n = len(tablero)
+        geo = bitboard_flota.geometria(n)
+        impactos = bitboard_flota.mascara_tablero(tablero, tocado)
+        pendientes = bitboard_flota.mascara_tablero(tablero, barco)
+        indice = cls(n)
+        while pendientes:
+            tramo = geo.extender_recta(pendientes, pendientes & -pendientes)
+            id_barco = indice.agregar_barco(bitboard_flota.casillas(tramo, n))
+            indice.vida[id_barco] = bin(tramo & ~impactos).count("1")
+            pendientes &= ~tramo
+        return indice
@@ -0,0 +1,187 @@
+"""
+PARTIDA BINARIA - Formato compacto para guardar partidas de Hundir la Flota
+==========================================================================
+
+Guarda varios tableros N × N y sus índices de barcos (ver indice_barcos.py)
+en unos 160 bytes, en lugar de los ~7,7 KB del JSON con sangría:
+
+- Cada casilla ocupa 2 bits (agua, barco, tocado, fallado), así que cuatro
+  tableros 10 × 10 son 100 bytes.
+- De cada barco se guardan su longitud, su vida y sus casillas (1 byte por
+  casilla si el tablero tiene hasta 256 casillas).
+- Cabecera con versión y CRC32 al final: un archivo cortado o dañado se
+  detecta al cargarlo en lugar de dar tableros a medias.
+
+Formato (versión 1, enteros big-endian):
+
+    'HFT' | versión (1) | n (1) | nº tableros (1) | nº índices (1)
+    tableros: 2 bits por casilla, fila a fila, tablero tras tablero
+    por índice: nº barcos (1; 255 = sin índice)
+                por barco: longitud (1) | vida (1) | casillas (1 o 2 bytes cada una)
+    CRC32 de todo lo anterior (4)
+
+Los nombres de los barcos no se guardan (la versión de Teo no los usa).
+
+escribir_atomico() escribe en un archivo temporal y lo cambia por el
+definitivo con os.replace(), así que un corte a mitad de escritura deja
+la partida anterior intacta.
+
+Autor: Proyecto Grupal ASIR - Python
+"""
+
+import os
+import struct
+import tempfile
+import zlib
+from functools import lru_cache
+
+from . import indice_barcos
+
+
+MAGIA = b"HFT"
+VERSION = 1
+
+CABECERA = struct.Struct(">3sBBBB")
+CRC = struct.Struct(">I")
+
+# Nº de barcos que indica que ese índice no se guardó
+SIN_INDICE = 255
+
+
+@lru_cache(maxsize=8)
+def _tablas(simbolos):
+    """
+    Tablas de traducción de un juego de 4 símbolos: símbolo -> dígito en
+    base 4 para codificar, y byte -> sus 4 símbolos para decodificar.
+    """
+    codificar = str.maketrans({simbolo: str(codigo) for codigo, simbolo in enumerate(simbolos)})
+    decodificar = ["".join(simbolos[(byte >> desplazamiento) & 3] for desplazamiento in (6, 4, 2, 0))
+                   for byte in range(256)]
+    return codificar, decodificar
+
+
+def es_binario(datos):
+    """
+    True si los datos empiezan como una partida en este formato.
+    """
+    return datos[:len(MAGIA)] == MAGIA
+
+
+def codificar_partida(tableros, indices, simbolos):
+    """
+    Codifica tableros e índices de barcos.
+
+    Args:
+        tableros (list): Tableros N × N (listas de filas) del mismo tamaño
+        indices (list): IndiceBarcos (o None) que se guardan junto a los tableros
+        simbolos (tuple): Los 4 valores posibles de una casilla, p. ej. ('~', '#', 'X', 'O')
+
+    Returns:
+        bytes: La partida codificada
+    """
+    n = len(tableros[0])
+    total = len(tableros) * n * n
+    codificar, _ = _tablas(tuple(simbolos))
+
+    texto = "".join("".join(fila) for tablero in tableros for fila in tablero)
+    digitos = texto.translate(codificar)
+    if len(texto) != total or digitos.strip("0123"):
+        raise ValueError("Los tableros tienen casillas que no están en 'simbolos'")
+    # Cada 4 casillas (4 dígitos en base 4) forman un byte
+    digitos += "0" * (-total % 4)
+    partes = [CABECERA.pack(MAGIA, VERSION, n, len(tableros), len(indices)),
+              int(digitos, 4).to_bytes(len(digitos) // 4, "big") if digitos else b""]
+
+    casilla = struct.Struct(">B" if n * n <= 256 else ">H")
+    for indice in indices:
+        if indice is None:
+            partes.append(bytes([SIN_INDICE]))
+            continue
+        partes.append(bytes([len(indice.casillas)]))
+        for casillas, vida in zip(indice.casillas, indice.vida):
+            partes.append(bytes([len(casillas), vida]))
+            partes.extend(casilla.pack(fila * n + columna) for fila, columna in casillas)
+
+    datos = b"".join(partes)
+    return datos + CRC.pack(zlib.crc32(datos))
+
+
+def decodificar_partida(datos, simbolos):
+    """
+    Decodifica una partida de codificar_partida().
+
+    Args:
+        datos (bytes): La partida codificada
+        simbolos (tuple): Los mismos 4 símbolos que al codificar
+
+    Returns:
+        tuple: (tableros, indices) con tableros de listas e IndiceBarcos o None
+
+    Raises:
+        ValueError: Si los datos no son de este formato, son de otra versión
+                    o están dañados
+    """
+    if len(datos) < CABECERA.size + CRC.size or not es_binario(datos):
+        raise ValueError("No es una partida en formato binario")
+    if CRC.unpack_from(datos, len(datos) - CRC.size)[0] != zlib.crc32(datos[:-CRC.size]):
+        raise ValueError("La partida está dañada (CRC incorrecto)")
+    _, version, n, num_tableros, num_indices = CABECERA.unpack_from(datos)
+    if version != VERSION:
+        raise ValueError(f"Versión de partida no soportada: {version}")
+
+    _, decodificar = _tablas(tuple(simbolos))
+    total = num_tableros * n * n
+    posicion = CABECERA.size
+    fin = posicion + (total + 3) // 4
+    texto = "".join([decodificar[byte] for byte in datos[posicion:fin]])
+    tableros = [[list(texto[inicio:inicio + n]) for inicio in range(t * n * n, (t + 1) * n * n, n)]
+                for t in range(num_tableros)]
+    posicion = fin
+
+    ancho = 1 if n * n <= 256 else 2
+    indices = []
+    try:
+        for _ in range(num_indices):
+            num_barcos = datos[posicion]
+            posicion += 1
+            if num_barcos == SIN_INDICE:
+                indices.append(None)
+                continue
+            indice = indice_barcos.IndiceBarcos(n)
+            for _ in range(num_barcos):
+                longitud, vida = datos[posicion], datos[posicion + 1]
+                posicion += 2
+                if ancho == 1:
+                    valores = datos[posicion:posicion + longitud]
+                else:
+                    valores = struct.unpack_from(f">{longitud}H", datos, posicion)
+                if len(valores) != longitud:
+                    raise IndexError
+                posicion += longitud * ancho
+                id_barco = indice.agregar_barco([divmod(valor, n) for valor in valores])
+                indice.vida[id_barco] = vida
+            indices.append(indice)
+    except (IndexError, struct.error):
+        raise ValueError("La partida está incompleta")
+    if posicion != len(datos) - CRC.size:
+        raise ValueError("La partida tiene datos de más")
+    return tableros, indices
+
+
+def escribir_atomico(ruta, datos):
+    """
+    Escribe los datos de forma atómica: archivo temporal en la misma carpeta,
+    volcado a disco y os.replace() sobre el definitivo.
+    """
+    directorio = os.path.dirname(os.path.abspath(ruta))
+    descriptor, temporal = tempfile.mkstemp(dir=directorio, suffix=".tmp")
+    try:
+        with os.fdopen(descriptor, "wb") as archivo:
+            archivo.write(datos)
+            archivo.flush()
+            os.fsync(archivo.fileno())
+        os.replace(temporal, ruta)
+    except OSError:
+        if os.path.exists(temporal):
+            os.remove(temporal)
+        raise
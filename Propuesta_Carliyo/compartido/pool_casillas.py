@@ -0,0 +1,109 @@
+"""
+POOL DE CASILLAS - Casillas sin disparar con elección al azar en O(1)
+=====================================================================
+
+Las IAs que disparan al azar repetían random.randint() hasta dar con una
+casilla sin disparar: al final de la partida casi todas lo están y hacen
+falta decenas (en tableros grandes, miles) de intentos por disparo.
+
+El pool guarda las casillas libres en una lista y la posición de cada una
+en esa lista. Elegir una al azar es un índice aleatorio, y quitar una
+casilla es cambiarla por la última y acortar la lista, así que las dos
+operaciones tardan lo mismo al principio y al final de la partida, y en
+un tablero 10×10 o 100×100.
+
+Uso:
+    pool = PoolCasillas(10)
+    fila, columna = pool.aleatoria()
+    pool.quitar(fila, columna)     # al disparar (por cualquier estrategia)
+
+Autor: Proyecto Grupal ASIR - Python
+"""
+
+import random
+
+
+class PoolCasillas:
+    """
+    Conjunto de casillas libres de un tablero N × N.
+
+    Atributos:
+        n (int): Lado del tablero
+        libres (list): Casillas libres (fila * n + columna), sin orden
+        posicion (list): Para cada casilla, su índice en 'libres' (-1 si ya no está)
+    """
+
+    def __init__(self, n=10, casillas=None):
+        """
+        Args:
+            n (int): Lado del tablero
+            casillas (iterable): Casillas libres (fila * n + columna); por defecto todas
+        """
+        self.n = n
+        self.libres = list(range(n * n)) if casillas is None else list(casillas)
+        self.posicion = [-1] * (n * n)
+        for indice, casilla in enumerate(self.libres):
+            self.posicion[casilla] = indice
+
+    @classmethod
+    def desde_tablero(cls, tablero, libres=('~',)):
+        """
+        Pool con las casillas de un tablero de listas cuyo valor está en 'libres'
+        (p. ej. al cargar una partida).
+        """
+        n = len(tablero)
+        return cls(n, [f * n + c for f, fila in enumerate(tablero)
+                       for c, valor in enumerate(fila) if valor in libres])
+
+    def __len__(self):
+        return len(self.libres)
+
+    def __contains__(self, fila_columna):
+        fila, columna = fila_columna
+        return self.posicion[fila * self.n + columna] >= 0
+
+    def aleatoria(self, rng=None):
+        """
+        Una casilla libre al azar (sin quitarla).
+
+        Args:
+            rng (random.Random): Generador; por defecto el módulo random
+
+        Returns:
+            tuple: (fila, columna), o None si no queda ninguna
+        """
+        if not self.libres:
+            return None
+        casilla = self.libres[(rng or random).randrange(len(self.libres))]
+        return divmod(casilla, self.n)
+
+    def quitar(self, fila, columna):
+        """
+        Quita una casilla del pool (no hace nada si ya no estaba).
+
+        Returns:
+            bool: True si estaba
+        """
+        casilla = fila * self.n + columna
+        indice = self.posicion[casilla]
+        if indice < 0:
+            return False
+        # La última ocupa su hueco
+        ultima = self.libres.pop()
+        if ultima != casilla:
+            self.libres[indice] = ultima
+            self.posicion[ultima] = indice
+        self.posicion[casilla] = -1
+        return True
+
+    def sacar(self, rng=None):
+        """
+        Quita y devuelve una casilla libre al azar.
+
+        Returns:
+            tuple: (fila, columna), o None si no queda ninguna
+        """
+        casilla = self.aleatoria(rng)
+        if casilla is not None:
+            self.quitar(*casilla)
+        return casilla
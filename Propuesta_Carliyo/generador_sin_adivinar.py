@@ -0,0 +1,392 @@
+"""
+GENERADOR SIN ADIVINAR - Tableros que se resuelven solo con lógica
+==================================================================
+
+Genera tableros de Buscaminas que se pueden resolver desde la casilla de
+inicio sin tener que arriesgarse nunca (sin "50/50").
+
+Cómo funciona:
+- Cada candidato es un tablero normal: colocar_minas() con la zona de
+  inicio protegida y calcular_vecinos().
+- El candidato se juega con el solucionador (solucionador.py) revelando solo
+  casillas seguras deducidas. Si llega un momento en que no hay ninguna
+  segura y la partida no está ganada, se descarta.
+- La búsqueda se reparte en lotes de semillas entre varios procesos. En
+  cuanto un proceso encuentra un tablero válido se avisa a los demás con un
+  Event para que dejen de buscar y se cancelan los lotes pendientes.
+
+Los tableros generados se guardan en un pool en disco, un archivo JSON por
+configuración (filas × columnas × minas), para que empezar una partida sea
+instantáneo. Al sacar uno, un hilo en segundo plano rellena el pool. Todo
+el programa usa un único pool (ver pool_compartido()), y cada archivo se
+bloquea con un archivo .lock mientras se lee y reescribe, para que dos hilos
+o dos procesos no pierdan tableros pisándose.
+
+Uso:
+    python generador_sin_adivinar.py [nivel] [cantidad]
+
+Autor: Proyecto Grupal ASIR - Python
+"""
+
+import json
+import multiprocessing
+import os
+import random
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from contextlib import contextmanager
+
+import buscaminas
+import solucionador
+from compartido import partida_binaria
+
+
+# Candidatos que prueba un proceso por envío
+TAMANO_LOTE = 8
+
+# Candidatos como máximo antes de rendirse (por llamada a generar())
+MAX_CANDIDATOS = 20000
+
+# Directorio del pool en disco y tableros que se intentan tener guardados
+DIRECTORIO_POOL = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pool_sin_adivinar")
+OBJETIVO_POOL = 5
+
+# Espera entre intentos de coger el bloqueo de un archivo del pool, y edad a
+# partir de la cual un bloqueo se da por abandonado (proceso que se cerró)
+ESPERA_BLOQUEO = 0.01
+CADUCIDAD_BLOQUEO = 30
+
+# Pool único del programa (ver pool_compartido())
+_pool = None
+_cerrojo_pool = threading.Lock()
+
+# Aviso compartido entre procesos para dejar de buscar (ver _iniciar_trabajador)
+_evento_parar = None
+
+
+def se_resuelve_sin_adivinar(tablero_real, fila, columna, num_minas):
+    """
+    Juega el tablero desde (fila, columna) revelando solo casillas seguras deducidas.
+
+    Args:
+        tablero_real (list): Tablero con minas y números ya calculados
+        fila, columna (int): Casilla de inicio (debe ser segura)
+        num_minas (int): Número total de minas
+
+    Returns:
+        bool: True si se llega a la victoria sin arriesgar ninguna vez
+    """
+    filas = len(tablero_real)
+    columnas = len(tablero_real[0])
+    tablero_visible = [['#' for _ in range(columnas)] for _ in range(filas)]
+
+    seguras_ocultas = filas * columnas - num_minas
+    seguras_ocultas -= len(buscaminas.revelar_area(tablero_real, tablero_visible, fila, columna))
+
+    while seguras_ocultas > 0:
+        seguras = solucionador.analizar(tablero_visible, num_minas)['seguras']
+        if not seguras:
+            return False
+        for f, c in seguras:
+            seguras_ocultas -= len(buscaminas.revelar_area(tablero_real, tablero_visible, f, c))
+
+    return True
+
+
+def generar_candidato(filas, columnas, num_minas, fila, columna, semilla):
+    """
+    Crea el tablero candidato de una semilla (siempre el mismo para la misma semilla).
+
+    Returns:
+        list: Tablero real con minas y números
+    """
+    tablero_real, _ = buscaminas.crear_tablero(filas, columnas)
+    zona = buscaminas.zona_primer_clic(tablero_real, fila, columna, num_minas)
+    buscaminas.colocar_minas(tablero_real, num_minas, excluir=zona, rng=random.Random(semilla))
+    buscaminas.calcular_vecinos(tablero_real)
+    return tablero_real
+
+
+def _iniciar_trabajador(evento):
+    global _evento_parar
+    _evento_parar = evento
+
+
+def buscar_en_lote(filas, columnas, num_minas, fila, columna, semillas):
+    """
+    Prueba las semillas de un lote hasta encontrar un tablero sin adivinar.
+    Se ejecuta en un proceso trabajador y deja de buscar si otro ya ha encontrado uno.
+
+    Returns:
+        int: La semilla del tablero encontrado o None
+    """
+    for semilla in semillas:
+        if _evento_parar is not None and _evento_parar.is_set():
+            return None
+        tablero_real = generar_candidato(filas, columnas, num_minas, fila, columna, semilla)
+        if se_resuelve_sin_adivinar(tablero_real, fila, columna, num_minas):
+            if _evento_parar is not None:
+                _evento_parar.set()
+            return semilla
+    return None
+
+
+def generar(filas, columnas, num_minas, fila=None, columna=None, procesos=None, semilla=None):
+    """
+    Busca un tablero que se resuelva sin adivinar desde (fila, columna).
+
+    Args:
+        filas, columnas, num_minas (int): Configuración del tablero
+        fila, columna (int): Casilla de inicio; por defecto el centro
+        procesos (int): Procesos de búsqueda; por defecto uno por núcleo. Con 1
+                        se busca en el propio proceso, sin pool
+        semilla (int): Primera semilla a probar; por defecto una al azar
+
+    Returns:
+        dict: {'minas': [posiciones fila * columnas + columna], 'inicio': [fila, columna],
+               'semilla': semilla del candidato} o None si no se encontró ninguno
+    """
+    fila = filas // 2 if fila is None else fila
+    columna = columnas // 2 if columna is None else columna
+    procesos = procesos or os.cpu_count() or 1
+    semilla = random.randrange(2 ** 32) if semilla is None else semilla
+
+    lotes = (range(inicio, inicio + TAMANO_LOTE)
+             for inicio in range(semilla, semilla + MAX_CANDIDATOS, TAMANO_LOTE))
+
+    encontrada = None
+    if procesos == 1:
+        for lote in lotes:
+            encontrada = buscar_en_lote(filas, columnas, num_minas, fila, columna, lote)
+            if encontrada is not None:
+                break
+    else:
+        evento = multiprocessing.Event()
+        with ProcessPoolExecutor(max_workers=procesos, initializer=_iniciar_trabajador,
+                                 initargs=(evento,)) as pool:
+            # Dos lotes en cola por proceso para que ninguno se quede esperando
+            pendientes = set()
+            for lote in lotes:
+                pendientes.add(pool.submit(buscar_en_lote, filas, columnas, num_minas, fila, columna, lote))
+                if len(pendientes) < procesos * 2:
+                    continue
+                hechos, pendientes = wait(pendientes, return_when=FIRST_COMPLETED)
+                encontrada = next((h.result() for h in hechos if h.result() is not None), None)
+                if encontrada is not None:
+                    break
+
+            if encontrada is None:
+                for hecho in wait(pendientes).done:
+                    if hecho.result() is not None:
+                        encontrada = hecho.result()
+                        break
+            else:
+                evento.set()
+                for pendiente in pendientes:
+                    pendiente.cancel()
+
+    if encontrada is None:
+        return None
+
+    tablero_real = generar_candidato(filas, columnas, num_minas, fila, columna, encontrada)
+    minas = [f * columnas + c for f in range(filas) for c in range(columnas) if tablero_real[f][c] == '*']
+    return {'minas': minas, 'inicio': [fila, columna], 'semilla': encontrada}
+
+
+def tablero_desde_datos(filas, columnas, datos):
+    """
+    Reconstruye los tableros real y visible de un tablero generado.
+
+    Returns:
+        tuple: (tablero_real, tablero_visible, (fila_inicio, columna_inicio))
+    """
+    tablero_real, tablero_visible = buscaminas.crear_tablero(filas, columnas)
+    for posicion in datos['minas']:
+        f, c = divmod(posicion, columnas)
+        tablero_real[f][c] = '*'
+    buscaminas.calcular_vecinos(tablero_real)
+    return tablero_real, tablero_visible, tuple(datos['inicio'])
+
+
+class PoolTableros:
+    """
+    Tableros sin adivinar ya generados, guardados en disco por configuración.
+
+    Cada configuración es un archivo JSON con una lista de tableros
+    (ver generar()). Los archivos se escriben en un temporal y se cambian
+    con os.replace(), así que nunca quedan a medias, y cada lectura y
+    reescritura se hace con el archivo bloqueado (ver bloquear()), así que
+    otro proceso con su propio pool tampoco pierde tableros.
+
+    Atributos:
+        directorio (str): Carpeta donde se guardan los archivos
+        objetivo (int): Tableros que se intentan tener por configuración
+    """
+
+    def __init__(self, directorio=DIRECTORIO_POOL, objetivo=OBJETIVO_POOL):
+        self.directorio = directorio
+        self.objetivo = objetivo
+        self.cerrojo = threading.Lock()
+        self.rellenando = set()
+
+    def ruta(self, filas, columnas, num_minas):
+        return os.path.join(self.directorio, f"{filas}x{columnas}x{num_minas}.json")
+
+    def leer(self, filas, columnas, num_minas):
+        try:
+            with open(self.ruta(filas, columnas, num_minas), encoding="utf-8") as archivo:
+                return json.load(archivo)
+        except (OSError, ValueError):
+            return []
+
+    def escribir(self, filas, columnas, num_minas, tableros):
+        os.makedirs(self.directorio, exist_ok=True)
+        partida_binaria.escribir_atomico(self.ruta(filas, columnas, num_minas),
+                                         json.dumps(tableros).encode("utf-8"))
+
+    @contextmanager
+    def bloquear(self, filas, columnas, num_minas):
+        """
+        Bloquea el archivo de una configuración, entre hilos (cerrojo) y entre
+        procesos (archivo .lock creado en exclusiva).
+        """
+        os.makedirs(self.directorio, exist_ok=True)
+        ruta_bloqueo = self.ruta(filas, columnas, num_minas) + ".lock"
+        with self.cerrojo:
+            while True:
+                try:
+                    descriptor = os.open(ruta_bloqueo, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                    break
+                except FileExistsError:
+                    try:
+                        if time.time() - os.path.getmtime(ruta_bloqueo) > CADUCIDAD_BLOQUEO:
+                            os.remove(ruta_bloqueo)
+                            continue
+                    except OSError:
+                        continue  # El otro proceso lo acaba de soltar
+                    time.sleep(ESPERA_BLOQUEO)
+            os.close(descriptor)
+            try:
+                yield
+            finally:
+                os.remove(ruta_bloqueo)
+
+    def cantidad(self, filas, columnas, num_minas):
+        with self.bloquear(filas, columnas, num_minas):
+            return len(self.leer(filas, columnas, num_minas))
+
+    def anadir(self, filas, columnas, num_minas, datos):
+        with self.bloquear(filas, columnas, num_minas):
+            tableros = self.leer(filas, columnas, num_minas)
+            tableros.append(datos)
+            self.escribir(filas, columnas, num_minas, tableros)
+
+    def tomar(self, filas, columnas, num_minas):
+        """
+        Saca un tablero del pool.
+
+        Returns:
+            dict: Datos del tablero (ver generar()) o None si no queda ninguno
+        """
+        with self.bloquear(filas, columnas, num_minas):
+            tableros = self.leer(filas, columnas, num_minas)
+            if not tableros:
+                return None
+            datos = tableros.pop()
+            self.escribir(filas, columnas, num_minas, tableros)
+            return datos
+
+    def rellenar(self, filas, columnas, num_minas, procesos=None):
+        """
+        Genera tableros hasta llegar al objetivo del pool. Cada tablero se
+        añade solo si sigue faltando (otro proceso puede estar rellenando a la vez).
+        """
+        while self.cantidad(filas, columnas, num_minas) < self.objetivo:
+            datos = generar(filas, columnas, num_minas, procesos=procesos)
+            if datos is None:
+                return
+            with self.bloquear(filas, columnas, num_minas):
+                tableros = self.leer(filas, columnas, num_minas)
+                if len(tableros) >= self.objetivo:
+                    return
+                tableros.append(datos)
+                self.escribir(filas, columnas, num_minas, tableros)
+
+    def rellenar_en_segundo_plano(self, filas, columnas, num_minas):
+        """
+        Rellena el pool en un hilo aparte, dejando un núcleo libre para el juego.
+
+        Returns:
+            threading.Thread: El hilo, o None si ya se estaba rellenando esa configuración
+        """
+        clave = (filas, columnas, num_minas)
+        with self.cerrojo:
+            if clave in self.rellenando:
+                return None
+            self.rellenando.add(clave)
+
+        def tarea():
+            try:
+                self.rellenar(filas, columnas, num_minas, procesos=max(1, (os.cpu_count() or 1) - 1))
+            except RuntimeError:
+                pass  # El programa se está cerrando: no se pueden lanzar más procesos
+            finally:
+                with self.cerrojo:
+                    self.rellenando.discard(clave)
+
+        hilo = threading.Thread(target=tarea, daemon=True)
+        hilo.start()
+        return hilo
+
+
+def pool_compartido():
+    """
+    Pool único del programa, creado la primera vez que se pide. Así todas las
+    llamadas a obtener_tablero() comparten cerrojo y saben qué configuraciones
+    se están rellenando ya.
+
+    Returns:
+        PoolTableros: El pool compartido
+    """
+    global _pool
+    with _cerrojo_pool:
+        if _pool is None:
+            _pool = PoolTableros()
+        return _pool
+
+
+def obtener_tablero(filas, columnas, num_minas, pool=None):
+    """
+    Devuelve un tablero sin adivinar: del pool si hay, o generándolo al momento.
+    En ambos casos se pone a rellenar el pool en segundo plano.
+    Sin 'pool' se usa el compartido (ver pool_compartido()).
+
+    Returns:
+        tuple: (tablero_real, tablero_visible, (fila_inicio, columna_inicio)) o None
+               si no se encontró ningún tablero
+    """
+    pool = pool or pool_compartido()
+    datos = pool.tomar(filas, columnas, num_minas)
+    if datos is None:
+        datos = generar(filas, columnas, num_minas)
+    pool.rellenar_en_segundo_plano(filas, columnas, num_minas)
+    if datos is None:
+        return None
+    return tablero_desde_datos(filas, columnas, datos)
+
+
+def main():
+    nivel = sys.argv[1] if len(sys.argv) > 1 else 'dificil'
+    cantidad = int(sys.argv[2]) if len(sys.argv) > 2 else OBJETIVO_POOL
+    filas, columnas, num_minas = buscaminas.NIVELES[nivel]
+
+    pool = PoolTableros(objetivo=cantidad)
+    print(f"Rellenando el pool de '{nivel}' hasta {cantidad} tableros...")
+    pool.rellenar(filas, columnas, num_minas)
+    print(f"Tableros guardados: {pool.cantidad(filas, columnas, num_minas)} en {pool.directorio}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,15 +4,17 @@ HUNDIR LA FLOTA (Battleship) - Juego Clásico Naval
 
 Este módulo implementa el juego Hundir la Flota con múltiples modos:
 - Jugador vs Jugador (local)
-- Jugador vs Computadora (3 niveles de IA)
+- Jugador vs Computadora (5 niveles de IA)
 
 Configuración del juego:
-- Tablero: 10×10 para cada jugador
-- Flota: 1 Portaaviones (5), 1 Acorazado (4), 2 Cruceros (3), 1 Lancha (2)
+- Tablero: 10×10 para cada jugador (o cualquier tamaño entre TAMANO_MINIMO
+  y TAMANO_MAXIMO; las columnas pasan de la J a la Z, AA, AB...)
+- Flota: 1 Portaaviones (5), 1 Acorazado (4), 2 Cruceros (3), 1 Lancha (2),
+  repetida en tableros grandes (ver flota_para_tamano) o a medida
 
 Funcionalidades principales:
 - Colocación manual o aleatoria de barcos
-- IA con 3 niveles de dificultad (Fácil, Intermedio, Difícil)
+- IA con 5 niveles de dificultad (Fácil, Intermedio, Difícil, Probabilístico, Experto)
 - Sistema de disparos con resultados (Agua/Tocado/Hundido)
 - Visualización de dos tableros (propio y enemigo)
 
@@ -21,67 +23,185 @@ Fecha: Diciembre 2025
 """
 
 import random
-import os
+import time
+from collections import deque
+
+import ia_montecarlo
+import ia_probabilistica
+import renderizado
+import tablero_compacto
+from compartido import bitboard_flota, colocacion_barcos, coordenadas, indice_barcos, pool_casillas
+
+
+# Modo depuración: si es True, cada comprobación de victoria basada en
+# contadores se contrasta con un recorrido completo del tablero.
+DEPURAR_CONTADORES = False
+
+# Segundos de pausa antes de cada disparo de la IA en la terminal (0 = sin pausa)
+PAUSA_IA = 1.5
+
+# Grabación de la última partida jugada (ver repeticion.py)
+ARCHIVO_REPETICION = "ultima_partida_flota.json"
+
+# Lado del tablero por defecto, el del tablero grande y límites del menú de configuración
+TAMANO = 10
+TAMANO_GRANDE = 20
+TAMANO_MINIMO = 7
+TAMANO_MAXIMO = 100
+
+# Casillas del tablero por cada copia de la flota normal (ver flota_para_tamano)
+CASILLAS_POR_FLOTA = 1000
+
+# Ancho de pantalla: si los dos tableros no caben lado a lado, se muestran uno debajo del otro
+ANCHO_PANTALLA = 80
+
+# Flota de cada jugador: (nombre, longitud)
+FLOTA = [
+    ("Portaaviones", 5),
+    ("Acorazado", 4),
+    ("Crucero 1", 3),
+    ("Crucero 2", 3),
+    ("Lancha de Reconocimiento", 2)
+]
 
 
 def limpiar_pantalla():
     """
     Limpia la pantalla de la terminal para mejorar la visualización.
+    En Linux/Mac usa una secuencia ANSI en lugar de lanzar 'clear' (ver renderizado.py).
     """
-    os.system('cls' if os.name == 'nt' else 'clear')
+    renderizado.limpiar_pantalla()
 
 
-def crear_tablero():
+def flota_para_tamano(n):
     """
-    Crea un tablero 10×10 vacío representado con agua ('~').
+    Flota para un tablero N × N: la normal, con una copia más por cada
+    CASILLAS_POR_FLOTA casillas (en 100×100, 10 copias: 50 barcos).
+    
+    Args:
+        n (int): Lado del tablero
     
     Returns:
-        list: Tablero 10×10 inicializado con agua
+        list: Barcos (nombre, longitud)
     """
-    return [['~' for _ in range(10)] for _ in range(10)]
+    copias = max(1, n * n // CASILLAS_POR_FLOTA)
+    if copias == 1:
+        return list(FLOTA)
+    return [(f"{nombre} ({copia})", longitud)
+            for copia in range(1, copias + 1) for nombre, longitud in FLOTA]
 
 
-def mostrar_tableros(tablero_propio, tablero_disparos, nombre_jugador, turno_actual=True):
+def leer_flota(texto):
     """
-    Muestra los dos tableros del jugador: el propio con sus barcos y el de disparos.
+    Convierte una lista de longitudes escrita por el jugador ("5 4 3 3 2")
+    en una flota.
+    
+    Returns:
+        list: Barcos (nombre, longitud), o None si el texto no es válido
+    """
+    try:
+        longitudes = [int(parte) for parte in texto.replace(",", " ").split()]
+    except ValueError:
+        return None
+    if not longitudes or min(longitudes) < 1:
+        return None
+    return [(f"Barco {numero} ({longitud})", longitud) for numero, longitud in enumerate(longitudes, 1)]
+
+
+def crear_tablero(n=TAMANO, compacto=False):
+    """
+    Crea un tablero N×N vacío representado con agua ('~').
+    
+    Args:
+        n (int): Lado del tablero
+        compacto (bool): Si True, usa TableroCompacto (1 byte por casilla) en lugar de listas
+    
+    Returns:
+        list: Tablero N×N inicializado con agua
+    """
+    if compacto:
+        return tablero_compacto.TableroCompacto(n, n, '~')
+    
+    return [['~' for _ in range(n)] for _ in range(n)]
+
+
+def formatear_tablero(tablero):
+    """
+    Líneas de un tablero con la cabecera de columnas (A, B... AA, AB...)
+    y el número de cada fila.
+    
+    Args:
+        tablero (list): Tablero a mostrar
+    
+    Returns:
+        list: Líneas de texto, todas del mismo ancho
+    """
+    n = len(tablero)
+    ancho_fila = max(2, len(str(n)))
+    ancho_columna = len(coordenadas.letras_columna(n - 1))
+    cabecera = " ".join(coordenadas.letras_columna(c).rjust(ancho_columna) for c in range(n))
+    lineas = [" " * (ancho_fila + 1) + cabecera]
+    for i in range(n):
+        casillas = " ".join(casilla.rjust(ancho_columna) for casilla in tablero[i])
+        lineas.append(f"{i+1:{ancho_fila}} {casillas}")
+    return lineas
+
+
+def formatear_tableros(tablero_propio, tablero_disparos, nombre_jugador, turno_actual=True):
+    """
+    Construye las líneas de texto de los dos tableros sin escribirlas en pantalla.
+    Van lado a lado si caben en ANCHO_PANTALLA; si no, uno debajo del otro.
     
     Args:
         tablero_propio (list): Tablero con los barcos del jugador
         tablero_disparos (list): Tablero con los disparos que ha hecho el jugador
         nombre_jugador (str): Nombre del jugador
         turno_actual (bool): Si es el turno de este jugador
+    
+    Returns:
+        list: Líneas de la pantalla (sin saltos de línea)
     """
-    print(f"\n{'='*60}")
+    lineas = ["", "=" * 60]
     if turno_actual:
-        print(f"  TURNO DE: {nombre_jugador.upper()}")
+        lineas.append(f"  TURNO DE: {nombre_jugador.upper()}")
     else:
-        print(f"  TABLEROS DE: {nombre_jugador.upper()}")
-    print(f"{'='*60}\n")
+        lineas.append(f"  TABLEROS DE: {nombre_jugador.upper()}")
+    lineas.extend(["=" * 60, ""])
     
-    # Encabezados
-    print("     TU FLOTA                      TUS DISPAROS")
-    print("   A B C D E F G H I J           A B C D E F G H I J")
+    propio = formatear_tablero(tablero_propio)
+    disparos = formatear_tablero(tablero_disparos)
+    ancho = len(propio[0])
+    separacion = " " * 7
     
-    # Mostrar ambos tableros lado a lado
-    for i in range(10):
-        # Tablero propio
-        print(f"{i+1:2} ", end="")
-        for casilla in tablero_propio[i]:
-            print(casilla, end=" ")
-        
-        # Espacio entre tableros
-        print("      ", end="")
-        
-        # Tablero de disparos
-        print(f"{i+1:2} ", end="")
-        for casilla in tablero_disparos[i]:
-            print(casilla, end=" ")
-        
-        print()
+    if 2 * ancho + len(separacion) <= ANCHO_PANTALLA:
+        # Ambos tableros lado a lado
+        lineas.append(f"{'TU FLOTA':^{ancho}}{separacion}{'TUS DISPAROS':^{ancho}}")
+        lineas.extend(izquierda + separacion + derecha for izquierda, derecha in zip(propio, disparos))
+    else:
+        lineas.append("TU FLOTA")
+        lineas.extend(propio)
+        lineas.extend(["", "TUS DISPAROS"])
+        lineas.extend(disparos)
     
-    print("\nLeyenda:")
-    print("  ~ = Agua  |  B = Barco  |  X = Tocado  |  O = Agua (disparo fallado)")
-    print(f"{'='*60}\n")
+    lineas.append("")
+    lineas.append("Leyenda:")
+    lineas.append("  ~ = Agua  |  B = Barco  |  X = Tocado  |  O = Agua (disparo fallado)")
+    lineas.extend(["=" * 60, ""])
+    return lineas
+
+
+def mostrar_tableros(tablero_propio, tablero_disparos, nombre_jugador, turno_actual=True):
+    """
+    Muestra los dos tableros del jugador: el propio con sus barcos y el de disparos.
+    Toda la pantalla se escribe de una vez, no casilla a casilla.
+    
+    Args:
+        tablero_propio (list): Tablero con los barcos del jugador
+        tablero_disparos (list): Tablero con los disparos que ha hecho el jugador
+        nombre_jugador (str): Nombre del jugador
+        turno_actual (bool): Si es el turno de este jugador
+    """
+    print("\n".join(formatear_tableros(tablero_propio, tablero_disparos, nombre_jugador, turno_actual)))
 
 
 def validar_posicion(tablero, fila, columna, longitud, orientacion):
@@ -103,38 +223,27 @@ def validar_posicion(tablero, fila, columna, longitud, orientacion):
     Returns:
         bool: True si la posición es válida, False si no
     """
-    # Verificar límites del tablero
+    n = len(tablero)
     if orientacion == 'H':
-        if columna + longitud > 10:
-            return False
-    else:  # Vertical
-        if fila + longitud > 10:
-            return False
-    
-    # Verificar cada casilla del barco y sus adyacentes
-    for i in range(longitud):
-        if orientacion == 'H':
-            f, c = fila, columna + i
-        else:
-            f, c = fila + i, columna
-        
-        # Verificar la casilla misma
-        if tablero[f][c] != '~':
-            return False
-        
-        # Verificar las 8 casillas adyacentes (para que no se toquen)
-        for df in [-1, 0, 1]:
-            for dc in [-1, 0, 1]:
-                nf, nc = f + df, c + dc
-                # Si está dentro del tablero y no es agua, hay un barco cerca
-                if 0 <= nf < 10 and 0 <= nc < 10:
-                    if tablero[nf][nc] != '~' and (nf, nc) != (f, c):
-                        return False
+        alto, ancho = 1, longitud
+    elif orientacion == 'V':
+        alto, ancho = longitud, 1
+    else:
+        return False
+    if longitud < 1 or fila < 0 or columna < 0 or fila + alto > n or columna + ancho > n:
+        return False  # Se sale del tablero
     
+    # Ninguna casilla del halo (el barco y sus 8 vecinas) puede tener ya algo.
+    # Solo se miran esas casillas, así que cuesta lo mismo en 10×10 que en 100×100
+    for f in range(max(0, fila - 1), min(n, fila + alto + 1)):
+        fila_tablero = tablero[f]
+        for c in range(max(0, columna - 1), min(n, columna + ancho + 1)):
+            if fila_tablero[c] != '~':
+                return False
     return True
 
 
-def colocar_barco(tablero, fila, columna, longitud, orientacion):
+def colocar_barco(tablero, fila, columna, longitud, orientacion, indice=None, nombre=None, tablero_bits=None):
     """
     Coloca un barco en el tablero en la posición especificada.
     
@@ -144,43 +253,106 @@ def colocar_barco(tablero, fila, columna, longitud, orientacion):
         columna (int): Columna inicial
         longitud (int): Longitud del barco
         orientacion (str): 'H' horizontal o 'V' vertical
+        indice (IndiceBarcos): Índice de barcos del tablero donde registrarlo, opcional
+        nombre (str): Nombre del barco para el índice, opcional
+        tablero_bits (TableroBits): Copia en máscaras del tablero donde añadirlo, opcional
     """
-    for i in range(longitud):
-        if orientacion == 'H':
-            tablero[fila][columna + i] = 'B'
-        else:
-            tablero[fila + i][columna] = 'B'
+    casillas = colocacion_barcos.casillas_barco(fila, columna, longitud, orientacion)
+    for f, c in casillas:
+        tablero[f][c] = 'B'
+    if indice is not None:
+        indice.agregar_barco(casillas, nombre)
+    if tablero_bits is not None:
+        tablero_bits.agregar_barco(*tablero_bits.geo.mascaras_de(longitud, fila, columna, orientacion))
 
 
-def colocar_barco_aleatorio(tablero, longitud):
+def colocar_barco_aleatorio(tablero, longitud, rng=None, indice=None, nombre=None, tablero_bits=None):
     """
-    Intenta colocar un barco de forma aleatoria en el tablero.
+    Coloca un barco en una posición aleatoria válida del tablero.
+    Se elige entre todas las posiciones legales (ver colocacion_barcos.py),
+    así que solo falla si el barco no cabe en ningún sitio.
+    
+    Al colocar barco tras barco conviene pasar siempre el mismo tablero_bits
+    (ver crear_tablero_bits): así no se recorre el tablero entero en cada
+    barco, solo se añade el halo del que se acaba de colocar.
     
     Args:
         tablero (list): Tablero donde colocar el barco
         longitud (int): Longitud del barco
+        rng (random.Random): Generador aleatorio, opcional
+        indice (IndiceBarcos): Índice de barcos del tablero donde registrarlo, opcional
+        nombre (str): Nombre del barco para el índice, opcional
+        tablero_bits (TableroBits): Copia en máscaras del tablero, opcional
     
     Returns:
-        bool: True si se pudo colocar, False si no
+        bool: True si se pudo colocar, False si no cabe
+    """
+    if not colocar_flota_aleatoria(tablero, [longitud], rng, indice, tablero_bits=tablero_bits):
+        return False
+    if indice is not None:
+        indice.nombres[-1] = nombre
+    return True
+
+
+def crear_tablero_bits(tablero):
+    """
+    Copia en máscaras de los barcos de un tablero (ver bitboard_flota.TableroBits),
+    para colocar varios barcos seguidos sin volver a recorrerlo.
+    """
+    return bitboard_flota.TableroBits.desde_tablero(tablero, ('B',))
+
+
+def colocar_flota_aleatoria(tablero, longitudes=None, rng=None, indice=None, flota=None, tablero_bits=None):
     """
-    intentos = 0
-    max_intentos = 100  # Evitar bucle infinito
+    Coloca varios barcos en posiciones aleatorias válidas.
+    Si no caben todos, el tablero no se modifica.
     
-    while intentos < max_intentos:
-        fila = random.randint(0, 9)
-        columna = random.randint(0, 9)
-        orientacion = random.choice(['H', 'V'])
-        
-        if validar_posicion(tablero, fila, columna, longitud, orientacion):
-            colocar_barco(tablero, fila, columna, longitud, orientacion)
-            return True
-        
-        intentos += 1
+    Cada barco se elige entre sus colocaciones legales con el índice de
+    colocacion_barcos.py, que vuelve atrás si la flota queda encajonada y
+    descarta enseguida las flotas que no caben.
+    
+    Args:
+        tablero (list): Tablero donde colocar los barcos
+        longitudes (list): Longitudes de los barcos (por defecto las de 'flota')
+        rng (random.Random): Generador aleatorio, opcional
+        indice (IndiceBarcos): Índice de barcos del tablero donde registrarlos, opcional
+        flota (list): Barcos (nombre, longitud) cuando no se dan longitudes;
+                      por defecto FLOTA. Cada barco se registra con su nombre
+        tablero_bits (TableroBits): Copia en máscaras del tablero (ver
+                                    crear_tablero_bits), opcional. Con ella la
+                                    zona prohibida sale de sus máscaras en vez
+                                    de recorrer el tablero, y se le añade cada barco
     
-    return False
+    Returns:
+        bool: True si se colocaron todos, False si no caben
+    """
+    if longitudes is None:
+        flota = list(flota) if flota is not None else list(FLOTA)
+        longitudes = [longitud for _, longitud in flota]
+    else:
+        flota = None
+    n = len(tablero)
+    
+    if tablero_bits is not None:
+        prohibidas = tablero_bits.prohibidas
+    else:
+        geo = bitboard_flota.geometria(n)
+        ocupadas = geo.total & ~bitboard_flota.mascara_tablero(tablero, ('~',))
+        prohibidas = geo.dilatar(ocupadas) if ocupadas else 0
+    indice_colocaciones = colocacion_barcos.IndiceColocaciones(n, prohibidas)
+    elegidas = colocacion_barcos.buscar_colocaciones(indice_colocaciones, longitudes, rng)
+    if elegidas is None:
+        return False
+    
+    # Las colocaciones vienen de mayor a menor
+    orden = sorted(range(len(longitudes)), key=lambda i: longitudes[i], reverse=True)
+    for i, (longitud, fila, columna, orientacion) in zip(orden, elegidas):
+        colocar_barco(tablero, fila, columna, longitud, orientacion, indice,
+                      flota[i][0] if flota is not None else None, tablero_bits)
+    return True
 
 
-def colocar_barco_manual(tablero, nombre_barco, longitud):
+def colocar_barco_manual(tablero, nombre_barco, longitud, indice=None, rng=None, tablero_bits=None):
     """
     Permite al jugador colocar un barco manualmente.
     
@@ -188,10 +360,15 @@ def colocar_barco_manual(tablero, nombre_barco, longitud):
         tablero (list): Tablero donde colocar el barco
         nombre_barco (str): Nombre del barco
         longitud (int): Longitud del barco
+        indice (IndiceBarcos): Índice de barcos del tablero donde registrarlo, opcional
+        rng (random.Random): Generador para la colocación aleatoria, opcional
+        tablero_bits (TableroBits): Copia en máscaras del tablero (ver crear_tablero_bits), opcional
     
     Returns:
         bool: True si colocó manualmente, False si eligió aleatorio
     """
+    n = len(tablero)
+    ultima_columna = coordenadas.letras_columna(n - 1)
     while True:
         limpiar_pantalla()
         print(f"{'='*60}")
@@ -199,12 +376,7 @@ def colocar_barco_manual(tablero, nombre_barco, longitud):
         print(f"{'='*60}\n")
         
         # Mostrar tablero actual
-        print("   A B C D E F G H I J")
-        for i in range(10):
-            print(f"{i+1:2} ", end="")
-            for casilla in tablero[i]:
-                print(casilla, end=" ")
-            print()
+        print("\n".join(formatear_tablero(tablero)))
         
         print(f"\n{'='*60}")
         print("Opciones:")
@@ -215,7 +387,7 @@ def colocar_barco_manual(tablero, nombre_barco, longitud):
         opcion = input("\n¿Qué quieres hacer? (1/2): ").strip()
         
         if opcion == '2':
-            if colocar_barco_aleatorio(tablero, longitud):
+            if colocar_barco_aleatorio(tablero, longitud, rng, indice, nombre_barco, tablero_bits):
                 print(f"\n✓ {nombre_barco} colocado aleatoriamente.")
                 input("Presiona Enter para continuar...")
                 return False
@@ -225,109 +397,108 @@ def colocar_barco_manual(tablero, nombre_barco, longitud):
                 continue
         
         elif opcion == '1':
-            try:
-                columna_input = input("Columna inicial (A-J): ").strip().upper()
-                fila_input = input("Fila inicial (1-10): ").strip()
-                orientacion = input("Orientación (H=horizontal, V=vertical): ").strip().upper()
-                
-                # Validar entrada
-                if len(columna_input) != 1 or columna_input not in 'ABCDEFGHIJ':
-                    print("\n❌ Columna inválida. Usa A-J.")
-                    input("Presiona Enter para continuar...")
-                    continue
-                
-                columna = ord(columna_input) - ord('A')
-                fila = int(fila_input) - 1
-                
-                if fila < 0 or fila > 9:
-                    print("\n❌ Fila inválida. Usa 1-10.")
-                    input("Presiona Enter para continuar...")
-                    continue
-                
-                if orientacion not in ['H', 'V']:
-                    print("\n❌ Orientación inválida. Usa H o V.")
-                    input("Presiona Enter para continuar...")
-                    continue
-                
-                # Validar posición
-                if not validar_posicion(tablero, fila, columna, longitud, orientacion):
-                    print("\n❌ No se puede colocar el barco ahí (fuera del tablero, solapado o muy cerca de otro).")
-                    input("Presiona Enter para continuar...")
-                    continue
-                
-                # Colocar el barco
-                colocar_barco(tablero, fila, columna, longitud, orientacion)
-                print(f"\n✓ {nombre_barco} colocado correctamente.")
+            columna_input = input(f"Columna inicial (A-{ultima_columna}): ").strip()
+            fila_input = input(f"Fila inicial (1-{n}): ").strip()
+            orientacion = input("Orientación (H=horizontal, V=vertical): ").strip().upper()
+            
+            # Validar entrada
+            fila, columna = convertir_coordenada(columna_input, fila_input, n)
+            if fila is None:
+                print(f"\n❌ Casilla inválida. Usa columnas A-{ultima_columna} y filas 1-{n}.")
                 input("Presiona Enter para continuar...")
-                return True
-                
-            except ValueError:
-                print("\n❌ Entrada inválida. Intenta de nuevo.")
+                continue
+            
+            if orientacion not in ['H', 'V']:
+                print("\n❌ Orientación inválida. Usa H o V.")
                 input("Presiona Enter para continuar...")
                 continue
+            
+            # Validar posición
+            if not validar_posicion(tablero, fila, columna, longitud, orientacion):
+                print("\n❌ No se puede colocar el barco ahí (fuera del tablero, solapado o muy cerca de otro).")
+                input("Presiona Enter para continuar...")
+                continue
+            
+            # Colocar el barco
+            colocar_barco(tablero, fila, columna, longitud, orientacion, indice, nombre_barco, tablero_bits)
+            print(f"\n✓ {nombre_barco} colocado correctamente.")
+            input("Presiona Enter para continuar...")
+            return True
         else:
             print("\n❌ Opción inválida.")
             input("Presiona Enter para continuar...")
 
 
-def colocar_flota(tablero, nombre_jugador):
+def colocar_flota(tablero, nombre_jugador, indice=None, flota=None, rng=None):
     """
-    Permite al jugador colocar toda su flota.
+    Permite al jugador colocar toda su flota, barco a barco o toda de una
+    vez al azar (cómodo con las flotas de los tableros grandes).
     
     Args:
         tablero (list): Tablero del jugador
         nombre_jugador (str): Nombre del jugador
-    """
-    flota = [
-        ("Portaaviones", 5),
-        ("Acorazado", 4),
-        ("Crucero 1", 3),
-        ("Crucero 2", 3),
-        ("Lancha de Reconocimiento", 2)
-    ]
+        indice (IndiceBarcos): Índice de barcos del tablero donde registrarla, opcional
+        flota (list): Barcos (nombre, longitud); por defecto FLOTA
+        rng (random.Random): Generador para las colocaciones aleatorias, opcional
     
+    Returns:
+        bool: True si se colocó toda la flota, False si no cabe al azar
+    """
+    flota = flota if flota is not None else FLOTA
     limpiar_pantalla()
     print(f"{'='*60}")
     print(f"  {nombre_jugador.upper()}: COLOCA TU FLOTA")
     print(f"{'='*60}")
     print("\nTu flota consiste en:")
-    for nombre, longitud in flota:
-        print(f"  - {nombre}: {longitud} casillas")
+    if len(flota) <= len(FLOTA):
+        for nombre, longitud in flota:
+            print(f"  - {nombre}: {longitud} casillas")
+    else:
+        # Flotas grandes: cuántos barcos hay de cada longitud
+        for longitud in sorted({longitud for _, longitud in flota}, reverse=True):
+            cuantos = sum(1 for _, otra in flota if otra == longitud)
+            print(f"  - {cuantos} barcos de {longitud} casillas")
     print(f"\n{'='*60}")
-    input("\nPresiona Enter para comenzar...")
+    opcion = input("\nPresiona Enter para colocarla barco a barco (A = toda al azar)... ").strip().upper()
+    
+    if opcion == 'A':
+        if colocar_flota_aleatoria(tablero, rng=rng, indice=indice, flota=flota):
+            return True
+        print("\n❌ La flota no cabe en el tablero.")
+        input("Presiona Enter para continuar...")
+        return False
     
+    tablero_bits = crear_tablero_bits(tablero)
     for nombre_barco, longitud in flota:
-        colocar_barco_manual(tablero, nombre_barco, longitud)
+        colocar_barco_manual(tablero, nombre_barco, longitud, indice, rng, tablero_bits)
+    return True
 
 
-def convertir_coordenada(columna_letra, fila_num):
+def convertir_coordenada(columna_letra, fila_num, n=TAMANO):
     """
     Convierte coordenadas de letra-número a índices.
     
     Args:
-        columna_letra (str): Letra de columna (A-J)
-        fila_num (str): Número de fila (1-10)
+        columna_letra (str): Letra o letras de columna (A-J en 10×10; AA, AB... en tableros grandes)
+        fila_num (str): Número de fila (1-n)
+        n (int): Lado del tablero
     
     Returns:
         tuple: (fila, columna) como índices o (None, None) si inválido
     """
+    columna = coordenadas.indice_columna(columna_letra)
     try:
-        columna_letra = columna_letra.upper()
-        if len(columna_letra) != 1 or columna_letra not in 'ABCDEFGHIJ':
-            return None, None
-        
-        columna = ord(columna_letra) - ord('A')
         fila = int(fila_num) - 1
-        
-        if fila < 0 or fila > 9:
-            return None, None
-        
-        return fila, columna
-    except:
+    except ValueError:
         return None, None
+    
+    if columna is None or not (0 <= fila < n and 0 <= columna < n):
+        return None, None
+    
+    return fila, columna
 
 
-def realizar_disparo(tablero_enemigo, tablero_disparos, fila, columna):
+def realizar_disparo(tablero_enemigo, tablero_disparos, fila, columna, contadores=None):
     """
     Realiza un disparo en el tablero enemigo.
     
@@ -336,29 +507,55 @@ def realizar_disparo(tablero_enemigo, tablero_disparos, fila, columna):
         tablero_disparos (list): Tablero de disparos del jugador que dispara
         fila (int): Fila del disparo
         columna (int): Columna del disparo
+        contadores (dict): Contadores del tablero enemigo (ver crear_contadores), opcional
     
     Returns:
         str: 'repetido', 'agua', 'tocado', o 'hundido'
     """
+    return resolver_disparo(tablero_enemigo, tablero_disparos, fila, columna, contadores)[0]
+
+
+def resolver_disparo(tablero_enemigo, tablero_disparos, fila, columna, contadores=None):
+    """
+    Realiza un disparo y dice también a qué barco le ha dado.
+    
+    Con contadores, el índice de barcos (ver crear_contadores) resuelve el
+    disparo sin recorrer el tablero; sin ellos se deduce el barco de las
+    casillas vecinas (verificar_barco_hundido).
+    
+    Args:
+        tablero_enemigo (list): Tablero del enemigo (con sus barcos reales)
+        tablero_disparos (list): Tablero de disparos del jugador que dispara
+        fila (int): Fila del disparo
+        columna (int): Columna del disparo
+        contadores (dict): Contadores del tablero enemigo (ver crear_contadores), opcional
+    
+    Returns:
+        tuple: (resultado, id_barco) con resultado 'repetido', 'agua', 'tocado'
+               o 'hundido', e id_barco el barco tocado en el índice (None si
+               es agua, repetido o no hay índice)
+    """
     # Verificar si ya disparó ahí
     if tablero_disparos[fila][columna] != '~':
-        return 'repetido'
+        return 'repetido', None
     
     # Verificar si hay barco
     if tablero_enemigo[fila][columna] == 'B':
         # Tocado
         tablero_enemigo[fila][columna] = 'X'
         tablero_disparos[fila][columna] = 'X'
+        if contadores is None:
+            # Verificar si hundió el barco
+            if verificar_barco_hundido(tablero_enemigo, fila, columna):
+                return 'hundido', None
+            return 'tocado', None
         
-        # Verificar si hundió el barco
-        if verificar_barco_hundido(tablero_enemigo, fila, columna):
-            return 'hundido'
-        else:
-            return 'tocado'
+        contadores['casillas_barco'] -= 1
+        return contadores['barcos'].resolver_disparo(fila, columna)
     else:
         # Agua
         tablero_disparos[fila][columna] = 'O'
-        return 'agua'
+        return 'agua', None
 
 
 def verificar_barco_hundido(tablero, fila, columna):
@@ -373,126 +570,182 @@ def verificar_barco_hundido(tablero, fila, columna):
     Returns:
         bool: True si el barco está hundido, False si no
     """
-    # Buscar todas las partes del barco (conectadas horizontal o verticalmente)
-    partes_barco = []
-    visitados = set()
+    # El barco es el tramo recto de casillas 'B'/'X' que pasa por el impacto:
+    # se recorre desde él en las 4 direcciones (solo las casillas del barco,
+    # así que no depende del tamaño del tablero)
+    n = len(tablero)
+    for df, dc in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+        f, c = fila + df, columna + dc
+        while 0 <= f < n and 0 <= c < n and tablero[f][c] in ('B', 'X'):
+            # Está hundido si no le queda ninguna casilla 'B' sin tocar
+            if tablero[f][c] == 'B':
+                return False
+            f, c = f + df, c + dc
+    return True
+
+
+def nombre_barco_hundido(nombre):
+    """
+    Texto con el nombre del barco hundido para los mensajes (" (Acorazado)").
     
-    def buscar_partes(f, c):
-        """Función recursiva para encontrar todas las partes del barco"""
-        if (f, c) in visitados or f < 0 or f >= 10 or c < 0 or c >= 10:
-            return
-        
-        visitados.add((f, c))
-        
-        if tablero[f][c] in ['B', 'X']:
-            partes_barco.append((f, c, tablero[f][c]))
-            # Buscar en las 4 direcciones (no diagonales)
-            buscar_partes(f-1, c)
-            buscar_partes(f+1, c)
-            buscar_partes(f, c-1)
-            buscar_partes(f, c+1)
+    Args:
+        nombre (str): Nombre del barco (None si no se sabe)
+    
+    Returns:
+        str: El nombre entre paréntesis, o "" si no se conoce
+    """
+    return f" ({nombre})" if nombre else ""
+
+
+def contar_casillas_barco(tablero):
+    """
+    Cuenta las casillas de barco que todavía no han sido tocadas.
     
-    buscar_partes(fila, columna)
+    Args:
+        tablero (list): Tablero con los barcos
     
-    # El barco está hundido si todas sus partes son 'X'
-    return all(estado == 'X' for _, _, estado in partes_barco)
+    Returns:
+        int: Número de casillas 'B' que quedan en el tablero
+    """
+    return sum(fila.count('B') for fila in tablero)
 
 
-def verificar_victoria(tablero):
+def crear_contadores(tablero, indice=None):
+    """
+    Crea los contadores en vivo de un tablero, con un único recorrido.
+    
+    A partir de aquí realizar_disparo() los actualiza en cada impacto, de modo
+    que verificar_victoria() no tiene que recorrer el tablero.
+    Se deben crear después de colocar la flota.
+    
+    Args:
+        tablero (list): Tablero con los barcos ya colocados
+        indice (IndiceBarcos): Índice de barcos rellenado al colocar la flota.
+                               Si no se da, se reconstruye a partir del tablero
+    
+    Returns:
+        dict: {'casillas_barco': int, 'barcos': IndiceBarcos}
+    """
+    if indice is None:
+        indice = indice_barcos.IndiceBarcos.desde_tablero(tablero)
+    return {'casillas_barco': contar_casillas_barco(tablero), 'barcos': indice}
+
+
+def verificar_victoria(tablero, contadores=None):
     """
     Verifica si todos los barcos en el tablero han sido hundidos.
     
+    Con contadores la comprobación es inmediata (O(1)); sin ellos se recorre
+    todo el tablero. Si DEPURAR_CONTADORES está activo, se hacen las dos cosas
+    y se comprueba que coinciden.
+    
     Args:
         tablero (list): Tablero a verificar
+        contadores (dict): Contadores del tablero (ver crear_contadores), opcional
     
     Returns:
         bool: True si todos los barcos están hundidos, False si no
     """
-    for fila in tablero:
-        for casilla in fila:
-            if casilla == 'B':  # Si queda alguna parte de barco sin tocar
-                return False
-    return True
+    if contadores is None:
+        return contar_casillas_barco(tablero) == 0
+    
+    if DEPURAR_CONTADORES:
+        restantes = contar_casillas_barco(tablero)
+        if restantes != contadores['casillas_barco']:
+            raise RuntimeError(
+                f"Contador desincronizado: casillas_barco={contadores['casillas_barco']}, "
+                f"recorrido completo={restantes}"
+            )
+    
+    return contadores['casillas_barco'] == 0
 
 
-def turno_jugador(nombre_jugador, tablero_propio, tablero_enemigo, tablero_disparos):
+def turno_jugador(nombre_jugador, partida, grabacion=None):
     """
-    Gestiona el turno de un jugador humano.
+    Gestiona el turno de un jugador humano: pide la casilla y muestra el
+    resultado. Las reglas las aplica el motor (ver motor_flota.py).
     
     Args:
         nombre_jugador (str): Nombre del jugador
-        tablero_propio (list): Tablero del jugador
-        tablero_enemigo (list): Tablero del enemigo
-        tablero_disparos (list): Tablero de disparos del jugador
+        partida (PartidaFlota): Partida en juego; dispara el jugador partida.turno
+        grabacion (Grabacion): Grabación de la partida donde anotar el disparo, opcional
     
     Returns:
         bool: True si ganó, False si no
     """
+    jugador = partida.turno
+    tablero_propio = partida.tableros[jugador]
+    tablero_disparos = partida.disparos[jugador]
+    ultima_columna = coordenadas.letras_columna(partida.n - 1)
+    
+    # Solo se reescriben las filas que cambian entre una pantalla y la siguiente
+    renderizador = renderizado.Renderizador()
+    
     while True:
-        limpiar_pantalla()
-        mostrar_tableros(tablero_propio, tablero_disparos, nombre_jugador, turno_actual=True)
+        renderizador.dibujar(formatear_tableros(tablero_propio, tablero_disparos, nombre_jugador))
         
-        columna_input = input("Columna para disparar (A-J): ").strip()
-        fila_input = input("Fila para disparar (1-10): ").strip()
+        columna_input = input(f"Columna para disparar (A-{ultima_columna}): ").strip()
+        fila_input = input(f"Fila para disparar (1-{partida.n}): ").strip()
         
-        fila, columna = convertir_coordenada(columna_input, fila_input)
+        fila, columna = convertir_coordenada(columna_input, fila_input, partida.n)
         
         if fila is None:
             print("\n❌ Coordenadas inválidas. Intenta de nuevo.")
             input("Presiona Enter para continuar...")
             continue
         
-        resultado = realizar_disparo(tablero_enemigo, tablero_disparos, fila, columna)
+        jugada = partida.aplicar_jugada(fila, columna)
+        resultado = jugada['resultado']
         
         if resultado == 'repetido':
             print("\n❌ Ya disparaste ahí. Elige otra casilla.")
             input("Presiona Enter para continuar...")
             continue
         
-        limpiar_pantalla()
-        mostrar_tableros(tablero_propio, tablero_disparos, nombre_jugador, turno_actual=True)
+        if grabacion is not None:
+            grabacion.anotar(fila, columna)
+        
+        renderizador.dibujar(formatear_tableros(tablero_propio, tablero_disparos, nombre_jugador))
         
         if resultado == 'agua':
             print("\n[~] AGUA! No hay nada ahi.")
         elif resultado == 'tocado':
             print("\n[X] TOCADO! Le diste a un barco.")
         elif resultado == 'hundido':
-            print("\n[XXX] HUNDIDO! Has hundido un barco enemigo.")
+            print(f"\n[XXX] HUNDIDO! Has hundido un barco enemigo{nombre_barco_hundido(jugada['barco'])}.")
         
         input("\nPresiona Enter para continuar...")
         
-        # Verificar victoria
-        if verificar_victoria(tablero_enemigo):
-            return True
-        
-        return False
+        return jugada['victoria']
 
 
-def ia_disparar_facil(tablero_disparos):
+def ia_disparar_facil(tablero_disparos, pool=None, rng=None):
     """
     IA de nivel fácil: dispara completamente al azar.
     
     Args:
         tablero_disparos (list): Tablero de disparos de la IA
+        pool (PoolCasillas): Casillas sin disparar (ver crear_estado_ia), opcional.
+                             Sin él se construye a partir del tablero
+        rng (random.Random): Generador de la partida; por defecto el módulo random
     
     Returns:
         tuple: (fila, columna) donde disparar
     """
-    while True:
-        fila = random.randint(0, 9)
-        columna = random.randint(0, 9)
-        
-        if tablero_disparos[fila][columna] == '~':
-            return fila, columna
+    if pool is None:
+        pool = pool_casillas.PoolCasillas.desde_tablero(tablero_disparos)
+    return pool.aleatoria(rng)
 
 
-def ia_disparar_intermedio(tablero_disparos, ultimo_tocado):
+def ia_disparar_intermedio(tablero_disparos, ultimo_tocado, pool=None, rng=None):
     """
     IA de nivel intermedio: si tocó un barco, dispara alrededor.
     
     Args:
         tablero_disparos (list): Tablero de disparos de la IA
         ultimo_tocado (list): Lista de posiciones tocadas pendientes de explorar
+        pool (PoolCasillas): Casillas sin disparar, opcional
+        rng (random.Random): Generador de la partida; por defecto el módulo random
     
     Returns:
         tuple: (fila, columna) donde disparar
@@ -503,81 +756,160 @@ def ia_disparar_intermedio(tablero_disparos, ultimo_tocado):
         
         # Intentar las 4 direcciones adyacentes
         direcciones = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-        random.shuffle(direcciones)
+        (rng or random).shuffle(direcciones)
         
         for df, dc in direcciones:
             nf, nc = f + df, c + dc
-            if 0 <= nf < 10 and 0 <= nc < 10 and tablero_disparos[nf][nc] == '~':
+            if 0 <= nf < len(tablero_disparos) and 0 <= nc < len(tablero_disparos[nf]) and tablero_disparos[nf][nc] == '~':
                 return nf, nc
         
         # Si no hay casillas adyacentes libres, quitar de la lista
         ultimo_tocado.pop()
-        return ia_disparar_intermedio(tablero_disparos, ultimo_tocado)
+        return ia_disparar_intermedio(tablero_disparos, ultimo_tocado, pool, rng)
     
     # Si no hay barcos tocados, disparar al azar
-    return ia_disparar_facil(tablero_disparos)
+    return ia_disparar_facil(tablero_disparos, pool, rng)
 
 
-def ia_disparar_dificil(tablero_disparos, ultimo_tocado, patron):
+def ia_disparar_dificil(tablero_disparos, ultimo_tocado, patron, pool=None, rng=None):
     """
     IA de nivel difícil: usa patrón de tablero de ajedrez y búsqueda inteligente.
     
     Args:
         tablero_disparos (list): Tablero de disparos de la IA
         ultimo_tocado (list): Lista de posiciones tocadas
-        patron (list): Lista de casillas en patrón de tablero de ajedrez
+        patron (deque): Casillas en patrón de tablero de ajedrez (ver crear_patron)
+        pool (PoolCasillas): Casillas sin disparar, opcional
+        rng (random.Random): Generador de la partida; por defecto el módulo random
     
     Returns:
         tuple: (fila, columna) donde disparar
     """
     # Si tiene barcos tocados, usar estrategia inteligente
     if ultimo_tocado:
-        return ia_disparar_intermedio(tablero_disparos, ultimo_tocado)
+        return ia_disparar_intermedio(tablero_disparos, ultimo_tocado, pool, rng)
     
-    # Si no, usar patrón de tablero de ajedrez
-    if patron:
-        while patron:
-            fila, columna = patron.pop(0)
-            if tablero_disparos[fila][columna] == '~':
-                return fila, columna
+    # Si no, usar patrón de tablero de ajedrez (popleft es O(1), pop(0) de una lista no)
+    while patron:
+        fila, columna = patron.popleft()
+        if tablero_disparos[fila][columna] == '~':
+            return fila, columna
     
     # Si se acabó el patrón, disparar al azar
-    return ia_disparar_facil(tablero_disparos)
+    return ia_disparar_facil(tablero_disparos, pool, rng)
 
 
-def turno_ia(nivel, tablero_ia, tablero_jugador, tablero_disparos_ia, ultimo_tocado, patron=None):
+def crear_patron(n=TAMANO, rng=None):
     """
-    Gestiona el turno de la IA según su nivel de dificultad.
+    Casillas en patrón de tablero de ajedrez, en orden aleatorio, para la IA difícil.
     
     Args:
-        nivel (str): 'facil', 'intermedio' o 'dificil'
-        tablero_ia (list): Tablero de la IA
-        tablero_jugador (list): Tablero del jugador
-        tablero_disparos_ia (list): Tablero de disparos de la IA
-        ultimo_tocado (list): Lista de tocados para IA intermedia/difícil
-        patron (list): Patrón para IA difícil
+        n (int): Lado del tablero
+        rng (random.Random): Generador de la partida; por defecto el módulo random
     
     Returns:
-        bool: True si la IA ganó, False si no
+        deque: Casillas (fila, columna) en el orden en que se dispararán
     """
-    print("\n[IA] Turno de la COMPUTADORA...")
-    import time
-    time.sleep(1.5)  # Pausa para dramatismo
+    patron = [(i, j) for i in range(n) for j in range(n) if (i + j) % 2 == 0]
+    (rng or random).shuffle(patron)
+    return deque(patron)
+
+
+def crear_estado_ia(nivel, n=TAMANO, rng=None, longitudes=None):
+    """
+    Crea el estado propio de la IA: el pool de casillas sin disparar para
+    los niveles fácil, intermedio y difícil (ver pool_casillas.py), el mapa
+    de calor de la probabilística (ver ia_probabilistica.py) o las muestras
+    de la experta (ver ia_montecarlo.py).
+    
+    En tableros de más de ia_montecarlo.LADO_MAXIMO de lado la experta usa
+    el mapa de calor: cada jugada tendría que mandar a los procesos
+    decenas de miles de colocaciones.
     
-    # Decidir dónde disparar según el nivel
+    Args:
+        nivel (str): Nivel de la IA
+        n (int): Lado del tablero
+        rng (random.Random): Generador de la partida para desempatar (probabilística
+                             y experta); sin él cada una crea el suyo
+        longitudes (list): Longitudes de la flota rival; por defecto las de FLOTA
+    
+    Returns:
+        PoolCasillas o MapaCalor: Estado de la IA
+    """
+    if longitudes is None:
+        longitudes = [longitud for _, longitud in FLOTA]
+    if nivel == 'experto' and n <= ia_montecarlo.LADO_MAXIMO:
+        return ia_montecarlo.EstadoMonteCarlo(n, longitudes, rng)
+    if nivel in ['probabilistico', 'experto']:
+        return ia_probabilistica.MapaCalor(n, longitudes, rng)
+    return pool_casillas.PoolCasillas(n)
+
+
+def elegir_disparo_ia(nivel, tablero_disparos_ia, ultimo_tocado, patron=None, estado_ia=None, rng=None):
+    """
+    Decide dónde dispara la IA según su nivel.
+    
+    Args:
+        rng (random.Random): Generador de la partida; por defecto el módulo random
+                             (la probabilística y la experta usan el de su estado)
+    
+    Returns:
+        tuple: (fila, columna) donde disparar
+    """
     if nivel == 'facil':
-        fila, columna = ia_disparar_facil(tablero_disparos_ia)
-    elif nivel == 'intermedio':
-        fila, columna = ia_disparar_intermedio(tablero_disparos_ia, ultimo_tocado)
-    else:  # difícil
-        fila, columna = ia_disparar_dificil(tablero_disparos_ia, ultimo_tocado, patron)
+        return ia_disparar_facil(tablero_disparos_ia, estado_ia, rng)
+    if nivel == 'intermedio':
+        return ia_disparar_intermedio(tablero_disparos_ia, ultimo_tocado, estado_ia, rng)
+    if nivel in ['probabilistico', 'experto']:
+        return estado_ia.elegir_disparo()
+    return ia_disparar_dificil(tablero_disparos_ia, ultimo_tocado, patron, estado_ia, rng)
+
+
+def registrar_disparo_ia(nivel, fila, columna, resultado, ultimo_tocado, estado_ia=None):
+    """
+    Actualiza la memoria de la IA con el resultado de su disparo.
+    """
+    if nivel in ['probabilistico', 'experto']:
+        estado_ia.registrar(fila, columna, resultado)
+        return
+    
+    # La casilla ya no está libre, la haya elegido al azar o no
+    if estado_ia is not None:
+        estado_ia.quitar(fila, columna)
+    if nivel in ['intermedio', 'dificil']:
+        if resultado == 'tocado':
+            # Añadir a la lista de tocados para IA intermedia/difícil
+            ultimo_tocado.append((fila, columna))
+        elif resultado == 'hundido' and (fila, columna) in ultimo_tocado:
+            # Si hundió, limpiar la lista de tocados para este barco
+            ultimo_tocado.remove((fila, columna))
+
+
+def turno_ia(ia, partida, pausa=PAUSA_IA, grabacion=None):
+    """
+    Gestiona el turno de la IA y muestra su disparo.
     
-    # Realizar el disparo
-    resultado = realizar_disparo(tablero_jugador, tablero_disparos_ia, fila, columna)
+    Args:
+        ia (IAFlota): IA que juega (ver motor_flota.py)
+        partida (PartidaFlota): Partida en juego; dispara el jugador partida.turno
+        pausa (float): Segundos de espera antes del disparo (0 = sin pausa)
+        grabacion (Grabacion): Grabación de la partida donde anotar el disparo, opcional
+    
+    Returns:
+        bool: True si la IA ganó, False si no
+    """
+    print("\n[IA] Turno de la COMPUTADORA...")
+    if pausa:
+        time.sleep(pausa)  # Pausa para dramatismo
+    
+    jugada = partida.jugada_ia(ia)
+    resultado = jugada['resultado']
+    if grabacion is not None and resultado in ('agua', 'tocado', 'hundido'):
+        grabacion.anotar(jugada['fila'], jugada['columna'])
     
     # Convertir coordenadas para mostrar
-    columna_letra = chr(ord('A') + columna)
-    fila_num = fila + 1
+    columna_letra = coordenadas.letras_columna(jugada['columna'])
+    fila_num = jugada['fila'] + 1
     
     print(f"\nLa computadora dispara en: {columna_letra}{fila_num}")
     
@@ -585,19 +917,12 @@ def turno_ia(nivel, tablero_ia, tablero_jugador, tablero_disparos_ia, ultimo_toc
         print("[~] AGUA!")
     elif resultado == 'tocado':
         print("[X] TOCADO! La computadora le dio a uno de tus barcos.")
-        # Añadir a la lista de tocados para IA intermedia/difícil
-        if nivel in ['intermedio', 'dificil']:
-            ultimo_tocado.append((fila, columna))
     elif resultado == 'hundido':
-        print("[XXX] HUNDIDO! La computadora hundio uno de tus barcos.")
-        # Si hundió, limpiar la lista de tocados para este barco
-        if nivel in ['intermedio', 'dificil'] and (fila, columna) in ultimo_tocado:
-            ultimo_tocado.remove((fila, columna))
+        print(f"[XXX] HUNDIDO! La computadora hundio uno de tus barcos{nombre_barco_hundido(jugada['barco'])}.")
     
     input("\nPresiona Enter para continuar...")
     
-    # Verificar victoria
-    return verificar_victoria(tablero_jugador)
+    return jugada['victoria']
 
 
 def menu_modo_juego():
@@ -630,12 +955,66 @@ def menu_modo_juego():
             input("Presiona Enter para continuar...")
 
 
-def menu_dificultad_ia():
+def menu_tablero():
+    """
+    Menú para elegir el tamaño del tablero y la flota.
+    
+    Returns:
+        tuple: (n, flota) con el lado del tablero y los barcos (nombre, longitud)
+    """
+    while True:
+        limpiar_pantalla()
+        print("=" * 60)
+        print("         HUNDIR LA FLOTA - TABLERO Y FLOTA")
+        print("=" * 60)
+        print(f"\n1. Clásico    ({TAMANO}×{TAMANO}, {len(FLOTA)} barcos)")
+        print(f"2. Grande     ({TAMANO_GRANDE}×{TAMANO_GRANDE}, {len(flota_para_tamano(TAMANO_GRANDE))} barcos)")
+        print(f"3. Gigante    ({TAMANO_MAXIMO}×{TAMANO_MAXIMO}, {len(flota_para_tamano(TAMANO_MAXIMO))} barcos)")
+        print("4. A medida   (tamaño y barcos a elegir)")
+        print("=" * 60)
+        
+        opcion = input("\nElige el tablero (1-4): ").strip()
+        
+        if opcion == '1':
+            return TAMANO, list(FLOTA)
+        elif opcion == '2':
+            return TAMANO_GRANDE, flota_para_tamano(TAMANO_GRANDE)
+        elif opcion == '3':
+            return TAMANO_MAXIMO, flota_para_tamano(TAMANO_MAXIMO)
+        elif opcion == '4':
+            tamano = input(f"\nLado del tablero ({TAMANO_MINIMO}-{TAMANO_MAXIMO}): ").strip()
+            if not tamano.isdigit() or not TAMANO_MINIMO <= int(tamano) <= TAMANO_MAXIMO:
+                print(f"\n❌ El lado debe estar entre {TAMANO_MINIMO} y {TAMANO_MAXIMO}.")
+                input("Presiona Enter para continuar...")
+                continue
+            n = int(tamano)
+            texto = input(f"Longitudes de los barcos (ej: 5 4 3 3 2; Enter = {len(flota_para_tamano(n))} barcos): ")
+            flota = leer_flota(texto) if texto.strip() else flota_para_tamano(n)
+            longitudes = [longitud for _, longitud in flota] if flota else []
+            # Se busca una colocación de verdad: la superficie no basta (9 barcos de 5 no caben en 10×10)
+            if not flota or colocacion_barcos.buscar_colocaciones(
+                    colocacion_barcos.IndiceColocaciones(n), longitudes) is None:
+                print("\n❌ Esa flota no es válida o no cabe en el tablero.")
+                input("Presiona Enter para continuar...")
+                continue
+            return n, flota
+        else:
+            print("\n❌ Opción inválida.")
+            input("Presiona Enter para continuar...")
+
+
+def menu_dificultad_ia(n=TAMANO):
     """
     Menú para seleccionar la dificultad de la IA.
     
+    En tableros de más de ia_montecarlo.LADO_MAXIMO de lado avisa de que la
+    experta jugará con el mapa de probabilidades (ver crear_estado_ia).
+    
+    Args:
+        n (int): Lado del tablero de la partida
+    
     Returns:
-        str: 'facil', 'intermedio', o 'dificil'
+        str: 'facil', 'intermedio', 'dificil', 'probabilistico' o 'experto'
     """
     while True:
         limpiar_pantalla()
@@ -645,9 +1024,15 @@ def menu_dificultad_ia():
         print("\n1. Fácil      (Disparos aleatorios)")
         print("2. Intermedio (Busca alrededor al tocar)")
         print("3. Difícil    (Estrategia avanzada)")
+        print("4. Probabilístico (Mapa de probabilidades)")
+        if n <= ia_montecarlo.LADO_MAXIMO:
+            print("5. Experto    (Simula miles de flotas posibles)")
+        else:
+            print(f"5. Experto    (Solo simula hasta {ia_montecarlo.LADO_MAXIMO}×{ia_montecarlo.LADO_MAXIMO}; "
+                  f"en {n}×{n} juega como la 4)")
         print("=" * 60)
         
-        opcion = input("\nElige la dificultad (1-3): ").strip()
+        opcion = input("\nElige la dificultad (1-5): ").strip()
         
         if opcion == '1':
             return 'facil'
@@ -655,6 +1040,10 @@ def menu_dificultad_ia():
             return 'intermedio'
         elif opcion == '3':
             return 'dificil'
+        elif opcion == '4':
+            return 'probabilistico'
+        elif opcion == '5':
+            return 'experto'
         else:
             print("\n❌ Opción inválida.")
             input("Presiona Enter para continuar...")
@@ -663,101 +1052,112 @@ def menu_dificultad_ia():
 def jugar_hundir_flota():
     """
     Función principal del juego Hundir la Flota.
+    
+    Solo se encarga de menús, pantallas y entrada del jugador; el estado de
+    la partida y las reglas están en motor_flota.PartidaFlota.
     """
+    # Importación aquí porque motor_flota y repeticion importan este módulo
+    import motor_flota
+    import repeticion
+    
     # Seleccionar modo de juego
     modo = menu_modo_juego()
     
     if modo is None:
         return  # Volver al menú principal
     
-    # Crear tableros
-    tablero_j1 = crear_tablero()
-    tablero_j2 = crear_tablero()
-    tablero_disparos_j1 = crear_tablero()
-    tablero_disparos_j2 = crear_tablero()
+    # Tamaño del tablero y flota de los dos jugadores
+    n, flota = menu_tablero()
+    
+    # Tableros, índices de barcos y turnos, con su propia semilla para poder
+    # reproducir la partida (ver repeticion.py)
+    partida = motor_flota.PartidaFlota(flota, semilla=repeticion.nueva_semilla(), n=n)
     
     if modo == 'pvp':
         # Modo Jugador vs Jugador
         nombre_j1 = input("\nNombre del Jugador 1: ").strip() or "Jugador 1"
         nombre_j2 = input("Nombre del Jugador 2: ").strip() or "Jugador 2"
+        nombres = [nombre_j1, nombre_j2]
         
-        # Colocar flotas
-        colocar_flota(tablero_j1, nombre_j1)
+        # Colocar flotas (registrando qué barco ocupa cada casilla)
+        if not colocar_flota(partida.tableros[0], nombre_j1, partida.indices[0], partida.flota, rng=partida.rng):
+            return
         input(f"\n{nombre_j1} ha colocado su flota. {nombre_j2}, aparta la vista...")
-        colocar_flota(tablero_j2, nombre_j2)
+        if not colocar_flota(partida.tableros[1], nombre_j2, partida.indices[1], partida.flota, rng=partida.rng):
+            return
         
-        # Juego por turnos
-        turno = 1  # 1 = Jugador 1, 2 = Jugador 2
+        # Contadores en vivo de casillas de barco sin tocar
+        partida.empezar()
+        grabacion = repeticion.Grabacion.de_flota(partida)
         
+        # Juego por turnos
         while True:
-            if turno == 1:
-                if turno_jugador(nombre_j1, tablero_j1, tablero_j2, tablero_disparos_j1):
-                    limpiar_pantalla()
-                    print("=" * 60)
-                    print(f"  *** {nombre_j1.upper()} HA GANADO! ***")
-                    print("=" * 60)
-                    input("\nPresiona Enter para volver al menú principal...")
-                    break
-                turno = 2
-            else:
-                if turno_jugador(nombre_j2, tablero_j2, tablero_j1, tablero_disparos_j2):
-                    limpiar_pantalla()
-                    print("=" * 60)
-                    print(f"  *** {nombre_j2.upper()} HA GANADO! ***")
-                    print("=" * 60)
-                    input("\nPresiona Enter para volver al menú principal...")
-                    break
-                turno = 1
+            nombre = nombres[partida.turno]
+            if turno_jugador(nombre, partida, grabacion):
+                limpiar_pantalla()
+                print("=" * 60)
+                print(f"  *** {nombre.upper()} HA GANADO! ***")
+                print("=" * 60)
+                input("\nPresiona Enter para volver al menú principal...")
+                break
     
     else:  # modo == 'pvc'
         # Modo Jugador vs Computadora
-        nivel_ia = menu_dificultad_ia()
+        nivel_ia = menu_dificultad_ia(n)
         nombre_j1 = input("\nTu nombre: ").strip() or "Jugador"
         
-        # Colocar flota del jugador
-        colocar_flota(tablero_j1, nombre_j1)
+        # Colocar flota del jugador (registrando qué barco ocupa cada casilla)
+        if not colocar_flota(partida.tableros[0], nombre_j1, partida.indices[0], partida.flota, rng=partida.rng):
+            return
         
         # Colocar flota de la IA aleatoriamente
         print("\n[IA] La computadora esta colocando su flota...")
-        for longitud in [5, 4, 3, 3, 2]:
-            colocar_barco_aleatorio(tablero_j2, longitud)
+        if not partida.colocar_flota_aleatoria(1):
+            print("\n❌ La flota de la computadora no cabe en el tablero.")
+            input("Presiona Enter para volver al menú principal...")
+            return
         print("[OK] Flota de la computadora lista.")
-        input("Presiona Enter para comenzar...")
         
-        # Variables para la IA
-        ultimo_tocado_ia = []  # Para IA intermedia y difícil
-        patron_ia = []  # Para IA difícil
-        
-        # Crear patrón de tablero de ajedrez para IA difícil
-        if nivel_ia == 'dificil':
-            for i in range(10):
-                for j in range(10):
-                    if (i + j) % 2 == 0:
-                        patron_ia.append((i, j))
-            random.shuffle(patron_ia)
+        # Contadores en vivo de casillas de barco sin tocar
+        partida.empezar()
+        grabacion = repeticion.Grabacion.de_flota(partida)
+        input("Presiona Enter para comenzar...")
         
-        # Juego por turnos
-        turno = 1  # 1 = Jugador, 2 = IA
+        # Memoria de la IA: impactos pendientes, patrón, casillas libres,
+        # mapa de probabilidades o muestras, según el nivel. Usa el generador
+        # de la partida, así que la semilla de la grabación reproduce sus decisiones
+        ia = motor_flota.IAFlota(nivel_ia, partida.n, rng=partida.rng,
+                                 longitudes=[longitud for _, longitud in partida.flota])
         
-        while True:
-            if turno == 1:
-                if turno_jugador(nombre_j1, tablero_j1, tablero_j2, tablero_disparos_j1):
-                    limpiar_pantalla()
-                    print("=" * 60)
-                    print(f"  *** {nombre_j1.upper()} HA GANADO! ***")
-                    print("=" * 60)
-                    input("\nPresiona Enter para volver al menú principal...")
-                    break
-                turno = 2
-            else:
-                if turno_ia(nivel_ia, tablero_j2, tablero_j1, tablero_disparos_j2, ultimo_tocado_ia, patron_ia):
-                    limpiar_pantalla()
-                    print("=" * 60)
-                    print("  *** LA COMPUTADORA HA GANADO ***")
-                    print("=" * 60)
-                    input("\nPresiona Enter para volver al menú principal...")
-                    break
-                turno = 1
+        # Juego por turnos (0 = Jugador, 1 = IA)
+        try:
+            while True:
+                if partida.turno == 0:
+                    if turno_jugador(nombre_j1, partida, grabacion):
+                        limpiar_pantalla()
+                        print("=" * 60)
+                        print(f"  *** {nombre_j1.upper()} HA GANADO! ***")
+                        print("=" * 60)
+                        input("\nPresiona Enter para volver al menú principal...")
+                        break
+                else:
+                    if turno_ia(ia, partida, grabacion=grabacion):
+                        limpiar_pantalla()
+                        print("=" * 60)
+                        print("  *** LA COMPUTADORA HA GANADO ***")
+                        print("=" * 60)
+                        input("\nPresiona Enter para volver al menú principal...")
+                        break
+        finally:
+            # Terminar los procesos de la IA experta, también si la partida se corta
+            if nivel_ia == 'experto':
+                ia_montecarlo.cerrar_pool()
+    
+    # Guardar la partida para poder verla después con repeticion.py
+    try:
+        grabacion.guardar(ARCHIVO_REPETICION)
+    except OSError as error:
+        print(f"\n❌ No se pudo guardar la repetición: {error}")
 
 
 # Punto de entrada para pruebas del módulo
@@ -0,0 +1,335 @@
+"""
+IA MONTE CARLO - Nivel experto de Hundir la Flota
+=================================================
+
+IA que genera miles de flotas enemigas completas compatibles con todo lo
+visto hasta ahora y dispara a la casilla que tiene barco en más de ellas.
+
+Una flota de muestra es compatible si:
+- Cada barco usa una colocación que la IA probabilística aún da por
+  posible (no pasa por agua, no toca barcos hundidos ni queda pegada a un
+  impacto sin pasar por él).
+- Los barcos no se tocan entre sí.
+- Cubre todos los impactos de barcos sin hundir.
+
+Para que casi todas las muestras salgan bien al atacar, primero se cubren
+los impactos (cada uno con una colocación al azar que pase por él) y
+después se colocan al azar los barcos que falten.
+
+Las muestras se generan en un pool de procesos que se mantiene durante
+toda la partida. Cada tarea lleva su propia semilla, sacada del generador
+de la partida (ver EstadoMonteCarlo.contar_muestras), así que el pool se
+puede reutilizar entre partidas sin que una dependa de la otra. Cada tarea
+trabaja hasta el límite de tiempo de la jugada; lo
+que haya contado para entonces es la respuesta. Así el turno de la
+computadora tarda siempre lo mismo, esté como esté la partida. Si no hay
+muestras (o no se pueden crear procesos) se usa el mapa de calor de la IA
+probabilística.
+
+Uso:
+    estado = EstadoMonteCarlo(10, [5, 4, 3, 3, 2])
+    fila, columna = estado.elegir_disparo()
+    estado.registrar(fila, columna, 'agua')   # 'agua', 'tocado' o 'hundido'
+    cerrar_pool()                             # al acabar la partida (y al salir)
+
+Autor: Proyecto Grupal ASIR - Python
+"""
+
+import atexit
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+
+import ia_probabilistica
+from compartido import bitboard_flota
+
+
+# Tiempo que se da a los procesos para generar muestras en cada jugada
+PRESUPUESTO_SEGUNDOS = 0.4
+
+# Espera extra para recoger los resultados después del límite
+MARGEN_SEGUNDOS = 0.05
+
+# Muestras por jugada a partir de las cuales no merece la pena seguir
+MAX_MUESTRAS = 20000
+
+# Intentos al azar para colocar cada barco antes de descartar la muestra
+INTENTOS_BARCO = 30
+
+# Lado máximo de tablero para la IA experta: la observación de cada jugada
+# (todas las colocaciones posibles con sus máscaras) ocupa ~1 MB en 32×32,
+# pero ~17 MB en 64×64 y ~100 MB en 100×100, demasiado para mandarla a los
+# procesos en cada jugada (ver hundir_flota.crear_estado_ia)
+LADO_MAXIMO = 32
+
+# Pool de procesos compartido por todas las jugadas (ver obtener_pool)
+_pool = None
+_procesos_pool = 0
+
+
+@lru_cache(maxsize=16)
+def tabla_mascaras(n, longitudes):
+    """
+    Máscara y halo de cada colocación, con los mismos ids que
+    ia_probabilistica.tablas_colocaciones(n, longitudes).
+    """
+    geo = bitboard_flota.geometria(n)
+    return tuple(geo.mascaras_de(longitud, fila, columna, orientacion)
+                 for longitud in longitudes
+                 for fila, columna, orientacion in geo.colocaciones_de(longitud))
+
+
+def generar_muestra(rng, observacion):
+    """
+    Genera una flota compatible con lo observado.
+
+    Args:
+        rng (random.Random): Generador de números aleatorios
+        observacion (tuple): (longitudes, por_longitud, impactos, por_impacto),
+                             ver EstadoMonteCarlo.observacion()
+
+    Returns:
+        int: Máscara de las casillas con barco, o 0 si la muestra no salió
+    """
+    longitudes, por_longitud, impactos, por_impacto = observacion
+    eleccion = rng.choice
+    prohibidas = ocupadas = 0
+    pendientes = list(longitudes)
+
+    # Primero, un barco que pase por cada impacto aún sin cubrir
+    sin_cubrir = impactos
+    while sin_cubrir:
+        casilla = (sin_cubrir & -sin_cubrir).bit_length() - 1
+        candidatas = [colocacion for colocacion in por_impacto[casilla]
+                      if colocacion[0] in pendientes and not colocacion[1] & prohibidas]
+        if not candidatas:
+            return 0
+        longitud, mascara, halo = eleccion(candidatas)
+        pendientes.remove(longitud)
+        ocupadas |= mascara
+        prohibidas |= halo
+        sin_cubrir &= ~mascara
+
+    # Después, el resto de barcos (de más largo a más corto) en cualquier sitio libre
+    for longitud in sorted(pendientes, reverse=True):
+        lista = por_longitud[longitud]
+        if not lista:
+            return 0
+        for _ in range(INTENTOS_BARCO):
+            mascara, halo = eleccion(lista)
+            if not mascara & prohibidas:
+                break
+        else:
+            return 0
+        ocupadas |= mascara
+        prohibidas |= halo
+    return ocupadas
+
+
+def muestrear(observacion, n, disparadas, limite, max_muestras, rng=None, semilla=None):
+    """
+    Genera muestras hasta el límite de tiempo y cuenta el barco de cada casilla.
+
+    Args:
+        n (int): Lado del tablero
+        disparadas (int): Máscara de casillas ya disparadas (no se cuentan)
+        limite (float): Instante (time.time()) en el que hay que parar
+        max_muestras (int): Muestras como máximo
+        rng (random.Random): Generador (en este mismo proceso)
+        semilla (int): Semilla de un generador nuevo, si no se da 'rng' (en los
+                       procesos trabajadores, una por tarea)
+
+    Returns:
+        tuple: (conteo, muestras) donde conteo[casilla] es el número de
+               muestras con barco en esa casilla
+    """
+    rng = rng or random.Random(semilla)
+    conteo = [0] * (n * n)
+    sin_disparar = ((1 << (n * n)) - 1) & ~disparadas
+    muestras = intentos = 0
+    while muestras < max_muestras:
+        # Mirar el reloj cada pocas muestras, que también cuesta
+        if intentos % 32 == 0 and time.time() >= limite:
+            break
+        intentos += 1
+        ocupadas = generar_muestra(rng, observacion) & sin_disparar
+        if not ocupadas and observacion[0]:
+            continue
+        muestras += 1
+        while ocupadas:
+            menor = ocupadas & -ocupadas
+            conteo[menor.bit_length() - 1] += 1
+            ocupadas ^= menor
+    return conteo, muestras
+
+
+def _calentar(n):
+    # Prepara las tablas en el proceso trabajador antes de la primera jugada
+    bitboard_flota.geometria(n)
+    return os.getpid()
+
+
+def obtener_pool(procesos):
+    """
+    Devuelve el pool de procesos compartido, creándolo si hace falta. Los
+    procesos no guardan estado entre tareas (la semilla va con cada una),
+    así que sirve para cualquier partida.
+
+    Args:
+        procesos (int): Número de procesos trabajadores
+    """
+    global _pool, _procesos_pool
+    if _pool is None or _procesos_pool != procesos:
+        cerrar_pool()
+        _pool = ProcessPoolExecutor(max_workers=procesos)
+        _procesos_pool = procesos
+    return _pool
+
+
+def cerrar_pool():
+    """
+    Termina los procesos del pool compartido (al acabar la partida).
+    """
+    global _pool, _procesos_pool
+    if _pool is not None:
+        _pool.shutdown(wait=True)
+    _pool = None
+    _procesos_pool = 0
+
+
+# Aunque la partida termine con una excepción, los procesos no se quedan colgados
+atexit.register(cerrar_pool)
+
+
+class EstadoMonteCarlo(ia_probabilistica.MapaCalor):
+    """
+    Estado de la IA experta durante una partida.
+
+    Lleva lo observado igual que MapaCalor (colocaciones posibles, impactos,
+    barcos restantes) y lo usa para generar las muestras.
+
+    Atributos:
+        presupuesto (float): Segundos para generar muestras en cada jugada
+        procesos (int): Procesos del pool (0 = generar en este mismo proceso)
+        max_muestras (int): Muestras por jugada como máximo
+        ultimas_muestras (int): Muestras usadas en la última jugada
+        semillas (random.Random): De dónde salen las semillas de cada tarea
+                                  del pool: random.Random(semilla) si se da
+                                  'semilla', si no el generador de la IA
+    """
+
+    def __init__(self, n=10, longitudes=(5, 4, 3, 3, 2), rng=None, presupuesto=PRESUPUESTO_SEGUNDOS,
+                 procesos=None, semilla=None, max_muestras=MAX_MUESTRAS):
+        super().__init__(n, longitudes, rng)
+        self.mascaras = tabla_mascaras(n, tuple(sorted(self.restantes)))
+        self.presupuesto = presupuesto
+        self.procesos = (os.cpu_count() or 1) if procesos is None else procesos
+        self.semillas = random.Random(semilla) if semilla is not None else self.rng
+        self.max_muestras = max_muestras
+        self.ultimas_muestras = 0
+
+        if self.procesos:
+            try:
+                pool = obtener_pool(self.procesos)
+                for _ in range(self.procesos):
+                    pool.submit(_calentar, n)
+            except (OSError, BrokenProcessPool):
+                # Sin procesos (p. ej. sin permisos para semáforos): todo en este proceso
+                self.procesos = 0
+
+    def observacion(self):
+        """
+        Resume lo observado para generar_muestra().
+
+        Returns:
+            tuple: (longitudes, por_longitud, impactos, por_impacto) donde
+                longitudes: barcos sin hundir
+                por_longitud: longitud -> lista de (mascara, halo) posibles
+                impactos: máscara de impactos de barcos sin hundir
+                por_impacto: casilla de cada impacto -> lista de
+                             (longitud, mascara, halo) posibles que pasan por ella
+        """
+        impactos = self.impactos
+        longitudes = []
+        for longitud, cantidad in self.restantes.items():
+            longitudes.extend([longitud] * cantidad)
+
+        por_longitud = {longitud: [] for longitud in self.restantes}
+        por_impacto = {}
+        pendientes = impactos
+        while pendientes:
+            menor = pendientes & -pendientes
+            por_impacto[menor.bit_length() - 1] = []
+            pendientes ^= menor
+
+        posibles, mascaras = self.posibles, self.mascaras
+        for id_colocacion, (longitud, _) in enumerate(self.colocaciones):
+            if not posibles[id_colocacion] or longitud not in por_longitud:
+                continue
+            mascara, halo = mascaras[id_colocacion]
+            por_longitud[longitud].append((mascara, halo))
+            # Una colocación solo de impactos ya estaría hundida
+            cubiertos = mascara & impactos
+            if cubiertos and mascara & ~impactos:
+                while cubiertos:
+                    menor = cubiertos & -cubiertos
+                    por_impacto[menor.bit_length() - 1].append((longitud, mascara, halo))
+                    cubiertos ^= menor
+        return longitudes, por_longitud, impactos, por_impacto
+
+    def contar_muestras(self):
+        """
+        Genera muestras hasta agotar el presupuesto de tiempo.
+
+        Returns:
+            tuple: (conteo, muestras) sumando lo de todos los procesos
+        """
+        observacion = self.observacion()
+        limite = time.time() + self.presupuesto
+        if not self.procesos:
+            return muestrear(observacion, self.n, self.disparadas, limite, self.max_muestras, self.rng)
+
+        try:
+            pool = obtener_pool(self.procesos)
+            por_proceso = -(-self.max_muestras // self.procesos)
+            futuros = [pool.submit(muestrear, observacion, self.n, self.disparadas, limite, por_proceso,
+                                   semilla=self.semillas.getrandbits(64))
+                       for _ in range(self.procesos)]
+        except (OSError, BrokenProcessPool):
+            self.procesos = 0
+            return muestrear(observacion, self.n, self.disparadas, limite, self.max_muestras, self.rng)
+
+        # Lo que no haya llegado a tiempo se descarta: la jugada no espera más
+        hechos, pendientes = wait(futuros, timeout=max(0.0, limite - time.time()) + MARGEN_SEGUNDOS)
+        for futuro in pendientes:
+            futuro.cancel()
+
+        conteo, muestras = [0] * (self.n * self.n), 0
+        for futuro in hechos:
+            try:
+                conteo_proceso, muestras_proceso = futuro.result()
+            except BrokenProcessPool:
+                self.procesos = 0
+                continue
+            for casilla, veces in enumerate(conteo_proceso):
+                conteo[casilla] += veces
+            muestras += muestras_proceso
+        return conteo, muestras
+
+    def elegir_disparo(self):
+        """
+        Devuelve la casilla sin disparar con barco en más muestras (al azar entre empatadas).
+
+        Returns:
+            tuple: (fila, columna)
+        """
+        conteo, self.ultimas_muestras = self.contar_muestras()
+        if self.ultimas_muestras:
+            mejores = self.mejores_casillas(enumerate(conteo), self.disparada)
+            if mejores:
+                return divmod(self.rng.choice(mejores), self.n)
+        # Sin muestras: mapa de calor de la IA probabilística
+        return super().elegir_disparo()
@@ -0,0 +1,341 @@
+"""
+IA PROBABILÍSTICA - Mapa de calor para Hundir la Flota
+======================================================
+
+IA que dispara a la casilla por la que pasan más colocaciones posibles de
+los barcos que le quedan al rival.
+
+Una colocación (longitud, fila, columna, orientación) sigue siendo posible si:
+- No pasa por ningún disparo al agua.
+- No toca ningún barco hundido ni su halo.
+- No queda pegada a un impacto sin pasar por él: por la regla de
+  separación, ese impacto sería de otro barco tocándola.
+
+Modo caza (no hay impactos pendientes): el mapa de calor cuenta, para cada
+casilla, cuántas colocaciones posibles la cubren, multiplicando por los
+barcos que quedan de cada longitud. Se mantiene de forma incremental:
+cada disparo solo descarta las colocaciones que pasan por la casilla (o
+por su alrededor) y les resta su aportación, sin volver a contar todo.
+
+En modo caza solo se mira una retícula si la flota está repetida (más de
+un barco de la longitud más corta, como en los tableros grandes): las
+casillas con (fila + columna) % L == resto, siendo L la longitud más corta
+que queda. Todo barco pasa por ella, así que cubrirla entera cuesta la
+mitad de disparos que el tablero; con un solo barco corto es mejor dejar
+que el mapa de calor elija en todo el tablero. Para no recorrer todas las
+casillas en cada jugada se guarda el máximo de cada fila y solo se
+recalculan las filas en las que ha cambiado el calor.
+
+Modo ataque (hay impactos de barcos sin hundir): solo cuentan las
+colocaciones que pasan por algún impacto, con más peso cuantos más
+impactos cubren, así que la IA sigue la línea del barco.
+
+El barco hundido se deduce del tablero (tramo recto de impactos que pasa
+por el último disparo), así que no hace falta que el juego diga cuál era.
+
+Uso:
+    estado = MapaCalor(10, [5, 4, 3, 3, 2])
+    fila, columna = estado.elegir_disparo()
+    estado.registrar(fila, columna, 'agua')   # 'agua', 'tocado' o 'hundido'
+
+Autor: Proyecto Grupal ASIR - Python
+"""
+
+import random
+from functools import lru_cache
+
+from compartido import bitboard_flota
+
+
+# Peso de una colocación en modo ataque: PESO_IMPACTO ** impactos que cubre
+PESO_IMPACTO = 50
+
+# Se resta del calor de cada casilla disparada para que max() no la elija nunca
+DISPARADA = 1 << 60
+
+
+@lru_cache(maxsize=16)
+def tablas_colocaciones(n, longitudes):
+    """
+    Tablas fijas de un tablero N × N para actualizar el mapa rápidamente.
+
+    Solo se generan las colocaciones de las longitudes de la flota y con
+    índices de casilla en lugar de máscaras, así que también caben en
+    memoria las de un tablero 100 × 100.
+
+    Args:
+        n (int): Lado del tablero
+        longitudes (tuple): Longitudes distintas de la flota (ordenadas)
+
+    Returns:
+        tuple: (colocaciones, por_casilla, por_halo, por_longitud) donde
+            colocaciones: lista de (longitud, casillas) con casillas como
+                          índices fila * n + columna
+            por_casilla: para cada casilla, colocaciones que la ocupan
+            por_halo: para cada casilla, colocaciones que la tienen alrededor
+                      (en el halo pero sin ocuparla)
+            por_longitud: longitud -> range de ids de sus colocaciones
+    """
+    geo = bitboard_flota.geometria(n)
+    colocaciones = []
+    por_casilla = [[] for _ in range(n * n)]
+    por_halo = [[] for _ in range(n * n)]
+    por_longitud = {}
+    for longitud in longitudes:
+        primera = len(colocaciones)
+        for fila, columna, orientacion in geo.colocaciones_de(longitud):
+            id_colocacion = len(colocaciones)
+            if orientacion == 'H':
+                paso, alto, ancho = 1, 1, longitud
+            else:
+                paso, alto, ancho = n, longitud, 1
+            casillas = tuple(fila * n + columna + i * paso for i in range(longitud))
+            colocaciones.append((longitud, casillas))
+            for casilla in casillas:
+                por_casilla[casilla].append(id_colocacion)
+            # Halo: el rectángulo de alrededor sin salirse del tablero
+            for f in range(max(0, fila - 1), min(n, fila + alto + 1)):
+                for c in range(max(0, columna - 1), min(n, columna + ancho + 1)):
+                    if not (fila <= f < fila + alto and columna <= c < columna + ancho):
+                        por_halo[f * n + c].append(id_colocacion)
+        por_longitud[longitud] = range(primera, len(colocaciones))
+    return colocaciones, por_casilla, por_halo, por_longitud
+
+
+class MapaCalor:
+    """
+    Estado de la IA probabilística durante una partida.
+
+    Atributos:
+        n (int): Lado del tablero
+        restantes (dict): longitud -> barcos de esa longitud sin hundir
+        posibles (bytearray): 1 si la colocación con ese id sigue siendo posible
+        calor (list): Para cada casilla, peso de las colocaciones posibles que la cubren
+                      (menos DISPARADA si ya está disparada)
+        disparadas (int): Máscara de casillas ya disparadas
+        impactos (int): Máscara de impactos de barcos sin hundir
+        disparada (bytearray): 1 en cada casilla ya disparada
+        impacto (bytearray): 1 en cada impacto de un barco sin hundir
+        rng (random.Random): Generador para desempatar entre casillas con el mismo peso
+        largo (int): Longitud del barco más largo de la flota
+        paridad (bool): Si se caza en la retícula (flota con varios barcos de la longitud más corta)
+        paso, resto (int): Retícula del modo caza: (fila + columna) % paso == resto
+        maximos (list): Calor máximo de cada fila dentro de la retícula
+        empates (list): Casillas de cada fila de la retícula con ese máximo
+        filas_cambiadas (set): Filas cuyo máximo hay que recalcular
+    """
+
+    def __init__(self, n=10, longitudes=(5, 4, 3, 3, 2), rng=None):
+        self.n = n
+        self.rng = rng or random.Random()
+        self.geo = bitboard_flota.geometria(n)
+
+        self.restantes = {}
+        for longitud in longitudes:
+            self.restantes[longitud] = self.restantes.get(longitud, 0) + 1
+        self.colocaciones, self.por_casilla, self.por_halo, self.por_longitud = tablas_colocaciones(
+            n, tuple(sorted(self.restantes)))
+
+        self.posibles = bytearray(b"\x01") * len(self.colocaciones)
+        self.calor = [0] * (n * n)
+        for id_colocacion, (longitud, casillas) in enumerate(self.colocaciones):
+            peso = self.restantes[longitud]
+            for casilla in casillas:
+                self.calor[casilla] += peso
+
+        self.disparadas = 0
+        self.impactos = 0
+        self.disparada = bytearray(n * n)
+        self.impacto = bytearray(n * n)
+
+        self.largo = max(self.restantes)
+        self.paridad = self.restantes[min(self.restantes)] > 1
+        self.paso, self.resto = 1, 0
+        self.maximos = [0] * n
+        self.empates = [0] * n
+        self.filas_cambiadas = set(range(n))
+        self.elegir_reticula()
+
+    # --- Actualización incremental ---
+
+    def descartar(self, ids):
+        """
+        Marca colocaciones como imposibles y resta su aportación al mapa de calor.
+        """
+        posibles, calor, restantes, colocaciones = self.posibles, self.calor, self.restantes, self.colocaciones
+        for id_colocacion in ids:
+            if not posibles[id_colocacion]:
+                continue
+            posibles[id_colocacion] = 0
+            longitud, casillas = colocaciones[id_colocacion]
+            peso = restantes.get(longitud, 0)
+            for casilla in casillas:
+                calor[casilla] -= peso
+
+    def quitar_barco(self, longitud):
+        """
+        Un barco de esa longitud ha sido hundido: sus colocaciones pesan uno menos.
+        """
+        if not self.restantes.get(longitud):
+            return
+        self.restantes[longitud] -= 1
+        calor, posibles, colocaciones = self.calor, self.posibles, self.colocaciones
+        for id_colocacion in self.por_longitud[longitud]:
+            if posibles[id_colocacion]:
+                for casilla in colocaciones[id_colocacion][1]:
+                    calor[casilla] -= 1
+        if self.restantes[longitud] == 0:
+            del self.restantes[longitud]
+            self.elegir_reticula()
+        self.filas_cambiadas = set(range(self.n))
+
+    def elegir_reticula(self):
+        """
+        Ajusta la retícula del modo caza a la longitud más corta que queda
+        (todo el tablero si no hay que cazar por paridad).
+        """
+        paso = min(self.restantes, default=1) if self.paridad else 1
+        if paso != self.paso:
+            self.paso, self.resto = paso, self.rng.randrange(paso)
+            self.filas_cambiadas = set(range(self.n))
+
+    def marcar_filas(self, desde, hasta):
+        """
+        Apunta las filas cuyo calor ha podido cambiar al descartar colocaciones
+        que pasan por las filas desde..hasta (una vertical llega largo - 1 más allá).
+        """
+        self.filas_cambiadas.update(range(max(0, desde - self.largo + 1), min(self.n, hasta + self.largo)))
+
+    def registrar(self, fila, columna, resultado):
+        """
+        Actualiza el estado con el resultado de un disparo.
+
+        Args:
+            resultado (str): 'agua', 'tocado' o 'hundido'
+        """
+        casilla = fila * self.n + columna
+        disparo = 1 << casilla
+        self.disparadas |= disparo
+        self.disparada[casilla] = 1
+        self.calor[casilla] -= DISPARADA
+
+        if resultado == 'agua':
+            self.descartar(self.por_casilla[casilla])
+            self.marcar_filas(fila, fila)
+            return
+
+        # Impacto: ningún otro barco puede quedar pegado a esta casilla
+        self.impactos |= disparo
+        self.impacto[casilla] = 1
+        self.descartar(self.por_halo[casilla])
+        self.marcar_filas(fila - 1, fila + 1)
+
+        if resultado == 'hundido':
+            barco = self.geo.extender_recta(self.impactos, disparo)
+            self.impactos &= ~barco
+            filas_barco = []
+            for fila_barco, columna_barco in bitboard_flota.casillas(barco, self.n):
+                self.impacto[fila_barco * self.n + columna_barco] = 0
+                filas_barco.append(fila_barco)
+            # Nada más puede pasar por el barco hundido ni por su alrededor
+            halo = self.geo.dilatar(barco)
+            while halo:
+                menor = halo & -halo
+                self.descartar(self.por_casilla[menor.bit_length() - 1])
+                halo ^= menor
+            self.marcar_filas(min(filas_barco) - 1, max(filas_barco) + 1)
+            self.quitar_barco(bin(barco).count("1"))
+
+    # --- Elección del disparo ---
+
+    def mapa_ataque(self):
+        """
+        Pesos del modo ataque: solo colocaciones posibles que pasan por impactos.
+
+        Returns:
+            dict: casilla -> peso
+        """
+        vistas = set()
+        pesos = {}
+        impacto = self.impacto
+        pendientes = self.impactos
+        while pendientes:
+            menor = pendientes & -pendientes
+            pendientes ^= menor
+            for id_colocacion in self.por_casilla[menor.bit_length() - 1]:
+                if id_colocacion in vistas or not self.posibles[id_colocacion]:
+                    continue
+                vistas.add(id_colocacion)
+                longitud, casillas = self.colocaciones[id_colocacion]
+                cubiertos = sum(impacto[casilla] for casilla in casillas)
+                peso = self.restantes.get(longitud, 0) * PESO_IMPACTO ** (cubiertos - 1)
+                for casilla in casillas:
+                    pesos[casilla] = pesos.get(casilla, 0) + peso
+        return pesos
+
+    def elegir_disparo(self):
+        """
+        Devuelve la casilla sin disparar con más peso (al azar entre empatadas).
+
+        Returns:
+            tuple: (fila, columna)
+        """
+        if self.impactos:
+            mejores = self.mejores_casillas(self.mapa_ataque().items(), self.disparada)
+            if mejores:
+                return divmod(self.rng.choice(mejores), self.n)
+        casilla = self.elegir_caza()
+        if casilla is None:
+            casilla = self.rng.choice(self.mejores_casillas(enumerate(self.calor), self.disparada))
+        return divmod(casilla, self.n)
+
+    def elegir_caza(self):
+        """
+        Modo caza: casilla sin disparar de la retícula con más calor (al azar
+        entre las empatadas).
+
+        Returns:
+            int: Casilla elegida, o None si ninguna de la retícula puede tener barco
+        """
+        n, calor, paso, resto = self.n, self.calor, self.paso, self.resto
+        maximos, empates = self.maximos, self.empates
+        for fila in self.filas_cambiadas:
+            valores = calor[fila * n + (resto - fila) % paso:(fila + 1) * n:paso]
+            maximos[fila] = max(valores)
+            empates[fila] = valores.count(maximos[fila])
+        self.filas_cambiadas.clear()
+
+        mejor = max(maximos)
+        if mejor <= 0:
+            return None
+        # Al azar entre todas las empatadas: primero la fila según cuántas tiene
+        k = self.rng.randrange(sum(empate for maximo, empate in zip(maximos, empates) if maximo == mejor))
+        for fila, maximo in enumerate(maximos):
+            if maximo == mejor:
+                if k < empates[fila]:
+                    break
+                k -= empates[fila]
+        inicio = fila * n + (resto - fila) % paso
+        valores = calor[inicio:(fila + 1) * n:paso]
+        posicion = -1
+        for _ in range(k + 1):
+            posicion = valores.index(mejor, posicion + 1)
+        return inicio + posicion * paso
+
+    @staticmethod
+    def mejores_casillas(pesos, disparada):
+        """
+        Casillas sin disparar con el peso máximo.
+
+        Args:
+            pesos (iterable): Pares (casilla, peso)
+            disparada (bytearray): 1 en cada casilla ya disparada
+        """
+        mejores, mejor_peso = [], -1
+        for casilla, peso in pesos:
+            if peso < mejor_peso or disparada[casilla]:
+                continue
+            if peso > mejor_peso:
+                mejores, mejor_peso = [], peso
+            mejores.append(casilla)
+        return mejores
@@ -11,19 +11,19 @@ Autor: Proyecto Grupal ASIR - Python
 Fecha: Diciembre 2025
 """
 
-import os
-
 # Importar los módulos de los juegos
 import buscaminas
+import buscaminas_infinito
 import hundir_flota
+import renderizado
 
 
 def limpiar_pantalla():
     """
     Limpia la pantalla de la terminal.
-    Funciona en Windows (cls) y Linux/Mac (clear).
+    En Linux/Mac usa una secuencia ANSI en lugar de lanzar 'clear' (ver renderizado.py).
     """
-    os.system('cls' if os.name == 'nt' else 'clear')
+    renderizado.limpiar_pantalla()
 
 
 def mostrar_banner():
@@ -44,7 +44,7 @@ def mostrar_banner():
 def menu_principal():
     """
     Muestra el menú principal y gestiona la selección del usuario.
-    Permite elegir entre Buscaminas, Hundir la Flota o Salir.
+    Permite elegir entre Buscaminas, Hundir la Flota, Buscaminas infinito o Salir.
     """
     while True:
         limpiar_pantalla()
@@ -55,10 +55,11 @@ def menu_principal():
         print("=" * 60)
         print("\n1. Jugar Buscaminas")
         print("2. Jugar Hundir la Flota")
-        print("3. Salir")
+        print("3. Jugar Buscaminas infinito")
+        print("4. Salir")
         print("\n" + "=" * 60)
         
-        opcion = input("\nElige una opción (1-3): ").strip()
+        opcion = input("\nElige una opción (1-4): ").strip()
         
         if opcion == '1':
             # Ejecutar Buscaminas
@@ -69,6 +70,10 @@ def menu_principal():
             hundir_flota.jugar_hundir_flota()
         
         elif opcion == '3':
+            # Ejecutar el modo infinito del Buscaminas
+            buscaminas_infinito.jugar_infinito()
+        
+        elif opcion == '4':
             # Salir del programa
             limpiar_pantalla()
             print("\n" + "=" * 60)
@@ -78,7 +83,7 @@ def menu_principal():
         
         else:
             # Opción inválida
-            print("\n[X] Opcion invalida. Por favor, elige 1, 2 o 3.")
+            print("\n[X] Opcion invalida. Por favor, elige 1, 2, 3 o 4.")
             input("\nPresiona Enter para continuar...")
 
 
@@ -0,0 +1,261 @@
+"""
+MOTOR DEL BUSCAMINAS - Partida sin terminal
+===========================================
+
+Partida de Buscaminas que se maneja solo con llamadas a métodos: no usa
+input(), print() ni limpia la pantalla. Reutiliza las funciones de
+buscaminas.py (tableros, minas, revelado, banderas y contadores) y
+devuelve el resultado de cada acción como un diccionario.
+
+Sirve para jugadores automáticos, simulaciones masivas y pruebas, y la
+interfaz de terminal (buscaminas.jugar_buscaminas) se apoya en él.
+
+Uso:
+    partida = PartidaBuscaminas.desde_nivel('intermedio', semilla=42)
+    resultado = partida.revelar(8, 8)
+    # {'resultado': 'seguro', 'reveladas': [(8, 8), ...]}
+
+Autor: Proyecto Grupal ASIR - Python
+"""
+
+import random
+import struct
+
+import buscaminas
+import tablero_compacto
+import tablero_numpy
+
+
+# Cabecera de a_bytes(): 'BMN', versión, filas, columnas, minas, estado,
+# minas colocadas (0/1) y jugadas
+CABECERA = struct.Struct(">3sBBBHBBI")
+MAGIA = b"BMN"
+VERSION = 1
+ESTADOS = ['jugando', 'ganada', 'perdida']
+
+
+def funciones_tablero(tablero_real):
+    """
+    Módulo con colocar_minas(), calcular_vecinos() y crear_contadores() para
+    este tipo de tablero: tablero_numpy para los de NumPy (vectorizadas) y
+    buscaminas para listas y tableros compactos.
+    """
+    if isinstance(tablero_real, tablero_numpy.TableroRealNumpy):
+        return tablero_numpy
+    return buscaminas
+
+
+class PartidaBuscaminas:
+    """
+    Estado completo de una partida de Buscaminas.
+
+    Las minas se colocan en el primer revelado, lejos de la casilla elegida,
+    con un generador aleatorio propio de la partida (reproducible con semilla).
+
+    Atributos:
+        filas, columnas, num_minas (int): Configuración del tablero
+        tablero_real, tablero_visible (list): Tableros de buscaminas.py (o de
+            tablero_compacto.py / tablero_numpy.py)
+        contadores (dict): Contadores en vivo (ver buscaminas.crear_contadores)
+        estado (str): 'jugando', 'ganada' o 'perdida'
+        jugadas (int): Número de acciones válidas realizadas
+    """
+
+    def __init__(self, filas, columnas, num_minas, semilla=None, compacto=False, usar_numpy=False):
+        self.filas = filas
+        self.columnas = columnas
+        self.num_minas = num_minas
+        self.semilla = semilla
+        self.rng = random.Random(semilla)
+
+        if usar_numpy:
+            self.tablero_real, self.tablero_visible = tablero_numpy.crear_tableros(filas, columnas, 0)
+        else:
+            self.tablero_real, self.tablero_visible = buscaminas.crear_tablero(filas, columnas, compacto)
+        self.contadores = funciones_tablero(self.tablero_real).crear_contadores(self.tablero_real,
+                                                                                 self.tablero_visible)
+        self.minas_colocadas = False
+        self.estado = 'jugando'
+        self.jugadas = 0
+
+    @classmethod
+    def desde_nivel(cls, nivel, semilla=None, compacto=False, usar_numpy=False):
+        """
+        Crea una partida con uno de los niveles de buscaminas.NIVELES.
+
+        Args:
+            nivel (str): 'facil', 'intermedio' o 'dificil'
+            semilla (int): Semilla de la partida, opcional
+            compacto (bool): Tableros de tablero_compacto.py en lugar de listas
+            usar_numpy (bool): Tableros de tablero_numpy.py (necesita NumPy)
+        """
+        filas, columnas, num_minas = buscaminas.NIVELES[nivel]
+        return cls(filas, columnas, num_minas, semilla, compacto, usar_numpy)
+
+    @classmethod
+    def desde_tableros(cls, tablero_real, tablero_visible, num_minas, semilla=None):
+        """
+        Crea una partida con las minas ya colocadas (p. ej. un tablero de
+        generador_sin_adivinar.py). El primer revelado no mueve las minas.
+
+        Args:
+            tablero_real, tablero_visible: Tableros de buscaminas.py o de tablero_numpy.py
+            num_minas (int): Minas del tablero
+            semilla (int): Semilla de la partida, opcional
+        """
+        partida = cls(len(tablero_real), len(tablero_real[0]), num_minas, semilla)
+        partida.tablero_real = tablero_real
+        partida.tablero_visible = tablero_visible
+        partida.contadores = funciones_tablero(tablero_real).crear_contadores(tablero_real, tablero_visible)
+        partida.minas_colocadas = True
+        return partida
+
+    def a_bytes(self):
+        """
+        Estado de la partida en binario (p. ej. para almacen_partidas.py):
+        la cabecera y 1 byte por casilla de cada tablero (códigos de
+        tablero_compacto.py). No incluye la semilla.
+        """
+        cabecera = CABECERA.pack(MAGIA, VERSION, self.filas, self.columnas, self.num_minas,
+                                 ESTADOS.index(self.estado), self.minas_colocadas, self.jugadas)
+        return (cabecera + bytes(tablero_compacto.TableroCompacto.desde_listas(self.tablero_real).datos)
+                + bytes(tablero_compacto.TableroCompacto.desde_listas(self.tablero_visible).datos))
+
+    @classmethod
+    def desde_bytes(cls, datos, semilla=None):
+        """
+        Reconstruye una partida guardada con a_bytes().
+
+        Raises:
+            ValueError: Si los datos no son una partida de Buscaminas válida
+        """
+        if len(datos) < CABECERA.size or datos[:len(MAGIA)] != MAGIA:
+            raise ValueError("No es una partida de Buscaminas")
+        _, version, filas, columnas, num_minas, estado, minas_colocadas, jugadas = CABECERA.unpack_from(datos)
+        if version != VERSION:
+            raise ValueError(f"Versión de partida no soportada: {version}")
+        casillas = filas * columnas
+        if len(datos) != CABECERA.size + 2 * casillas:
+            raise ValueError("La partida está incompleta")
+
+        tableros = []
+        for inicio in (CABECERA.size, CABECERA.size + casillas):
+            tablero = tablero_compacto.TableroCompacto(filas, columnas)
+            tablero.datos = bytearray(datos[inicio:inicio + casillas])
+            tableros.append(tablero.a_listas())
+        partida = cls.desde_tableros(tableros[0], tableros[1], num_minas, semilla)
+        partida.minas_colocadas = bool(minas_colocadas)
+        partida.estado = ESTADOS[estado]
+        partida.jugadas = jugadas
+        return partida
+
+    @property
+    def terminada(self):
+        return self.estado != 'jugando'
+
+    def copiar(self):
+        """
+        Copia independiente de la partida (p. ej. para los puntos de control
+        de repeticion.py). Si las minas aún no están colocadas, la copia
+        lleva un generador en el mismo estado y las coloca igual que el
+        original; después ya no se usa y se comparte.
+
+        Returns:
+            PartidaBuscaminas: La copia
+        """
+        copia = PartidaBuscaminas.__new__(PartidaBuscaminas)
+        copia.filas = self.filas
+        copia.columnas = self.columnas
+        copia.num_minas = self.num_minas
+        copia.semilla = self.semilla
+        if self.minas_colocadas:
+            copia.rng = self.rng
+        else:
+            copia.rng = random.Random.__new__(random.Random)
+            copia.rng.setstate(self.rng.getstate())
+        copia.tablero_real, copia.tablero_visible = [
+            [fila[:] for fila in tablero] if isinstance(tablero, list) else tablero.copiar()
+            for tablero in (self.tablero_real, self.tablero_visible)]
+        copia.contadores = dict(self.contadores)
+        copia.minas_colocadas = self.minas_colocadas
+        copia.estado = self.estado
+        copia.jugadas = self.jugadas
+        return copia
+
+    def dentro(self, fila, columna):
+        return 0 <= fila < self.filas and 0 <= columna < self.columnas
+
+    def colocar_minas(self, fila, columna):
+        """
+        Coloca las minas protegiendo la zona del primer clic y crea los contadores.
+        """
+        funciones = funciones_tablero(self.tablero_real)
+        zona = buscaminas.zona_primer_clic(self.tablero_real, fila, columna, self.num_minas)
+        funciones.colocar_minas(self.tablero_real, self.num_minas, excluir=zona, rng=self.rng)
+        funciones.calcular_vecinos(self.tablero_real)
+        self.contadores = funciones.crear_contadores(self.tablero_real, self.tablero_visible)
+        self.minas_colocadas = True
+
+    def revelar(self, fila, columna):
+        """
+        Revela una casilla (con expansión automática si es 0).
+
+        Returns:
+            dict: {'resultado': r, 'reveladas': [(fila, columna), ...]} donde r es
+                  'seguro', 'victoria', 'mina' o 'invalida'
+        """
+        # Una bandera no se puede revelar: las minas tampoco se colocan todavía
+        if self.terminada or not self.dentro(fila, columna) or self.tablero_visible[fila][columna] != '#':
+            return {'resultado': 'invalida', 'reveladas': []}
+
+        if not self.minas_colocadas:
+            self.colocar_minas(fila, columna)
+
+        reveladas = buscaminas.revelar_area(self.tablero_real, self.tablero_visible, fila, columna)
+
+        self.jugadas += 1
+
+        if self.tablero_real[fila][columna] == '*':
+            self.estado = 'perdida'
+            return {'resultado': 'mina', 'reveladas': reveladas}
+
+        self.contadores['seguras_ocultas'] -= len(reveladas)
+        if buscaminas.verificar_victoria(self.tablero_real, self.tablero_visible, self.contadores):
+            self.estado = 'ganada'
+            return {'resultado': 'victoria', 'reveladas': reveladas}
+
+        return {'resultado': 'seguro', 'reveladas': reveladas}
+
+    def marcar(self, fila, columna):
+        """
+        Marca o desmarca una bandera.
+
+        Returns:
+            dict: {'resultado': 'bandera' | 'sin_bandera' | 'invalida'}
+        """
+        if self.terminada or not self.dentro(fila, columna):
+            return {'resultado': 'invalida'}
+
+        if not buscaminas.marcar_bandera(self.tablero_visible, fila, columna, self.contadores):
+            return {'resultado': 'invalida'}
+
+        self.jugadas += 1
+        if self.tablero_visible[fila][columna] == 'F':
+            return {'resultado': 'bandera'}
+        return {'resultado': 'sin_bandera'}
+
+    def aplicar(self, accion, fila, columna):
+        """
+        Aplica una acción con la misma letra que usa el menú del juego.
+
+        Args:
+            accion (str): 'R' (revelar) o 'F' (bandera)
+
+        Returns:
+            dict: Resultado de revelar() o marcar()
+        """
+        if accion == 'R':
+            return self.revelar(fila, columna)
+        if accion == 'F':
+            return self.marcar(fila, columna)
+        return {'resultado': 'invalida'}
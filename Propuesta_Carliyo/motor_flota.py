@@ -0,0 +1,260 @@
+"""
+MOTOR DE HUNDIR LA FLOTA - Partida sin terminal
+===============================================
+
+Partida de Hundir la Flota entre dos jugadores que se maneja solo con
+llamadas a métodos: no usa input(), print() ni pausas. Reutiliza las
+funciones de hundir_flota.py (tableros, colocación, disparos, índice de
+barcos y contadores) y devuelve el resultado de cada jugada como un
+diccionario.
+
+La interfaz de terminal (hundir_flota.jugar_hundir_flota) se apoya en
+este motor y solo se encarga de pedir coordenadas y mostrar resultados;
+las simulaciones y los torneos usan el motor directamente.
+
+Uso:
+    partida = PartidaFlota(semilla=42)          # o PartidaFlota(n=100) con 50 barcos
+    partida.colocar_flota_aleatoria(0)
+    partida.colocar_flota_aleatoria(1)
+    partida.empezar()
+    resultado = partida.aplicar_jugada(4, 5)
+    # {'resultado': 'tocado', 'jugador': 0, 'fila': 4, 'columna': 5,
+    #  'barco': None, 'victoria': False}
+
+Autor: Proyecto Grupal ASIR - Python
+"""
+
+import random
+from collections import deque
+
+import hundir_flota
+from compartido import indice_barcos
+
+
+def _copiar_generador(rng):
+    copia = random.Random.__new__(random.Random)
+    copia.setstate(rng.getstate())
+    return copia
+
+
+def _copiar_tablero(tablero):
+    if isinstance(tablero, list):
+        return [fila[:] for fila in tablero]
+    return tablero.copiar()
+
+
+class IAFlota:
+    """
+    IA de hundir_flota.py con su memoria entre disparos.
+
+    Atributos:
+        nivel (str): 'facil', 'intermedio', 'dificil', 'probabilistico' o 'experto'
+        ultimo_tocado (list): Impactos pendientes (IA intermedia y difícil)
+        patron (deque): Patrón de tablero de ajedrez (IA difícil)
+        estado_ia: Estado propio del nivel (ver hundir_flota.crear_estado_ia)
+        rng (random.Random): Generador de todas las decisiones al azar de la IA
+    """
+
+    def __init__(self, nivel, n=hundir_flota.TAMANO, estado_ia=None, rng=None, longitudes=None):
+        """
+        Args:
+            n (int): Lado del tablero
+            rng (random.Random): Generador de la IA (p. ej. el de la partida,
+                                 para poder reproducirla); por defecto uno nuevo,
+                                 así que cada IA tiene el suyo y no comparte el
+                                 del módulo random con otros hilos
+            longitudes (list): Longitudes de la flota rival; por defecto las de hundir_flota.FLOTA
+        """
+        self.nivel = nivel
+        self.rng = rng if rng is not None else random.Random()
+        self.ultimo_tocado = []
+        self.patron = hundir_flota.crear_patron(n, self.rng) if nivel == 'dificil' else deque()
+        self.estado_ia = (estado_ia if estado_ia is not None
+                          else hundir_flota.crear_estado_ia(nivel, n, self.rng, longitudes))
+
+    def elegir(self, tablero_disparos):
+        """
+        Decide dónde disparar.
+
+        Args:
+            tablero_disparos (list): Tablero de disparos de la IA
+
+        Returns:
+            tuple: (fila, columna)
+        """
+        return hundir_flota.elegir_disparo_ia(self.nivel, tablero_disparos, self.ultimo_tocado,
+                                              self.patron, self.estado_ia, self.rng)
+
+    def registrar(self, fila, columna, resultado):
+        """
+        Actualiza la memoria de la IA con el resultado de su disparo.
+        """
+        hundir_flota.registrar_disparo_ia(self.nivel, fila, columna, resultado,
+                                          self.ultimo_tocado, self.estado_ia)
+
+
+class PartidaFlota:
+    """
+    Estado completo de una partida de Hundir la Flota (jugadores 0 y 1).
+
+    Atributos:
+        n (int): Lado del tablero
+        tableros (list): Tablero con los barcos de cada jugador
+        disparos (list): Tablero de disparos de cada jugador
+        indices (list): Índice de barcos de cada jugador (ver indice_barcos.py)
+        contadores (list): Contadores de cada tablero (tras empezar())
+        estado (str): 'colocando', 'jugando' o 'terminada'
+        turno (int): Jugador al que le toca disparar
+        ganador (int): Jugador que ha ganado (None mientras no acabe)
+        jugadas (int): Disparos válidos realizados
+    """
+
+    def __init__(self, flota=None, semilla=None, compacto=False, rng=None, n=hundir_flota.TAMANO):
+        """
+        Args:
+            flota (list): Barcos (nombre, longitud); por defecto la de
+                          hundir_flota.flota_para_tamano(n) (en 10×10, hundir_flota.FLOTA)
+            semilla (int): Semilla de las colocaciones aleatorias, opcional
+            compacto (bool): Si True, tableros TableroCompacto en lugar de listas
+            rng (random.Random): Generador a usar en lugar de crear uno con la
+                                 semilla (p. ej. uno compartido por muchas partidas)
+            n (int): Lado del tablero
+        """
+        self.flota = list(flota) if flota is not None else hundir_flota.flota_para_tamano(n)
+        self.semilla = semilla
+        self.rng = rng if rng is not None else random.Random(semilla)
+
+        self.tableros = [hundir_flota.crear_tablero(n, compacto) for _ in range(2)]
+        self.disparos = [hundir_flota.crear_tablero(n, compacto) for _ in range(2)]
+        self.n = n
+        self.indices = [indice_barcos.IndiceBarcos(self.n) for _ in range(2)]
+        self.contadores = [None, None]
+
+        self.estado = 'colocando'
+        self.turno = 0
+        self.ganador = None
+        self.jugadas = 0
+
+    @property
+    def terminada(self):
+        return self.estado == 'terminada'
+
+    def copiar(self):
+        """
+        Copia independiente de la partida (p. ej. para los puntos de control
+        de repeticion.py). El generador solo se usa al colocar las flotas:
+        hasta entonces la copia lleva uno en el mismo estado y después
+        comparte el del original.
+
+        Returns:
+            PartidaFlota: La copia
+        """
+        copia = PartidaFlota.__new__(PartidaFlota)
+        copia.flota = self.flota
+        copia.semilla = self.semilla
+        copia.rng = _copiar_generador(self.rng) if self.estado == 'colocando' else self.rng
+        copia.tableros = [_copiar_tablero(tablero) for tablero in self.tableros]
+        copia.disparos = [_copiar_tablero(tablero) for tablero in self.disparos]
+        copia.n = self.n
+        copia.indices = [indice.copiar() for indice in self.indices]
+        copia.contadores = [None if contadores is None else dict(contadores, barcos=indice)
+                            for contadores, indice in zip(self.contadores, copia.indices)]
+        copia.estado = self.estado
+        copia.turno = self.turno
+        copia.ganador = self.ganador
+        copia.jugadas = self.jugadas
+        return copia
+
+    def dentro(self, fila, columna):
+        return 0 <= fila < self.n and 0 <= columna < self.n
+
+    # --- Colocación ---
+
+    def colocar_barco(self, jugador, fila, columna, longitud, orientacion, nombre=None):
+        """
+        Coloca un barco del jugador si la posición es válida.
+
+        Returns:
+            dict: {'resultado': 'colocado' o 'invalida'}
+        """
+        if self.estado != 'colocando' or not hundir_flota.validar_posicion(
+                self.tableros[jugador], fila, columna, longitud, orientacion):
+            return {'resultado': 'invalida'}
+        hundir_flota.colocar_barco(self.tableros[jugador], fila, columna, longitud, orientacion,
+                                   self.indices[jugador], nombre)
+        return {'resultado': 'colocado'}
+
+    def colocar_flota_aleatoria(self, jugador):
+        """
+        Coloca toda la flota del jugador al azar (con el generador de la
+        partida), con su nombre en el índice de barcos.
+
+        Returns:
+            bool: True si se colocó, False si no cabe
+        """
+        if self.estado != 'colocando':
+            return False
+        return hundir_flota.colocar_flota_aleatoria(self.tableros[jugador], rng=self.rng,
+                                                    indice=self.indices[jugador], flota=self.flota)
+
+    def empezar(self, primero=0):
+        """
+        Termina la colocación y crea los contadores de los dos tableros.
+
+        Args:
+            primero (int): Jugador que dispara primero
+        """
+        self.contadores = [hundir_flota.crear_contadores(tablero, indice)
+                           for tablero, indice in zip(self.tableros, self.indices)]
+        self.estado = 'jugando'
+        self.turno = primero
+
+    # --- Disparos ---
+
+    def aplicar_jugada(self, fila, columna):
+        """
+        Dispara el jugador al que le toca. Si el disparo es válido, pasa el
+        turno al rival (salvo que con él haya ganado).
+
+        Returns:
+            dict: {'resultado': r, 'jugador': int, 'fila': int, 'columna': int,
+                   'barco': nombre del barco hundido o None, 'victoria': bool}
+                  donde r es 'agua', 'tocado', 'hundido', 'repetido' o 'invalida'
+        """
+        jugador = self.turno
+        jugada = {'resultado': 'invalida', 'jugador': jugador, 'fila': fila, 'columna': columna,
+                  'barco': None, 'victoria': False}
+        if self.estado != 'jugando' or not self.dentro(fila, columna):
+            return jugada
+
+        rival = 1 - jugador
+        resultado, id_barco = hundir_flota.resolver_disparo(self.tableros[rival], self.disparos[jugador],
+                                                            fila, columna, self.contadores[rival])
+        jugada['resultado'] = resultado
+        if resultado == 'repetido':
+            return jugada
+
+        self.jugadas += 1
+        if resultado == 'hundido':
+            jugada['barco'] = self.indices[rival].nombres[id_barco]
+            if hundir_flota.verificar_victoria(self.tableros[rival], self.contadores[rival]):
+                self.estado = 'terminada'
+                self.ganador = jugador
+                jugada['victoria'] = True
+                return jugada
+
+        self.turno = rival
+        return jugada
+
+    def jugada_ia(self, ia):
+        """
+        Deja que una IA (ver IAFlota) haga la jugada del jugador al que le toca.
+
+        Returns:
+            dict: Resultado de aplicar_jugada()
+        """
+        fila, columna = ia.elegir(self.disparos[self.turno])
+        jugada = self.aplicar_jugada(fila, columna)
+        if jugada['resultado'] not in ('repetido', 'invalida'):
+            ia.registrar(fila, columna, jugada['resultado'])
+        return jugada
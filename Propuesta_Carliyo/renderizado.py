@@ -0,0 +1,145 @@
+"""
+RENDERIZADO - Dibujo de pantallas con secuencias ANSI
+=====================================================
+
+Utilidades para dibujar los tableros en la terminal sin parpadeo:
+
+- limpiar_pantalla() borra la pantalla con una secuencia ANSI en lugar de
+  lanzar un proceso 'clear' con os.system().
+- Renderizador guarda las líneas del último fotograma y, en el siguiente,
+  solo reescribe las que han cambiado, colocando el cursor con secuencias
+  ANSI. Todo el fotograma se envía con una única escritura.
+- CacheFilas guarda el texto ya formateado de cada fila del tablero y solo
+  lo vuelve a construir si la fila ha cambiado desde el último fotograma.
+
+Por SSH esto reduce mucho los bytes enviados por jugada: al revelar una
+casilla normalmente solo cambia una fila del tablero.
+
+Autor: Proyecto Grupal ASIR - Python
+"""
+
+import os
+import shutil
+import sys
+
+
+# Secuencias ANSI
+BORRAR_PANTALLA = "\x1b[2J\x1b[H"
+BORRAR_HASTA_FIN_LINEA = "\x1b[K"
+BORRAR_HASTA_FIN_PANTALLA = "\x1b[J"
+
+# Líneas que se reservan debajo del fotograma para preguntas y mensajes.
+# Si el fotograma no cabe con ellas, la terminal haría scroll y las
+# posiciones del cursor dejarían de coincidir: se redibuja entero.
+MARGEN_INFERIOR = 6
+
+
+def mover_cursor(fila):
+    """
+    Secuencia ANSI para llevar el cursor al principio de una fila (empezando en 0).
+    """
+    return f"\x1b[{fila + 1};1H"
+
+
+def limpiar_pantalla(salida=None):
+    """
+    Limpia la pantalla de la terminal.
+
+    En Linux/Mac escribe la secuencia ANSI de borrado (sin lanzar procesos).
+    En Windows se mantiene 'cls', porque la consola clásica no entiende ANSI.
+    """
+    if os.name == 'nt':
+        os.system('cls')
+        return
+    salida = salida or sys.stdout
+    salida.write(BORRAR_PANTALLA)
+    salida.flush()
+
+
+class CacheFilas:
+    """
+    Texto formateado de cada fila de un tablero, reconstruido solo si la fila cambia.
+    """
+
+    def __init__(self):
+        self.filas = {}
+
+    def obtener(self, indice, fila, formatear):
+        """
+        Devuelve el texto de la fila, usando el guardado si la fila no ha cambiado.
+
+        Args:
+            indice (int): Número de fila
+            fila (list): Valores de la fila
+            formatear (callable): Función que convierte los valores en texto
+
+        Returns:
+            str: Texto de la fila
+        """
+        valores = tuple(fila)
+        guardada = self.filas.get(indice)
+        if guardada is not None and guardada[0] == valores:
+            return guardada[1]
+        texto = formatear(valores)
+        self.filas[indice] = (valores, texto)
+        return texto
+
+
+class Renderizador:
+    """
+    Dibuja fotogramas completos reescribiendo solo las líneas que cambian.
+
+    El fotograma se dibuja siempre desde la esquina superior izquierda. Lo que
+    se escriba debajo (preguntas al jugador, mensajes) se borra en el
+    siguiente fotograma.
+
+    Atributos:
+        salida: Flujo donde se escribe (por defecto sys.stdout)
+        lineas (list): Líneas del fotograma que hay ahora en pantalla
+        bytes_escritos (int): Bytes enviados en el último fotograma
+    """
+
+    def __init__(self, salida=None):
+        self.salida = salida or sys.stdout
+        self.lineas = None
+        self.bytes_escritos = 0
+
+    def invalidar(self):
+        """
+        Olvida lo que hay en pantalla: el próximo fotograma se dibuja entero.
+        Hay que llamarlo si otra parte del programa ha borrado o movido la pantalla.
+        """
+        self.lineas = None
+
+    def dibujar(self, lineas):
+        """
+        Dibuja un fotograma y deja el cursor justo debajo.
+
+        Args:
+            lineas (list): Líneas de texto del fotograma (sin saltos de línea)
+        """
+        if self.salida.isatty():
+            alto = shutil.get_terminal_size().lines
+            if len(lineas) + MARGEN_INFERIOR > alto:
+                self.invalidar()
+
+        partes = []
+        if self.lineas is None:
+            # Primer fotograma: borrar todo y escribirlo entero
+            partes.append(BORRAR_PANTALLA)
+            partes.append("\n".join(lineas))
+            partes.append("\n")
+        else:
+            anteriores = self.lineas
+            for i, linea in enumerate(lineas):
+                if i >= len(anteriores) or anteriores[i] != linea:
+                    partes.append(mover_cursor(i) + linea + BORRAR_HASTA_FIN_LINEA)
+            # Borrar lo que haya debajo del fotograma (líneas sobrantes y preguntas)
+            partes.append(mover_cursor(len(lineas)) + BORRAR_HASTA_FIN_PANTALLA)
+
+        texto = "".join(partes)
+        self.salida.write(texto)
+        self.salida.flush()
+
+        self.lineas = list(lineas)
+        self.bytes_escritos = len(texto.encode())
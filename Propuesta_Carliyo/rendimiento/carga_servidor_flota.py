@@ -0,0 +1,202 @@
+"""
+MEDICIÓN - Generador de carga para servidor_flota.py
+====================================================
+
+Arranca el servidor en otro proceso (o usa uno ya arrancado) y simula
+clientes con asyncio:
+
+- 'inactivas' conexiones que crean una partida PVC y se quedan quietas,
+  para ver cuánta memoria ocupa cada partida en el servidor (RSS leído
+  de /proc, solo en Linux).
+- 'clientes' conexiones que juegan partidas PVC completas disparando al
+  azar, para medir disparos por segundo y la latencia de cada disparo vista
+  desde el cliente (ida y vuelta) y desde el servidor (orden ESTADISTICAS).
+
+Uso:
+    python rendimiento/carga_servidor_flota.py [clientes] [partidas] [inactivas] [host:puerto]
+"""
+
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+
+DIRECTORIO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, DIRECTORIO)
+
+
+def memoria_kb(pid):
+    """
+    Memoria residente (VmRSS) de un proceso en KB, o None si no se puede leer.
+    """
+    try:
+        with open(f"/proc/{pid}/status") as archivo:
+            for linea in archivo:
+                if linea.startswith("VmRSS:"):
+                    return int(linea.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def arrancar_servidor():
+    """
+    Arranca servidor_flota.py en un puerto libre.
+
+    Returns:
+        tuple: (proceso, puerto)
+    """
+    proceso = subprocess.Popen([sys.executable, "-u", os.path.join(DIRECTORIO, "servidor_flota.py"), "0"],
+                               stdout=subprocess.PIPE, text=True)
+    linea = proceso.stdout.readline()
+    return proceso, int(linea.rsplit(":", 1)[1])
+
+
+class Cliente:
+    """
+    Conexión de prueba que lee los mensajes JSON del servidor.
+    """
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+
+    @classmethod
+    async def conectar(cls, host, puerto):
+        reader, writer = await asyncio.open_connection(host, puerto)
+        cliente = cls(reader, writer)
+        await cliente.esperar('bienvenida')
+        return cliente
+
+    async def orden(self, texto):
+        self.writer.write(texto.encode() + b"\n")
+        await self.writer.drain()
+
+    async def esperar(self, *tipos):
+        """
+        Lee mensajes hasta uno de esos tipos y lo devuelve.
+        """
+        while True:
+            linea = await self.reader.readline()
+            if not linea:
+                raise ConnectionError("El servidor cerró la conexión")
+            mensaje = json.loads(linea)
+            if mensaje['tipo'] == 'error':
+                raise RuntimeError(mensaje['mensaje'])
+            if mensaje['tipo'] in tipos:
+                return mensaje
+
+    def cerrar(self):
+        self.writer.close()
+
+
+async def partida_inactiva(host, puerto):
+    cliente = await Cliente.conectar(host, puerto)
+    await cliente.orden("PVC facil")
+    await cliente.esperar('partida')
+    return cliente
+
+
+async def jugar_partidas(host, puerto, partidas, semilla, latencias):
+    """
+    Un cliente que juega partidas PVC completas disparando al azar.
+
+    Returns:
+        int: Disparos realizados
+    """
+    rng = random.Random(semilla)
+    cliente = await Cliente.conectar(host, puerto)
+    disparos = 0
+    for _ in range(partidas):
+        await cliente.orden("PVC facil")
+        await cliente.esperar('partida')
+        await cliente.orden("ALEATORIA")
+        await cliente.esperar('empieza')
+        casillas = [f"{letra}{numero}" for letra in "ABCDEFGHIJ" for numero in range(1, 11)]
+        rng.shuffle(casillas)
+        while True:
+            inicio = time.perf_counter()
+            await cliente.orden(f"DISPARO {casillas.pop()}")
+            mensaje = await cliente.esperar('disparo')
+            latencias.append(time.perf_counter() - inicio)
+            disparos += 1
+            # Después llega el disparo de la IA, o el fin de la partida
+            while mensaje['tipo'] != 'fin' and not mensaje['tu_turno']:
+                mensaje = await cliente.esperar('disparo_rival', 'fin')
+            if mensaje['tipo'] == 'fin':
+                break
+    cliente.cerrar()
+    return disparos
+
+
+def percentil(valores, p):
+    return valores[min(len(valores) - 1, int(p * len(valores)))] if valores else 0.0
+
+
+async def medir(host, puerto, clientes, partidas, inactivas, pid):
+    memoria_inicial = memoria_kb(pid) if pid else None
+
+    # Partidas quietas (en tandas para no agotar la cola de conexiones)
+    quietas = []
+    for inicio in range(0, inactivas, 500):
+        quietas += await asyncio.gather(*(partida_inactiva(host, puerto)
+                                          for _ in range(min(500, inactivas - inicio))))
+    memoria_inactivas = memoria_kb(pid) if pid else None
+    if inactivas:
+        print(f"Partidas inactivas abiertas: {inactivas}")
+        if memoria_inicial is not None:
+            por_partida = (memoria_inactivas - memoria_inicial) / inactivas
+            print(f"  Memoria del servidor: {memoria_inicial / 1024:.1f} MB -> "
+                  f"{memoria_inactivas / 1024:.1f} MB ({por_partida:.1f} KB por partida y conexión)")
+
+    # Clientes jugando a la vez
+    latencias = []
+    inicio = time.perf_counter()
+    disparos = await asyncio.gather(*(jugar_partidas(host, puerto, partidas, semilla, latencias)
+                                      for semilla in range(clientes)))
+    segundos = time.perf_counter() - inicio
+    total = sum(disparos)
+    latencias.sort()
+    print(f"\n{clientes} clientes x {partidas} partidas PVC: {clientes * partidas} partidas en {segundos:.2f} s")
+    print(f"  Disparos por segundo: {total / segundos:,.0f} (más otros tantos de la IA)")
+    print(f"  Latencia ida y vuelta (cliente): p50 {percentil(latencias, 0.5) * 1000:.2f} ms | "
+          f"p99 {percentil(latencias, 0.99) * 1000:.2f} ms")
+
+    consulta = await Cliente.conectar(host, puerto)
+    await consulta.orden("ESTADISTICAS")
+    estadisticas = await consulta.esperar('estadisticas')
+    consulta.cerrar()
+    print(f"  Tiempo por orden en el servidor: p50 {estadisticas['ms_p50']:.3f} ms | "
+          f"p99 {estadisticas['ms_p99']:.3f} ms | máx {estadisticas['ms_max']:.3f} ms")
+    print(f"  Partidas abiertas en el servidor: {estadisticas['partidas']}")
+
+    for cliente in quietas:
+        cliente.cerrar()
+
+
+def main():
+    clientes = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    partidas = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    inactivas = int(sys.argv[3]) if len(sys.argv) > 3 else 2000
+
+    proceso = None
+    if len(sys.argv) > 4:
+        host, puerto = sys.argv[4].rsplit(":", 1)
+        puerto = int(puerto)
+        pid = None
+    else:
+        proceso, puerto = arrancar_servidor()
+        host, pid = "127.0.0.1", proceso.pid
+    try:
+        asyncio.run(medir(host, puerto, clientes, partidas, inactivas, pid))
+    finally:
+        if proceso is not None:
+            proceso.terminate()
+            proceso.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+MEDICIÓN - Almacén de partidas SQLite con muchas partidas
+=========================================================
+
+Llena una base de datos temporal con N partidas de Hundir la Flota
+(10 por jugador) y mide:
+- cuánto tarda listar las partidas de un jugador y cargar una
+- que la consulta usa el índice (EXPLAIN QUERY PLAN)
+- que en modo WAL se puede leer mientras otra conexión está escribiendo
+
+Uso:
+    python rendimiento/medir_almacen_partidas.py [partidas]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import hundir_flota
+from compartido import almacen_partidas, indice_barcos, partida_binaria
+
+PARTIDAS_POR_JUGADOR = 10
+TAMANO_TANDA = 100000
+
+
+def partida_ejemplo():
+    tableros, indices = [], []
+    for _ in range(2):
+        tablero = hundir_flota.crear_tablero()
+        indice = indice_barcos.IndiceBarcos(10)
+        hundir_flota.colocar_flota_aleatoria(tablero, indice=indice)
+        tableros += [tablero, hundir_flota.crear_tablero()]
+        indices.append(indice)
+    return partida_binaria.codificar_partida(tableros, indices, ('~', 'B', 'X', 'O'))
+
+
+def microsegundos(tiempos):
+    tiempos = sorted(tiempos)
+    return (tiempos[len(tiempos) // 2] * 1e6, tiempos[int(len(tiempos) * 0.99)] * 1e6)
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    jugadores = max(1, total // PARTIDAS_POR_JUGADOR)
+    datos = partida_ejemplo()
+    rng = random.Random(1)
+
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta = os.path.join(carpeta, "partidas.db")
+        with almacen_partidas.AlmacenPartidas(ruta) as almacen:
+            inicio = time.perf_counter()
+            for primera in range(0, total, TAMANO_TANDA):
+                almacen.guardar_muchas(
+                    (f"jugador{i % jugadores}",
+                     almacen_partidas.JUEGO_FLOTA_TEO if i % 3 else almacen_partidas.JUEGO_BUSCAMINAS,
+                     None, 1.7e9 + i, datos)
+                    for i in range(primera, min(total, primera + TAMANO_TANDA)))
+            segundos = time.perf_counter() - inicio
+            print(f"{almacen.contar():,} partidas insertadas en {segundos:.1f} s "
+                  f"({os.path.getsize(ruta) / 2**20:.0f} MB)")
+
+            plan = almacen.conexion.execute(
+                "EXPLAIN QUERY PLAN SELECT id, juego, nombre, actualizada FROM partidas "
+                "WHERE jugador = ? ORDER BY actualizada DESC LIMIT ?", ("jugador1", 20)).fetchall()
+            print("Plan de listar():", "; ".join(fila[-1] for fila in plan))
+
+            consultas = 2000
+            tiempos_listar, tiempos_cargar, tiempos_guardar = [], [], []
+            for _ in range(consultas):
+                jugador = f"jugador{rng.randrange(jugadores)}"
+                inicio = time.perf_counter()
+                partidas = almacen.listar(jugador)
+                tiempos_listar.append(time.perf_counter() - inicio)
+
+                inicio = time.perf_counter()
+                partida_binaria.decodificar_partida(almacen.cargar(partidas[0][0], jugador)[4], ('~', 'B', 'X', 'O'))
+                tiempos_cargar.append(time.perf_counter() - inicio)
+
+                inicio = time.perf_counter()
+                almacen.guardar(jugador, partidas[0][1], datos, partidas[0][0])
+                tiempos_guardar.append(time.perf_counter() - inicio)
+
+            print(f"\n{'Operación':<28} | {'p50 µs':>8} | {'p99 µs':>8}")
+            print("-" * 50)
+            for nombre, tiempos in (("Listar partidas de jugador", tiempos_listar),
+                                    ("Cargar y decodificar", tiempos_cargar),
+                                    ("Guardar (sobrescribir)", tiempos_guardar)):
+                p50, p99 = microsegundos(tiempos)
+                print(f"{nombre:<28} | {p50:>8.1f} | {p99:>8.1f}")
+
+            # WAL: una transacción de escritura abierta no bloquea a los lectores
+            almacen.conexion.execute("BEGIN IMMEDIATE")
+            almacen.conexion.execute("UPDATE partidas SET actualizada = actualizada + 1 WHERE id = 1")
+            with almacen_partidas.AlmacenPartidas(ruta) as lector:
+                inicio = time.perf_counter()
+                lector.listar("jugador1")
+                print(f"\nLectura con otra conexión escribiendo: {(time.perf_counter() - inicio) * 1e6:.1f} µs "
+                      f"(sin bloqueo)")
+            almacen.conexion.rollback()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+MEDICIÓN - Tableros de listas vs bitboards
+==========================================
+
+Compara las operaciones básicas de Hundir la Flota con tableros de listas
+(código original de hundir_flota.py) y con máscaras de bits
+(bitboard_flota.py):
+
+- Comprobar si una colocación es válida (con la regla de separación)
+- Resolver un disparo (agua / tocado / hundido)
+- Generar tableros hipotéticos completos (flota de 5 barcos), que es lo
+  que necesita la IA para evaluar posiciones
+
+Uso:
+    python rendimiento/medir_bitboard.py
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import hundir_flota
+from compartido import bitboard_flota
+
+
+FLOTA = [5, 4, 3, 3, 2]
+
+
+def validar_posicion_original(tablero, fila, columna, longitud, orientacion):
+    """
+    Copia de la implementación original de validar_posicion, solo para comparar.
+    """
+    if orientacion == 'H':
+        if columna + longitud > 10:
+            return False
+    else:
+        if fila + longitud > 10:
+            return False
+    for i in range(longitud):
+        f, c = (fila, columna + i) if orientacion == 'H' else (fila + i, columna)
+        if tablero[f][c] != '~':
+            return False
+        for df in [-1, 0, 1]:
+            for dc in [-1, 0, 1]:
+                nf, nc = f + df, c + dc
+                if 0 <= nf < 10 and 0 <= nc < 10:
+                    if tablero[nf][nc] != '~' and (nf, nc) != (f, c):
+                        return False
+    return True
+
+
+def por_segundo(funcion, repeticiones):
+    inicio = time.perf_counter()
+    funcion(repeticiones)
+    return repeticiones / (time.perf_counter() - inicio)
+
+
+def main():
+    rng = random.Random(0)
+    tablero = hundir_flota.crear_tablero()
+    hundir_flota.colocar_flota_aleatoria(tablero, FLOTA, rng)
+    tablero_bits = bitboard_flota.TableroBits.desde_tablero(tablero)
+    geo = tablero_bits.geo
+
+    consultas = [(rng.randrange(10), rng.randrange(10), rng.choice(FLOTA), rng.choice('HV'))
+                 for _ in range(1000)]
+
+    def validar_listas(n):
+        for i in range(n):
+            validar_posicion_original(tablero, *consultas[i % 1000])
+
+    def validar_bits(n):
+        prohibidas = tablero_bits.prohibidas
+        mascaras_de = geo.mascaras_de
+        for i in range(n):
+            f, c, longitud, orientacion = consultas[i % 1000]
+            par = mascaras_de(longitud, f, c, orientacion)
+            par is not None and not par[0] & prohibidas
+
+    casillas = [(f, c) for f in range(10) for c in range(10)]
+
+    def disparos_listas(n):
+        for i in range(n // 100):
+            objetivo = [fila[:] for fila in tablero]
+            disparos = hundir_flota.crear_tablero()
+            for f, c in casillas:
+                hundir_flota.realizar_disparo(objetivo, disparos, f, c)
+
+    def disparos_bits(n):
+        for i in range(n // 100):
+            objetivo = bitboard_flota.TableroBits.desde_tablero(tablero)
+            for f, c in casillas:
+                objetivo.disparar(f, c)
+
+    def hipoteticos_listas(n):
+        for _ in range(n):
+            hipotetico = hundir_flota.crear_tablero()
+            for longitud in FLOTA:
+                while True:
+                    f, c, o = rng.randrange(10), rng.randrange(10), rng.choice('HV')
+                    if validar_posicion_original(hipotetico, f, c, longitud, o):
+                        hundir_flota.colocar_barco(hipotetico, f, c, longitud, o)
+                        break
+
+    colocaciones = {longitud: [geo.mascaras_de(longitud, *colocacion) for colocacion in geo.colocaciones_de(longitud)]
+                    for longitud in set(FLOTA)}
+
+    def hipoteticos_bits(n):
+        eleccion = rng.choice
+        for _ in range(n):
+            prohibidas = ocupadas = 0
+            for longitud in FLOTA:
+                while True:
+                    mascara, halo = eleccion(colocaciones[longitud])
+                    if not mascara & prohibidas:
+                        ocupadas |= mascara
+                        prohibidas |= halo
+                        break
+
+    print(f"{'Operación':<32} | {'Listas/s':>12} | {'Bits/s':>12} | {'Mejora':>7}")
+    print("-" * 72)
+    for nombre, listas, bits, repeticiones in (
+            ("Validar colocación", validar_listas, validar_bits, 200000),
+            ("Resolver disparo", disparos_listas, disparos_bits, 100000),
+            ("Tablero hipotético (5 barcos)", hipoteticos_listas, hipoteticos_bits, 20000)):
+        a = por_segundo(listas, repeticiones)
+        b = por_segundo(bits, repeticiones)
+        print(f"{nombre:<32} | {a:>12,.0f} | {b:>12,.0f} | {b / a:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
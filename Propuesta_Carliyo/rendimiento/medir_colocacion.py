@@ -0,0 +1,98 @@
+"""
+MEDICIÓN - Colocación aleatoria de la flota
+===========================================
+
+Compara la colocación original (hasta 100 intentos a ciegas por barco, sin
+deshacer nada si un barco no cabe) con el índice de colocaciones válidas
+de compartido/colocacion_barcos.py.
+
+Se mide el tiempo por flota y cuántas flotas quedan incompletas con:
+- La flota normal del juego (5, 4, 3, 3, 2)
+- Una flota muy apretada (5, 4, 4, 3, 3, 3, 2, 2, 2, 2), que cabe en 10×10
+  pero deja poco sitio a los últimos barcos
+- Ocho portaaviones (solo caben en muy pocas distribuciones)
+- Doce acorazados, que caben pero muy justos
+- Nueve portaaviones, que no caben aunque la superficie alcance
+- Una flota que no cabe por superficie, para ver que falla rápido
+
+Uso:
+    python rendimiento/medir_colocacion.py [flotas]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import hundir_flota
+
+
+FLOTAS = [
+    ("Normal", [5, 4, 3, 3, 2]),
+    ("Apretada", [5, 4, 4, 3, 3, 3, 2, 2, 2, 2]),
+    ("8 × 5", [5] * 8),
+    ("12 × 4", [4] * 12),
+    ("9 × 5", [5] * 9),
+    ("Imposible", [5] * 11),
+]
+
+
+def colocar_barco_original(tablero, longitud, rng):
+    """
+    Copia de la implementación original de colocar_barco_aleatorio, solo para comparar.
+    """
+    for _ in range(100):
+        fila = rng.randint(0, 9)
+        columna = rng.randint(0, 9)
+        orientacion = rng.choice(['H', 'V'])
+        if hundir_flota.validar_posicion(tablero, fila, columna, longitud, orientacion):
+            hundir_flota.colocar_barco(tablero, fila, columna, longitud, orientacion)
+            return True
+    return False
+
+
+def flota_original(tablero, longitudes, rng):
+    # Como en jugar_hundir_flota(): el resultado de cada barco se ignoraba
+    return all([colocar_barco_original(tablero, longitud, rng) for longitud in longitudes])
+
+
+def flota_indice(tablero, longitudes, rng):
+    return hundir_flota.colocar_flota_aleatoria(tablero, longitudes, rng)
+
+
+def medir(colocar, longitudes, flotas):
+    """
+    Returns:
+        tuple: (ms por flota, ms de la peor flota, flotas incompletas)
+    """
+    rng = random.Random(0)
+    fallos = 0
+    peor = 0.0
+    inicio = time.perf_counter()
+    for _ in range(flotas):
+        tablero = hundir_flota.crear_tablero()
+        t = time.perf_counter()
+        if not colocar(tablero, longitudes, rng):
+            fallos += 1
+        peor = max(peor, time.perf_counter() - t)
+    total = time.perf_counter() - inicio
+    return total * 1000 / flotas, peor * 1000, fallos
+
+
+def main():
+    flotas = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    print(f"{flotas} flotas por caso en un tablero 10×10\n")
+    print(f"{'Flota':<10} | {'Versión':<9} | {'ms/flota':>9} | {'Peor ms':>8} | {'Incompletas':>11}")
+    print("-" * 60)
+    for nombre, longitudes in FLOTAS:
+        n = flotas if nombre in ("Normal", "Apretada") else max(1, flotas // 20)
+        for version, colocar in (("Original", flota_original), ("Índice", flota_indice)):
+            ms, peor, fallos = medir(colocar, longitudes, n)
+            print(f"{nombre:<10} | {version:<9} | {ms:>9.3f} | {peor:>8.2f} | {fallos:>6}/{n}")
+
+
+if __name__ == "__main__":
+    main()
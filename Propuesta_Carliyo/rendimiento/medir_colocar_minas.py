@@ -0,0 +1,78 @@
+"""
+MEDICIÓN - Colocación de minas por densidad
+===========================================
+
+Barrido de densidad de minas del 1 % al 99 % comparando la colocación
+original (sorteo con reintentos al chocar con una mina) con la nueva
+colocar_minas() sin reintentos, en un tablero de 200×200 con el primer
+clic protegido.
+
+Uso:
+    python rendimiento/medir_colocar_minas.py
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import buscaminas
+
+
+FILAS = 200
+COLUMNAS = 200
+
+
+def colocar_con_reintentos(tablero_real, num_minas, rng):
+    """
+    Copia de la colocación original (con reintentos), solo para comparar.
+
+    Returns:
+        int: Número de sorteos realizados
+    """
+    filas = len(tablero_real)
+    columnas = len(tablero_real[0])
+    minas_colocadas = 0
+    sorteos = 0
+    while minas_colocadas < num_minas:
+        fila = rng.randint(0, filas - 1)
+        columna = rng.randint(0, columnas - 1)
+        sorteos += 1
+        if tablero_real[fila][columna] != '*':
+            tablero_real[fila][columna] = '*'
+            minas_colocadas += 1
+    return sorteos
+
+
+def main():
+    total = FILAS * COLUMNAS
+    print(f"Tablero {FILAS}×{COLUMNAS} ({total} casillas)\n")
+    print(f"{'Densidad':>9} | {'Minas':>6} | {'Reintentos (ms)':>16} | {'Sorteos':>8} | {'Sin reintentos (ms)':>20}")
+    print("-" * 72)
+
+    for porcentaje in (1, 10, 25, 50, 75, 90, 95, 99):
+        num_minas = total * porcentaje // 100
+
+        # Original: no admite zona excluida y no termina si no caben las minas
+        tablero_real, _ = buscaminas.crear_tablero(FILAS, COLUMNAS)
+        inicio = time.perf_counter()
+        sorteos = colocar_con_reintentos(tablero_real, num_minas, random.Random(porcentaje))
+        antes = (time.perf_counter() - inicio) * 1000
+
+        # Nueva: sorteo sin reemplazo y primer clic protegido
+        tablero_real, _ = buscaminas.crear_tablero(FILAS, COLUMNAS)
+        zona = buscaminas.zona_primer_clic(tablero_real, FILAS // 2, COLUMNAS // 2, num_minas)
+        inicio = time.perf_counter()
+        buscaminas.colocar_minas(tablero_real, num_minas, excluir=zona, rng=random.Random(porcentaje))
+        despues = (time.perf_counter() - inicio) * 1000
+
+        assert sum(fila.count('*') for fila in tablero_real) == num_minas
+        assert all(tablero_real[f][c] != '*' for f, c in zona)
+
+        print(f"{porcentaje:>8}% | {num_minas:>6} | {antes:>16.1f} | {sorteos:>8} | {despues:>20.1f}")
+
+
+if __name__ == "__main__":
+    main()
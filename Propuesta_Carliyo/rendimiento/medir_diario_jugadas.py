@@ -0,0 +1,85 @@
+"""
+MEDICIÓN - Guardado automático con diario de jugadas
+====================================================
+
+Compara el coste por jugada de:
+- reescribir la partida entera de forma atómica en cada disparo (lo que
+  haría guardar_partida() de la versión de Teo si se llamase en cada turno)
+- anotar el disparo en el diario (diario_jugadas.py) con cada modo de
+  sincronización: 'nunca', 'lote' y 'siempre'
+
+y lo que tarda recuperar una partida a partir de la foto y el diario.
+
+Uso:
+    python rendimiento/medir_diario_jugadas.py [jugadas]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import hundir_flota
+from compartido import diario_jugadas, indice_barcos, partida_binaria
+
+SIMBOLOS = ('~', 'B', 'X', 'O')
+
+
+def crear_partida():
+    tableros, indices = [], []
+    for _ in range(2):
+        barcos = hundir_flota.crear_tablero()
+        indice = indice_barcos.IndiceBarcos(10)
+        hundir_flota.colocar_flota_aleatoria(barcos, rng=random.Random(1), indice=indice)
+        tableros += [barcos, hundir_flota.crear_tablero()]
+        indices.append(indice)
+    return tableros, indices
+
+
+def main():
+    jugadas = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    tableros, indices = crear_partida()
+    estado = partida_binaria.codificar_partida(tableros, indices, SIMBOLOS)
+    rng = random.Random(1)
+    casillas = [(rng.randrange(10), rng.randrange(10)) for _ in range(jugadas)]
+
+    with tempfile.TemporaryDirectory() as carpeta:
+        print(f"{'Guardado por jugada':<34} | {'µs/jugada':>10}")
+        print("-" * 47)
+
+        ruta = os.path.join(carpeta, "partida.flota")
+        repeticiones = max(1, jugadas // 10)
+        inicio = time.perf_counter()
+        for _ in range(repeticiones):
+            partida_binaria.escribir_atomico(ruta, partida_binaria.codificar_partida(tableros, indices, SIMBOLOS))
+        print(f"{'Reescribir la partida (atómico)':<34} | "
+              f"{(time.perf_counter() - inicio) / repeticiones * 1e6:>10.1f}")
+
+        for sincronizar in diario_jugadas.SINCRONIZAR:
+            cuantas = jugadas if sincronizar != 'siempre' else max(1, jugadas // 10)
+            base = os.path.join(carpeta, sincronizar)
+            diario = diario_jugadas.DiarioJugadas(base, sincronizar, compactar_cada=10**9)
+            diario.empezar(estado)
+            inicio = time.perf_counter()
+            for fila, columna in casillas[:cuantas]:
+                diario.anotar('J', fila, columna)
+            segundos = time.perf_counter() - inicio
+            diario.cerrar()
+            etiqueta = f"Diario '{sincronizar}'" + (f" (fsync cada {diario.cada})" if sincronizar == 'lote' else "")
+            print(f"{etiqueta:<34} | {segundos / cuantas * 1e6:>10.1f}")
+
+        # Recuperar: foto + todas las jugadas del diario 'nunca'
+        diario = diario_jugadas.DiarioJugadas(os.path.join(carpeta, 'nunca'))
+        inicio = time.perf_counter()
+        foto, anotadas = diario.recuperar()
+        partida_binaria.decodificar_partida(foto, SIMBOLOS)
+        segundos = time.perf_counter() - inicio
+        print(f"\nRecuperar foto + {len(anotadas)} jugadas "
+              f"({len(anotadas) * diario_jugadas.REGISTRO.size} bytes de diario): {segundos * 1e3:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
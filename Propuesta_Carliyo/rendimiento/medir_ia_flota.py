@@ -0,0 +1,83 @@
+"""
+MEDICIÓN - Disparos para ganar de cada IA de Hundir la Flota
+============================================================
+
+Cada IA juega sola contra flotas aleatorias (la flota normal del juego en
+10×10) hasta hundirlas todas. Se mide:
+- Disparos medios (y percentiles) para ganar
+- Tiempo medio y máximo de cada decisión
+
+Las IAs usan las mismas funciones que turno_ia(): elegir_disparo_ia() y
+registrar_disparo_ia(), sin pausas ni mensajes.
+
+Uso:
+    python rendimiento/medir_ia_flota.py [partidas]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import hundir_flota
+
+
+NIVELES = ['facil', 'intermedio', 'dificil', 'probabilistico']
+
+
+def jugar_partida(nivel, semilla, tiempos):
+    """
+    Juega una partida de la IA contra una flota aleatoria.
+
+    Args:
+        tiempos (list): Lista donde se añade la duración de cada decisión (segundos)
+
+    Returns:
+        int: Disparos necesarios para hundir toda la flota
+    """
+    # Las IAs antiguas usan el módulo random directamente
+    random.seed(semilla)
+    tablero = hundir_flota.crear_tablero()
+    hundir_flota.colocar_flota_aleatoria(tablero, rng=random.Random(semilla))
+    contadores = hundir_flota.crear_contadores(tablero)
+    disparos = hundir_flota.crear_tablero()
+
+    ultimo_tocado = []
+    patron = hundir_flota.crear_patron() if nivel == 'dificil' else []
+    estado_ia = hundir_flota.crear_estado_ia(nivel)
+
+    total = 0
+    while not hundir_flota.verificar_victoria(tablero, contadores):
+        inicio = time.perf_counter()
+        fila, columna = hundir_flota.elegir_disparo_ia(nivel, disparos, ultimo_tocado, patron, estado_ia)
+        resultado = hundir_flota.realizar_disparo(tablero, disparos, fila, columna, contadores)
+        hundir_flota.registrar_disparo_ia(nivel, fila, columna, resultado, ultimo_tocado, estado_ia)
+        tiempos.append(time.perf_counter() - inicio)
+        total += 1
+    return total
+
+
+def percentil(valores_ordenados, p):
+    return valores_ordenados[min(len(valores_ordenados) - 1, int(len(valores_ordenados) * p))]
+
+
+def main():
+    partidas = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+
+    print(f"{partidas} partidas por nivel (flota 5, 4, 3, 3, 2 en 10×10)\n")
+    print(f"{'Nivel':<15} | {'Disparos':>8} | {'p10':>4} | {'p50':>4} | {'p90':>4} | "
+          f"{'ms/disparo':>10} | {'Máx ms':>7}")
+    print("-" * 72)
+    for nivel in NIVELES:
+        tiempos = []
+        disparos = sorted(jugar_partida(nivel, semilla, tiempos) for semilla in range(partidas))
+        media = sum(disparos) / partidas
+        print(f"{nivel:<15} | {media:>8.1f} | {percentil(disparos, 0.1):>4} | "
+              f"{percentil(disparos, 0.5):>4} | {percentil(disparos, 0.9):>4} | "
+              f"{sum(tiempos) / len(tiempos) * 1000:>10.3f} | {max(tiempos) * 1000:>7.2f}")
+
+
+if __name__ == "__main__":
+    main()
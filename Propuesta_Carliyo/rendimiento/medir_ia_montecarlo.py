@@ -0,0 +1,89 @@
+"""
+MEDICIÓN - IA experta (Monte Carlo) de Hundir la Flota
+======================================================
+
+Juega partidas de la IA experta contra flotas aleatorias y las compara con
+la IA probabilística. Se mide:
+- Disparos medios para ganar
+- Muestras generadas por jugada
+- Tiempo de cada jugada al principio, a mitad y al final de la partida,
+  para ver que se queda en el presupuesto aunque avance la partida
+
+Uso:
+    python rendimiento/medir_ia_montecarlo.py [partidas] [presupuesto_ms] [procesos]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import hundir_flota
+import ia_montecarlo
+import ia_probabilistica
+
+
+LONGITUDES = [longitud for _, longitud in hundir_flota.FLOTA]
+
+
+def jugar_partida(estado, semilla, tiempos, muestras):
+    """
+    Juega una partida de una IA (MapaCalor o EstadoMonteCarlo) contra una flota aleatoria.
+
+    Args:
+        tiempos (list): Lista donde se añaden (disparo, segundos) de cada jugada
+        muestras (list): Lista donde se añaden las muestras de cada jugada
+
+    Returns:
+        int: Disparos necesarios para hundir toda la flota
+    """
+    tablero = hundir_flota.crear_tablero()
+    hundir_flota.colocar_flota_aleatoria(tablero, rng=random.Random(semilla))
+    contadores = hundir_flota.crear_contadores(tablero)
+    disparos = hundir_flota.crear_tablero()
+
+    total = 0
+    while not hundir_flota.verificar_victoria(tablero, contadores):
+        inicio = time.perf_counter()
+        fila, columna = estado.elegir_disparo()
+        tiempos.append((total, time.perf_counter() - inicio))
+        muestras.append(getattr(estado, 'ultimas_muestras', 0))
+        resultado = hundir_flota.realizar_disparo(tablero, disparos, fila, columna, contadores)
+        estado.registrar(fila, columna, resultado)
+        total += 1
+    return total
+
+
+def main():
+    partidas = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    presupuesto = (float(sys.argv[2]) if len(sys.argv) > 2 else ia_montecarlo.PRESUPUESTO_SEGUNDOS * 1000) / 1000
+    procesos = int(sys.argv[3]) if len(sys.argv) > 3 else (os.cpu_count() or 1)
+
+    print(f"{partidas} partidas, presupuesto {presupuesto * 1000:.0f} ms, {procesos} procesos\n")
+    print(f"{'IA':<15} | {'Disparos':>8} | {'Muestras':>8} | {'ms 1-20':>8} | "
+          f"{'ms 21-40':>8} | {'ms 41+':>8} | {'Máx ms':>7}")
+    print("-" * 80)
+    for nombre in ('probabilistico', 'experto'):
+        tiempos, muestras, disparos = [], [], []
+        for semilla in range(partidas):
+            if nombre == 'experto':
+                estado = ia_montecarlo.EstadoMonteCarlo(10, LONGITUDES, random.Random(semilla),
+                                                        presupuesto, procesos, semilla)
+            else:
+                estado = ia_probabilistica.MapaCalor(10, LONGITUDES, random.Random(semilla))
+            disparos.append(jugar_partida(estado, semilla, tiempos, muestras))
+
+        def media_ms(desde, hasta):
+            tramo = [t for disparo, t in tiempos if desde <= disparo < hasta]
+            return sum(tramo) / len(tramo) * 1000 if tramo else 0.0
+
+        print(f"{nombre:<15} | {sum(disparos) / partidas:>8.1f} | {sum(muestras) / len(muestras):>8.0f} | "
+              f"{media_ms(0, 20):>8.2f} | {media_ms(20, 40):>8.2f} | {media_ms(40, 100):>8.2f} | "
+              f"{max(t for _, t in tiempos) * 1000:>7.2f}")
+    ia_montecarlo.cerrar_pool()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+MEDICIÓN - Memoria de tableros de listas vs TableroCompacto
+===========================================================
+
+Mide los bytes que ocupa cada tablero (lista exterior + listas de cada
+fila, o objeto + bytearray) para los tamaños que se usan en los juegos, y
+cuánto ocuparían mil partidas en memoria.
+
+Los valores de las casillas (cadenas de un carácter y enteros pequeños) son
+objetos compartidos por Python, así que no se cuentan en ninguno de los dos.
+
+Uso:
+    python rendimiento/medir_memoria_tableros.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import buscaminas
+import hundir_flota
+
+
+def tamano_listas(tablero):
+    """
+    Bytes de un tablero de listas: la lista exterior más cada fila.
+    """
+    return sys.getsizeof(tablero) + sum(sys.getsizeof(fila) for fila in tablero)
+
+
+def main():
+    casos = [
+        ("Hundir la Flota 10×10 (4 tableros)", lambda compacto: [hundir_flota.crear_tablero(compacto=compacto) for _ in range(4)]),
+        ("Buscaminas 8×10 (2 tableros)", lambda compacto: buscaminas.crear_tablero(8, 10, compacto)),
+        ("Buscaminas 30×16 (2 tableros)", lambda compacto: buscaminas.crear_tablero(30, 16, compacto)),
+    ]
+
+    print(f"{'Partida':<36} | {'Listas':>9} | {'Compacto':>9} | {'Ahorro':>7} | {'1000 partidas':>20}")
+    print("-" * 94)
+    for nombre, crear in casos:
+        listas = sum(tamano_listas(tablero) for tablero in crear(False))
+        compacto = sum(sys.getsizeof(tablero) for tablero in crear(True))
+        mil = f"{listas * 1000 / 1e6:.1f} → {compacto * 1000 / 1e6:.2f} MB"
+        print(f"{nombre:<36} | {listas:>7} B | {compacto:>7} B | {listas / compacto:>6.1f}x | {mil:>20}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+MEDICIÓN - Partidas completas sin terminal con motor_flota
+==========================================================
+
+Juega partidas completas IA contra IA con motor_flota.PartidaFlota, sin
+input(), print() ni pausas, en un solo proceso, y mide cuántas partidas
+por segundo salen (colocación de las dos flotas incluida).
+
+Uso:
+    python rendimiento/medir_motor_flota.py [partidas] [nivel_a] [nivel_b]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import motor_flota
+
+
+def jugar(nivel_a, nivel_b, semilla):
+    """
+    Una partida completa entre dos IAs.
+
+    Returns:
+        tuple: (ganador, jugadas)
+    """
+    # Las IAs antiguas usan el módulo random directamente
+    random.seed(semilla)
+    partida = motor_flota.PartidaFlota(semilla=semilla)
+    partida.colocar_flota_aleatoria(0)
+    partida.colocar_flota_aleatoria(1)
+    partida.empezar(semilla % 2)
+    ias = [motor_flota.IAFlota(nivel_a, partida.n), motor_flota.IAFlota(nivel_b, partida.n)]
+    while not partida.terminada:
+        partida.jugada_ia(ias[partida.turno])
+    return partida.ganador, partida.jugadas
+
+
+def main():
+    partidas = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    nivel_a = sys.argv[2] if len(sys.argv) > 2 else 'facil'
+    nivel_b = sys.argv[3] if len(sys.argv) > 3 else 'dificil'
+
+    victorias = [0, 0]
+    jugadas = 0
+    inicio = time.perf_counter()
+    for semilla in range(partidas):
+        ganador, total = jugar(nivel_a, nivel_b, semilla)
+        victorias[ganador] += 1
+        jugadas += total
+    segundos = time.perf_counter() - inicio
+
+    print(f"{nivel_a} vs {nivel_b}: {partidas} partidas en {segundos:.2f} s")
+    print(f"  Partidas por segundo: {partidas / segundos:,.0f}")
+    print(f"  Disparos por segundo: {jugadas / segundos:,.0f}")
+    print(f"  Victorias: {nivel_a} {victorias[0]} - {victorias[1]} {nivel_b}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+MEDICIÓN - Partida guardada en JSON vs formato binario
+======================================================
+
+Compara el tamaño y el tiempo de guardar y cargar una partida de la
+versión de Teo (4 tableros 10 × 10 y 2 índices de barcos) con el JSON
+con sangría original y con partida_binaria.py.
+
+Uso:
+    python rendimiento/medir_partida_binaria.py [repeticiones]
+"""
+
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import hundir_flota
+from compartido import indice_barcos, partida_binaria
+
+SIMBOLOS = ('~', 'B', 'X', 'O')
+
+
+def crear_partida():
+    """
+    Cuatro tableros a mitad de partida y los índices de las dos flotas.
+    """
+    rng = random.Random(1)
+    tableros, indices = [], []
+    for _ in range(2):
+        barcos = hundir_flota.crear_tablero()
+        disparos = hundir_flota.crear_tablero()
+        indice = indice_barcos.IndiceBarcos(10)
+        hundir_flota.colocar_flota_aleatoria(barcos, rng=rng, indice=indice)
+        contadores = hundir_flota.crear_contadores(barcos, indice)
+        for _ in range(40):
+            hundir_flota.realizar_disparo(barcos, disparos, rng.randrange(10), rng.randrange(10), contadores)
+        tableros += [barcos, disparos]
+        indices.append(indice)
+    return tableros, indices
+
+
+def medir(funcion, repeticiones):
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        funcion()
+    return (time.perf_counter() - inicio) / repeticiones * 1e6
+
+
+def main():
+    repeticiones = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    tableros, indices = crear_partida()
+
+    estado = {"tableros": tableros, "indices": [indice.a_dict() for indice in indices]}
+    texto = json.dumps(estado, indent=4)
+    datos = partida_binaria.codificar_partida(tableros, indices, SIMBOLOS)
+
+    def cargar_json():
+        cargado = json.loads(texto)
+        return cargado["tableros"], [indice_barcos.IndiceBarcos.desde_dict(d) for d in cargado["indices"]]
+
+    print(f"{'Formato':<10} | {'Bytes':>6} | {'Guardar µs':>11} | {'Cargar µs':>10}")
+    print("-" * 46)
+    print(f"{'JSON':<10} | {len(texto.encode()):>6} | {medir(lambda: json.dumps(estado, indent=4), repeticiones):>11.1f} | "
+          f"{medir(cargar_json, repeticiones):>10.1f}")
+    print(f"{'Binario':<10} | {len(datos):>6} | "
+          f"{medir(lambda: partida_binaria.codificar_partida(tableros, indices, SIMBOLOS), repeticiones):>11.1f} | "
+          f"{medir(lambda: partida_binaria.decodificar_partida(datos, SIMBOLOS), repeticiones):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
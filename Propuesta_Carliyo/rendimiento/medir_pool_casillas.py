@@ -0,0 +1,105 @@
+"""
+MEDICIÓN - Disparo al azar con reintentos vs pool de casillas libres
+====================================================================
+
+Compara, disparando a todas las casillas de tableros N × N:
+- IA fácil original (random.randint hasta dar con una casilla libre)
+  contra el pool de casillas (pool_casillas.py)
+- Patrón de la IA difícil con list.pop(0) contra deque.popleft()
+
+Se mide el tiempo medio por disparo en el primer y el último 10 % de la
+partida y el peor disparo, para ver que con el pool el coste no crece al
+avanzar la partida ni con el tamaño del tablero.
+
+Uso:
+    python rendimiento/medir_pool_casillas.py [tamaños...]
+"""
+
+import os
+import random
+import sys
+import time
+from collections import deque
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import hundir_flota
+from compartido import pool_casillas
+
+
+def disparo_facil_original(tablero_disparos):
+    """
+    Copia de la implementación original de ia_disparar_facil, solo para comparar.
+    """
+    n = len(tablero_disparos)
+    while True:
+        fila = random.randint(0, n - 1)
+        columna = random.randint(0, n - 1)
+        if tablero_disparos[fila][columna] == '~':
+            return fila, columna
+
+
+def medir_facil(n, con_pool):
+    """
+    Returns:
+        list: Segundos de cada disparo, en orden
+    """
+    random.seed(n)
+    disparos = [['~'] * n for _ in range(n)]
+    pool = pool_casillas.PoolCasillas(n) if con_pool else None
+    tiempos = []
+    for _ in range(n * n):
+        inicio = time.perf_counter()
+        if con_pool:
+            fila, columna = hundir_flota.ia_disparar_facil(disparos, pool)
+            pool.quitar(fila, columna)
+        else:
+            fila, columna = disparo_facil_original(disparos)
+        tiempos.append(time.perf_counter() - inicio)
+        disparos[fila][columna] = 'O'
+    return tiempos
+
+
+def medir_patron(n, con_deque):
+    """
+    Returns:
+        list: Segundos de cada casilla sacada del patrón, en orden
+    """
+    random.seed(n)
+    patron = list(hundir_flota.crear_patron(n))
+    if con_deque:
+        patron = deque(patron)
+    tiempos = []
+    while patron:
+        inicio = time.perf_counter()
+        if con_deque:
+            patron.popleft()
+        else:
+            patron.pop(0)
+        tiempos.append(time.perf_counter() - inicio)
+    return tiempos
+
+
+def resumen(tiempos):
+    decimo = max(1, len(tiempos) // 10)
+    principio = sum(tiempos[:decimo]) / decimo
+    final = sum(tiempos[-decimo:]) / decimo
+    return principio * 1e6, final * 1e6, max(tiempos) * 1e6
+
+
+def main():
+    tamanos = [int(x) for x in sys.argv[1:]] or [10, 30, 100]
+
+    print(f"{'Operación':<22} | {'N':>4} | {'µs inicio':>10} | {'µs final':>10} | {'Peor µs':>10}")
+    print("-" * 68)
+    for n in tamanos:
+        for nombre, medir, nuevo in (("Fácil original", medir_facil, False),
+                                     ("Fácil con pool", medir_facil, True),
+                                     ("Patrón list.pop(0)", medir_patron, False),
+                                     ("Patrón deque", medir_patron, True)):
+            inicio, final, peor = resumen(medir(n, nuevo))
+            print(f"{nombre:<22} | {n:>4} | {inicio:>10.2f} | {final:>10.2f} | {peor:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""
+MEDICIÓN - Tiempo por fotograma del Buscaminas
+==============================================
+
+Juega una partida Difícil (30 × 16) con el solucionador y dibuja un
+fotograma después de cada jugada de dos formas:
+
+- Antes: os.system('clear') + print() casilla a casilla (copia del código original)
+- Después: Renderizador + CacheFilas (renderizado.py), que solo reescriben
+  las filas que cambian y envían el fotograma en una sola escritura
+
+La salida va a /dev/null (también la del proceso 'clear'), así que los
+tiempos no incluyen la terminal: por SSH la diferencia en bytes y número
+de escrituras pesa todavía más.
+
+Uso:
+    python rendimiento/medir_renderizado.py [jugadas]
+"""
+
+import contextlib
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import buscaminas
+import renderizado
+import solucionador
+from motor_buscaminas import PartidaBuscaminas
+
+
+class SalidaContada:
+    """
+    Flujo que escribe en /dev/null con buffer de línea (como una terminal)
+    y cuenta las escrituras y los bytes.
+    """
+
+    def __init__(self):
+        self.archivo = open(os.devnull, 'w', buffering=1)
+        self.escrituras = 0
+        self.bytes = 0
+
+    def write(self, texto):
+        self.escrituras += 1
+        self.bytes += len(texto.encode())
+        return self.archivo.write(texto)
+
+    def flush(self):
+        self.archivo.flush()
+
+    def isatty(self):
+        return False
+
+
+def mostrar_tablero_original(tablero_visible):
+    """
+    Copia de la implementación original de mostrar_tablero, solo para comparar.
+    """
+    columnas = len(tablero_visible[0])
+    print("\n    ", end="")
+    for i in range(columnas):
+        print(chr(65 + i), end=" ")
+    print()
+    for i, fila in enumerate(tablero_visible):
+        print(f"{i + 1:3} ", end="")
+        for casilla in fila:
+            if casilla == '#':
+                print('#', end=" ")
+            elif casilla == 'F':
+                print('F', end=" ")
+            elif casilla == 0:
+                print('.', end=" ")
+            else:
+                print(casilla, end=" ")
+        print()
+    print()
+
+
+def fotograma_antes(partida):
+    """
+    Dibuja un fotograma como lo hacía jugar_buscaminas() originalmente.
+    """
+    os.system('cls' if os.name == 'nt' else 'clear')
+    print("=" * 50)
+    print("                   BUSCAMINAS")
+    print("=" * 50)
+    print(f"Tablero: {partida.filas}×{partida.columnas} | Minas: {partida.num_minas}")
+    print("=" * 50)
+    mostrar_tablero_original(partida.tablero_visible)
+    print("=" * 50)
+
+
+def fotograma_despues(partida, renderizador, cache):
+    """
+    Dibuja el mismo fotograma con el renderizador.
+    """
+    lineas = [
+        "=" * 50,
+        "                   BUSCAMINAS",
+        "=" * 50,
+        f"Tablero: {partida.filas}×{partida.columnas} | Minas: {partida.num_minas}",
+        "=" * 50,
+        "",
+    ]
+    lineas.extend(buscaminas.formatear_tablero(partida.tablero_visible, cache=cache))
+    lineas.extend(["", "=" * 50])
+    renderizador.dibujar(lineas)
+
+
+def jugadas_de_partida(jugadas, semilla=3):
+    """
+    Devuelve los estados visibles de una partida Difícil tras cada jugada.
+    """
+    partida = PartidaBuscaminas.desde_nivel('dificil', semilla)
+    partida.revelar(partida.filas // 2, partida.columnas // 2)
+    estados = [[list(fila) for fila in partida.tablero_visible]]
+    while not partida.terminada and len(estados) < jugadas:
+        jugada = solucionador.elegir_jugada(partida.tablero_visible, partida.num_minas)
+        partida.aplicar(*jugada)
+        estados.append([list(fila) for fila in partida.tablero_visible])
+    return partida, estados
+
+
+def medir(estados, partida, dibujar):
+    """
+    Dibuja un fotograma por estado con la salida redirigida a /dev/null.
+
+    Returns:
+        tuple: (ms por fotograma, escrituras por fotograma, bytes por fotograma)
+    """
+    salida = SalidaContada()
+    nulo = os.open(os.devnull, os.O_WRONLY)
+    stdout_original = os.dup(1)
+    sys.stdout.flush()
+    os.dup2(nulo, 1)  # la salida del proceso 'clear' también va a /dev/null
+    try:
+        with contextlib.redirect_stdout(salida):
+            inicio = time.perf_counter()
+            for estado in estados:
+                partida.tablero_visible = estado
+                dibujar(partida, salida)
+            total = time.perf_counter() - inicio
+    finally:
+        os.dup2(stdout_original, 1)
+        os.close(stdout_original)
+        os.close(nulo)
+        salida.archivo.close()
+
+    n = len(estados)
+    return total * 1000 / n, salida.escrituras / n, salida.bytes / n
+
+
+def main():
+    jugadas = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    partida, estados = jugadas_de_partida(jugadas)
+
+    antes = medir(estados, partida, lambda p, salida: fotograma_antes(p))
+
+    renderizador = renderizado.Renderizador()
+    cache = renderizado.CacheFilas()
+
+    def dibujar_despues(p, salida):
+        renderizador.salida = salida
+        fotograma_despues(p, renderizador, cache)
+
+    despues = medir(estados, partida, dibujar_despues)
+
+    print(f"{len(estados)} fotogramas de una partida Difícil (30 × 16)\n")
+    print(f"{'Versión':<34} | {'ms/fotograma':>12} | {'Escrituras':>10} | {'Bytes':>8}")
+    print("-" * 74)
+    for nombre, (ms, escrituras, bytes_) in (("Antes (clear + print por casilla)", antes),
+                                               ("Después (Renderizador)", despues)):
+        print(f"{nombre:<34} | {ms:>12.3f} | {escrituras:>10.1f} | {bytes_:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
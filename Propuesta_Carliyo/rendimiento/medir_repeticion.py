@@ -0,0 +1,84 @@
+"""
+MEDICIÓN - Repetición de partidas de Hundir la Flota
+====================================================
+
+Juega N partidas IA contra IA con el motor (motor_flota.py) grabándolas
+(repeticion.py) y mide:
+- cuánto tarda reconstruir cada partida hasta el final sin dibujar nada
+- cuánto tarda retroceder una jugada (desde el punto de control anterior)
+- cuánto tarda saltar a una jugada al azar
+
+y comprueba que la partida reproducida acaba igual que la original.
+
+Uso:
+    python rendimiento/medir_repeticion.py [partidas]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import motor_flota
+import repeticion
+
+
+def jugar_grabando(semilla, nivel='dificil'):
+    partida = motor_flota.PartidaFlota(semilla=semilla)
+    partida.colocar_flota_aleatoria(0)
+    partida.colocar_flota_aleatoria(1)
+    partida.empezar()
+    grabacion = repeticion.Grabacion.de_flota(partida)
+    ias = [motor_flota.IAFlota(nivel), motor_flota.IAFlota(nivel)]
+    while not partida.terminada:
+        jugada = partida.jugada_ia(ias[partida.turno])
+        if jugada['resultado'] in ('agua', 'tocado', 'hundido'):
+            grabacion.anotar(jugada['fila'], jugada['columna'])
+    return partida, grabacion
+
+
+def microsegundos(tiempos):
+    tiempos = sorted(tiempos)
+    return (tiempos[len(tiempos) // 2] * 1e6, tiempos[int(len(tiempos) * 0.99)] * 1e6)
+
+
+def main():
+    partidas = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    rng = random.Random(1)
+    tiempos_final, tiempos_atras, tiempos_salto, jugadas = [], [], [], []
+
+    for semilla in range(partidas):
+        original, grabacion = jugar_grabando(semilla)
+        jugadas.append(len(grabacion.jugadas))
+
+        inicio = time.perf_counter()
+        repe = repeticion.Repeticion(grabacion)
+        final = repe.al_final()
+        tiempos_final.append(time.perf_counter() - inicio)
+        if final.tableros != original.tableros or final.ganador != original.ganador:
+            raise RuntimeError(f"La partida {semilla} no se reproduce igual")
+
+        inicio = time.perf_counter()
+        repe.retroceder()
+        tiempos_atras.append(time.perf_counter() - inicio)
+
+        destino = rng.randrange(repe.total + 1)
+        inicio = time.perf_counter()
+        repe.ir_a(destino)
+        tiempos_salto.append(time.perf_counter() - inicio)
+
+    print(f"{partidas} partidas, {sum(jugadas) / len(jugadas):.0f} jugadas de media "
+          f"(punto de control cada {repeticion.CADA_PUNTO_CONTROL})")
+    print(f"\n{'Operación':<32} | {'p50 µs':>8} | {'p99 µs':>8}")
+    print("-" * 54)
+    for nombre, tiempos in (("Reconstruir hasta el final", tiempos_final),
+                            ("Retroceder una jugada", tiempos_atras),
+                            ("Saltar a una jugada al azar", tiempos_salto)):
+        p50, p99 = microsegundos(tiempos)
+        print(f"{nombre:<32} | {p50:>8.1f} | {p99:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+MEDICIÓN - Revelado recursivo vs iterativo
+==========================================
+
+Compara la versión recursiva original de revelar_casilla con el motor
+iterativo revelar_area() sobre tableros grandes casi vacíos, donde un solo
+clic abre prácticamente todo el tablero.
+
+La versión recursiva se ejecuta con el límite de recursión por defecto, así
+que en los tableros grandes se espera que falle con RecursionError.
+
+Uso:
+    python rendimiento/medir_revelar.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import buscaminas
+
+
+def revelar_recursivo(tablero_real, tablero_visible, fila, columna):
+    """
+    Copia de la implementación recursiva original, solo para comparar.
+    """
+    if fila < 0 or fila >= len(tablero_real) or columna < 0 or columna >= len(tablero_real[0]):
+        return False
+    if tablero_visible[fila][columna] != '#':
+        return False
+    tablero_visible[fila][columna] = tablero_real[fila][columna]
+    if tablero_real[fila][columna] == '*':
+        return True
+    if tablero_real[fila][columna] == 0:
+        for df in (-1, 0, 1):
+            for dc in (-1, 0, 1):
+                if df or dc:
+                    revelar_recursivo(tablero_real, tablero_visible, fila + df, columna + dc)
+    return False
+
+
+def preparar_tablero(lado):
+    """
+    Crea un tablero lado×lado con una sola mina en una esquina.
+    """
+    tablero_real, tablero_visible = buscaminas.crear_tablero(lado, lado)
+    tablero_real[lado - 1][lado - 1] = '*'
+    buscaminas.calcular_vecinos(tablero_real)
+    return tablero_real, tablero_visible
+
+
+def medir(funcion, lado):
+    """
+    Mide cuánto tarda una función de revelado en abrir el tablero desde (0, 0).
+
+    Returns:
+        str: Tiempo en milisegundos o el error producido
+    """
+    tablero_real, tablero_visible = preparar_tablero(lado)
+    inicio = time.perf_counter()
+    try:
+        funcion(tablero_real, tablero_visible, 0, 0)
+    except RecursionError:
+        return "RecursionError"
+    return f"{(time.perf_counter() - inicio) * 1000:10.1f} ms"
+
+
+def main():
+    print(f"{'Tablero':>12} | {'Recursivo':>16} | {'Iterativo':>16}")
+    print("-" * 52)
+    for lado in (20, 50, 100, 500, 1000, 2000):
+        recursivo = medir(revelar_recursivo, lado)
+        iterativo = medir(buscaminas.revelar_area, lado)
+        print(f"{lado:>5}×{lado:<6} | {recursivo:>16} | {iterativo:>16}")
+
+
+if __name__ == "__main__":
+    main()
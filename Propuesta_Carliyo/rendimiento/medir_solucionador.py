@@ -0,0 +1,92 @@
+"""
+MEDICIÓN - Solucionador del Buscaminas
+======================================
+
+Juega miles de partidas con semilla en cada dificultad usando solo el
+solucionador (solucionador.py) y mide:
+- Tasa de victorias (el primer clic es seguro, el resto lo decide el solucionador)
+- Latencia de cada decisión: analizar() + elegir_jugada()
+
+Uso:
+    python rendimiento/medir_solucionador.py [partidas_por_nivel]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import buscaminas
+import solucionador
+
+
+NIVELES = [
+    ("Fácil", 8, 10, 10),
+    ("Intermedio", 16, 16, 40),
+    ("Difícil", 30, 16, 99),
+]
+
+
+def jugar_partida(filas, columnas, num_minas, semilla, latencias):
+    """
+    Juega una partida completa con el solucionador.
+
+    Args:
+        latencias (list): Lista donde se añade la duración de cada decisión (segundos)
+
+    Returns:
+        bool: True si ganó, False si pisó una mina
+    """
+    rng = random.Random(semilla)
+    tablero_real, tablero_visible = buscaminas.crear_tablero(filas, columnas)
+
+    # Primer clic en el centro, con su zona libre de minas
+    fila, columna = filas // 2, columnas // 2
+    zona = buscaminas.zona_primer_clic(tablero_real, fila, columna, num_minas)
+    buscaminas.colocar_minas(tablero_real, num_minas, excluir=zona, rng=rng)
+    buscaminas.calcular_vecinos(tablero_real)
+    contadores = buscaminas.crear_contadores(tablero_real, tablero_visible)
+    buscaminas.revelar_casilla(tablero_real, tablero_visible, fila, columna, contadores)
+
+    while not buscaminas.verificar_victoria(tablero_real, tablero_visible, contadores):
+        inicio = time.perf_counter()
+        analisis = solucionador.analizar(tablero_visible, num_minas)
+        _, fila, columna = solucionador.elegir_jugada(tablero_visible, num_minas, analisis)
+        latencias.append(time.perf_counter() - inicio)
+
+        # Todas las casillas seguras se revelan de una vez; si no hay, se arriesga
+        casillas = analisis['seguras'] or [(fila, columna)]
+        for fila, columna in casillas:
+            if buscaminas.revelar_casilla(tablero_real, tablero_visible, fila, columna, contadores):
+                return False
+
+    return True
+
+
+def percentil(valores_ordenados, p):
+    return valores_ordenados[min(len(valores_ordenados) - 1, int(len(valores_ordenados) * p))]
+
+
+def main():
+    partidas = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+
+    print(f"{partidas} partidas por nivel\n")
+    print(f"{'Nivel':<11} | {'Victorias':>9} | {'Decisiones':>10} | {'Media':>8} | {'p50':>8} | {'p99':>8} | {'Máx':>8}")
+    print("-" * 80)
+
+    for nombre, filas, columnas, num_minas in NIVELES:
+        latencias = []
+        victorias = sum(jugar_partida(filas, columnas, num_minas, semilla, latencias)
+                        for semilla in range(partidas))
+        latencias.sort()
+        media = sum(latencias) / len(latencias)
+
+        print(f"{nombre:<11} | {victorias / partidas:>8.1%} | {len(latencias):>10} | "
+              f"{media * 1000:>5.2f} ms | {percentil(latencias, 0.5) * 1000:>5.2f} ms | "
+              f"{percentil(latencias, 0.99) * 1000:>5.2f} ms | {latencias[-1] * 1000:>5.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+MEDICIÓN - Tablero de listas vs backend NumPy
+=============================================
+
+Mide tiempo de generación (minas + números) y memoria de los dos backends
+del Buscaminas para tableros cada vez más grandes. También comprueba que
+el backend NumPy calcula los mismos números que calcular_vecinos().
+
+Necesita NumPy instalado.
+
+Uso:
+    python rendimiento/medir_tablero_numpy.py
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import buscaminas
+import tablero_numpy
+
+
+def generar_listas(filas, columnas, num_minas):
+    tablero_real, tablero_visible = buscaminas.crear_tablero(filas, columnas)
+    buscaminas.colocar_minas(tablero_real, num_minas)
+    buscaminas.calcular_vecinos(tablero_real)
+    return tablero_real, tablero_visible
+
+
+def generar_numpy(filas, columnas, num_minas):
+    return tablero_numpy.crear_tableros(filas, columnas, num_minas, semilla=1)
+
+
+def medir(funcion, filas, columnas, num_minas):
+    """
+    Returns:
+        tuple: (segundos, megabytes que ocupan los tableros, megabytes de pico)
+    """
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    tableros = funcion(filas, columnas, num_minas)
+    segundos = time.perf_counter() - inicio
+    ocupado, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del tableros
+    return segundos, ocupado / 1e6, pico / 1e6
+
+
+def comprobar_equivalencia():
+    """
+    Comprueba que los números del backend NumPy coinciden con calcular_vecinos().
+    """
+    tablero_real, _ = tablero_numpy.crear_tableros(40, 60, 500, semilla=7)
+    listas = [['*' if mina else 0 for mina in fila] for fila in tablero_real.minas.tolist()]
+    buscaminas.calcular_vecinos(listas)
+    assert listas == [list(fila) for fila in tablero_real], "Los números no coinciden"
+    print("Equivalencia con calcular_vecinos(): OK\n")
+
+
+def main():
+    comprobar_equivalencia()
+
+    print("Tiempo de generación, memoria ocupada por los tableros y pico de memoria\n")
+    print(f"{'Casillas':>10} | {'Listas':>30} | {'NumPy':>30}")
+    print("-" * 78)
+    for filas, columnas in ((100, 100), (1000, 1000), (2000, 2500), (2500, 4000)):
+        num_minas = filas * columnas // 6
+        casillas = filas * columnas
+
+        # Las listas se omiten por encima de 10⁶ casillas (tardan minutos)
+        if casillas <= 1_000_000:
+            seg, mb, pico = medir(generar_listas, filas, columnas, num_minas)
+            listas = f"{seg:7.2f} s {mb:7.1f} MB ({pico:6.1f})"
+        else:
+            listas = "(omitido)"
+
+        seg, mb, pico = medir(generar_numpy, filas, columnas, num_minas)
+        numpy = f"{seg:7.2f} s {mb:7.1f} MB ({pico:6.1f})"
+
+        print(f"{casillas:>10} | {listas:>30} | {numpy:>30}")
+
+
+if __name__ == "__main__":
+    main()
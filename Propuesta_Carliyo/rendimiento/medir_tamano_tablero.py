@@ -0,0 +1,139 @@
+"""
+MEDICIÓN - Coste por jugada según el tamaño del tablero
+=======================================================
+
+Juega partidas IA contra IA con motor_flota en tableros de distintos
+tamaños (con la flota de hundir_flota.flota_para_tamano, que crece con el
+tablero) y mide, por separado:
+- crear las dos IAs (tablas de colocaciones, patrones...)
+- colocar las flotas al azar, por barco
+- resolver un disparo en PartidaFlota.aplicar_jugada()
+- la decisión de la IA (elegir + registrar)
+
+Lo que importa es que el coste por jugada crezca poco con el tablero: un
+disparo debe costar lo mismo en 10x10 que en 100x100, y las IAs que miran
+todo el tablero (probabilístico) crecer como mucho con las casillas.
+
+Uso:
+    python rendimiento/medir_tamano_tablero.py [partidas] [tamaños] [niveles]
+
+    tamaños y niveles separados por comas, p. ej. 10,50,100 facil,dificil
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import hundir_flota
+import motor_flota
+
+TAMANOS = [10, 20, 40, 70, 100]
+NIVELES = ['facil', 'dificil', 'probabilistico']
+
+# Ancho máximo de las barras de la gráfica
+ANCHO_GRAFICA = 50
+
+
+def jugar(n, nivel, semilla):
+    """
+    Una partida completa en un tablero n x n, cronometrando cada parte.
+
+    Returns:
+        dict: Segundos de cada parte y número de barcos y disparos
+    """
+    reloj = time.perf_counter
+    partida = motor_flota.PartidaFlota(semilla=semilla, n=n)
+    longitudes = [longitud for _, longitud in partida.flota]
+
+    inicio = reloj()
+    ias = [motor_flota.IAFlota(nivel, n, rng=random.Random(f"{semilla}:{jugador}"), longitudes=longitudes)
+           for jugador in range(2)]
+    crear = reloj() - inicio
+
+    inicio = reloj()
+    partida.colocar_flota_aleatoria(0)
+    partida.colocar_flota_aleatoria(1)
+    colocar = reloj() - inicio
+
+    partida.empezar(semilla % 2)
+    disparar = decidir = 0.0
+    while not partida.terminada:
+        ia = ias[partida.turno]
+        inicio = reloj()
+        fila, columna = ia.elegir(partida.disparos[partida.turno])
+        medio = reloj()
+        jugada = partida.aplicar_jugada(fila, columna)
+        fin = reloj()
+        ia.registrar(fila, columna, jugada['resultado'])
+        decidir += (medio - inicio) + (reloj() - fin)
+        disparar += fin - medio
+
+    return {'crear': crear, 'colocar': colocar, 'disparar': disparar, 'decidir': decidir,
+            'barcos': 2 * len(partida.flota), 'disparos': partida.jugadas}
+
+
+def medir(n, nivel, partidas):
+    """
+    Suma varias partidas y devuelve los costes medios.
+
+    Returns:
+        dict: 'crear' en ms por IA; 'colocar' en µs por barco; 'disparar' y
+              'decidir' en µs por disparo; 'disparos' medios por partida
+    """
+    total = {'crear': 0.0, 'colocar': 0.0, 'disparar': 0.0, 'decidir': 0.0, 'barcos': 0, 'disparos': 0}
+    for semilla in range(partidas):
+        for clave, valor in jugar(n, nivel, semilla).items():
+            total[clave] += valor
+    return {'crear': total['crear'] / (2 * partidas) * 1e3,
+            'colocar': total['colocar'] / total['barcos'] * 1e6,
+            'disparar': total['disparar'] / total['disparos'] * 1e6,
+            'decidir': total['decidir'] / total['disparos'] * 1e6,
+            'disparos': total['disparos'] / partidas}
+
+
+def grafica(titulo, puntos, unidad):
+    """
+    Gráfica de barras en ASCII: una barra por tamaño de tablero.
+
+    Args:
+        puntos (list): (tamaño, valor)
+    """
+    maximo = max(valor for _, valor in puntos) or 1
+    print(f"\n{titulo}")
+    for n, valor in puntos:
+        barra = "#" * max(1, round(valor / maximo * ANCHO_GRAFICA))
+        print(f"  {n:>3}x{n:<3} | {barra:<{ANCHO_GRAFICA}} {valor:,.1f} {unidad}")
+
+
+def main():
+    partidas = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    tamanos = [int(n) for n in sys.argv[2].split(',')] if len(sys.argv) > 2 else TAMANOS
+    niveles = sys.argv[3].split(',') if len(sys.argv) > 3 else NIVELES
+
+    resultados = {}
+    print(f"{partidas} partidas por tamaño y nivel\n")
+    print(f"{'Nivel':<15} | {'Tablero':>7} | {'Barcos':>6} | {'Disparos':>8} | {'Crear IA':>9} | "
+          f"{'Colocar/barco':>13} | {'Disparo':>8} | {'Decisión IA':>11}")
+    print("-" * 101)
+    for nivel in niveles:
+        for n in tamanos:
+            medida = medir(n, nivel, partidas)
+            resultados[nivel, n] = medida
+            print(f"{nivel:<15} | {n:>3}x{n:<3} | {len(hundir_flota.flota_para_tamano(n)):>6} | "
+                  f"{medida['disparos']:>8,.0f} | {medida['crear']:>6,.1f} ms | "
+                  f"{medida['colocar']:>10,.1f} µs | {medida['disparar']:>5,.1f} µs | {medida['decidir']:>8,.1f} µs")
+
+    grafica("Disparo (aplicar_jugada), todos los niveles",
+            [(n, sum(resultados[nivel, n]['disparar'] for nivel in niveles) / len(niveles)) for n in tamanos], "µs")
+    grafica("Colocación al azar, por barco",
+            [(n, sum(resultados[nivel, n]['colocar'] for nivel in niveles) / len(niveles)) for n in tamanos], "µs")
+    for nivel in niveles:
+        grafica(f"Decisión de la IA '{nivel}', por disparo",
+                [(n, resultados[nivel, n]['decidir']) for n in tamanos], "µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+"""
+REPETICIÓN DE PARTIDAS - Grabar y reproducir partidas jugada a jugada
+=====================================================================
+
+Una partida se puede reproducir exactamente con:
+- la semilla de su generador aleatorio (random.Random propio de la partida),
+- cómo empezó (flotas colocadas o tablero del Buscaminas) y
+- la lista de jugadas válidas en orden.
+
+Eso es una Grabacion, que se guarda en JSON (pocos KB) y sirve para
+depurar la IA o reproducir la partida que ha mandado un jugador.
+
+Repeticion reconstruye la partida con los motores sin terminal
+(motor_flota.py y motor_buscaminas.py), sin dibujar nada: puede saltar a
+la jugada N, avanzar y retroceder. Cada CADA_PUNTO_CONTROL jugadas guarda
+una copia de la partida (punto de control), así que retroceder parte del
+punto de control anterior en lugar de repetir la partida desde el principio.
+
+Uso:
+    python repeticion.py ultima_partida_flota.json
+
+    repeticion = Repeticion(Grabacion.cargar("ultima_partida_flota.json"))
+    partida = repeticion.ir_a(40)      # estado tras 40 jugadas
+    repeticion.retroceder()            # jugada 39
+    repeticion.avanzar(5)              # jugada 44
+
+Autor: Proyecto Grupal ASIR - Python
+"""
+
+import base64
+import json
+import random
+import sys
+
+import buscaminas
+import hundir_flota
+import motor_buscaminas
+import motor_flota
+from compartido import partida_binaria
+
+
+JUEGO_FLOTA = 'flota'
+JUEGO_BUSCAMINAS = 'buscaminas'
+
+# Jugadas entre dos puntos de control de una repetición
+CADA_PUNTO_CONTROL = 16
+
+
+def nueva_semilla():
+    """
+    Semilla para el generador de una partida nueva.
+    """
+    return random.randrange(2 ** 32)
+
+
+class Grabacion:
+    """
+    Lo necesario para reproducir una partida.
+
+    Atributos:
+        juego (str): JUEGO_FLOTA o JUEGO_BUSCAMINAS
+        semilla (int): Semilla del generador de la partida
+        inicio (dict): Estado inicial (depende del juego)
+        jugadas (list): Jugadas válidas en orden: [fila, columna] en Hundir la
+                        Flota, [accion, fila, columna] en el Buscaminas
+    """
+
+    def __init__(self, juego, semilla, inicio, jugadas=None):
+        self.juego = juego
+        self.semilla = semilla
+        self.inicio = inicio
+        self.jugadas = jugadas if jugadas is not None else []
+
+    @classmethod
+    def de_flota(cls, partida):
+        """
+        Empieza la grabación de una partida de motor_flota.PartidaFlota
+        (después de partida.empezar()).
+        """
+        barcos = [[[nombre, [list(casilla) for casilla in casillas]]
+                   for casillas, nombre in zip(indice.casillas, indice.nombres)]
+                  for indice in partida.indices]
+        inicio = {'n': partida.n, 'flota': [list(barco) for barco in partida.flota],
+                  'barcos': barcos, 'primero': partida.turno}
+        return cls(JUEGO_FLOTA, partida.semilla, inicio)
+
+    @classmethod
+    def de_buscaminas(cls, partida):
+        """
+        Empieza la grabación de una partida de motor_buscaminas.PartidaBuscaminas
+        (nueva, sin adivinar o recuperada) en su estado actual.
+        """
+        inicio = {'estado': base64.b64encode(partida.a_bytes()).decode('ascii')}
+        return cls(JUEGO_BUSCAMINAS, partida.semilla, inicio)
+
+    def anotar(self, *jugada):
+        """
+        Añade una jugada válida: anotar(fila, columna) o anotar(accion, fila, columna).
+        """
+        self.jugadas.append(list(jugada))
+
+    # --- Guardar y cargar ---
+
+    def a_dict(self):
+        return {'juego': self.juego, 'semilla': self.semilla, 'inicio': self.inicio, 'jugadas': self.jugadas}
+
+    @classmethod
+    def desde_dict(cls, datos):
+        return cls(datos['juego'], datos['semilla'], datos['inicio'], datos['jugadas'])
+
+    def guardar(self, ruta):
+        """
+        Guarda la grabación en JSON (escritura atómica).
+        """
+        partida_binaria.escribir_atomico(ruta, json.dumps(self.a_dict(), separators=(',', ':')).encode('utf-8'))
+
+    @classmethod
+    def cargar(cls, ruta):
+        """
+        Raises:
+            OSError: Si no se puede leer el archivo
+            ValueError: Si no es una grabación válida
+        """
+        with open(ruta, 'rb') as archivo:
+            try:
+                return cls.desde_dict(json.loads(archivo.read().decode('utf-8')))
+            except (KeyError, TypeError) as error:
+                raise ValueError(f"No es una grabación de partida: {error}")
+
+
+# --- Cada juego: crear la partida inicial y aplicar una jugada ---
+
+def _crear_flota(grabacion):
+    inicio = grabacion.inicio
+    partida = motor_flota.PartidaFlota([tuple(barco) for barco in inicio['flota']], grabacion.semilla,
+                                       n=inicio['n'])
+    for jugador, barcos in enumerate(inicio['barcos']):
+        tablero = partida.tableros[jugador]
+        for nombre, casillas in barcos:
+            for fila, columna in casillas:
+                tablero[fila][columna] = 'B'
+            partida.indices[jugador].agregar_barco(casillas, nombre)
+    partida.empezar(inicio['primero'])
+    return partida
+
+
+def _aplicar_flota(partida, jugada):
+    return partida.aplicar_jugada(jugada[0], jugada[1])
+
+
+def _crear_buscaminas(grabacion):
+    return motor_buscaminas.PartidaBuscaminas.desde_bytes(base64.b64decode(grabacion.inicio['estado']),
+                                                          grabacion.semilla)
+
+
+def _aplicar_buscaminas(partida, jugada):
+    return partida.aplicar(jugada[0], jugada[1], jugada[2])
+
+
+JUEGOS = {
+    JUEGO_FLOTA: (_crear_flota, _aplicar_flota),
+    JUEGO_BUSCAMINAS: (_crear_buscaminas, _aplicar_buscaminas),
+}
+
+
+class Repeticion:
+    """
+    Reproduce una grabación sin dibujar nada.
+
+    Atributos:
+        grabacion (Grabacion): Partida grabada
+        partida: Partida en la jugada actual (PartidaFlota o PartidaBuscaminas)
+        posicion (int): Jugadas aplicadas a 'partida'
+        puntos_control (list): Copia de la partida tras 0, cada, 2·cada... jugadas
+    """
+
+    def __init__(self, grabacion, cada=CADA_PUNTO_CONTROL):
+        if grabacion.juego not in JUEGOS:
+            raise ValueError(f"Juego desconocido: {grabacion.juego}")
+        self.grabacion = grabacion
+        self.cada = cada
+        crear, self._aplicar = JUEGOS[grabacion.juego]
+        self.partida = crear(grabacion)
+        self.posicion = 0
+        self.puntos_control = [self.partida.copiar()]
+
+    @property
+    def total(self):
+        return len(self.grabacion.jugadas)
+
+    def ir_a(self, numero):
+        """
+        Deja la partida tal como estaba tras 'numero' jugadas.
+
+        Hacia delante aplica las jugadas que faltan; hacia atrás (o muy lejos)
+        parte del punto de control más cercano anterior a 'numero'.
+
+        Returns:
+            La partida en esa jugada
+        """
+        numero = max(0, min(numero, self.total))
+        punto = min(numero // self.cada, len(self.puntos_control) - 1)
+        if numero < self.posicion or self.posicion < punto * self.cada:
+            self.partida = self.puntos_control[punto].copiar()
+            self.posicion = punto * self.cada
+
+        jugadas = self.grabacion.jugadas
+        while self.posicion < numero:
+            self._aplicar(self.partida, jugadas[self.posicion])
+            self.posicion += 1
+            if self.posicion == len(self.puntos_control) * self.cada:
+                self.puntos_control.append(self.partida.copiar())
+        return self.partida
+
+    def avanzar(self, pasos=1):
+        return self.ir_a(self.posicion + pasos)
+
+    def retroceder(self, pasos=1):
+        return self.ir_a(self.posicion - pasos)
+
+    def al_final(self):
+        return self.ir_a(self.total)
+
+
+# --- Visor en terminal ---
+
+def formatear(repeticion):
+    """
+    Líneas de texto de la partida en la jugada actual.
+    """
+    partida = repeticion.partida
+    lineas = [f"Jugada {repeticion.posicion} de {repeticion.total}"]
+    if repeticion.posicion:
+        lineas.append(f"Última jugada: {repeticion.grabacion.jugadas[repeticion.posicion - 1]}")
+    if repeticion.grabacion.juego == JUEGO_FLOTA:
+        for jugador in range(2):
+            lineas.append("")
+            lineas.extend(hundir_flota.formatear_tableros(partida.tableros[jugador], partida.disparos[jugador],
+                                                          f"Jugador {jugador + 1}",
+                                                          turno_actual=partida.turno == jugador))
+    else:
+        lineas.append("")
+        lineas.extend(buscaminas.formatear_tablero(partida.tablero_visible))
+    return lineas
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Uso: python repeticion.py GRABACION.json")
+        return
+    try:
+        repeticion = Repeticion(Grabacion.cargar(sys.argv[1]))
+    except (OSError, ValueError) as error:
+        print(f"No se pudo cargar la grabación: {error}")
+        return
+
+    while True:
+        print("\n".join(formatear(repeticion)))
+        orden = input("\n[Enter/+] siguiente  [-] anterior  [número] ir a jugada  [F] final  [S] salir: ")
+        orden = orden.strip().upper()
+        if orden == 'S':
+            break
+        if orden in ('', '+'):
+            repeticion.avanzar()
+        elif orden == '-':
+            repeticion.retroceder()
+        elif orden == 'F':
+            repeticion.al_final()
+        elif orden.isdigit():
+            repeticion.ir_a(int(orden))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,447 @@
+"""
+SERVIDOR DE HUNDIR LA FLOTA - Partidas en red con asyncio
+=========================================================
+
+Servidor TCP que aloja muchas partidas a la vez (jugador contra jugador y
+jugador contra la IA) en un solo proceso y un solo hilo: cada conexión es
+una corrutina de asyncio, no un hilo. El estado de cada partida es un
+motor_flota.PartidaFlota en memoria, con tableros compactos y un generador
+aleatorio compartido para que una partida ocupe pocos KB.
+
+Protocolo: una línea UTF-8 por mensaje.
+
+    Cliente -> servidor (órdenes de texto, sin distinguir mayúsculas):
+        PVC [nivel]     Nueva partida contra la IA (por defecto 'intermedio')
+        PVP [id]        Partida contra otra persona: se une a la partida 'id',
+                        o a una que esté esperando rival, o crea una nueva
+        BARCO A1 H      Coloca el siguiente barco de la flota (columna, fila, H/V)
+        ALEATORIA       Coloca al azar los barcos que falten
+        DISPARO A5      Dispara a una casilla
+        TABLERO         Pide los tableros propios
+        ESTADISTICAS    Órdenes atendidas y tiempos del servidor
+        SALIR           Cierra la conexión
+
+    Servidor -> cliente: un objeto JSON por línea con el campo 'tipo':
+        bienvenida, partida, esperando, rival_conectado, colocado, empieza,
+        disparo (el propio), disparo_rival, fin, tablero, estadisticas,
+        rival_desconectado, error
+
+Uso:
+    python servidor_flota.py [puerto] [host]
+
+Ver cliente_flota.py (cliente de terminal) y
+rendimiento/carga_servidor_flota.py (generador de carga).
+
+Autor: Proyecto Grupal ASIR - Python
+"""
+
+import asyncio
+import itertools
+import json
+import random
+import sys
+import time
+from collections import deque
+
+import hundir_flota
+import motor_flota
+from compartido import coordenadas
+
+
+PUERTO = 5555
+HOST = "127.0.0.1"
+
+# Niveles de IA que se pueden pedir con PVC
+NIVELES_IA = ['facil', 'intermedio', 'dificil', 'probabilistico', 'experto']
+
+# Tiempos de las últimas órdenes que se guardan para los percentiles
+MUESTRAS_TIEMPOS = 10000
+
+# Longitud máxima de una línea del cliente
+MAX_LINEA = 256
+
+
+def texto_casilla(fila, columna):
+    """
+    Casilla (fila, columna) en el formato del juego, p. ej. (4, 0) -> 'A5'.
+    """
+    return f"{coordenadas.letras_columna(columna)}{fila + 1}"
+
+
+def leer_casilla(texto, n=hundir_flota.TAMANO):
+    """
+    Convierte 'A5' (o 'AB12' en tableros grandes) en (fila, columna), o
+    (None, None) si no es válida.
+    """
+    letras, numero = coordenadas.separar_coordenada(texto)
+    if letras is None:
+        return None, None
+    return hundir_flota.convertir_coordenada(letras, numero, n)
+
+
+class Conexion:
+    """
+    Un cliente conectado y la partida en la que juega.
+    """
+    __slots__ = ('writer', 'sala', 'jugador')
+
+    def __init__(self, writer):
+        self.writer = writer
+        self.sala = None
+        self.jugador = None
+
+
+class Sala:
+    """
+    Una partida del servidor: el motor, quién juega y cuántos barcos ha
+    colocado cada jugador.
+    """
+    __slots__ = ('id', 'modo', 'partida', 'conexiones', 'ia', 'colocados')
+
+    def __init__(self, id_sala, modo, partida, ia=None):
+        self.id = id_sala
+        self.modo = modo
+        self.partida = partida
+        self.conexiones = [None, None]
+        self.ia = ia
+        self.colocados = [0, 0]
+
+
+class ServidorFlota:
+    """
+    Servidor de partidas de Hundir la Flota.
+
+    Atributos:
+        salas (dict): id -> Sala de las partidas en curso
+        esperando (deque): ids de partidas PVP que esperan un rival
+        estadisticas (dict): Conexiones, órdenes y disparos atendidos
+        tiempos (deque): Segundos de las últimas órdenes atendidas
+    """
+
+    def __init__(self, semilla=None):
+        self.salas = {}
+        self.esperando = deque()
+        self.ids = itertools.count(1)
+        # Cada partida lleva su propio generador (ver nueva_sala), así los
+        # sorteos de una no cambian los de otra
+        self.semilla = semilla
+        self.estadisticas = {'conexiones': 0, 'conexiones_activas': 0, 'ordenes': 0, 'disparos': 0}
+        self.tiempos = deque(maxlen=MUESTRAS_TIEMPOS)
+        self.ordenes = {
+            'PVC': self.orden_pvc,
+            'PVP': self.orden_pvp,
+            'BARCO': self.orden_barco,
+            'ALEATORIA': self.orden_aleatoria,
+            'DISPARO': self.orden_disparo,
+            'TABLERO': self.orden_tablero,
+            'ESTADISTICAS': self.orden_estadisticas,
+        }
+
+    # --- Conexiones ---
+
+    def enviar(self, conexion, mensaje):
+        """
+        Escribe un mensaje JSON (sin esperar a que salga; ver atender()).
+        """
+        if conexion is not None and not conexion.writer.is_closing():
+            conexion.writer.write(json.dumps(mensaje, ensure_ascii=False).encode() + b"\n")
+
+    def error(self, conexion, texto):
+        self.enviar(conexion, {'tipo': 'error', 'mensaje': texto})
+
+    async def atender(self, reader, writer):
+        """
+        Corrutina de una conexión: lee órdenes hasta que el cliente se va.
+        """
+        conexion = Conexion(writer)
+        self.estadisticas['conexiones'] += 1
+        self.estadisticas['conexiones_activas'] += 1
+        self.enviar(conexion, {'tipo': 'bienvenida', 'flota': hundir_flota.FLOTA, 'niveles': NIVELES_IA})
+        try:
+            while True:
+                linea = await reader.readline()
+                if not linea:
+                    break
+                inicio = time.perf_counter()
+                partes = linea[:MAX_LINEA].decode(errors='replace').split()
+                if not partes:
+                    continue
+                orden = partes[0].upper()
+                if orden == 'SALIR':
+                    break
+                funcion = self.ordenes.get(orden)
+                if funcion is None:
+                    self.error(conexion, f"Orden desconocida: {orden}")
+                else:
+                    await funcion(conexion, partes[1:])
+                self.estadisticas['ordenes'] += 1
+                self.tiempos.append(time.perf_counter() - inicio)
+                # Si el cliente no lee, se espera aquí en lugar de acumular datos
+                await writer.drain()
+        except (ConnectionError, ValueError):
+            # ValueError: línea más larga que el límite del lector
+            pass
+        finally:
+            self.salir_de_sala(conexion)
+            self.estadisticas['conexiones_activas'] -= 1
+            writer.close()
+
+    # --- Salas ---
+
+    def nueva_sala(self, modo):
+        """
+        Crea una partida con su propio generador: derivado de la semilla del
+        servidor y el id de la partida si hay semilla, o uno nuevo si no.
+        """
+        id_sala = next(self.ids)
+        rng = random.Random(f"{self.semilla}:{id_sala}") if self.semilla is not None else random.Random()
+        partida = motor_flota.PartidaFlota(compacto=True, rng=rng)
+        sala = Sala(id_sala, modo, partida)
+        self.salas[id_sala] = sala
+        return sala
+
+    def entrar(self, conexion, sala, jugador):
+        self.salir_de_sala(conexion)
+        sala.conexiones[jugador] = conexion
+        conexion.sala = sala
+        conexion.jugador = jugador
+        self.enviar(conexion, {'tipo': 'partida', 'id': sala.id, 'modo': sala.modo, 'jugador': jugador})
+
+    def salir_de_sala(self, conexion):
+        """
+        Saca al cliente de su partida; la partida se borra y el rival, si lo
+        hay, recibe 'rival_desconectado'.
+        """
+        sala = conexion.sala
+        if sala is None:
+            return
+        conexion.sala = None
+        sala.conexiones[conexion.jugador] = None
+        rival = sala.conexiones[1 - conexion.jugador]
+        if rival is not None:
+            rival.sala = None
+            sala.conexiones[rival.jugador] = None
+            self.enviar(rival, {'tipo': 'rival_desconectado'})
+        self.salas.pop(sala.id, None)
+
+    def sala_jugando(self, conexion, estado):
+        """
+        Sala del cliente si la partida está en ese estado; si no, avisa y devuelve None.
+        """
+        sala = conexion.sala
+        if sala is None:
+            self.error(conexion, "No estás en ninguna partida (usa PVC o PVP)")
+            return None
+        if sala.partida.estado != estado:
+            self.error(conexion, "Ahora no puedes hacer eso" if estado == 'colocando'
+                       else "La partida no ha empezado o ya ha terminado")
+            return None
+        return sala
+
+    # --- Órdenes ---
+
+    async def orden_pvc(self, conexion, argumentos):
+        nivel = argumentos[0].lower() if argumentos else 'intermedio'
+        if nivel not in NIVELES_IA:
+            self.error(conexion, f"Nivel desconocido: {nivel}")
+            return
+        sala = self.nueva_sala('pvc')
+        # La experta decide en otro hilo (run_in_executor): lleva su propio generador
+        rng = None if nivel == 'experto' else sala.partida.rng
+        sala.ia = motor_flota.IAFlota(nivel, sala.partida.n, rng=rng)
+        sala.partida.colocar_flota_aleatoria(1)
+        sala.colocados[1] = len(sala.partida.flota)
+        self.entrar(conexion, sala, 0)
+
+    async def orden_pvp(self, conexion, argumentos):
+        if argumentos:
+            try:
+                sala = self.salas.get(int(argumentos[0]))
+            except ValueError:
+                sala = None
+            if sala is None or sala.modo != 'pvp' or sala.conexiones[1] is not None or sala is conexion.sala:
+                self.error(conexion, "Esa partida no existe o ya está completa")
+                return
+        else:
+            # La primera partida que siga esperando (las abandonadas ya no están
+            # en salas), sin contar la del propio cliente si ya está esperando
+            sala = None
+            propia = None
+            while self.esperando:
+                id_sala = self.esperando.popleft()
+                candidata = self.salas.get(id_sala)
+                if candidata is None or candidata.conexiones[1] is not None:
+                    continue
+                if candidata is conexion.sala:
+                    propia = id_sala
+                    continue
+                sala = candidata
+                break
+            if propia is not None:
+                self.esperando.appendleft(propia)
+                if sala is None:
+                    self.enviar(conexion, {'tipo': 'esperando'})
+                    return
+
+        if sala is None:
+            sala = self.nueva_sala('pvp')
+            self.entrar(conexion, sala, 0)
+            self.esperando.append(sala.id)
+            self.enviar(conexion, {'tipo': 'esperando'})
+            return
+
+        self.entrar(conexion, sala, 1)
+        self.enviar(sala.conexiones[0], {'tipo': 'rival_conectado'})
+        self.enviar(conexion, {'tipo': 'rival_conectado'})
+
+    async def orden_barco(self, conexion, argumentos):
+        sala = self.sala_jugando(conexion, 'colocando')
+        if sala is None:
+            return
+        jugador = conexion.jugador
+        if sala.colocados[jugador] == len(sala.partida.flota):
+            self.error(conexion, "Ya has colocado toda tu flota")
+            return
+        if len(argumentos) != 2:
+            self.error(conexion, "Uso: BARCO A1 H")
+            return
+        fila, columna = leer_casilla(argumentos[0], sala.partida.n)
+        orientacion = argumentos[1].upper()
+        if fila is None or orientacion not in ('H', 'V'):
+            self.error(conexion, "Uso: BARCO A1 H")
+            return
+
+        nombre, longitud = sala.partida.flota[sala.colocados[jugador]]
+        if sala.partida.colocar_barco(jugador, fila, columna, longitud, orientacion,
+                                      nombre)['resultado'] == 'invalida':
+            self.error(conexion, f"No se puede colocar el {nombre} ahí")
+            return
+        sala.colocados[jugador] += 1
+        self.flota_colocada(sala, conexion, nombre)
+
+    async def orden_aleatoria(self, conexion, argumentos):
+        sala = self.sala_jugando(conexion, 'colocando')
+        if sala is None:
+            return
+        jugador = conexion.jugador
+        partida = sala.partida
+        if sala.colocados[jugador] == 0:
+            colocada = partida.colocar_flota_aleatoria(jugador)
+        else:
+            tablero_bits = hundir_flota.crear_tablero_bits(partida.tableros[jugador])
+            colocada = all(hundir_flota.colocar_barco_aleatorio(partida.tableros[jugador], longitud,
+                                                                partida.rng, partida.indices[jugador], nombre,
+                                                                tablero_bits)
+                           for nombre, longitud in partida.flota[sala.colocados[jugador]:])
+        if not colocada:
+            self.error(conexion, "Los barcos que faltan no caben")
+            return
+        sala.colocados[jugador] = len(partida.flota)
+        self.flota_colocada(sala, conexion, None)
+
+    def flota_colocada(self, sala, conexion, nombre):
+        """
+        Confirma una colocación y empieza la partida cuando las dos flotas están listas.
+        """
+        pendientes = len(sala.partida.flota) - sala.colocados[conexion.jugador]
+        self.enviar(conexion, {'tipo': 'colocado', 'barco': nombre, 'pendientes': pendientes})
+        # En PVC la flota de la IA ya está colocada; en PVP falta la del rival
+        if sala.colocados == [len(sala.partida.flota)] * 2:
+            sala.partida.empezar()
+            for jugador in (0, 1):
+                self.enviar(sala.conexiones[jugador], {'tipo': 'empieza', 'tu_turno': jugador == 0})
+
+    async def orden_disparo(self, conexion, argumentos):
+        sala = self.sala_jugando(conexion, 'jugando')
+        if sala is None:
+            return
+        partida = sala.partida
+        if partida.turno != conexion.jugador:
+            self.error(conexion, "No es tu turno")
+            return
+        fila, columna = leer_casilla(argumentos[0], partida.n) if argumentos else (None, None)
+        if fila is None:
+            self.error(conexion, "Uso: DISPARO A5")
+            return
+
+        jugada = partida.aplicar_jugada(fila, columna)
+        if jugada['resultado'] == 'repetido':
+            self.error(conexion, "Ya disparaste ahí")
+            return
+        self.estadisticas['disparos'] += 1
+        self.anunciar(sala, jugada)
+
+        # En PVC la IA responde enseguida (la experta, fuera del bucle de eventos)
+        while sala.ia is not None and partida.estado == 'jugando' and partida.turno == 1:
+            if sala.ia.nivel == 'experto':
+                jugada = await asyncio.get_running_loop().run_in_executor(None, partida.jugada_ia, sala.ia)
+            else:
+                jugada = partida.jugada_ia(sala.ia)
+            self.anunciar(sala, jugada)
+
+        if partida.terminada:
+            for jugador in (0, 1):
+                self.enviar(sala.conexiones[jugador], {'tipo': 'fin', 'ganador': partida.ganador == jugador})
+            self.salas.pop(sala.id, None)
+            for otra in sala.conexiones:
+                if otra is not None:
+                    otra.sala = None
+
+    def anunciar(self, sala, jugada):
+        """
+        Envía el resultado de una jugada al que dispara y a su rival.
+        """
+        mensaje = {'resultado': jugada['resultado'], 'casilla': texto_casilla(jugada['fila'], jugada['columna']),
+                   'fila': jugada['fila'], 'columna': jugada['columna'], 'barco': jugada['barco']}
+        tirador = jugada['jugador']
+        turno = None if sala.partida.terminada else sala.partida.turno
+        self.enviar(sala.conexiones[tirador], dict(mensaje, tipo='disparo', tu_turno=turno == tirador))
+        self.enviar(sala.conexiones[1 - tirador], dict(mensaje, tipo='disparo_rival', tu_turno=turno == 1 - tirador))
+
+    async def orden_tablero(self, conexion, argumentos):
+        sala = conexion.sala
+        if sala is None:
+            self.error(conexion, "No estás en ninguna partida (usa PVC o PVP)")
+            return
+        jugador = conexion.jugador
+        self.enviar(conexion, {
+            'tipo': 'tablero',
+            'barcos': ["".join(fila) for fila in sala.partida.tableros[jugador]],
+            'disparos': ["".join(fila) for fila in sala.partida.disparos[jugador]],
+        })
+
+    async def orden_estadisticas(self, conexion, argumentos):
+        tiempos = sorted(self.tiempos)
+
+        def percentil(p):
+            return tiempos[min(len(tiempos) - 1, int(p * len(tiempos)))] * 1000 if tiempos else 0.0
+
+        self.enviar(conexion, dict(self.estadisticas, tipo='estadisticas', partidas=len(self.salas),
+                                   ms_p50=percentil(0.5), ms_p99=percentil(0.99),
+                                   ms_max=tiempos[-1] * 1000 if tiempos else 0.0))
+
+
+async def servir(puerto=PUERTO, host=HOST, semilla=None):
+    """
+    Arranca el servidor y atiende conexiones hasta que se interrumpa.
+    """
+    servidor = ServidorFlota(semilla)
+    tcp = await asyncio.start_server(servidor.atender, host, puerto, limit=MAX_LINEA * 4)
+    direccion = tcp.sockets[0].getsockname()
+    # Esta línea la lee el generador de carga para saber el puerto
+    print(f"Escuchando en {direccion[0]}:{direccion[1]}", flush=True)
+    async with tcp:
+        await tcp.serve_forever()
+
+
+def main():
+    puerto = int(sys.argv[1]) if len(sys.argv) > 1 else PUERTO
+    host = sys.argv[2] if len(sys.argv) > 2 else HOST
+    try:
+        asyncio.run(servir(puerto, host))
+    except KeyboardInterrupt:
+        print("\nServidor detenido.")
+
+
+if __name__ == "__main__":
+    main()
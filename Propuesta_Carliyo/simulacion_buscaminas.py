@@ -0,0 +1,161 @@
+"""
+SIMULACIÓN DEL BUSCAMINAS - Partidas masivas en paralelo
+========================================================
+
+Juega N partidas con semilla de cada nivel de dificultad usando el motor
+sin terminal (motor_buscaminas.py) y una estrategia de jugador
+intercambiable. Las partidas se reparten en lotes entre varios procesos
+con ProcessPoolExecutor, así que el rendimiento escala con los núcleos
+(o entre hilos con ThreadPoolExecutor, ver simular()). Cada partida usa
+solo el generador de su semilla (partida.rng).
+
+Una estrategia es una función de nivel de módulo (para que se pueda enviar
+a otros procesos) que recibe lo que ve el jugador y devuelve una lista de
+jugadas a aplicar en orden:
+
+    def mi_estrategia(tablero_visible, num_minas, rng):
+        return [('R', fila, columna), ...]
+
+Uso:
+    python simulacion_buscaminas.py [partidas] [estrategia] [procesos]
+
+Autor: Proyecto Grupal ASIR - Python
+"""
+
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import buscaminas
+import solucionador
+from motor_buscaminas import PartidaBuscaminas
+
+
+# Partidas que juega cada proceso por envío (reduce la comunicación entre procesos)
+TAMANO_LOTE = 25
+
+
+def estrategia_aleatoria(tablero_visible, num_minas, rng):
+    """
+    Revela una casilla oculta cualquiera.
+    """
+    ocultas = [(f, c) for f, fila in enumerate(tablero_visible)
+               for c, valor in enumerate(fila) if valor == '#']
+    fila, columna = rng.choice(ocultas)
+    return [('R', fila, columna)]
+
+
+def estrategia_solucionador(tablero_visible, num_minas, rng):
+    """
+    Revela todas las casillas seguras que deduce el solucionador o,
+    si no hay ninguna, la de menor probabilidad de mina.
+    """
+    analisis = solucionador.analizar(tablero_visible, num_minas)
+    if analisis['seguras']:
+        return [('R', fila, columna) for fila, columna in sorted(analisis['seguras'])]
+    return [solucionador.elegir_jugada(tablero_visible, num_minas, analisis)]
+
+
+ESTRATEGIAS = {
+    'aleatoria': estrategia_aleatoria,
+    'solucionador': estrategia_solucionador,
+}
+
+
+def jugar_partida(nivel, semilla, estrategia):
+    """
+    Juega una partida completa sin terminal.
+
+    Returns:
+        dict: {'victoria': bool, 'jugadas': int, 'segundos': float}
+    """
+    inicio = time.perf_counter()
+    partida = PartidaBuscaminas.desde_nivel(nivel, semilla)
+
+    # Primer clic en el centro (siempre seguro)
+    partida.revelar(partida.filas // 2, partida.columnas // 2)
+
+    while not partida.terminada:
+        for accion, fila, columna in estrategia(partida.tablero_visible, partida.num_minas, partida.rng):
+            partida.aplicar(accion, fila, columna)
+            if partida.terminada:
+                break
+
+    return {
+        'victoria': partida.estado == 'ganada',
+        'jugadas': partida.jugadas,
+        'segundos': time.perf_counter() - inicio,
+    }
+
+
+def jugar_lote(nivel, semillas, estrategia):
+    """
+    Juega un lote de partidas en un proceso (o hilo) trabajador.
+
+    Returns:
+        list: Resultados de jugar_partida() para cada semilla
+    """
+    return [jugar_partida(nivel, semilla, estrategia) for semilla in semillas]
+
+
+def simular(nivel, partidas, estrategia=estrategia_solucionador, procesos=None, semilla_inicial=0, hilos=False):
+    """
+    Juega 'partidas' partidas de un nivel repartidas entre varios procesos.
+
+    Args:
+        nivel (str): Nivel de buscaminas.NIVELES
+        partidas (int): Número de partidas
+        estrategia (callable): Estrategia del jugador (función de nivel de módulo)
+        procesos (int): Número de procesos; por defecto uno por núcleo. Con 1
+                        se juega en el propio proceso, sin pool
+        semilla_inicial (int): Semilla de la primera partida (las demás son consecutivas)
+        hilos (bool): Si True, los lotes se reparten entre hilos de este proceso
+                      (ThreadPoolExecutor); las partidas no comparten generador
+
+    Returns:
+        dict: Estadísticas agregadas (victorias, jugadas y tiempos)
+    """
+    procesos = procesos or os.cpu_count() or 1
+    semillas = list(range(semilla_inicial, semilla_inicial + partidas))
+    lotes = [semillas[i:i + TAMANO_LOTE] for i in range(0, partidas, TAMANO_LOTE)]
+
+    inicio = time.perf_counter()
+    if procesos == 1:
+        resultados = [r for lote in lotes for r in jugar_lote(nivel, lote, estrategia)]
+    else:
+        ejecutor = ThreadPoolExecutor if hilos else ProcessPoolExecutor
+        with ejecutor(max_workers=procesos) as pool:
+            envios = [pool.submit(jugar_lote, nivel, lote, estrategia) for lote in lotes]
+            resultados = [r for envio in envios for r in envio.result()]
+    total = time.perf_counter() - inicio
+
+    victorias = sum(r['victoria'] for r in resultados)
+    return {
+        'nivel': nivel,
+        'partidas': partidas,
+        'victorias': victorias,
+        'tasa_victoria': victorias / partidas,
+        'jugadas_media': sum(r['jugadas'] for r in resultados) / partidas,
+        'segundos_por_partida': sum(r['segundos'] for r in resultados) / partidas,
+        'partidas_por_segundo': partidas / total,
+        'procesos': procesos,
+    }
+
+
+def main():
+    partidas = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    estrategia = ESTRATEGIAS[sys.argv[2] if len(sys.argv) > 2 else 'solucionador']
+    procesos = int(sys.argv[3]) if len(sys.argv) > 3 else None
+
+    print(f"{partidas} partidas por nivel, estrategia '{estrategia.__name__}'\n")
+    print(f"{'Nivel':<11} | {'Victorias':>9} | {'Jugadas':>8} | {'ms/partida':>10} | {'Partidas/s':>10} | {'Procesos':>8}")
+    print("-" * 72)
+    for nivel in buscaminas.NIVELES:
+        e = simular(nivel, partidas, estrategia, procesos)
+        print(f"{nivel:<11} | {e['tasa_victoria']:>8.1%} | {e['jugadas_media']:>8.1f} | "
+              f"{e['segundos_por_partida'] * 1000:>10.2f} | {e['partidas_por_segundo']:>10.1f} | {e['procesos']:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,475 @@
+"""
+SOLUCIONADOR DEL BUSCAMINAS
+===========================
+
+Analiza el tablero visible de buscaminas.py (solo lo que ve el jugador) y
+decide la siguiente jugada. Sirve para jugadores automáticos, simulaciones
+y para generar tableros que se resuelven sin adivinar.
+
+Cómo funciona:
+1. Cada número revelado con casillas ocultas alrededor es una restricción:
+   "entre estas casillas hay exactamente N minas".
+2. Propagación de restricciones: si una restricción pide 0 minas, todas sus
+   casillas son seguras; si pide tantas minas como casillas, todas son
+   minas; y si una restricción está contenida en otra, la diferencia es una
+   restricción nueva (que se usa si permite deducir algo). Se repite hasta
+   que no se deduce nada más.
+3. La frontera que queda se separa en componentes independientes (grupos
+   de casillas que no comparten ninguna restricción) y cada componente se
+   enumera por separado con vuelta atrás. Los resultados se memorizan, así
+   que una componente que no ha cambiado no se vuelve a enumerar.
+4. Las componentes se combinan con el número total de minas restantes y
+   las casillas interiores (ocultas sin ningún número al lado) para obtener
+   la probabilidad exacta de mina de cada casilla.
+
+Uso:
+    analisis = analizar(tablero_visible, num_minas)
+    accion, fila, columna = elegir_jugada(tablero_visible, num_minas)
+
+Autor: Proyecto Grupal ASIR - Python
+"""
+
+from functools import lru_cache
+
+
+# Componentes más grandes que esto no se enumeran (crecen exponencialmente);
+# sus casillas reciben una probabilidad aproximada
+LIMITE_ENUMERACION = 48
+
+# Tamaño máximo de la memoria de componentes ya enumeradas
+LIMITE_MEMORIA = 4096
+
+# Componentes ya enumeradas: firma de la componente -> resultado
+_memoria_componentes = {}
+
+
+@lru_cache(maxsize=None)
+def combinaciones(n, k):
+    """
+    Número combinatorio C(n, k) como entero exacto (0 si k está fuera de rango).
+    """
+    if k < 0 or k > n:
+        return 0
+    k = min(k, n - k)
+    resultado = 1
+    for i in range(1, k + 1):
+        resultado = resultado * (n - k + i) // i
+    return resultado
+
+
+@lru_cache(maxsize=64)
+def tabla_vecinos(filas, columnas):
+    """
+    Precalcula las vecinas de cada casilla, con posiciones lineales.
+
+    Returns:
+        tuple: Para cada posición (fila * columnas + columna), la tupla de sus vecinas
+    """
+    tabla = []
+    for fila in range(filas):
+        for columna in range(columnas):
+            tabla.append(tuple(
+                f * columnas + c
+                for f in range(max(0, fila - 1), min(filas, fila + 2))
+                for c in range(max(0, columna - 1), min(columnas, columna + 2))
+                if (f, c) != (fila, columna)
+            ))
+    return tuple(tabla)
+
+
+def leer_restricciones(tablero_visible, confiar_banderas):
+    """
+    Recorre el tablero visible y construye las restricciones de los números.
+
+    Returns:
+        tuple: (columnas, desconocidas, minas, restricciones)
+            - desconocidas: set de posiciones ocultas
+            - minas: set de posiciones que se saben minas (banderas, si se confía en ellas)
+            - restricciones: dict {frozenset(posiciones ocultas): minas que faltan}
+    """
+    filas = len(tablero_visible)
+    columnas = len(tablero_visible[0])
+    vecinos = tabla_vecinos(filas, columnas)
+
+    celdas = [valor for fila in tablero_visible for valor in fila]
+    desconocidas = set()
+    minas = set()
+    for posicion, valor in enumerate(celdas):
+        if valor == '#':
+            desconocidas.add(posicion)
+        elif valor == 'F':
+            if confiar_banderas:
+                minas.add(posicion)
+            else:
+                desconocidas.add(posicion)
+
+    restricciones = {}
+    for posicion, valor in enumerate(celdas):
+        # Solo los números revelados aportan información ('*' es una mina pisada)
+        if valor.__class__ is not int:
+            continue
+        ocultas = []
+        minas_vecinas = 0
+        for vecina in vecinos[posicion]:
+            if vecina in desconocidas:
+                ocultas.append(vecina)
+            elif vecina in minas:
+                minas_vecinas += 1
+        if ocultas:
+            restricciones[frozenset(ocultas)] = valor - minas_vecinas
+
+    return columnas, desconocidas, minas, restricciones
+
+
+def propagar(restricciones, seguras, minas):
+    """
+    Aplica las reglas triviales y la regla del subconjunto hasta no deducir más.
+    Añade las deducciones a 'seguras' y 'minas' y devuelve las restricciones que quedan.
+
+    Returns:
+        dict: Restricciones simplificadas {frozenset(posiciones): minas que faltan}
+    """
+    while True:
+        # 1. Reglas triviales: 0 minas -> seguras, tantas minas como casillas -> minas
+        nuevas_seguras = set()
+        nuevas_minas = set()
+        for casillas, faltan in restricciones.items():
+            if faltan == 0:
+                nuevas_seguras |= casillas
+            elif faltan == len(casillas):
+                nuevas_minas |= casillas
+
+        if nuevas_seguras or nuevas_minas:
+            seguras |= nuevas_seguras
+            minas |= nuevas_minas
+            conocidas = nuevas_seguras | nuevas_minas
+
+            # Quitar las casillas ya conocidas de todas las restricciones
+            simplificadas = {}
+            for casillas, faltan in restricciones.items():
+                if casillas.isdisjoint(conocidas):
+                    simplificadas[casillas] = faltan
+                    continue
+                resto = casillas - conocidas
+                if resto:
+                    simplificadas[resto] = faltan - len(casillas & nuevas_minas)
+            restricciones = simplificadas
+            continue
+
+        # 2. Regla del subconjunto: si A ⊂ B, entonces B - A tiene faltan(B) - faltan(A) minas
+        por_casilla = {}
+        for casillas in restricciones:
+            for casilla in casillas:
+                por_casilla.setdefault(casilla, []).append(casillas)
+
+        derivadas = {}
+        for a, faltan_a in restricciones.items():
+            candidatas = set()
+            for casilla in a:
+                candidatas.update(por_casilla[casilla])
+            for b in candidatas:
+                if len(b) > len(a) and a < b:
+                    resto = b - a
+                    if resto not in restricciones and resto not in derivadas:
+                        derivadas[resto] = restricciones[b] - faltan_a
+
+        # Solo interesan las derivadas que permiten deducir algo con las reglas
+        # triviales; el resto ya lo tendrá en cuenta la enumeración
+        utiles = {casillas: faltan for casillas, faltan in derivadas.items()
+                  if faltan == 0 or faltan == len(casillas)}
+        if not utiles:
+            return restricciones
+        restricciones.update(utiles)
+
+
+def separar_componentes(restricciones):
+    """
+    Separa las restricciones en grupos independientes (sin casillas en común).
+
+    Returns:
+        list: Lista de componentes; cada una es una lista de (casillas, faltan)
+    """
+    por_casilla = {}
+    for casillas in restricciones:
+        for casilla in casillas:
+            por_casilla.setdefault(casilla, []).append(casillas)
+
+    componentes = []
+    vistas = set()
+    for inicial in restricciones:
+        if inicial in vistas:
+            continue
+        vistas.add(inicial)
+        pila = [inicial]
+        componente = []
+        while pila:
+            actual = pila.pop()
+            componente.append((actual, restricciones[actual]))
+            for casilla in actual:
+                for vecina in por_casilla[casilla]:
+                    if vecina not in vistas:
+                        vistas.add(vecina)
+                        pila.append(vecina)
+        componentes.append(componente)
+
+    return componentes
+
+
+def enumerar_componente(componente):
+    """
+    Cuenta todas las formas de colocar minas en una componente que cumplen sus restricciones.
+
+    Las soluciones se agrupan por número de minas k, porque después hay que
+    combinarlas con las minas que quedan para el resto del tablero.
+
+    Se recorren las variables en orden con vuelta atrás, pero memorizando cada
+    subproblema: lo que queda por resolver a partir de la variable i solo
+    depende de cuántas minas faltan en las restricciones "abiertas" (las que
+    tienen variables a los dos lados de i). Así los subárboles repetidos se
+    cuentan una sola vez en lugar de visitar cada solución.
+
+    Args:
+        componente (list): Lista de (casillas, faltan)
+
+    Returns:
+        tuple: (variables, resultados)
+            - variables: tupla de posiciones, en el orden de los recuentos
+            - resultados: dict {k: (soluciones, recuento de mina por variable)}
+    """
+    # Ordenar las variables por posición (fila a fila), para que haya pocas restricciones abiertas
+    variables = sorted(set().union(*(casillas for casillas, _ in componente)))
+    indice = {casilla: i for i, casilla in enumerate(variables)}
+
+    n = len(variables)
+    faltan = [r[1] for r in componente]
+    libres = [len(r[0]) for r in componente]
+    restricciones_de = [[] for _ in range(n)]
+    for numero, (casillas, _) in enumerate(componente):
+        for casilla in casillas:
+            restricciones_de[indice[casilla]].append(numero)
+
+    # Restricciones abiertas en cada variable: empezadas antes de i y no terminadas
+    abiertas = [[] for _ in range(n + 1)]
+    for numero, (casillas, _) in enumerate(componente):
+        posiciones = [indice[c] for c in casillas]
+        for i in range(min(posiciones) + 1, max(posiciones) + 1):
+            abiertas[i].append(numero)
+
+    memoria = {}
+
+    def contar(i):
+        """
+        Devuelve {k: (soluciones, recuento)} para las variables de i en adelante.
+        """
+        if i == n:
+            return {0: (1, [])}
+
+        clave = (i, tuple(faltan[r] for r in abiertas[i]))
+        if clave in memoria:
+            return memoria[clave]
+
+        resultado = {}
+        mias = restricciones_de[i]
+        for valor in (0, 1):
+            # Comprobar que cada restricción de esta casilla sigue siendo posible
+            posible = True
+            for r in mias:
+                queda = faltan[r] - valor
+                if queda < 0 or queda > libres[r] - 1:
+                    posible = False
+                    break
+            if not posible:
+                continue
+
+            for r in mias:
+                faltan[r] -= valor
+                libres[r] -= 1
+            resto = contar(i + 1)
+            for r in mias:
+                faltan[r] += valor
+                libres[r] += 1
+
+            # Añadir la variable i delante de los recuentos del resto
+            for k, (soluciones, recuento) in resto.items():
+                fila = [soluciones * valor] + recuento
+                anterior = resultado.get(k + valor)
+                if anterior is not None:
+                    soluciones += anterior[0]
+                    fila = [x + y for x, y in zip(fila, anterior[1])]
+                resultado[k + valor] = (soluciones, fila)
+
+        memoria[clave] = resultado
+        return resultado
+
+    # Guardar los recuentos como tuplas: ocupan menos y el recolector de basura no las recorre
+    resultados = {k: (soluciones, tuple(recuento)) for k, (soluciones, recuento) in contar(0).items()}
+    return tuple(variables), resultados
+
+
+def resolver_componente(componente):
+    """
+    Enumera una componente usando la memoria de componentes ya resueltas.
+    """
+    firma = frozenset(componente)
+    resultado = _memoria_componentes.get(firma)
+    if resultado is None:
+        if len(_memoria_componentes) >= LIMITE_MEMORIA:
+            _memoria_componentes.clear()
+        resultado = enumerar_componente(componente)
+        _memoria_componentes[firma] = resultado
+    return resultado
+
+
+def convolucionar(a, b):
+    """
+    Combina dos distribuciones {minas: formas} sumando el número de minas.
+    """
+    resultado = {}
+    for ka, va in a.items():
+        for kb, vb in b.items():
+            resultado[ka + kb] = resultado.get(ka + kb, 0) + va * vb
+    return resultado
+
+
+def analizar(tablero_visible, num_minas, confiar_banderas=False):
+    """
+    Analiza el tablero visible y calcula casillas seguras, minas y probabilidades.
+
+    Args:
+        tablero_visible (list): Tablero que ve el jugador
+        num_minas (int): Número total de minas del tablero
+        confiar_banderas (bool): Si True, las banderas se toman como minas seguras
+
+    Returns:
+        dict: {
+            'seguras': set de (fila, columna) que seguro no son mina,
+            'minas': set de (fila, columna) que seguro son mina,
+            'probabilidades': dict {(fila, columna): probabilidad de mina}
+                              para todas las casillas ocultas,
+        }
+    """
+    columnas, desconocidas, minas_conocidas, restricciones = leer_restricciones(
+        tablero_visible, confiar_banderas)
+
+    seguras = set()
+    minas = set()
+    restricciones = propagar(restricciones, seguras, minas)
+
+    probabilidades = {}
+    frontera = set()
+    componentes_exactas = []
+    for componente in separar_componentes(restricciones):
+        casillas = set()
+        for r, _ in componente:
+            casillas |= r
+        frontera |= casillas
+        if len(casillas) <= LIMITE_ENUMERACION:
+            componentes_exactas.append(resolver_componente(componente))
+        else:
+            # Demasiado grande: probabilidad aproximada con la restricción más exigente
+            for r, faltan in componente:
+                for casilla in r:
+                    probabilidades[casilla] = max(probabilidades.get(casilla, 0.0), faltan / len(r))
+
+    # Casillas interiores (ocultas sin ningún número al lado) y minas que quedan
+    interiores = len(desconocidas) - len(seguras) - len(minas) - len(frontera)
+    restantes = num_minas - len(minas_conocidas) - len(minas)
+
+    # Peso de cada número de minas en la frontera exacta: formas de repartir el resto
+    def peso(k):
+        return combinaciones(interiores, restantes - k)
+
+    distribuciones = [{k: s for k, (s, _) in resultados.items()} for _, resultados in componentes_exactas]
+    total = {0: 1}
+    for distribucion in distribuciones:
+        total = convolucionar(total, distribucion)
+    peso_total = sum(formas * peso(k) for k, formas in total.items())
+
+    prob_interior = 0.0
+    if peso_total:
+        for j, (variables, resultados) in enumerate(componentes_exactas):
+            # Distribución de minas del resto de componentes
+            otras = {0: 1}
+            for i, distribucion in enumerate(distribuciones):
+                if i != j:
+                    otras = convolucionar(otras, distribucion)
+
+            numeradores = [0] * len(variables)
+            for k, (_, recuento) in resultados.items():
+                factor = sum(formas * peso(k + ko) for ko, formas in otras.items())
+                if factor:
+                    for v, veces in enumerate(recuento):
+                        numeradores[v] += veces * factor
+
+            for v, casilla in enumerate(variables):
+                if numeradores[v] == 0:
+                    seguras.add(casilla)
+                elif numeradores[v] == peso_total:
+                    minas.add(casilla)
+                else:
+                    probabilidades[casilla] = numeradores[v] / peso_total
+
+        # Probabilidad de las interiores: todas iguales
+        if interiores:
+            numerador = sum(formas * combinaciones(interiores - 1, restantes - k - 1)
+                            for k, formas in total.items())
+            prob_interior = numerador / peso_total
+    else:
+        # Tablero inconsistente (por ejemplo, por una bandera mal puesta)
+        for variables, _ in componentes_exactas:
+            for casilla in variables:
+                probabilidades.setdefault(casilla, 0.5)
+        prob_interior = restantes / interiores if interiores else 0.0
+
+    for casilla in desconocidas:
+        if casilla in seguras or casilla in minas or casilla in probabilidades:
+            continue
+        probabilidades[casilla] = prob_interior
+
+    for casilla in seguras:
+        probabilidades[casilla] = 0.0
+    for casilla in minas | minas_conocidas:
+        probabilidades[casilla] = 1.0
+
+    return {
+        'seguras': {divmod(c, columnas) for c in seguras},
+        'minas': {divmod(c, columnas) for c in minas},
+        'probabilidades': {divmod(c, columnas): p for c, p in probabilidades.items()},
+    }
+
+
+def elegir_jugada(tablero_visible, num_minas, analisis=None):
+    """
+    Decide la siguiente casilla a revelar.
+
+    Si hay casillas seguras revela una; si no, la de menor probabilidad de mina
+    (en caso de empate, la más cercana a una esquina, que suele abrir más).
+
+    Args:
+        tablero_visible (list): Tablero que ve el jugador
+        num_minas (int): Número total de minas del tablero
+        analisis (dict): Resultado de analizar() si ya se tiene, opcional
+
+    Returns:
+        tuple: ('R', fila, columna) o None si no queda ninguna casilla oculta
+    """
+    if analisis is None:
+        analisis = analizar(tablero_visible, num_minas)
+
+    if analisis['seguras']:
+        fila, columna = min(analisis['seguras'])
+        return 'R', fila, columna
+
+    filas = len(tablero_visible)
+    columnas = len(tablero_visible[0])
+    candidatas = [(p, casilla) for casilla, p in analisis['probabilidades'].items()
+                  if casilla not in analisis['minas']]
+    if not candidatas:
+        return None
+
+    def distancia_esquina(casilla):
+        fila, columna = casilla
+        return min(fila, filas - 1 - fila) + min(columna, columnas - 1 - columna)
+
+    _, (fila, columna) = min(candidatas, key=lambda c: (round(c[0], 9), distancia_esquina(c[1]), c[1]))
+    return 'R', fila, columna
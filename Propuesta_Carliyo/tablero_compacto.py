@@ -0,0 +1,164 @@
+"""
+TABLERO COMPACTO - Tablero en un bytearray
+==========================================
+
+Tablero de ambos juegos guardado en un único bytearray, con 1 byte por
+casilla, en lugar de una lista de listas con un puntero de 8 bytes por
+casilla más la cabecera de cada lista.
+
+Cada byte es un código que representa uno de los valores que usan los
+tableros de buscaminas.py y hundir_flota.py (ver VALORES). El tablero se
+sigue leyendo y escribiendo como las listas (tablero[fila][columna]), así
+que las funciones de los juegos funcionan sin cambios, y además ofrece
+operaciones rápidas sobre el tablero entero (contar, rellenar, reemplazar,
+copiar) que trabajan directamente sobre los bytes.
+
+Uso:
+    tablero = TableroCompacto(10, 10, '~')
+    tablero[3][4] = 'B'
+    tablero.contar('B')  # -> 1
+
+Autor: Proyecto Grupal ASIR - Python
+"""
+
+
+# Valores que puede contener una casilla, en el orden de sus códigos:
+# - Buscaminas: 0-8 (minas vecinas), '*' mina, '#' oculta, 'F' bandera
+# - Hundir la Flota: '~' agua, 'B' barco, 'X' tocado, 'O' agua disparada
+#   (la versión de Teo usa '#' para los barcos, que también está incluido)
+VALORES = [0, 1, 2, 3, 4, 5, 6, 7, 8, '*', '#', 'F', '~', 'B', 'X', 'O']
+
+# Traducción valor -> código
+CODIGOS = {valor: codigo for codigo, valor in enumerate(VALORES)}
+
+
+class FilaCompacta:
+    """
+    Vista de una fila de un TableroCompacto.
+    Se comporta como la lista de una fila: fila[columna], len(), for y count().
+    """
+    __slots__ = ('datos', 'inicio', 'columnas')
+
+    def __init__(self, datos, inicio, columnas):
+        self.datos = datos
+        self.inicio = inicio
+        self.columnas = columnas
+
+    def __len__(self):
+        return self.columnas
+
+    def __getitem__(self, columna):
+        if not 0 <= columna < self.columnas:
+            raise IndexError("columna fuera del tablero")
+        return VALORES[self.datos[self.inicio + columna]]
+
+    def __setitem__(self, columna, valor):
+        if not 0 <= columna < self.columnas:
+            raise IndexError("columna fuera del tablero")
+        self.datos[self.inicio + columna] = CODIGOS[valor]
+
+    def __iter__(self):
+        for codigo in self.datos[self.inicio:self.inicio + self.columnas]:
+            yield VALORES[codigo]
+
+    def __eq__(self, otra):
+        return list(self) == list(otra)
+
+    def count(self, valor):
+        return self.datos.count(CODIGOS[valor], self.inicio, self.inicio + self.columnas)
+
+
+class TableroCompacto:
+    """
+    Tablero filas×columnas con 1 byte por casilla.
+
+    Atributos:
+        filas (int): Número de filas
+        columnas (int): Número de columnas
+        datos (bytearray): Códigos de las casillas, fila a fila
+    """
+    __slots__ = ('filas', 'columnas', 'datos')
+
+    def __init__(self, filas, columnas, valor='~'):
+        self.filas = filas
+        self.columnas = columnas
+        self.datos = bytearray([CODIGOS[valor]]) * (filas * columnas)
+
+    @classmethod
+    def desde_listas(cls, tablero):
+        """
+        Crea un tablero compacto a partir de un tablero de listas.
+
+        Args:
+            tablero (list): Tablero como lista de listas
+
+        Returns:
+            TableroCompacto: Copia compacta del tablero
+        """
+        compacto = cls(len(tablero), len(tablero[0]))
+        compacto.datos = bytearray(CODIGOS[valor] for fila in tablero for valor in fila)
+        return compacto
+
+    def a_listas(self):
+        """
+        Devuelve el tablero como lista de listas (por ejemplo, para guardarlo en JSON).
+        """
+        return [list(fila) for fila in self]
+
+    def __len__(self):
+        return self.filas
+
+    def __getitem__(self, fila):
+        if not 0 <= fila < self.filas:
+            raise IndexError("fila fuera del tablero")
+        return FilaCompacta(self.datos, fila * self.columnas, self.columnas)
+
+    def __iter__(self):
+        for fila in range(self.filas):
+            yield FilaCompacta(self.datos, fila * self.columnas, self.columnas)
+
+    def __eq__(self, otro):
+        if isinstance(otro, TableroCompacto):
+            return (self.filas, self.columnas, self.datos) == (otro.filas, otro.columnas, otro.datos)
+        return self.a_listas() == [list(fila) for fila in otro]
+
+    def __sizeof__(self):
+        # Incluir el bytearray, que es donde están las casillas
+        return object.__sizeof__(self) + self.datos.__sizeof__()
+
+    # --- Operaciones sobre el tablero entero ---
+
+    def contar(self, valor):
+        """
+        Cuenta las casillas que contienen un valor (sin recorrer filas en Python).
+        """
+        return self.datos.count(CODIGOS[valor])
+
+    def rellenar(self, valor):
+        """
+        Pone el mismo valor en todas las casillas.
+        """
+        self.datos[:] = bytes([CODIGOS[valor]]) * len(self.datos)
+
+    def reemplazar(self, anterior, nuevo):
+        """
+        Cambia todas las casillas con el valor 'anterior' por 'nuevo'.
+        """
+        tabla = bytearray(range(256))
+        tabla[CODIGOS[anterior]] = CODIGOS[nuevo]
+        self.datos[:] = self.datos.translate(tabla)
+
+    def copiar_desde(self, otro):
+        """
+        Copia todas las casillas de otro tablero compacto del mismo tamaño.
+        Por ejemplo, revelar todo el Buscaminas: visible.copiar_desde(real).
+        """
+        self.datos[:] = otro.datos
+
+    def copiar(self):
+        """
+        Devuelve una copia independiente del tablero.
+        """
+        copia = TableroCompacto(self.filas, self.columnas)
+        copia.datos = bytearray(self.datos)
+        return copia
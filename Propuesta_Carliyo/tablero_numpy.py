@@ -0,0 +1,300 @@
+"""
+TABLERO NUMPY - Backend opcional del Buscaminas
+===============================================
+
+Tableros del Buscaminas guardados en arrays de NumPy en lugar de listas de
+listas. Está pensado para tableros enormes (10⁷ casillas o más):
+
+- Las minas se guardan en un array booleano (1 byte por casilla).
+- Los números de minas vecinas se calculan de una sola vez con una suma
+  de ventana 3×3 sobre el array de minas, sin bucles de Python.
+- El tablero visible se guarda como códigos uint8 (1 byte por casilla).
+
+Los dos tableros se pueden indexar como las listas originales
+(tablero[fila][columna]), así que revelar_casilla(), marcar_bandera(),
+mostrar_tablero() y el resto de funciones de buscaminas.py siguen
+funcionando sin cambios.
+
+NumPy es una dependencia opcional: motor_buscaminas.py usa estos tableros
+cuando se puede importar (ver disponible()) y, si no está instalado, el
+juego usa las listas de siempre y solo este módulo lanza un ImportError al
+crear un tablero.
+
+Autor: Proyecto Grupal ASIR - Python
+"""
+
+import random
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional
+    np = None
+
+import buscaminas
+
+
+# Códigos del tablero visible: 0-8 son los números, el resto son símbolos
+CODIGO_MINA = 9
+CODIGO_OCULTA = 10
+CODIGO_BANDERA = 11
+
+# Traducción código -> valor tal y como lo usan las listas de buscaminas.py
+VALORES = [0, 1, 2, 3, 4, 5, 6, 7, 8, '*', '#', 'F']
+
+# Traducción valor -> código
+CODIGOS = {valor: codigo for codigo, valor in enumerate(VALORES)}
+
+
+def disponible():
+    """
+    Indica si NumPy está instalado y se pueden crear tableros de este módulo.
+    """
+    return np is not None
+
+
+def comprobar_numpy():
+    """
+    Lanza un ImportError con un mensaje claro si NumPy no está instalado.
+    """
+    if np is None:
+        raise ImportError("El backend NumPy del Buscaminas necesita 'numpy' (pip install numpy).")
+
+
+class FilaReal:
+    """
+    Vista de una fila del tablero real: devuelve '*' o el número de vecinas.
+    """
+    __slots__ = ('minas', 'vecinos')
+
+    def __init__(self, minas, vecinos):
+        self.minas = minas
+        self.vecinos = vecinos
+
+    def __len__(self):
+        return len(self.minas)
+
+    def __getitem__(self, columna):
+        if self.minas[columna]:
+            return '*'
+        return int(self.vecinos[columna])
+
+    def __iter__(self):
+        for mina, vecinas in zip(self.minas.tolist(), self.vecinos.tolist()):
+            yield '*' if mina else vecinas
+
+
+class TableroRealNumpy:
+    """
+    Tablero real respaldado por NumPy.
+
+    Atributos:
+        minas (ndarray): Array booleano filas×columnas, True donde hay mina
+        vecinos (ndarray): Array uint8 con el número de minas vecinas
+    """
+    __slots__ = ('minas', 'vecinos')
+
+    def __init__(self, minas):
+        self.minas = minas
+        self.vecinos = contar_vecinos(minas)
+
+    def __len__(self):
+        return self.minas.shape[0]
+
+    def __getitem__(self, fila):
+        return FilaReal(self.minas[fila], self.vecinos[fila])
+
+    def __iter__(self):
+        for fila in range(len(self)):
+            yield self[fila]
+
+    def codigos(self):
+        """
+        Devuelve el tablero real como códigos del tablero visible (0-9).
+        """
+        return np.where(self.minas, np.uint8(CODIGO_MINA), self.vecinos).astype(np.uint8)
+
+    def copiar(self):
+        """
+        Devuelve una copia independiente del tablero.
+        """
+        copia = TableroRealNumpy.__new__(TableroRealNumpy)
+        copia.minas = self.minas.copy()
+        copia.vecinos = self.vecinos.copy()
+        return copia
+
+    def nbytes(self):
+        """
+        Memoria ocupada por los arrays del tablero, en bytes.
+        """
+        return self.minas.nbytes + self.vecinos.nbytes
+
+
+class FilaVisible:
+    """
+    Vista de una fila del tablero visible: traduce entre códigos y valores.
+    """
+    __slots__ = ('codigos',)
+
+    def __init__(self, codigos):
+        self.codigos = codigos
+
+    def __len__(self):
+        return len(self.codigos)
+
+    def __getitem__(self, columna):
+        return VALORES[self.codigos[columna]]
+
+    def __setitem__(self, columna, valor):
+        self.codigos[columna] = CODIGOS[valor]
+
+    def __iter__(self):
+        for codigo in self.codigos.tolist():
+            yield VALORES[codigo]
+
+    def count(self, valor):
+        return int(np.count_nonzero(self.codigos == CODIGOS[valor]))
+
+
+class TableroVisibleNumpy:
+    """
+    Tablero visible respaldado por un array uint8 de códigos.
+
+    Atributos:
+        codigos (ndarray): Array uint8 filas×columnas (ver VALORES)
+    """
+    __slots__ = ('codigos',)
+
+    def __init__(self, filas, columnas):
+        self.codigos = np.full((filas, columnas), CODIGO_OCULTA, dtype=np.uint8)
+
+    def __len__(self):
+        return self.codigos.shape[0]
+
+    def __getitem__(self, fila):
+        return FilaVisible(self.codigos[fila])
+
+    def __iter__(self):
+        for fila in range(len(self)):
+            yield self[fila]
+
+    def copiar(self):
+        """
+        Devuelve una copia independiente del tablero.
+        """
+        copia = TableroVisibleNumpy.__new__(TableroVisibleNumpy)
+        copia.codigos = self.codigos.copy()
+        return copia
+
+    def nbytes(self):
+        """
+        Memoria ocupada por el array del tablero, en bytes.
+        """
+        return self.codigos.nbytes
+
+
+def contar_vecinos(minas):
+    """
+    Calcula el número de minas vecinas de todas las casillas a la vez.
+
+    Suma una ventana 3×3 deslizante sobre el array de minas (rellenado con un
+    borde de ceros) y resta la propia casilla. La ventana se suma primero por
+    filas y luego por columnas, así que son 4 sumas de arrays en total.
+
+    Args:
+        minas (ndarray): Array booleano filas×columnas
+
+    Returns:
+        ndarray: Array uint8 filas×columnas con las minas vecinas (0-8)
+    """
+    comprobar_numpy()
+    unos = minas.astype(np.uint8)
+    relleno = np.pad(unos, 1)
+
+    # Suma vertical de 3 filas y luego horizontal de 3 columnas
+    suma_filas = relleno[:-2] + relleno[1:-1] + relleno[2:]
+    ventana = suma_filas[:, :-2] + suma_filas[:, 1:-1] + suma_filas[:, 2:]
+
+    return ventana - unos
+
+
+def crear_tableros(filas, columnas, num_minas, semilla=None):
+    """
+    Crea el tablero real (con minas y números) y el tablero visible con NumPy.
+
+    Es el equivalente de crear_tablero() + colocar_minas() + calcular_vecinos()
+    de buscaminas.py, pero sin bucles de Python salvo el sorteo de las minas
+    (buscaminas.elegir_posiciones(), el mismo que en los tableros de listas).
+
+    Args:
+        filas (int): Número de filas del tablero
+        columnas (int): Número de columnas del tablero
+        num_minas (int): Cantidad de minas a colocar
+        semilla (int): Semilla del generador aleatorio, opcional
+
+    Returns:
+        tuple: (TableroRealNumpy, TableroVisibleNumpy)
+    """
+    comprobar_numpy()
+    total = filas * columnas
+    if not 0 <= num_minas <= total:
+        raise ValueError(f"No caben {num_minas} minas en un tablero de {total} casillas.")
+
+    # Las mismas posiciones que buscaminas.py con la misma semilla
+    posiciones = buscaminas.elegir_posiciones(total, num_minas, (), random.Random(semilla))
+
+    minas = np.zeros(total, dtype=bool)
+    minas[posiciones] = True
+
+    tablero_real = TableroRealNumpy(minas.reshape(filas, columnas))
+    tablero_visible = TableroVisibleNumpy(filas, columnas)
+
+    return tablero_real, tablero_visible
+
+
+def colocar_minas(tablero_real, num_minas, excluir=None, rng=None):
+    """
+    Versión de buscaminas.colocar_minas() para tableros NumPy.
+
+    Sortea las posiciones con buscaminas.elegir_posiciones(), así que con el
+    mismo generador salen las mismas minas que en un tablero de listas, y
+    las pone todas de una vez. Después hay que llamar a calcular_vecinos().
+
+    Raises:
+        ValueError: Si las minas no caben fuera de la zona excluida
+    """
+    filas, columnas = tablero_real.minas.shape
+    excluidas = [f * columnas + c for f, c in (excluir or ())
+                 if 0 <= f < filas and 0 <= c < columnas]
+
+    posiciones = buscaminas.elegir_posiciones(filas * columnas, num_minas, excluidas, rng)
+    tablero_real.minas.flat[posiciones] = True
+
+
+def calcular_vecinos(tablero_real):
+    """
+    Versión vectorizada de buscaminas.calcular_vecinos() para tableros NumPy.
+    """
+    tablero_real.vecinos = contar_vecinos(tablero_real.minas)
+
+
+def crear_contadores(tablero_real, tablero_visible):
+    """
+    Versión vectorizada de buscaminas.crear_contadores() para tableros NumPy.
+
+    Returns:
+        dict: {'seguras_ocultas': int, 'banderas': int}
+    """
+    codigos = tablero_visible.codigos
+    no_reveladas = (codigos == CODIGO_OCULTA) | (codigos == CODIGO_BANDERA)
+
+    return {
+        'seguras_ocultas': int(np.count_nonzero(no_reveladas & ~tablero_real.minas)),
+        'banderas': int(np.count_nonzero(codigos == CODIGO_BANDERA)),
+    }
+
+
+def revelar_todo(tablero_real, tablero_visible):
+    """
+    Versión vectorizada de buscaminas.revelar_todo() para tableros NumPy.
+    """
+    tablero_visible.codigos[:] = tablero_real.codigos()
@@ -0,0 +1,80 @@
+"""
+PRUEBA - Almacén de partidas separado por jugador
+=================================================
+
+Guarda partidas de varios jugadores en una base SQLite temporal y
+comprueba que cada uno solo ve, carga, sobrescribe y borra las suyas:
+con el id de la partida de otro, cargar() da None, guardar() no la toca
+y borrar() no la borra. También que listar() filtra por juego y va de la
+más reciente a la más antigua, y que las partidas siguen ahí al volver a
+abrir la base.
+
+Uso (desde Propuesta_Carliyo):
+    python -m unittest tests.test_almacen_partidas
+    python -m pytest tests
+"""
+
+import os
+import tempfile
+import unittest
+
+from compartido import almacen_partidas
+
+
+class PruebaAlmacenPartidas(unittest.TestCase):
+
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        self.ruta = os.path.join(self.directorio.name, "partidas.db")
+        self.almacen = almacen_partidas.AlmacenPartidas(self.ruta)
+
+    def tearDown(self):
+        self.almacen.cerrar()
+        self.directorio.cleanup()
+
+    def test_cada_jugador_sus_partidas(self):
+        id_ana = self.almacen.guardar("ana", almacen_partidas.JUEGO_BUSCAMINAS, b"ana-1")
+        id_luis = self.almacen.guardar("luis", almacen_partidas.JUEGO_BUSCAMINAS, b"luis-1")
+
+        self.assertEqual(self.almacen.cargar(id_ana, "ana")[4], b"ana-1")
+        self.assertIsNone(self.almacen.cargar(id_ana, "luis"))
+        self.assertIsNone(self.almacen.cargar(id_luis, "ana"))
+        self.assertEqual([fila[0] for fila in self.almacen.listar("ana")], [id_ana])
+        self.assertEqual(self.almacen.listar("nadie"), [])
+
+    def test_no_sobrescribe_ni_borra_la_de_otro(self):
+        id_ana = self.almacen.guardar("ana", almacen_partidas.JUEGO_BUSCAMINAS, b"ana-1")
+        self.assertIsNone(self.almacen.guardar("luis", almacen_partidas.JUEGO_BUSCAMINAS, b"luis", id_ana))
+        # Tampoco con el mismo jugador pero otro juego
+        self.assertIsNone(self.almacen.guardar("ana", almacen_partidas.JUEGO_FLOTA_TEO, b"flota", id_ana))
+        self.assertFalse(self.almacen.borrar(id_ana, "luis"))
+        self.assertEqual(self.almacen.cargar(id_ana, "ana")[4], b"ana-1")
+
+        self.assertEqual(self.almacen.guardar("ana", almacen_partidas.JUEGO_BUSCAMINAS, b"ana-2", id_ana), id_ana)
+        self.assertEqual(self.almacen.cargar(id_ana, "ana")[4], b"ana-2")
+        self.assertEqual(self.almacen.contar(), 1)
+        self.assertTrue(self.almacen.borrar(id_ana, "ana"))
+        self.assertIsNone(self.almacen.cargar(id_ana, "ana"))
+
+    def test_listar_por_juego_y_fecha(self):
+        filas = [("ana", almacen_partidas.JUEGO_BUSCAMINAS, "b1", 1.0, b"1"),
+                 ("ana", almacen_partidas.JUEGO_FLOTA_TEO, "f1", 2.0, b"2"),
+                 ("ana", almacen_partidas.JUEGO_BUSCAMINAS, "b2", 3.0, b"3"),
+                 ("luis", almacen_partidas.JUEGO_BUSCAMINAS, "l1", 4.0, b"4")]
+        self.almacen.guardar_muchas(filas)
+        self.assertEqual([fila[2] for fila in self.almacen.listar("ana")], ["b2", "f1", "b1"])
+        self.assertEqual([fila[2] for fila in self.almacen.listar("ana", almacen_partidas.JUEGO_BUSCAMINAS)],
+                         ["b2", "b1"])
+        self.assertEqual([fila[2] for fila in self.almacen.listar("ana", limite=1)], ["b2"])
+
+    def test_sigue_al_reabrir(self):
+        id_ana = self.almacen.guardar("ana", almacen_partidas.JUEGO_FLOTA_TEO, b"\0\1\2", nombre="la buena")
+        self.almacen.cerrar()
+        with almacen_partidas.AlmacenPartidas(self.ruta) as almacen:
+            jugador, juego, nombre, _, datos = almacen.cargar(id_ana, "ana")
+            self.assertEqual((jugador, juego, nombre, datos), ("ana", almacen_partidas.JUEGO_FLOTA_TEO, "la buena", b"\0\1\2"))
+        self.almacen = almacen_partidas.AlmacenPartidas(self.ruta)
+
+
+if __name__ == "__main__":
+    unittest.main()
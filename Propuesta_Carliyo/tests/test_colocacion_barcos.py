@@ -0,0 +1,120 @@
+"""
+PRUEBA - Colocación de la flota con el índice de posiciones legales
+===================================================================
+
+Comprueba compartido/colocacion_barcos.py:
+- Las flotas que devuelve son legales: sin solaparse, sin tocarse (si hay
+  separación) y fuera de las casillas prohibidas.
+- Un barco solo sale con la misma frecuencia en todas sus colocaciones.
+- Las flotas apretadas que caben se colocan, y las que no caben fallan
+  enseguida (las pruebas de superficie y de bloques las descartan sin
+  buscar).
+- Si la flota no cabe, hundir_flota.colocar_flota_aleatoria() no toca el
+  tablero.
+
+Uso (desde Propuesta_Carliyo):
+    python -m unittest tests.test_colocacion_barcos
+    python -m pytest tests
+"""
+
+import random
+import time
+import unittest
+from collections import Counter
+
+import hundir_flota
+from compartido import bitboard_flota, colocacion_barcos
+
+
+# Segundos que puede tardar como mucho en descartar una flota imposible
+TIEMPO_IMPOSIBLE = 0.1
+
+
+def comprobar_legal(prueba, n, elegidas, longitudes, prohibidas=0, separacion=True):
+    """
+    Comprueba que las colocaciones elegidas son una flota legal con esas longitudes.
+    """
+    geo = bitboard_flota.geometria(n)
+    prueba.assertEqual(sorted(longitud for longitud, _, _, _ in elegidas), sorted(longitudes))
+    bloqueadas = prohibidas
+    for longitud, fila, columna, orientacion in elegidas:
+        prueba.assertIn((fila, columna, orientacion), geo.colocaciones_de(longitud))
+        mascara, halo = geo.mascaras_de(longitud, fila, columna, orientacion)
+        prueba.assertFalse(mascara & bloqueadas, (longitud, fila, columna, orientacion))
+        bloqueadas |= halo if separacion else mascara
+
+
+class PruebaColocacion(unittest.TestCase):
+
+    def test_flotas_legales(self):
+        for n, longitudes in ((10, [5, 4, 3, 3, 2]), (10, [5, 4, 4, 3, 3, 3, 2, 2, 2, 2]), (7, [3, 3, 2, 2, 1]),
+                              (30, [5, 4, 3, 3, 2] * 4)):
+            for separacion in (True, False):
+                for semilla in range(5):
+                    with self.subTest(n=n, longitudes=longitudes, separacion=separacion, semilla=semilla):
+                        indice = colocacion_barcos.IndiceColocaciones(n, separacion=separacion)
+                        elegidas = colocacion_barcos.buscar_colocaciones(indice, longitudes, random.Random(semilla))
+                        self.assertIsNotNone(elegidas)
+                        comprobar_legal(self, n, elegidas, longitudes, separacion=separacion)
+
+    def test_respeta_prohibidas(self):
+        # Las cinco primeras filas prohibidas
+        prohibidas = sum(1 << (fila * 10 + columna) for fila in range(5) for columna in range(10))
+        for semilla in range(10):
+            with self.subTest(semilla=semilla):
+                indice = colocacion_barcos.IndiceColocaciones(10, prohibidas)
+                elegidas = colocacion_barcos.buscar_colocaciones(indice, [5, 4, 3], random.Random(semilla))
+                comprobar_legal(self, 10, elegidas, [5, 4, 3], prohibidas)
+        # Con la última fila también prohibida quedan 4 filas: solo caben dos portaaviones
+        prohibidas |= sum(1 << (90 + columna) for columna in range(10))
+        indice = colocacion_barcos.IndiceColocaciones(10, prohibidas)
+        self.assertIsNone(colocacion_barcos.buscar_colocaciones(indice, [5] * 3, random.Random(0)))
+
+    def test_un_barco_uniforme(self):
+        # Un barco de 3 en 5 × 5 tiene 30 colocaciones: unas 200 veces cada una
+        rng = random.Random(0)
+        veces = Counter()
+        for _ in range(6000):
+            indice = colocacion_barcos.IndiceColocaciones(5)
+            veces[tuple(colocacion_barcos.buscar_colocaciones(indice, [3], rng)[0])] += 1
+        self.assertEqual(len(veces), 30)
+        self.assertTrue(all(140 <= n <= 260 for n in veces.values()), veces)
+
+    def test_flotas_apretadas_que_caben(self):
+        for n, longitudes, separacion in ((10, [5] * 8, True), (10, [4] * 12, True), (10, [1] * 25, True),
+                                          (10, [5] * 20, False)):
+            for semilla in range(3):
+                with self.subTest(longitudes=longitudes, separacion=separacion, semilla=semilla):
+                    indice = colocacion_barcos.IndiceColocaciones(n, separacion=separacion)
+                    elegidas = colocacion_barcos.buscar_colocaciones(indice, longitudes, random.Random(semilla))
+                    self.assertIsNotNone(elegidas)
+                    comprobar_legal(self, n, elegidas, longitudes, separacion=separacion)
+
+    def test_flotas_imposibles_fallan_rapido(self):
+        for n, longitudes, separacion in ((10, [5] * 9, True), (10, [5] * 11, True), (10, [1] * 26, True),
+                                          (10, [3] * 14, True), (10, [11], True), (10, [5] * 21, False)):
+            with self.subTest(longitudes=longitudes, separacion=separacion):
+                inicio = time.perf_counter()
+                indice = colocacion_barcos.IndiceColocaciones(n, separacion=separacion)
+                self.assertIsNone(colocacion_barcos.buscar_colocaciones(indice, longitudes, random.Random(0)))
+                self.assertLess(time.perf_counter() - inicio, TIEMPO_IMPOSIBLE)
+
+    def test_posicion_bit(self):
+        rng = random.Random(0)
+        for bits in (8, 64, 65, 500, 10000):
+            mascara = rng.getrandbits(bits) | 1
+            posiciones = [i for i in range(bits) if mascara >> i & 1]
+            for k in (0, len(posiciones) // 2, len(posiciones) - 1):
+                with self.subTest(bits=bits, k=k):
+                    self.assertEqual(colocacion_barcos.posicion_bit(mascara, k), posiciones[k])
+
+    def test_tablero_intacto_si_no_cabe(self):
+        tablero = hundir_flota.crear_tablero()
+        self.assertTrue(hundir_flota.colocar_flota_aleatoria(tablero, [5, 4], random.Random(1)))
+        antes = [list(fila) for fila in tablero]
+        self.assertFalse(hundir_flota.colocar_flota_aleatoria(tablero, [5] * 9, random.Random(1)))
+        self.assertEqual(tablero, antes)
+
+
+if __name__ == "__main__":
+    unittest.main()
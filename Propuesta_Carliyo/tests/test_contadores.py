@@ -0,0 +1,95 @@
+"""
+PRUEBA - Contadores en vivo igual que un recorrido completo
+===========================================================
+
+Juega jugadas al azar en el Buscaminas y en las dos versiones de Hundir la
+Flota actualizando los contadores en vivo, y después de cada jugada los
+compara con los que salen de recorrer el tablero entero (crear_contadores,
+contar_casillas_barco...). La victoria tiene que decirse igual con
+contadores y sin ellos.
+
+Uso (desde Propuesta_Carliyo):
+    python -m unittest tests.test_contadores
+    python -m pytest tests
+"""
+
+import random
+import unittest
+
+import buscaminas
+import hundir_flota
+import torneo_flota
+from compartido import indice_barcos
+
+
+class PruebaContadores(unittest.TestCase):
+
+    def test_buscaminas(self):
+        for semilla in range(10):
+            with self.subTest(semilla=semilla):
+                rng = random.Random(semilla)
+                tablero_real, tablero_visible = buscaminas.crear_tablero(12, 12)
+                buscaminas.colocar_minas(tablero_real, 20, rng=rng)
+                buscaminas.calcular_vecinos(tablero_real)
+                contadores = buscaminas.crear_contadores(tablero_real, tablero_visible)
+
+                for _ in range(200):
+                    fila, columna = rng.randrange(12), rng.randrange(12)
+                    if rng.random() < 0.3:
+                        buscaminas.marcar_bandera(tablero_visible, fila, columna, contadores)
+                    elif tablero_real[fila][columna] != '*':
+                        buscaminas.revelar_casilla(tablero_real, tablero_visible, fila, columna, contadores)
+                    self.assertEqual(contadores, buscaminas.crear_contadores(tablero_real, tablero_visible))
+                    self.assertEqual(buscaminas.verificar_victoria(tablero_real, tablero_visible, contadores),
+                                     buscaminas.verificar_victoria(tablero_real, tablero_visible))
+
+                # Revelando todo lo seguro se gana
+                for fila in range(12):
+                    for columna in range(12):
+                        if tablero_real[fila][columna] != '*':
+                            if tablero_visible[fila][columna] == 'F':
+                                buscaminas.marcar_bandera(tablero_visible, fila, columna, contadores)
+                            buscaminas.revelar_casilla(tablero_real, tablero_visible, fila, columna, contadores)
+                self.assertEqual(contadores['seguras_ocultas'], 0)
+                self.assertTrue(buscaminas.verificar_victoria(tablero_real, tablero_visible))
+
+    def test_hundir_flota(self):
+        for semilla in range(10):
+            with self.subTest(semilla=semilla):
+                rng = random.Random(semilla)
+                tablero = hundir_flota.crear_tablero()
+                indice = indice_barcos.IndiceBarcos(hundir_flota.TAMANO)
+                self.assertTrue(hundir_flota.colocar_flota_aleatoria(tablero, rng=rng, indice=indice))
+                disparos = hundir_flota.crear_tablero()
+                contadores = hundir_flota.crear_contadores(tablero, indice)
+
+                casillas = [(f, c) for f in range(hundir_flota.TAMANO) for c in range(hundir_flota.TAMANO)]
+                rng.shuffle(casillas)
+                for fila, columna in casillas:
+                    hundir_flota.resolver_disparo(tablero, disparos, fila, columna, contadores)
+                    self.assertEqual(contadores['casillas_barco'], hundir_flota.contar_casillas_barco(tablero))
+                    self.assertEqual(hundir_flota.verificar_victoria(tablero, contadores),
+                                     hundir_flota.verificar_victoria(tablero))
+                self.assertTrue(hundir_flota.verificar_victoria(tablero, contadores))
+
+    def test_hundir_flota_teo(self):
+        teo = torneo_flota.cargar_teo()
+        for semilla in range(10):
+            with self.subTest(semilla=semilla):
+                rng = random.Random(semilla)
+                barcos, disparos = teo.crear_tablero(10), teo.crear_tablero(10)
+                indice = indice_barcos.IndiceBarcos(10)
+                teo.colocar_barcos_aleatorios(barcos, teo.flota_para_dimension(10), indice, rng)
+                contadores = teo.crear_contadores(barcos, indice)
+
+                casillas = [(f, c) for f in range(10) for c in range(10)]
+                rng.shuffle(casillas)
+                for fila, columna in casillas:
+                    teo.aplicar_disparo(barcos, disparos, fila, columna, contadores)
+                    self.assertEqual(contadores['barcos_restantes'], teo.contar_barcos_restantes(barcos))
+                    self.assertEqual(teo.verificar_victoria(barcos, contadores), teo.verificar_victoria(barcos))
+                self.assertTrue(teo.verificar_victoria(barcos, contadores))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+"""
+PRUEBA - Misma semilla, misma partida, también con hilos
+========================================================
+
+Juega las mismas partidas dos veces:
+- una detrás de otra en este hilo
+- todas a la vez en un ThreadPoolExecutor, de una en una por envío y con
+  cambios de hilo muy frecuentes (sys.setswitchinterval) para que se
+  intercalen al máximo
+
+y comprueba que cada partida da exactamente el mismo resultado. Cubre las
+IAs de Hundir la Flota (contra flota fija y en duelos, incluida la de Teo),
+partidas completas del motor con colocación aleatoria y el Buscaminas.
+Si alguna partida usase el módulo random compartido (o cualquier otro
+estado de módulo), los resultados con hilos cambiarían.
+
+También comprueba que una partida de Buscaminas es la misma con tableros
+de listas y con los de tablero_numpy.py (si NumPy está instalado).
+
+Uso (desde Propuesta_Carliyo):
+    python -m unittest tests.test_determinismo
+    python -m pytest tests
+"""
+
+import random
+import sys
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import motor_buscaminas
+import motor_flota
+import simulacion_buscaminas
+import tablero_numpy
+import torneo_flota
+
+
+# Partidas por grupo y hilos del pool
+PARTIDAS = 5
+HILOS = 8
+
+
+def partida_motor(semilla, nivel='dificil'):
+    """
+    Partida completa del motor (flotas al azar e IAs con el generador de la
+    partida): devuelve la lista de disparos.
+    """
+    partida = motor_flota.PartidaFlota(semilla=semilla)
+    partida.colocar_flota_aleatoria(0)
+    partida.colocar_flota_aleatoria(1)
+    partida.empezar(semilla % 2)
+    ias = [motor_flota.IAFlota(nivel, rng=random.Random(f"{semilla}:{jugador}")) for jugador in range(2)]
+    disparos = []
+    while not partida.terminada:
+        jugada = partida.jugada_ia(ias[partida.turno])
+        disparos.append((jugada['fila'], jugada['columna'], jugada['resultado']))
+    return disparos
+
+
+def resultado_torneo(tarea, semilla):
+    """
+    Resultado de una partida del torneo sin los tiempos (que sí cambian).
+    """
+    resultado = torneo_flota.jugar_lote(tarea, [semilla])[0]
+    return (resultado['disparos'], resultado.get('ganador'))
+
+
+def resultado_buscaminas(nivel, semilla):
+    resultado = simulacion_buscaminas.jugar_lote(nivel, [semilla], simulacion_buscaminas.estrategia_solucionador)[0]
+    return (resultado['victoria'], resultado['jugadas'])
+
+
+def partida_buscaminas(semilla, usar_numpy):
+    """
+    Partida de Buscaminas con jugadas al azar: devuelve los resultados y la
+    partida final en binario.
+    """
+    partida = motor_buscaminas.PartidaBuscaminas(16, 16, 40, semilla=semilla, usar_numpy=usar_numpy)
+    rng = random.Random(semilla)
+    resultados = []
+    while not partida.terminada:
+        resultado = partida.aplicar(rng.choice('RRRF'), rng.randrange(16), rng.randrange(16))
+        resultados.append((resultado['resultado'], sorted(resultado.get('reveladas', []))))
+    return resultados, partida.a_bytes()
+
+
+def trabajos():
+    """
+    Partidas a jugar: (grupo, función, argumentos).
+    """
+    lista = []
+    for nombre in torneo_flota.JUGADORES_TORNEO:
+        lista += [(f"torneo {nombre}", resultado_torneo, (('flota', nombre), semilla)) for semilla in range(PARTIDAS)]
+    lista += [(f"duelo {a}-{b}", resultado_torneo, (('duelo', a, b), semilla))
+              for a, b in (('facil', 'dificil'), ('intermedio', 'teo'), ('dificil', 'probabilistico'))
+              for semilla in range(PARTIDAS)]
+    lista += [("motor dificil", partida_motor, (semilla,)) for semilla in range(PARTIDAS)]
+    lista += [("buscaminas intermedio", resultado_buscaminas, ('intermedio', semilla)) for semilla in range(PARTIDAS)]
+    return lista
+
+
+class PruebaDeterminismo(unittest.TestCase):
+
+    def test_misma_semilla_misma_partida_con_hilos(self):
+        lista = trabajos()
+        secuencial = [funcion(*argumentos) for _, funcion, argumentos in lista]
+
+        intervalo = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with ThreadPoolExecutor(max_workers=HILOS) as pool:
+                envios = [pool.submit(funcion, *argumentos) for _, funcion, argumentos in lista]
+                concurrente = [envio.result() for envio in envios]
+        finally:
+            sys.setswitchinterval(intervalo)
+
+        for (grupo, _, argumentos), uno, otro in zip(lista, secuencial, concurrente):
+            with self.subTest(grupo=grupo, semilla=argumentos[-1]):
+                self.assertEqual(uno, otro)
+
+    def test_semillas_distintas_partidas_distintas(self):
+        # Que la prueba anterior no pase solo porque todo sale igual
+        self.assertNotEqual(partida_motor(1), partida_motor(2))
+
+    @unittest.skipUnless(tablero_numpy.disponible(), "NumPy no está instalado")
+    def test_buscaminas_igual_con_numpy(self):
+        for semilla in range(PARTIDAS):
+            with self.subTest(semilla=semilla):
+                self.assertEqual(partida_buscaminas(semilla, False), partida_buscaminas(semilla, True))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+"""
+PRUEBA - Recuperar la partida del diario de jugadas
+===================================================
+
+Anota jugadas en un diario temporal, lo cierra "de golpe" y comprueba que
+recuperar() devuelve la foto y las jugadas en orden. Si el último registro
+quedó a medio escribir (diario cortado) o dañado, se descarta ese y se
+conservan los anteriores, y el diario sigue bien para las jugadas
+siguientes. Tampoco se repiten las jugadas que ya estaban en la foto si
+el corte fue entre guardar la foto y vaciar el diario.
+
+Uso (desde Propuesta_Carliyo):
+    python -m unittest tests.test_diario_jugadas
+    python -m pytest tests
+"""
+
+import os
+import random
+import shutil
+import tempfile
+import unittest
+
+from compartido import diario_jugadas
+
+
+def jugadas_al_azar(cuantas, semilla):
+    rng = random.Random(semilla)
+    return [(rng.choice("DB"), rng.randrange(10), rng.randrange(10)) for _ in range(cuantas)]
+
+
+class PruebaDiarioJugadas(unittest.TestCase):
+
+    def setUp(self):
+        self.directorio = tempfile.mkdtemp()
+        self.base = os.path.join(self.directorio, "partida_en_curso")
+
+    def tearDown(self):
+        shutil.rmtree(self.directorio)
+
+    def anotar(self, jugadas, estado=b"estado inicial"):
+        diario = diario_jugadas.DiarioJugadas(self.base, sincronizar='nunca')
+        diario.empezar(estado)
+        for jugada in jugadas:
+            diario.anotar(*jugada)
+        # Sin cerrar(): como si el programa se hubiera cortado
+        os.close(diario.descriptor)
+
+    def test_recupera_todas(self):
+        jugadas = jugadas_al_azar(50, 0)
+        self.anotar(jugadas)
+        diario = diario_jugadas.DiarioJugadas(self.base)
+        self.assertTrue(diario.hay_partida())
+        self.assertEqual(diario.recuperar(), (b"estado inicial", jugadas))
+        self.assertEqual(diario.numero, 50)
+
+    def test_ultimo_registro_cortado(self):
+        jugadas = jugadas_al_azar(20, 1)
+        for sobran in range(1, diario_jugadas.REGISTRO.size):
+            with self.subTest(sobran=sobran):
+                self.anotar(jugadas)
+                ruta_diario = self.base + ".diario"
+                with open(ruta_diario, "r+b") as archivo:
+                    archivo.truncate(os.path.getsize(ruta_diario) - sobran)
+
+                diario = diario_jugadas.DiarioJugadas(self.base)
+                self.assertEqual(diario.recuperar(), (b"estado inicial", jugadas[:-1]))
+                # El trozo suelto se quita y las jugadas nuevas van detrás de las buenas
+                self.assertEqual(os.path.getsize(ruta_diario), 19 * diario_jugadas.REGISTRO.size)
+                diario.anotar('D', 9, 9)
+                diario.cerrar()
+                self.assertEqual(diario_jugadas.DiarioJugadas(self.base).recuperar(),
+                                 (b"estado inicial", jugadas[:-1] + [('D', 9, 9)]))
+
+    def test_ultimo_registro_danado(self):
+        jugadas = jugadas_al_azar(10, 2)
+        self.anotar(jugadas)
+        with open(self.base + ".diario", "r+b") as archivo:
+            archivo.seek(-2, os.SEEK_END)
+            columna = archivo.read(1)[0]
+            archivo.seek(-2, os.SEEK_END)
+            archivo.write(bytes([columna ^ 1]))
+        self.assertEqual(diario_jugadas.DiarioJugadas(self.base).recuperar(), (b"estado inicial", jugadas[:-1]))
+
+    def test_corte_al_compactar(self):
+        jugadas = jugadas_al_azar(30, 3)
+        self.anotar(jugadas[:20])
+        with open(self.base + ".diario", "rb") as archivo:
+            copia = archivo.read()
+        diario = diario_jugadas.DiarioJugadas(self.base)
+        diario.recuperar()
+        diario.compactar(b"estado tras 20")
+        for jugada in jugadas[20:]:
+            diario.anotar(*jugada)
+        diario.cerrar()
+        # Como si el diario no se hubiera vaciado: las 20 primeras ya están en la foto
+        with open(self.base + ".diario", "rb") as archivo:
+            nuevas = archivo.read()
+        with open(self.base + ".diario", "wb") as archivo:
+            archivo.write(copia + nuevas)
+        self.assertEqual(diario_jugadas.DiarioJugadas(self.base).recuperar(), (b"estado tras 20", jugadas[20:]))
+
+    def test_foto_danada_y_terminar(self):
+        self.anotar(jugadas_al_azar(5, 4))
+        with open(self.base + ".foto", "r+b") as archivo:
+            archivo.seek(10)
+            archivo.write(b"?")
+        with self.assertRaises(ValueError):
+            diario_jugadas.DiarioJugadas(self.base).recuperar()
+        diario = diario_jugadas.DiarioJugadas(self.base)
+        diario.terminar()
+        self.assertFalse(diario.hay_partida())
+        self.assertIsNone(diario.recuperar())
+        self.assertEqual(os.listdir(self.directorio), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+"""
+PRUEBA - Índice de barcos igual que mirar el tablero
+====================================================
+
+Dispara a todas las casillas de flotas al azar y comprueba que
+IndiceBarcos.resolver_disparo() da el mismo resultado que deducirlo del
+tablero (hundir_flota.verificar_barco_hundido), y el barco correcto.
+También que funciona con barcos que se tocan (reglas de Teo), que
+desde_tablero() reconstruye el mismo índice a mitad de partida, y que
+copiar() y a_dict() / desde_dict() no comparten la vida de los barcos.
+
+Uso (desde Propuesta_Carliyo):
+    python -m unittest tests.test_indice_barcos
+    python -m pytest tests
+"""
+
+import random
+import unittest
+
+import hundir_flota
+from compartido import indice_barcos
+
+
+def flota_al_azar(semilla):
+    tablero = hundir_flota.crear_tablero()
+    indice = indice_barcos.IndiceBarcos(hundir_flota.TAMANO)
+    hundir_flota.colocar_flota_aleatoria(tablero, rng=random.Random(semilla), indice=indice)
+    return tablero, indice
+
+
+class PruebaIndiceBarcos(unittest.TestCase):
+
+    def test_igual_que_el_tablero(self):
+        for semilla in range(10):
+            with self.subTest(semilla=semilla):
+                tablero, indice = flota_al_azar(semilla)
+                casillas = [(f, c) for f in range(10) for c in range(10)]
+                random.Random(semilla).shuffle(casillas)
+                for fila, columna in casillas:
+                    es_barco = tablero[fila][columna] == 'B'
+                    resultado, id_barco = indice.resolver_disparo(fila, columna)
+                    if not es_barco:
+                        self.assertEqual((resultado, id_barco), ('agua', None))
+                        continue
+                    tablero[fila][columna] = 'X'
+                    self.assertIn((fila, columna), indice.casillas[id_barco])
+                    hundido = hundir_flota.verificar_barco_hundido(tablero, fila, columna)
+                    self.assertEqual(resultado, 'hundido' if hundido else 'tocado')
+                self.assertEqual(indice.barcos_a_flote(), 0)
+                self.assertEqual(len(indice.hundidos()), len(hundir_flota.FLOTA))
+
+    def test_barcos_que_se_tocan(self):
+        # Dos barcos pegados: desde el tablero parecerían uno solo de 5
+        indice = indice_barcos.IndiceBarcos(10)
+        indice.agregar_barco([(0, 0), (0, 1), (0, 2)], "Submarino")
+        indice.agregar_barco([(0, 3), (0, 4)], "Destructor")
+        self.assertEqual(indice.resolver_disparo(0, 3), ('tocado', 1))
+        self.assertEqual(indice.resolver_disparo(0, 4), ('hundido', 1))
+        self.assertEqual(indice.resolver_disparo(0, 0), ('tocado', 0))
+        self.assertEqual(indice.barcos_a_flote(), 1)
+        with self.assertRaises(ValueError):
+            indice.agregar_barco([(0, 4), (1, 4)])
+
+    def test_desde_tablero_a_mitad_de_partida(self):
+        for semilla in range(10):
+            with self.subTest(semilla=semilla):
+                tablero, indice = flota_al_azar(semilla)
+                rng = random.Random(semilla)
+                for _ in range(40):
+                    fila, columna = rng.randrange(10), rng.randrange(10)
+                    if tablero[fila][columna] == 'B':
+                        tablero[fila][columna] = 'X'
+                        indice.resolver_disparo(fila, columna)
+                reconstruido = indice_barcos.IndiceBarcos.desde_tablero(tablero)
+                self.assertEqual(sorted(zip(reconstruido.casillas, reconstruido.vida)),
+                                 sorted(zip(indice.casillas, indice.vida)))
+
+    def test_copias_independientes(self):
+        _, indice = flota_al_azar(1)
+        copia = indice.copiar()
+        guardado = indice_barcos.IndiceBarcos.desde_dict(indice.a_dict())
+        self.assertEqual(guardado.a_dict(), indice.a_dict())
+        fila, columna = indice.casillas[0][0]
+        indice.resolver_disparo(fila, columna)
+        self.assertEqual(copia.vida[0], indice.vida[0] + 1)
+        self.assertEqual(guardado.vida[0], indice.vida[0] + 1)
+        self.assertEqual(guardado.nombres, indice.nombres)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+"""
+PRUEBA - Partida binaria: ida y vuelta y CRC
+============================================
+
+Codifica partidas de Hundir la Flota a medias (tableros con agua, barcos,
+tocados y fallos, con y sin índice de barcos) y comprueba que al
+decodificarlas salen exactamente los mismos tableros y barcos, también en
+tableros de más de 256 casillas (casillas de 2 bytes). Una partida con
+un byte cambiado, cortada o de otra versión tiene que dar ValueError en
+lugar de tableros a medias.
+
+Uso (desde Propuesta_Carliyo):
+    python -m unittest tests.test_partida_binaria
+    python -m pytest tests
+"""
+
+import os
+import random
+import struct
+import tempfile
+import unittest
+import zlib
+
+from compartido import colocacion_barcos, indice_barcos, partida_binaria
+
+
+SIMBOLOS = ('~', 'B', 'X', 'O')
+
+
+def partida_a_medias(n, longitudes, disparos, semilla):
+    """
+    Tablero de barcos con un índice y tablero de disparos tras unos cuantos disparos al azar.
+    """
+    rng = random.Random(semilla)
+    barcos = [['~'] * n for _ in range(n)]
+    disparos_tablero = [['~'] * n for _ in range(n)]
+    indice = indice_barcos.IndiceBarcos(n)
+    elegidas = colocacion_barcos.buscar_colocaciones(colocacion_barcos.IndiceColocaciones(n), longitudes, rng)
+    for longitud, fila, columna, orientacion in elegidas:
+        casillas = colocacion_barcos.casillas_barco(fila, columna, longitud, orientacion)
+        for f, c in casillas:
+            barcos[f][c] = 'B'
+        indice.agregar_barco(casillas)
+    for _ in range(disparos):
+        fila, columna = rng.randrange(n), rng.randrange(n)
+        if barcos[fila][columna] in ('X', 'O'):
+            continue
+        resultado, _ = indice.resolver_disparo(fila, columna)
+        marca = 'O' if resultado == 'agua' else 'X'
+        barcos[fila][columna] = disparos_tablero[fila][columna] = marca
+    return [barcos, disparos_tablero], [indice, None]
+
+
+def con_crc(datos):
+    """
+    Cambia el CRC para que cuadre con los datos (para probar lo que hay detrás).
+    """
+    return datos[:-4] + struct.pack(">I", zlib.crc32(datos[:-4]))
+
+
+class PruebaPartidaBinaria(unittest.TestCase):
+
+    def test_ida_y_vuelta(self):
+        for n, longitudes in ((10, [5, 4, 3, 3, 2]), (7, [3, 2, 2, 1]), (20, [5, 4, 3, 3, 2] * 3)):
+            for semilla in range(5):
+                with self.subTest(n=n, semilla=semilla):
+                    tableros, indices = partida_a_medias(n, longitudes, n * n // 2, semilla)
+                    datos = partida_binaria.codificar_partida(tableros, indices, SIMBOLOS)
+                    self.assertTrue(partida_binaria.es_binario(datos))
+                    leidos, indices_leidos = partida_binaria.decodificar_partida(datos, SIMBOLOS)
+                    self.assertEqual(leidos, tableros)
+                    self.assertIsNone(indices_leidos[1])
+                    self.assertEqual(indices_leidos[0].casillas, indices[0].casillas)
+                    self.assertEqual(indices_leidos[0].vida, indices[0].vida)
+
+    def test_byte_cambiado(self):
+        tableros, indices = partida_a_medias(10, [5, 4, 3, 3, 2], 40, 0)
+        datos = partida_binaria.codificar_partida(tableros, indices, SIMBOLOS)
+        for posicion in range(len(datos)):
+            with self.subTest(posicion=posicion):
+                danados = bytearray(datos)
+                danados[posicion] ^= 0x10
+                with self.assertRaises(ValueError):
+                    partida_binaria.decodificar_partida(bytes(danados), SIMBOLOS)
+
+    def test_cortada(self):
+        tableros, indices = partida_a_medias(10, [5, 4, 3, 3, 2], 40, 1)
+        datos = partida_binaria.codificar_partida(tableros, indices, SIMBOLOS)
+        for largo in range(len(datos)):
+            with self.subTest(largo=largo):
+                with self.assertRaises(ValueError):
+                    partida_binaria.decodificar_partida(datos[:largo], SIMBOLOS)
+        # Aunque el CRC cuadre, los barcos a medias o los bytes de más se detectan
+        with self.assertRaises(ValueError):
+            partida_binaria.decodificar_partida(con_crc(datos[:-10] + datos[-4:]), SIMBOLOS)
+        with self.assertRaises(ValueError):
+            partida_binaria.decodificar_partida(con_crc(datos[:-4] + b"\0" + datos[-4:]), SIMBOLOS)
+
+    def test_otro_formato_u_otra_version(self):
+        with self.assertRaises(ValueError):
+            partida_binaria.decodificar_partida(b'{"tableros": []}', SIMBOLOS)
+        self.assertFalse(partida_binaria.es_binario(b'{"tableros": []}'))
+        tableros, indices = partida_a_medias(10, [3, 2], 10, 2)
+        datos = partida_binaria.codificar_partida(tableros, indices, SIMBOLOS)
+        otra_version = datos[:3] + bytes([partida_binaria.VERSION + 1]) + datos[4:]
+        with self.assertRaises(ValueError):
+            partida_binaria.decodificar_partida(con_crc(otra_version), SIMBOLOS)
+
+    def test_simbolo_desconocido(self):
+        tableros, indices = partida_a_medias(10, [3, 2], 0, 3)
+        tableros[0][4][4] = '?'
+        with self.assertRaises(ValueError):
+            partida_binaria.codificar_partida(tableros, indices, SIMBOLOS)
+
+    def test_escribir_atomico(self):
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, "partida.bin")
+            partida_binaria.escribir_atomico(ruta, b"primera")
+            partida_binaria.escribir_atomico(ruta, b"segunda")
+            with open(ruta, "rb") as archivo:
+                self.assertEqual(archivo.read(), b"segunda")
+            # No quedan archivos temporales
+            self.assertEqual(os.listdir(directorio), ["partida.bin"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+"""
+PRUEBA - Pool de casillas sin disparar
+======================================
+
+Comprueba PoolCasillas contra un set con las mismas casillas: después de
+quitar y sacar casillas al azar tiene que contener exactamente las
+mismas, sacar() nunca repite casilla y vacía el tablero, y la elección
+al azar es uniforme entre las casillas que quedan.
+
+Uso (desde Propuesta_Carliyo):
+    python -m unittest tests.test_pool_casillas
+    python -m pytest tests
+"""
+
+import random
+import unittest
+from collections import Counter
+
+from compartido import pool_casillas
+
+
+class PruebaPoolCasillas(unittest.TestCase):
+
+    def comprobar_igual(self, pool, libres):
+        n = pool.n
+        self.assertEqual(len(pool), len(libres))
+        self.assertEqual({divmod(casilla, n) for casilla in pool.libres}, libres)
+        for fila in range(n):
+            for columna in range(n):
+                self.assertEqual((fila, columna) in pool, (fila, columna) in libres)
+
+    def test_igual_que_un_set(self):
+        for semilla in range(5):
+            with self.subTest(semilla=semilla):
+                rng = random.Random(semilla)
+                pool = pool_casillas.PoolCasillas(8)
+                libres = {(f, c) for f in range(8) for c in range(8)}
+                for _ in range(50):
+                    fila, columna = rng.randrange(8), rng.randrange(8)
+                    self.assertEqual(pool.quitar(fila, columna), (fila, columna) in libres)
+                    libres.discard((fila, columna))
+                    casilla = pool.sacar(rng)
+                    if casilla is not None:
+                        self.assertIn(casilla, libres)
+                        libres.remove(casilla)
+                    self.comprobar_igual(pool, libres)
+
+    def test_sacar_vacia_sin_repetir(self):
+        rng = random.Random(1)
+        pool = pool_casillas.PoolCasillas(10)
+        sacadas = [pool.sacar(rng) for _ in range(100)]
+        self.assertEqual(len(set(sacadas)), 100)
+        self.assertEqual(len(pool), 0)
+        self.assertIsNone(pool.sacar(rng))
+        self.assertIsNone(pool.aleatoria(rng))
+
+    def test_desde_tablero(self):
+        tablero = [['~', 'X', '~'], ['O', '~', '~'], ['~', '~', 'X']]
+        pool = pool_casillas.PoolCasillas.desde_tablero(tablero)
+        self.comprobar_igual(pool, {(f, c) for f in range(3) for c in range(3) if tablero[f][c] == '~'})
+
+    def test_aleatoria_uniforme(self):
+        rng = random.Random(0)
+        pool = pool_casillas.PoolCasillas(4)
+        for casilla in range(0, 16, 2):
+            pool.quitar(*divmod(casilla, 4))
+        # Quedan 8 casillas: unas 1000 veces cada una
+        veces = Counter(pool.aleatoria(rng) for _ in range(8000))
+        self.assertEqual(set(veces), {divmod(casilla, 4) for casilla in range(1, 16, 2)})
+        self.assertTrue(all(850 <= n <= 1150 for n in veces.values()), veces)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+"""
+PRUEBA - Repetición con puntos de control igual que de corrido
+==============================================================
+
+Graba partidas de Hundir la Flota y de Buscaminas (guardando el estado
+tras cada jugada) y después salta con Repeticion.ir_a(), avanzar() y
+retroceder() a jugadas al azar: el estado tiene que ser exactamente el
+de la partida original en esa jugada, y el mismo que reproduciendo la
+grabación de corrido sin puntos de control. En el Buscaminas la grabación
+empieza antes de colocar las minas, así que volver al punto de control
+inicial tiene que colocarlas igual. También que la grabación guardada en
+JSON se reproduce igual.
+
+Uso (desde Propuesta_Carliyo):
+    python -m unittest tests.test_repeticion
+    python -m pytest tests
+"""
+
+import os
+import random
+import tempfile
+import unittest
+
+import motor_buscaminas
+import motor_flota
+import repeticion
+
+
+def estado_flota(partida):
+    return ([[list(fila) for fila in tablero] for tablero in partida.tableros + partida.disparos],
+            [list(indice.vida) for indice in partida.indices],
+            partida.turno, partida.estado, partida.ganador, partida.jugadas)
+
+
+def estado_buscaminas(partida):
+    return partida.a_bytes()
+
+
+def grabar_flota(semilla):
+    """
+    Partida de Hundir la Flota con disparos al azar: su grabación y el estado tras cada jugada.
+    """
+    partida = motor_flota.PartidaFlota(semilla=semilla)
+    partida.colocar_flota_aleatoria(0)
+    partida.colocar_flota_aleatoria(1)
+    partida.empezar(semilla % 2)
+    grabacion = repeticion.Grabacion.de_flota(partida)
+    estados = [estado_flota(partida)]
+    rng = random.Random(semilla)
+    while not partida.terminada:
+        fila, columna = rng.randrange(partida.n), rng.randrange(partida.n)
+        if partida.aplicar_jugada(fila, columna)['resultado'] not in ('repetido', 'invalida'):
+            grabacion.anotar(fila, columna)
+            estados.append(estado_flota(partida))
+    return grabacion, estados, estado_flota
+
+
+def grabar_buscaminas(semilla):
+    """
+    Partida de Buscaminas con jugadas al azar (grabada antes de colocar las minas).
+    """
+    partida = motor_buscaminas.PartidaBuscaminas(12, 12, 20, semilla=semilla)
+    grabacion = repeticion.Grabacion.de_buscaminas(partida)
+    estados = [estado_buscaminas(partida)]
+    rng = random.Random(semilla)
+    while not partida.terminada:
+        accion, fila, columna = rng.choice('RRRF'), rng.randrange(12), rng.randrange(12)
+        if partida.aplicar(accion, fila, columna)['resultado'] != 'invalida':
+            grabacion.anotar(accion, fila, columna)
+            estados.append(estado_buscaminas(partida))
+    return grabacion, estados, estado_buscaminas
+
+
+class PruebaRepeticion(unittest.TestCase):
+
+    def comprobar_saltos(self, grabacion, estados, estado):
+        rng = random.Random(len(estados))
+        con_puntos = repeticion.Repeticion(grabacion, cada=4)
+        for _ in range(100):
+            numero = rng.randrange(len(estados))
+            movimiento = rng.randrange(3)
+            if movimiento == 0:
+                partida = con_puntos.ir_a(numero)
+            elif movimiento == 1:
+                partida = con_puntos.avanzar(rng.randrange(1, 6))
+            else:
+                partida = con_puntos.retroceder(rng.randrange(1, 6))
+            self.assertEqual(estado(partida), estados[con_puntos.posicion])
+            # Lo mismo que de corrido, sin volver a ningún punto de control
+            de_corrido = repeticion.Repeticion(grabacion, cada=len(estados) + 1).ir_a(con_puntos.posicion)
+            self.assertEqual(estado(de_corrido), estados[con_puntos.posicion])
+        self.assertEqual(estado(con_puntos.al_final()), estados[-1])
+        self.assertEqual(estado(con_puntos.ir_a(0)), estados[0])
+
+    def test_flota(self):
+        for semilla in range(3):
+            with self.subTest(semilla=semilla):
+                self.comprobar_saltos(*grabar_flota(semilla))
+
+    def test_buscaminas(self):
+        for semilla in range(5):
+            with self.subTest(semilla=semilla):
+                self.comprobar_saltos(*grabar_buscaminas(semilla))
+
+    def test_guardar_y_cargar(self):
+        for grabar in (grabar_flota, grabar_buscaminas):
+            with self.subTest(juego=grabar.__name__):
+                grabacion, estados, estado = grabar(7)
+                with tempfile.TemporaryDirectory() as directorio:
+                    ruta = os.path.join(directorio, "grabacion.json")
+                    grabacion.guardar(ruta)
+                    cargada = repeticion.Grabacion.cargar(ruta)
+                self.assertEqual(estado(repeticion.Repeticion(cargada).al_final()), estados[-1])
+
+    def test_grabacion_invalida(self):
+        with self.assertRaises(ValueError):
+            repeticion.Repeticion(repeticion.Grabacion('ajedrez', 0, {}))
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, "grabacion.json")
+            with open(ruta, "w") as archivo:
+                archivo.write('{"juego": "flota"}')
+            with self.assertRaises(ValueError):
+                repeticion.Grabacion.cargar(ruta)
+
+
+if __name__ == "__main__":
+    unittest.main()
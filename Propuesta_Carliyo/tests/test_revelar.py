@@ -0,0 +1,113 @@
+"""
+PRUEBA - Revelado iterativo igual que el recursivo
+==================================================
+
+Compara buscaminas.revelar_casilla() (pila explícita, ver revelar_area())
+con la versión recursiva original en tableros al azar de varias
+densidades, con banderas puestas y también con tableros compactos:
+tienen que quedar los mismos tableros visibles y devolver lo mismo.
+Además, revelar_area() no repite casillas y abre tableros demasiado
+grandes para la recursión.
+
+Uso (desde Propuesta_Carliyo):
+    python -m unittest tests.test_revelar
+    python -m pytest tests
+"""
+
+import random
+import sys
+import unittest
+
+import buscaminas
+
+
+def revelar_recursivo(tablero_real, tablero_visible, fila, columna):
+    """
+    revelar_casilla() tal y como era antes del motor iterativo, como referencia.
+    """
+    if fila < 0 or fila >= len(tablero_real) or columna < 0 or columna >= len(tablero_real[0]):
+        return False
+    if tablero_visible[fila][columna] != '#':
+        return False
+
+    tablero_visible[fila][columna] = tablero_real[fila][columna]
+    if tablero_real[fila][columna] == '*':
+        return True
+
+    if tablero_real[fila][columna] == 0:
+        for df in (-1, 0, 1):
+            for dc in (-1, 0, 1):
+                if df or dc:
+                    revelar_recursivo(tablero_real, tablero_visible, fila + df, columna + dc)
+    return False
+
+
+def tableros_al_azar(filas, columnas, num_minas, banderas, rng, compacto=False):
+    """
+    Tablero real con minas y números y un visible con algunas banderas.
+    """
+    tablero_real, tablero_visible = buscaminas.crear_tablero(filas, columnas, compacto)
+    buscaminas.colocar_minas(tablero_real, num_minas, rng=rng)
+    buscaminas.calcular_vecinos(tablero_real)
+    for _ in range(banderas):
+        buscaminas.marcar_bandera(tablero_visible, rng.randrange(filas), rng.randrange(columnas))
+    return tablero_real, tablero_visible
+
+
+def copiar(tablero):
+    return [list(fila) for fila in tablero]
+
+
+class PruebaRevelar(unittest.TestCase):
+
+    def comparar(self, filas, columnas, num_minas, banderas, semilla, compacto=False):
+        rng = random.Random(semilla)
+        tablero_real, visible_iterativo = tableros_al_azar(filas, columnas, num_minas, banderas, rng, compacto)
+        visible_recursivo = copiar(visible_iterativo)
+
+        # Varios clics seguidos sobre el mismo tablero, incluidos los de casillas ya reveladas
+        for _ in range(10):
+            fila, columna = rng.randrange(filas), rng.randrange(columnas)
+            antes = copiar(visible_iterativo)
+            reveladas = buscaminas.revelar_area(tablero_real, visible_iterativo, fila, columna)
+            self.assertEqual(len(reveladas), len(set(reveladas)))
+            cambiadas = {(f, c) for f in range(filas) for c in range(columnas)
+                         if antes[f][c] != visible_iterativo[f][c]}
+            self.assertEqual(set(reveladas), cambiadas)
+
+            piso_mina = revelar_recursivo(tablero_real, visible_recursivo, fila, columna)
+            self.assertEqual(bool(reveladas) and tablero_real[fila][columna] == '*', piso_mina)
+            self.assertEqual(copiar(visible_iterativo), visible_recursivo)
+
+    def test_igual_que_recursivo(self):
+        for filas, columnas, num_minas, banderas in ((9, 9, 10, 0), (16, 16, 40, 5), (16, 30, 99, 10),
+                                                     (20, 20, 0, 0), (12, 20, 8, 20), (1, 25, 3, 0)):
+            for semilla in range(5):
+                with self.subTest(tablero=(filas, columnas, num_minas, banderas), semilla=semilla):
+                    self.comparar(filas, columnas, num_minas, banderas, semilla)
+
+    def test_igual_que_recursivo_compacto(self):
+        for semilla in range(5):
+            with self.subTest(semilla=semilla):
+                self.comparar(16, 16, 40, 5, semilla, compacto=True)
+
+    def test_revelar_casilla_devuelve_mina(self):
+        tablero_real, tablero_visible = tableros_al_azar(9, 9, 10, 0, random.Random(1))
+        fila, columna = next((f, c) for f in range(9) for c in range(9) if tablero_real[f][c] == '*')
+        self.assertTrue(buscaminas.revelar_casilla(tablero_real, tablero_visible, fila, columna))
+        # Ya revelada: no hace nada
+        self.assertFalse(buscaminas.revelar_casilla(tablero_real, tablero_visible, fila, columna))
+
+    def test_sin_limite_de_recursion(self):
+        # Un área abierta con muchas más casillas que el límite de recursión
+        lado = 200
+        self.assertGreater(lado * lado, sys.getrecursionlimit())
+        tablero_real, tablero_visible = buscaminas.crear_tablero(lado, lado)
+        tablero_real[lado - 1][lado - 1] = '*'
+        buscaminas.calcular_vecinos(tablero_real)
+        reveladas = buscaminas.revelar_area(tablero_real, tablero_visible, 0, 0)
+        self.assertEqual(len(reveladas), lado * lado - 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
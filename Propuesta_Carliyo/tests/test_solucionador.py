@@ -0,0 +1,89 @@
+"""
+PRUEBA - Probabilidades del solucionador igual que por fuerza bruta
+===================================================================
+
+En tableros pequeños se pueden enumerar todas las formas de poner las
+minas que quedan en las casillas ocultas que cuadran con los números
+revelados. La probabilidad de mina de cada casilla es la fracción de esas
+formas en que tiene mina, y solucionador.analizar() tiene que dar
+exactamente lo mismo; las casillas que da por seguras o por minas tienen
+que serlo en todas esas formas.
+
+Uso (desde Propuesta_Carliyo):
+    python -m unittest tests.test_solucionador
+    python -m pytest tests
+"""
+
+import itertools
+import random
+import unittest
+
+import buscaminas
+import solucionador
+
+
+def probabilidades_fuerza_bruta(tablero_visible, num_minas):
+    """
+    Probabilidad de mina de cada casilla oculta (las banderas cuentan como ocultas).
+    """
+    filas = len(tablero_visible)
+    columnas = len(tablero_visible[0])
+    ocultas = [(f, c) for f in range(filas) for c in range(columnas) if tablero_visible[f][c] in ('#', 'F')]
+    numeros = [(f, c, tablero_visible[f][c]) for f in range(filas) for c in range(columnas)
+               if isinstance(tablero_visible[f][c], int)]
+
+    veces = dict.fromkeys(ocultas, 0)
+    total = 0
+    for minas in itertools.combinations(ocultas, num_minas):
+        minas = set(minas)
+        if all(sum((nf, nc) in minas for nf in range(f - 1, f + 2) for nc in range(c - 1, c + 2)) == valor
+               for f, c, valor in numeros):
+            total += 1
+            for casilla in minas:
+                veces[casilla] += 1
+    return {casilla: n / total for casilla, n in veces.items()}
+
+
+def tablero_a_medias(filas, columnas, num_minas, clics, semilla):
+    """
+    Tablero visible tras unos cuantos clics en casillas sin mina (y alguna bandera).
+    """
+    rng = random.Random(semilla)
+    tablero_real, tablero_visible = buscaminas.crear_tablero(filas, columnas)
+    buscaminas.colocar_minas(tablero_real, num_minas, rng=rng)
+    buscaminas.calcular_vecinos(tablero_real)
+    seguras = [(f, c) for f in range(filas) for c in range(columnas) if tablero_real[f][c] != '*']
+    for fila, columna in rng.sample(seguras, clics):
+        buscaminas.revelar_area(tablero_real, tablero_visible, fila, columna)
+    buscaminas.marcar_bandera(tablero_visible, rng.randrange(filas), rng.randrange(columnas))
+    return tablero_visible
+
+
+class PruebaSolucionador(unittest.TestCase):
+
+    def test_igual_que_fuerza_bruta(self):
+        for filas, columnas, num_minas, clics in ((4, 4, 3, 2), (5, 5, 4, 3), (5, 5, 6, 2), (4, 6, 5, 2), (3, 8, 4, 2)):
+            for semilla in range(8):
+                with self.subTest(tablero=(filas, columnas, num_minas, clics), semilla=semilla):
+                    tablero_visible = tablero_a_medias(filas, columnas, num_minas, clics, semilla)
+                    esperadas = probabilidades_fuerza_bruta(tablero_visible, num_minas)
+                    analisis = solucionador.analizar(tablero_visible, num_minas)
+
+                    self.assertEqual(set(analisis['probabilidades']), set(esperadas))
+                    for casilla, probabilidad in esperadas.items():
+                        self.assertAlmostEqual(analisis['probabilidades'][casilla], probabilidad, places=9)
+                    # Las que da por seguras (o por minas) lo son de verdad
+                    self.assertLessEqual(analisis['seguras'], {c for c, p in esperadas.items() if p == 0})
+                    self.assertLessEqual(analisis['minas'], {c for c, p in esperadas.items() if p == 1})
+
+    def test_jugada_elegida_es_la_menos_probable(self):
+        for semilla in range(8):
+            with self.subTest(semilla=semilla):
+                tablero_visible = tablero_a_medias(5, 5, 5, 2, semilla)
+                esperadas = probabilidades_fuerza_bruta(tablero_visible, 5)
+                _, fila, columna = solucionador.elegir_jugada(tablero_visible, 5)
+                self.assertAlmostEqual(esperadas[(fila, columna)], min(esperadas.values()), places=9)
+
+
+if __name__ == "__main__":
+    unittest.main()
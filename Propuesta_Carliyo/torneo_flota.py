@@ -0,0 +1,418 @@
+"""
+TORNEO DE HUNDIR LA FLOTA - IAs contra flotas fijas y entre ellas
+=================================================================
+
+Enfrenta las IAs de Hundir la Flota sin terminal y sin pausas:
+- Contra flota fija: cada IA dispara a una flota aleatoria con semilla
+  hasta hundirla. Mide disparos para ganar y tiempo de cada decisión.
+- Duelos: cada pareja de IAs juega partidas alternando disparos (cada
+  una con su flota) y empezando una u otra según la semilla.
+
+Todas las partidas usan la flota de hundir_flota.py (5, 4, 3, 3, 2 en 10×10),
+colocada con colocar_flota_aleatoria() y la semilla de la partida, así que
+todas las IAs se enfrentan a los mismos tableros. Cada IA decide con su
+propio random.Random, sacado de la semilla de la partida: una partida se
+juega igual sola, en un proceso o en un hilo junto a otras. Las partidas se
+reparten en lotes entre varios procesos con ProcessPoolExecutor (o entre
+hilos con ThreadPoolExecutor, ver torneo()).
+
+IAs disponibles (ver crear_jugador):
+- 'facil', 'intermedio', 'dificil', 'probabilistico', 'experto': las de
+  hundir_flota.py (la experta genera las muestras en el propio proceso)
+- 'teo': generar_disparo_ia() de Hundir_la_flota_Teo/Hundir_la_flota.py
+
+Los resultados se guardan en JSON. Si el archivo ya existe, antes de
+sobrescribirlo se muestra la diferencia con la ejecución anterior para
+detectar empeoramientos entre versiones.
+
+Uso:
+    python torneo_flota.py [partidas] [procesos] [archivo.json]
+
+Autor: Proyecto Grupal ASIR - Python
+"""
+
+import importlib.util
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import combinations
+
+import hundir_flota
+import ia_montecarlo
+import motor_flota
+from compartido import indice_barcos
+
+
+# Partidas que juega cada proceso por envío (reduce la comunicación entre procesos)
+TAMANO_LOTE = 20
+
+# IAs que juegan por defecto (la experta tarda PRESUPUESTO_EXPERTO por disparo)
+JUGADORES_TORNEO = ['facil', 'intermedio', 'dificil', 'probabilistico', 'teo']
+
+# Presupuesto por disparo de la IA experta dentro del torneo
+PRESUPUESTO_EXPERTO = 0.02
+
+# Archivo de resultados por defecto
+ARCHIVO_RESULTADOS = "resultados_torneo.json"
+
+DIRECTORIO_TEO = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Hundir_la_flota_Teo")
+RUTA_TEO = os.path.join(DIRECTORIO_TEO, "Hundir_la_flota.py")
+
+
+@lru_cache(maxsize=1)
+def cargar_teo():
+    """
+    Importa Hundir_la_flota_Teo/Hundir_la_flota.py por su ruta (no es un paquete).
+    Usa el mismo paquete 'compartido' que ya tiene cargado este proceso.
+    """
+    spec = importlib.util.spec_from_file_location("hundir_la_flota_teo", RUTA_TEO)
+    modulo = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(modulo)
+    return modulo
+
+
+class JugadorFlota(motor_flota.IAFlota):
+    """
+    IA de hundir_flota.py (ver motor_flota.IAFlota) con su propio tablero
+    de disparos.
+
+    Atributos:
+        nivel (str): Nivel de la IA
+        disparos (list): Tablero de disparos de la IA
+    """
+
+    def __init__(self, nivel, n=10, rng=None):
+        rng = rng if rng is not None else random.Random()
+        estado_ia = None
+        if nivel == 'experto':
+            # Sin pool propio: ya estamos dentro de un proceso del torneo
+            longitudes = [longitud for _, longitud in hundir_flota.FLOTA]
+            estado_ia = ia_montecarlo.EstadoMonteCarlo(n, longitudes, rng, presupuesto=PRESUPUESTO_EXPERTO,
+                                                       procesos=0)
+        super().__init__(nivel, n, estado_ia, rng)
+        self.disparos = hundir_flota.crear_tablero(n)
+
+    def elegir(self, tablero_disparos=None):
+        return super().elegir(self.disparos if tablero_disparos is None else tablero_disparos)
+
+
+class JugadorTeo:
+    """
+    IA de la propuesta de Teo. Su generar_disparo_ia() mira las marcas de
+    tocado y fallado en el tablero rival, así que se le pasa una copia que
+    solo tiene esas marcas (nunca los barcos).
+    """
+
+    def __init__(self, n=10, rng=None):
+        self.teo = cargar_teo()
+        self.rng = rng if rng is not None else random.Random()
+        self.disparos = hundir_flota.crear_tablero(n)
+        self.marcas = self.teo.crear_tablero(n)
+        self.pool = self.teo.crear_pool_ia(self.marcas)
+
+    def elegir(self):
+        return self.teo.generar_disparo_ia(self.marcas, self.pool, self.rng)
+
+    def registrar(self, fila, columna, resultado):
+        self.marcas[fila][columna] = self.teo.FALLADO if resultado == 'agua' else self.teo.TOCADO
+        self.pool.quitar(fila, columna)
+
+
+def crear_jugador(nombre, rng=None):
+    """
+    Crea la IA con ese nombre ('teo' o un nivel de hundir_flota.py).
+
+    Args:
+        rng (random.Random): Generador de la IA (ver generador_ia)
+    """
+    if nombre == 'teo':
+        return JugadorTeo(rng=rng)
+    return JugadorFlota(nombre, rng=rng)
+
+
+def generador_ia(semilla, lado='a'):
+    """
+    Generador propio de una IA en la partida con esa semilla (uno distinto
+    para cada lado de un duelo).
+    """
+    return random.Random(f"{semilla}:{lado}")
+
+
+def crear_flota(semilla):
+    """
+    Tablero con la flota normal colocada con esa semilla, y sus contadores.
+    """
+    tablero = hundir_flota.crear_tablero()
+    indice = indice_barcos.IndiceBarcos(len(tablero))
+    hundir_flota.colocar_flota_aleatoria(tablero, rng=random.Random(semilla), indice=indice)
+    return tablero, hundir_flota.crear_contadores(tablero, indice)
+
+
+def disparar(jugador, tablero, contadores, tiempos):
+    """
+    Un disparo de la IA: decide (midiendo el tiempo), dispara y se lo cuenta.
+
+    Returns:
+        bool: True si con este disparo ha ganado
+    """
+    inicio = time.perf_counter()
+    fila, columna = jugador.elegir()
+    tiempos.append(time.perf_counter() - inicio)
+    resultado = hundir_flota.realizar_disparo(tablero, jugador.disparos, fila, columna, contadores)
+    if resultado == 'repetido':
+        raise RuntimeError(f"La IA repitió el disparo en ({fila}, {columna})")
+    jugador.registrar(fila, columna, resultado)
+    return hundir_flota.verificar_victoria(tablero, contadores)
+
+
+def jugar_contra_flota(nombre, semilla):
+    """
+    Una IA dispara a una flota fija hasta hundirla.
+
+    Returns:
+        dict: {'disparos': int, 'tiempos': list, 'segundos': float}
+    """
+    inicio = time.perf_counter()
+    tablero, contadores = crear_flota(semilla)
+    jugador = crear_jugador(nombre, generador_ia(semilla))
+    tiempos = []
+    while not disparar(jugador, tablero, contadores, tiempos):
+        pass
+    return {'disparos': len(tiempos), 'tiempos': tiempos, 'segundos': time.perf_counter() - inicio}
+
+
+def jugar_duelo(nombre_a, nombre_b, semilla):
+    """
+    Dos IAs se disparan por turnos; empieza 'a' con semilla par y 'b' con impar.
+
+    Returns:
+        dict: {'ganador': 'a' o 'b', 'disparos': int (del ganador), 'segundos': float}
+    """
+    inicio = time.perf_counter()
+    # Cada IA dispara a la flota del otro
+    objetivos = {'a': crear_flota(2 * semilla + 1), 'b': crear_flota(2 * semilla)}
+    jugadores = {'a': crear_jugador(nombre_a, generador_ia(semilla, 'a')),
+                 'b': crear_jugador(nombre_b, generador_ia(semilla, 'b'))}
+    tiempos = {'a': [], 'b': []}
+    turno = 'a' if semilla % 2 == 0 else 'b'
+    while True:
+        tablero, contadores = objetivos[turno]
+        if disparar(jugadores[turno], tablero, contadores, tiempos[turno]):
+            return {'ganador': turno, 'disparos': len(tiempos[turno]),
+                    'segundos': time.perf_counter() - inicio}
+        turno = 'b' if turno == 'a' else 'a'
+
+
+def jugar_lote(tarea, semillas):
+    """
+    Juega un lote de partidas en un proceso (o hilo) trabajador.
+
+    Args:
+        tarea (tuple): ('flota', nombre) o ('duelo', nombre_a, nombre_b)
+
+    Returns:
+        list: Resultados de cada partida
+    """
+    if tarea[0] == 'flota':
+        return [jugar_contra_flota(tarea[1], semilla) for semilla in semillas]
+    return [jugar_duelo(tarea[1], tarea[2], semilla) for semilla in semillas]
+
+
+def percentil(valores_ordenados, p):
+    return valores_ordenados[min(len(valores_ordenados) - 1, int(len(valores_ordenados) * p))]
+
+
+def resumir_flota(nombre, resultados):
+    """
+    Estadísticas de una IA contra flota fija.
+    """
+    disparos = sorted(r['disparos'] for r in resultados)
+    tiempos = sorted(t for r in resultados for t in r['tiempos'])
+    segundos = sum(r['segundos'] for r in resultados)
+    partidas = len(resultados)
+    return {
+        'jugador': nombre,
+        'partidas': partidas,
+        'disparos_media': sum(disparos) / partidas,
+        'disparos_p10': percentil(disparos, 0.1),
+        'disparos_p50': percentil(disparos, 0.5),
+        'disparos_p90': percentil(disparos, 0.9),
+        'disparos_max': disparos[-1],
+        'ms_decision_media': sum(tiempos) / len(tiempos) * 1000,
+        'ms_decision_p99': percentil(tiempos, 0.99) * 1000,
+        'ms_decision_max': tiempos[-1] * 1000,
+        'partidas_por_segundo': partidas / segundos if segundos else 0.0,
+    }
+
+
+def resumir_duelo(nombre_a, nombre_b, resultados):
+    """
+    Estadísticas de un duelo entre dos IAs.
+    """
+    partidas = len(resultados)
+    victorias_a = sum(r['ganador'] == 'a' for r in resultados)
+    return {
+        'jugador_a': nombre_a,
+        'jugador_b': nombre_b,
+        'partidas': partidas,
+        'victorias_a': victorias_a,
+        'victorias_b': partidas - victorias_a,
+        'tasa_victoria_a': victorias_a / partidas,
+        'disparos_ganador_media': sum(r['disparos'] for r in resultados) / partidas,
+    }
+
+
+def version_codigo():
+    """
+    Commit actual de git (o None si no se puede saber), para comparar ejecuciones.
+    """
+    try:
+        salida = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__)), timeout=5)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return salida.stdout.strip() or None
+
+
+def torneo(partidas, jugadores=None, procesos=None, duelos=True, semilla_inicial=0, hilos=False):
+    """
+    Juega el torneo completo repartido entre varios procesos.
+
+    Args:
+        partidas (int): Partidas por IA contra flota fija y por pareja en duelos
+        jugadores (list): Nombres de las IAs (por defecto JUGADORES_TORNEO)
+        procesos (int): Número de procesos (o de hilos); por defecto uno por
+                        núcleo. Con 1 se juega en el propio proceso, sin pool
+        duelos (bool): Si False, solo se juega contra flota fija
+        semilla_inicial (int): Semilla de la primera partida (las demás son consecutivas)
+        hilos (bool): Si True, los lotes se reparten entre hilos de este proceso
+                      (ThreadPoolExecutor). Las partidas no comparten generador ni
+                      estado de módulo, así que el resultado es el mismo; con el
+                      GIL solo va más rápido en un Python sin GIL
+
+    Returns:
+        dict: Resultados (se pueden guardar con guardar_resultados())
+    """
+    jugadores = jugadores or JUGADORES_TORNEO
+    procesos = procesos or os.cpu_count() or 1
+    semillas = list(range(semilla_inicial, semilla_inicial + partidas))
+    lotes = [semillas[i:i + TAMANO_LOTE] for i in range(0, partidas, TAMANO_LOTE)]
+
+    tareas = [('flota', nombre) for nombre in jugadores]
+    if duelos:
+        tareas += [('duelo', a, b) for a, b in combinations(jugadores, 2)]
+
+    inicio = time.perf_counter()
+    if procesos == 1:
+        por_tarea = {tarea: [r for lote in lotes for r in jugar_lote(tarea, lote)] for tarea in tareas}
+    else:
+        ejecutor = ThreadPoolExecutor if hilos else ProcessPoolExecutor
+        with ejecutor(max_workers=procesos) as pool:
+            envios = {tarea: [pool.submit(jugar_lote, tarea, lote) for lote in lotes] for tarea in tareas}
+            por_tarea = {tarea: [r for envio in lista for r in envio.result()] for tarea, lista in envios.items()}
+    total = time.perf_counter() - inicio
+
+    partidas_jugadas = sum(len(resultados) for resultados in por_tarea.values())
+    return {
+        'info': {
+            'fecha': time.strftime("%Y-%m-%d %H:%M:%S"),
+            'version': version_codigo(),
+            'python': platform.python_version(),
+            'procesos': procesos,
+            'hilos': hilos,
+            'partidas': partidas,
+            'semilla_inicial': semilla_inicial,
+            'segundos': total,
+            'partidas_por_segundo': partidas_jugadas / total,
+        },
+        'contra_flota': [resumir_flota(tarea[1], por_tarea[tarea]) for tarea in tareas if tarea[0] == 'flota'],
+        'duelos': [resumir_duelo(tarea[1], tarea[2], por_tarea[tarea]) for tarea in tareas if tarea[0] == 'duelo'],
+    }
+
+
+def guardar_resultados(resultados, ruta):
+    """
+    Guarda los resultados en JSON de forma atómica (archivo temporal + reemplazo).
+    """
+    directorio = os.path.dirname(os.path.abspath(ruta))
+    descriptor, temporal = tempfile.mkstemp(dir=directorio, suffix=".tmp")
+    try:
+        with os.fdopen(descriptor, "w", encoding="utf-8") as archivo:
+            json.dump(resultados, archivo, indent=2, ensure_ascii=False)
+        os.replace(temporal, ruta)
+    except OSError:
+        if os.path.exists(temporal):
+            os.remove(temporal)
+        raise
+
+
+def cargar_resultados(ruta):
+    """
+    Lee unos resultados guardados (o None si no existen o no se pueden leer).
+    """
+    try:
+        with open(ruta, "r", encoding="utf-8") as archivo:
+            return json.load(archivo)
+    except (OSError, ValueError):
+        return None
+
+
+def comparar(anteriores, actuales):
+    """
+    Líneas de texto con el cambio de cada IA respecto a una ejecución anterior.
+    """
+    previos = {e['jugador']: e for e in anteriores.get('contra_flota', [])}
+    lineas = []
+    for e in actuales['contra_flota']:
+        previo = previos.get(e['jugador'])
+        if previo is None:
+            continue
+        lineas.append(f"{e['jugador']:<15} | disparos {e['disparos_media'] - previo['disparos_media']:>+6.2f} | "
+                      f"ms/decisión {e['ms_decision_media'] - previo['ms_decision_media']:>+8.3f}")
+    return lineas
+
+
+def main():
+    partidas = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    procesos = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    ruta = sys.argv[3] if len(sys.argv) > 3 else ARCHIVO_RESULTADOS
+
+    resultados = torneo(partidas, procesos=procesos)
+    info = resultados['info']
+
+    print(f"{partidas} partidas por IA y por duelo, {info['procesos']} procesos, "
+          f"{info['segundos']:.1f} s ({info['partidas_por_segundo']:.0f} partidas/s)\n")
+    print(f"{'IA':<15} | {'Disparos':>8} | {'p10':>4} | {'p50':>4} | {'p90':>4} | "
+          f"{'ms/decisión':>11} | {'p99 ms':>7} | {'Partidas/s':>10}")
+    print("-" * 86)
+    for e in resultados['contra_flota']:
+        print(f"{e['jugador']:<15} | {e['disparos_media']:>8.1f} | {e['disparos_p10']:>4} | "
+              f"{e['disparos_p50']:>4} | {e['disparos_p90']:>4} | {e['ms_decision_media']:>11.3f} | "
+              f"{e['ms_decision_p99']:>7.3f} | {e['partidas_por_segundo']:>10.0f}")
+
+    if resultados['duelos']:
+        print(f"\n{'Duelo':<33} | {'Victorias':>9} | {'Disparos ganador':>16}")
+        print("-" * 66)
+        for d in resultados['duelos']:
+            pareja = f"{d['jugador_a']} vs {d['jugador_b']}"
+            print(f"{pareja:<33} | {d['tasa_victoria_a']:>8.1%} | {d['disparos_ganador_media']:>16.1f}")
+
+    anteriores = cargar_resultados(ruta)
+    if anteriores is not None:
+        print(f"\nCambio respecto a la ejecución anterior ({anteriores.get('info', {}).get('version')}):")
+        for linea in comparar(anteriores, resultados):
+            print(linea)
+
+    guardar_resultados(resultados, ruta)
+    print(f"\nResultados guardados en '{ruta}'.")
+
+
+if __name__ == "__main__":
+    main()